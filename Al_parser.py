@@ -11,6 +11,7 @@ import json
 import time
 from typing import Dict
 from dotenv import dotenv_values
+from llm_cache import cached_completion
 
 # Загрузка переменных окружения
 config = dotenv_values(".env")
@@ -39,8 +40,11 @@ def scrape_html(url: str) -> str:
     response = requests.get(full_url, headers=headers)
     return response.text
 
-def extract_info(content: str, model: str = "deepseek-chat"):
-    """Извлечение информации с помощью DeepSeek"""
+def extract_info(content: str, model: str = "deepseek-chat", use_cache: bool = False):
+    """
+    Извлечение информации с помощью DeepSeek.
+    Курсы меняются каждую минуту, поэтому ответ по умолчанию не кешируется (use_cache=False)
+    """
     headers = {
         "Authorization": f"Bearer {API_KEY}",
         "Content-Type": "application/json"
@@ -65,17 +69,24 @@ def extract_info(content: str, model: str = "deepseek-chat"):
         "temperature": 0.7  # Добавляем случайность для избежания кеша
     }
 
-    response = requests.post(
-        f"{BASE_URL}/chat/completions",
-        headers=headers,
-        json=payload
+    def request():
+        response = requests.post(
+            f"{BASE_URL}/chat/completions",
+            headers=headers,
+            json=payload
+        )
+
+        if response.status_code == 200:
+            return response.json()["choices"][0]["message"]["content"]
+        else:
+            raise Exception(f"API Error: {response.status_code} - {response.text}")
+
+    return cached_completion(
+        model, payload["messages"][0]["content"], content, request,
+        {"response_format": payload["response_format"], "temperature": payload["temperature"]}, use_cache,
+        validate=json.loads,
     )
 
-    if response.status_code == 200:
-        return response.json()["choices"][0]["message"]["content"]
-    else:
-        raise Exception(f"API Error: {response.status_code} - {response.text}")
-
 
 def count_tokens(text: str, model: str = "deepseek-chat") -> int:
     """Подсчет количества токенов в тексте"""
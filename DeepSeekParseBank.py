@@ -2,11 +2,15 @@ import tiktoken
 import requests
 import json
 import time
-from typing import Dict, Any
+import datetime
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 import os
 import pandas as pd
 import psycopg2
+from packed_requests import PACKED_SYSTEM_PROMPT, run_packed
+from llm_cache import cached_completion
+from t_pb_incremental import run_incremental
 
 # 1. Загружаем переменные из файла .env в окружение
 load_dotenv()  # берёт .env из текущей директории
@@ -17,8 +21,13 @@ BASE_URL = "https://api.deepseek.com/v1"
 initial_balance = float(config.get("INITIAL_BALANCE", 0.0))
 
 
-# из быза pg, таб t_pb извлечем уникальные данные
-def extract_data_from_postgresql():
+# Начало выборки при полном прогоне и при первом инкрементальном запуске
+START_DATE = datetime.date(2025, 3, 25)
+# Имя задания в таблице состояния инкрементальной обработки (t_pb_incremental)
+JOB = "deepseek_parse_bank"
+
+
+def connect_postgresql():
     user = os.getenv("PG_USER")
     password = os.getenv("PG_PASSWORD")
     host = os.getenv("PG_HOST")
@@ -27,16 +36,27 @@ def extract_data_from_postgresql():
     conn = psycopg2.connect(
         user=user, password=password, host=host, port=port, dbname=dbname
     )
+    return conn
+
+
+# из быза pg, таб t_pb извлечем уникальные данные
+def extract_data_from_postgresql(start_date: datetime.date = START_DATE):
+    conn = connect_postgresql()
     df = pd.read_sql_query(
-        """SELECT DISTINCT osnd FROM t_pb WHERE date_time_dat_od_tim_p::date >= '25.03.2025'::date Limit 5;""",
-        conn
+        """SELECT DISTINCT osnd FROM t_pb WHERE date_time_dat_od_tim_p::date >= %s Limit 5;""",
+        conn,
+        params=(start_date,),
     )
     conn.close()
     return df
 
 
 # Извлечение информации с помощью DeepSeek
-def extract_info(content: str, model: str = "deepseek-chat"):
+def extract_info(content: str, model: str = "deepseek-chat", system_prompt: str = None, use_cache: bool = True):
+    """
+    system_prompt - другой системный промпт (например, PACKED_SYSTEM_PROMPT для пакета назначений)
+    use_cache - брать ответ из общего кеша LLM (llm_cache), если такой запрос уже был
+    """
     headers = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
 
     payload = {
@@ -59,20 +79,28 @@ def extract_info(content: str, model: str = "deepseek-chat"):
                            " Если отсутствует информация, выведи пустоту. НДС извлеки не %, а сумму. "
                            "Дату выводи в формате: dd.mm.yyyy."
                            "Период выводи в формате: mm.yyyy",
-            },
+            } if system_prompt is None else {"role": "system", "content": system_prompt},
             {"role": "user", "content": content},
         ],
         "response_format": {"type": "json_object"},
     }
 
-    response = requests.post(
-        f"{BASE_URL}/chat/completions", headers=headers, json=payload
-    )
+    def request():
+        response = requests.post(
+            f"{BASE_URL}/chat/completions", headers=headers, json=payload
+        )
 
-    if response.status_code == 200:
-        return response.json()["choices"][0]["message"]["content"]
-    else:
-        raise Exception(f"API Error: {response.status_code} - {response.text}")
+        if response.status_code == 200:
+            return response.json()["choices"][0]["message"]["content"]
+        else:
+            raise Exception(f"API Error: {response.status_code} - {response.text}")
+
+    return cached_completion(
+        model, payload["messages"][0]["content"], content, request,
+        {"response_format": payload["response_format"]}, use_cache,
+        # в кеш попадают только ответы, которые разбираются как json (ответ в формате json_object)
+        validate=json.loads,
+    )
 
 
 # Подсчет количества токенов в тексте
@@ -173,7 +201,8 @@ def calculate_cost(input_tokens: int, output_tokens: int, model: str = "deepseek
     }
 
 
-def extraxt_from_deepseek_main():
+def extraxt_from_deepseek_main(pack_size: int = 20):
+    """pack_size - назначений в одном запросе (packed_requests); 1 - по одному запросу на строку"""
     MODEL = "deepseek-chat"
     df = extract_data_from_postgresql()
 
@@ -187,6 +216,15 @@ def extraxt_from_deepseek_main():
         df["НДС"] = ""
         df["период"] = ""
 
+        packed = {}
+        if pack_size > 1:
+            packed, stats = run_packed(
+                list(zip(df.index, df["osnd"])),
+                lambda content: extract_info(content, MODEL, PACKED_SYSTEM_PROMPT),
+                pack_size,
+            )
+            print(f"Пакетные запросы: {stats}")
+
         for i, row in df.iterrows():
             print("-" * 80)
             content = row["osnd"]
@@ -197,8 +235,12 @@ def extraxt_from_deepseek_main():
             # получаем информацию о входящих токенах
             # input_tokens = count_tokens(content)
 
-            # Извлечение информации
-            result = extract_info(content, MODEL)
+            # Извлечение информации (строки без результата пакетного режима - отдельным запросом)
+            if i in packed:
+                data = packed[i]
+            else:
+                result = extract_info(content, MODEL)
+                data = json.loads(result)
 
             # получаем информацию об исходящих токенах
             # output_tokens = count_tokens(result)
@@ -213,8 +255,7 @@ def extraxt_from_deepseek_main():
             # print(f"Выходные токены: {output_tokens:,} (${cost['output_cost']:.4f})")
             # print(f"ИТОГО: ${cost['total_cost']:.4f}")
 
-            # Парсинг и вывод результатов
-            data = json.loads(result)
+            # Вывод результатов
 
             # добавим в Series значения
             df.loc[i, "назначение"] = data["за_что"]
@@ -245,6 +286,14 @@ def extraxt_from_deepseek_main():
     df.to_excel("deepseek_parsed_data.xlsx", index=False)
 
 
+def extract_incremental_main(pack_size: int = 20, limit: Optional[int] = None):
+    """Инкрементальный прогон t_pb (t_pb_incremental.run_incremental) с моделью deepseek-chat"""
+    run_incremental(
+        connect_postgresql, JOB, lambda content, system_prompt: extract_info(content, "deepseek-chat", system_prompt),
+        START_DATE, pack_size, limit,
+    )
+
+
 if __name__ == "__main__":
     extraxt_from_deepseek_main()
     
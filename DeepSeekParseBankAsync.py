@@ -8,6 +8,9 @@ import os
 import pandas as pd
 import sys
 import subprocess
+from work_queue import AdaptiveLimiter, RateLimitError, retry_after_seconds, run_queue
+from packed_requests import PACKED_SYSTEM_PROMPT, PackStats, make_packs, solve_pack_async
+from osnd_dedup import dedup_osnd, fan_out, group_members
 
 # Проверка и установка необходимых модулей
 try:
@@ -71,7 +74,9 @@ async def extract_data_from_postgresql():
 
 
 # Извлечение информации с помощью DeepSeek
-async def extract_info(content: str, session: aiohttp.ClientSession, model: str = "deepseek-chat"):
+async def extract_info(content: str, session: aiohttp.ClientSession, model: str = "deepseek-chat",
+                       system_prompt: str = None):
+    """system_prompt - другой системный промпт (например, PACKED_SYSTEM_PROMPT для пакета назначений)"""
     headers = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
     
     payload = {
@@ -95,7 +100,7 @@ async def extract_info(content: str, session: aiohttp.ClientSession, model: str
                 "Дату выводи в формате: dd.mm.yyyy."
                 "Период выводи в формате: mm.yyyy"
                 "за_что - выводи коротко. Например: за товар, за услугу, комиссия... . "
-            },
+            } if system_prompt is None else {"role": "system", "content": system_prompt},
             {"role": "user", "content": content},
         ],
         "response_format": {"type": "json_object"},
@@ -108,10 +113,17 @@ async def extract_info(content: str, session: aiohttp.ClientSession, model: str
             if response.status == 200:
                 result = await response.json()
                 return result["choices"][0]["message"]["content"]
+            elif response.status in (429, 503):
+                # перегрузка: запрос будет повторен очередью, а параллельность - снижена
+                raise RateLimitError(
+                    f"API Error: {response.status}", retry_after_seconds(response.headers.get("Retry-After"))
+                )
             else:
                 error_text = await response.text()
                 print(f"Ошибка API: {response.status} - {error_text}")
                 raise Exception(f"API Error: {response.status} - {error_text}")
+    except RateLimitError:
+        raise
     except aiohttp.ClientPayloadError as e:
         print(f"Ошибка загрузки ответа: {str(e)}")
         return json.dumps({"за_что": "", "номер_договора": "", "номер_счета": "", "номер_накладной": "", "номер_заказа": "", "дата": "", "НДС": 0.0, "период": ""})
@@ -229,12 +241,27 @@ async def process_content(content: str, i: int, session: aiohttp.ClientSession,
         
         return data
         
+    except RateLimitError:
+        raise
     except Exception as e:
         print(f"Ошибка при обработке контента {i}: {str(e)}")
         return None
 
 
-async def extract_from_deepseek_main():
+async def extract_from_deepseek_main(concurrency: int = 5, max_concurrency: int = 30,
+                                     target_latency: float = 20.0, progress_path: str = "deepseek_parsed_data_async.jsonl",
+                                     pack_size: int = 20, template: bool = False):
+    """
+    Извлечение данных по всем строкам t_pb через очередь запросов (work_queue):
+    начинаем с concurrency одновременных запросов, лимит растет до max_concurrency,
+    пока нет ответов 429 и задержка ниже target_latency секунд.
+    pack_size - назначений в одном запросе (packed_requests); строки, не разобранные в пакетах,
+    отправляются по одной. 1 - только одиночные запросы.
+    Одинаковые назначения (osnd_dedup) отправляются один раз - по представителю группы, результат
+    раздается всем id_banka группы; template=True - группировать и назначения, отличающиеся только
+    числами и датами (строки, на которые результат не переносится, отправляются отдельно).
+    Каждый результат сразу записывается в DataFrame и дописывается в progress_path (JSON Lines).
+    """
     MODEL = "deepseek-chat"
     df = await extract_data_from_postgresql()
     df['sum_e'] = df['sum_e'].astype(float)
@@ -249,31 +276,82 @@ async def extract_from_deepseek_main():
         df["НДС"] = 0.0
         df["период"] = ""
 
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for i, row in df.iterrows():
-                task = process_content(row["osnd"], i, session, MODEL)
-                tasks.append(task)
-
-            # Выполняем задачи параллельно с ограничением в 5 одновременных запросов
-            for i in range(0, len(tasks), 5):
-                batch = tasks[i:i+5]
-                results = await asyncio.gather(*batch)
-
-                for j, data in enumerate(results):
-                    if data:
-                        idx = i + j
-                        df.loc[idx, "назначение"] = data["за_что"]
-                        df.loc[idx, "номер_договора"] = data["номер_договора"]
-                        df.loc[idx, "номер_счета"] = data["номер_счета"]
-                        df.loc[idx, "номер_накладной"] = data["номер_накладной"]
-                        df.loc[idx, "номер_заказа"] = data["номер_заказа"]
-                        df.loc[idx, "дата"] = data["дата"]
-                        df.loc[idx, "НДС"] = data["НДС"]
-                        df.loc[idx, "период"] = data["период"]
-
-                # Небольшая задержка между батчами
-                await asyncio.sleep(1)
+        representatives, dedup_stats = dedup_osnd(df, "osnd", template)
+        print(f"Дедупликация osnd: {dedup_stats}")
+        members = group_members(representatives)
+        done = set()
+        unresolved = []
+        with open(progress_path, "a", encoding="utf-8") as progress:
+
+            def write_row(idx, data):
+                if not data:
+                    return
+                done.add(idx)
+                df.loc[idx, "назначение"] = data["за_что"]
+                df.loc[idx, "номер_договора"] = data["номер_договора"]
+                df.loc[idx, "номер_счета"] = data["номер_счета"]
+                df.loc[idx, "номер_накладной"] = data["номер_накладной"]
+                df.loc[idx, "номер_заказа"] = data["номер_заказа"]
+                df.loc[idx, "дата"] = data["дата"]
+                df.loc[idx, "НДС"] = data["НДС"]
+                df.loc[idx, "период"] = data["период"]
+                progress.write(json.dumps({"id_banka": int(df.at[idx, "id_banka"]), **data}, ensure_ascii=False, default=str) + "\n")
+                progress.flush()
+
+            def on_result(idx, data):
+                # результат представителя - всем строкам группы
+                if not data:
+                    return
+                rows, failed = fan_out(df, representatives.loc[members[idx]], {idx: data}, "osnd", template)
+                for row, row_data in rows.items():
+                    write_row(row, row_data)
+                unresolved.extend(failed)
+
+            def on_error(idx, error):
+                print(f"Строка {idx} не обработана: {error}")
+
+            async with aiohttp.ClientSession() as session:
+                limiter = AdaptiveLimiter(initial=concurrency, maximum=max_concurrency, target_latency=target_latency)
+                if pack_size > 1:
+                    pack_stats = PackStats()
+                    pack_stats.rows = len(members)
+
+                    async def solve(pack):
+                        results = {}
+                        await solve_pack_async(
+                            pack,
+                            lambda content: extract_info(content, session, MODEL, PACKED_SYSTEM_PROMPT),
+                            results,
+                            pack_stats,
+                            reraise=(RateLimitError,),
+                        )
+                        return results
+
+                    def on_pack(pack, results):
+                        for idx, _ in pack:
+                            on_result(idx, results.get(idx))
+
+                    packs = make_packs([(idx, df.at[idx, "osnd"]) for idx in members], pack_size, max_chars=8000)
+                    stats = await run_queue(packs, solve, on_pack, None, limiter)
+                    print(f"Пакетные запросы: {pack_stats.as_dict()}, очередь: {stats}")
+
+                stats = await run_queue(
+                    [idx for idx in members if idx not in done],
+                    lambda idx: process_content(df.at[idx, "osnd"], idx, session, MODEL),
+                    on_result,
+                    on_error,
+                    limiter,
+                )
+                if unresolved:
+                    print(f"Строк с непереносимым результатом шаблона: {len(unresolved)}")
+                    await run_queue(
+                        unresolved,
+                        lambda idx: process_content(df.at[idx, "osnd"], idx, session, MODEL),
+                        write_row,
+                        on_error,
+                        limiter,
+                    )
+        print(f"Очередь запросов: {stats}")
 
     except Exception as e:
         print(f"Ошибка: {str(e)}")
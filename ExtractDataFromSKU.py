@@ -7,16 +7,43 @@
 import tiktoken
 import requests
 import json
-from typing import Dict
+from typing import Dict, Optional
 from dotenv import dotenv_values
+from sku_cache import SkuCache, text_version
+from work_queue import RateLimitError, retry_after_seconds
 
 # Загрузка переменных окружения
 config = dotenv_values(".env")
 API_KEY = config["DEEPSEEK_API_KEY"]  # Ключ должен быть в .env
 BASE_URL = "https://api.deepseek.com/v1"
 
-def extract_info(content: str, model: str = "deepseek-chat"):
-    """Извлечение информации с помощью DeepSeek"""
+SYSTEM_PROMPT = ("Извлеки грамм, шт, блок в json формате: "
+                 "{грамм: float, шт: float, блок:int}."
+                 "Если данных нет, тогда ставь 1")
+
+
+def _cache_key(model: str):
+    """Имя парсера и версия для кеша ответов (версия меняется вместе с промптом)"""
+    return f"deepseek:{model}", text_version(SYSTEM_PROMPT)
+
+
+def cached_info(content: str, model: str, cache: SkuCache) -> Optional[str]:
+    """Ответ модели из кеша (None - в кеше нет)"""
+    cached = cache.get(content, *_cache_key(model))
+    return None if cached is None else cached["content"]
+
+
+def store_info(content: str, model: str, cache: SkuCache, result: str):
+    """Сохраняет ответ в кеш; неразбираемый ответ не кешируем: следующий запуск спросит модель снова"""
+    try:
+        json.loads(result)
+    except ValueError:
+        return
+    cache.put(content, *_cache_key(model), {"content": result})
+
+
+def request_info(content: str, model: str = "deepseek-chat") -> str:
+    """Запрос к DeepSeek без кеша; при 429/503 - RateLimitError (с паузой из Retry-After)"""
     headers = {
         "Authorization": f"Bearer {API_KEY}",
         "Content-Type": "application/json"
@@ -27,9 +54,7 @@ def extract_info(content: str, model: str = "deepseek-chat"):
         "messages": [
             {
                 "role": "system",
-                "content": "Извлеки грамм, шт, блок в json формате: "
-                           "{грамм: float, шт: float, блок:int}."
-                           "Если данных нет, тогда ставь 1"
+                "content": SYSTEM_PROMPT
             },
             {
                 "role": "user",
@@ -48,10 +73,27 @@ def extract_info(content: str, model: str = "deepseek-chat"):
 
     if response.status_code == 200:
         return response.json()["choices"][0]["message"]["content"]
+    elif response.status_code in (429, 503):
+        # перегрузка: очередь (work_queue) повторит запрос и снизит параллельность
+        raise RateLimitError(
+            f"API Error: {response.status_code}", retry_after_seconds(response.headers.get("Retry-After"))
+        )
     else:
         raise Exception(f"API Error: {response.status_code} - {response.text}")
 
 
+def extract_info(content: str, model: str = "deepseek-chat", cache: Optional[SkuCache] = None):
+    """Извлечение информации с помощью DeepSeek (ответ берется из кеша, если он есть)"""
+    if cache is None:
+        return request_info(content, model)
+    cached = cached_info(content, model, cache)
+    if cached is not None:
+        return cached
+    result = request_info(content, model)
+    store_info(content, model, cache, result)
+    return result
+
+
 def count_tokens(text: str, model: str = "deepseek-chat") -> int:
     """Подсчет количества токенов в тексте"""
     encoding = tiktoken.get_encoding("cl100k_base")  # DeepSeek использует ту же кодировку
@@ -77,6 +119,7 @@ def calculate_cost(input_tokens: int, output_tokens: int, model: str = "deepseek
 
 if __name__ == "__main__":
     MODEL = "deepseek-chat"
+    cache = SkuCache()
 
     try:
         contents = [
@@ -95,11 +138,13 @@ if __name__ == "__main__":
             input_tokens = count_tokens(content)
 
             # Извлечение информации
-            result = extract_info(content, MODEL)
+            result = extract_info(content, MODEL, cache)
 
             # Парсинг и вывод результатов
             data = json.loads(result)
             print(f"{content}; грм: {data['грамм']}; шт: {data['шт']}; блок: {data['блок']}")
 
     except Exception as e:
-        print(f"Ошибка: {str(e)}")
\ No newline at end of file
+        print(f"Ошибка: {str(e)}")
+
+    cache.print_stats()
\ No newline at end of file
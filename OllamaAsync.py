@@ -11,18 +11,30 @@ import asyncio
 import aiohttp
 from typing import List, Dict, Any, Optional
 import os
+from sku_cache import SkuCache, text_version
+from llm_cache import cached_completion_async
 
-async def async_ollama_generate(model: str, prompt: str) -> str:
+async def async_ollama_generate(model: str, prompt: str, use_cache: bool = True) -> str:
     """
     Асинхронный запрос к Ollama API
 
     Args:
         model (str): Название модели
         prompt (str): Запрос к модели
+        use_cache (bool): Брать ответ из общего кеша LLM (llm_cache), если такой запрос уже был
 
     Returns:
         str: Ответ от модели
     """
+    return await cached_completion_async(
+        f"ollama:{model}", None, prompt, lambda: _ollama_generate(model, prompt), use_cache=use_cache,
+        # в кеш попадают только ответы, из которых извлекается json
+        validate=clean_llm_json_response,
+    )
+
+
+async def _ollama_generate(model: str, prompt: str) -> str:
+    """Запрос к Ollama без кеша: chat, при ошибке - generate"""
     # Используем официальный Python-клиент Ollama
     # Запускаем синхронный код в асинхронном контексте
     loop = asyncio.get_event_loop()
@@ -79,31 +91,40 @@ def clean_llm_json_response(response_text: str) -> Any:
         raise ValueError(f"Не удалось распарсить JSON: {e}")
 
 
-async def process_single_sku(model_name: str, item: str) -> Dict[str, Any]:
+SKU_PROMPT_TEMPLATE = ('''Извлеки в формате json.
+                {
+                    "sku": str,  # оригинальный SKU
+                    "grams_in_pcs": float,  # 55
+                    "pcs_in_block": float,  # 24
+                    "box_in_cartoon": int,  # 12
+                    "weight_unit": float,  # g,ml,kg,гр,грм,кг,мл
+                    "pcs_type": str,  # pcs,шт
+                    "box_type": str  # jar,box,банка,блок
+                }
+            ''')
+
+
+async def process_single_sku(model_name: str, item: str, cache: Optional[SkuCache] = None) -> Dict[str, Any]:
     """
     Обрабатывает один SKU асинхронно
 
     Args:
         model_name (str): Название модели Ollama
         item (str): SKU для обработки
+        cache (SkuCache): Кеш результатов (если задан, повторные SKU не отправляются в модель)
 
     Returns:
         Dict[str, Any]: Результат обработки
     """
     print(f"\nОбработка SKU: {item}")
 
-    prompt = (f'''sku:{item}.'''
-              '''Извлеки в формате json.
-                {
-                    "sku": str,  # оригинальный SKU
-                    "grams_in_pcs": float,  # 55
-                    "pcs_in_block": float,  # 24
-                    "box_in_cartoon": int,  # 12
-                    "weight_unit": float,  # g,ml,kg,гр,грм,кг,мл
-                    "pcs_type": str,  # pcs,шт
-                    "box_type": str  # jar,box,банка,блок
-                }
-            ''')
+    parser_name, version = f"ollama:{model_name}", text_version(SKU_PROMPT_TEMPLATE)
+    if cache is not None:
+        cached = cache.get(item, parser_name, version)
+        if cached is not None:
+            return {"original_sku": item, "parsed_data": cached}
+
+    prompt = f'''sku:{item}.''' + SKU_PROMPT_TEMPLATE
 
     # Асинхронный запрос к API
     response_text = await async_ollama_generate(model_name, prompt)
@@ -116,19 +137,23 @@ async def process_single_sku(model_name: str, item: str) -> Dict[str, Any]:
     print(json.dumps(clean_json, ensure_ascii=False, indent=2))
     print("-" * 50)
 
+    if cache is not None:
+        cache.put(item, parser_name, version, clean_json)
+
     return {
         "original_sku": item,
         "parsed_data": clean_json
     }
 
 
-async def main_async(text: List[str], save_to_file: bool = False) -> Optional[List[Dict[str, Any]]]:
+async def main_async(text: List[str], save_to_file: bool = False, cache: Optional[SkuCache] = None) -> Optional[List[Dict[str, Any]]]:
     """
     Асинхронная основная функция для обработки списка SKU
 
     Args:
         text (List[str]): Список SKU для обработки
         save_to_file (bool): Сохранять результаты в файл
+        cache (SkuCache): Кеш результатов разбора SKU
 
     Returns:
         Optional[List[Dict[str, Any]]]: Список результатов обработки или None в случае ошибки
@@ -137,7 +162,7 @@ async def main_async(text: List[str], save_to_file: bool = False) -> Optional[Li
 
     try:
         # Создаем задачи для асинхронного выполнения
-        tasks = [process_single_sku(model_name, item) for item in text]
+        tasks = [process_single_sku(model_name, item, cache) for item in text]
 
         # Выполняем все задачи параллельно
         results = await asyncio.gather(*tasks)
@@ -157,22 +182,25 @@ async def main_async(text: List[str], save_to_file: bool = False) -> Optional[Li
         return None
 
 
-def main(text: List[str], save_to_file: bool = False) -> Optional[List[Dict[str, Any]]]:
+def main(text: List[str], save_to_file: bool = False, cache: Optional[SkuCache] = None) -> Optional[List[Dict[str, Any]]]:
     """
     Обертка для запуска асинхронной функции
 
     Args:
         text (List[str]): Список SKU для обработки
         save_to_file (bool): Сохранять результаты в файл
+        cache (SkuCache): Кеш результатов разбора SKU
 
     Returns:
         Optional[List[Dict[str, Any]]]: Список результатов обработки или None в случае ошибки
     """
-    return asyncio.run(main_async(text, save_to_file))
+    return asyncio.run(main_async(text, save_to_file, cache))
 
 
 if __name__ == "__main__":
     from products_source import test_products
     print(f"Начало обработки... {datetime.now()}")
-    main(test_products[:3], save_to_file=True)
+    cache = SkuCache()
+    main(test_products[:3], save_to_file=True, cache=cache)
+    cache.print_stats()
     print(f"Конец обработки... {datetime.now()}")
\ No newline at end of file
@@ -0,0 +1,188 @@
+# Потоковое чтение описаний SKU из файлов каталогов.
+# Все функции - генераторы: файл читается частями, в памяти держится только текущая строка/часть,
+# поэтому каталоги на миллионы строк разбираются с постоянным расходом памяти.
+# Поддерживаются: JSON-массив (как Catalog_nomenclature.json), JSON Lines, CSV, xlsx
+# список строк в .py модуле - без импорта и компиляции модуля, и корпус .skuc (sku_corpus.py).
+
+import ast
+import csv
+import json
+import os
+import tokenize
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
+
+READ_CHUNK = 1 << 16
+
+
+def _field(item, column: str) -> str:
+    if isinstance(item, dict):
+        return str(item[column])
+    return str(item)
+
+
+def iter_json_array(path: str, column: str = "Description", chunk: int = READ_CHUNK) -> Iterator[str]:
+    """Элементы JSON-массива (строки или объекты с полем column), без загрузки файла целиком"""
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8-sig") as f:
+        buffer = f.read(chunk)
+        eof = not buffer
+        position = 0
+
+        def skip(chars: str) -> int:
+            # пропуск разделителей; подчитываем файл, пока буфер не кончится
+            nonlocal buffer, eof, position
+            while True:
+                while position < len(buffer) and buffer[position] in chars:
+                    position += 1
+                if position < len(buffer) or eof:
+                    return position
+                buffer, position = f.read(chunk), 0
+                eof = not buffer
+
+        skip(" \t\r\n")
+        if position >= len(buffer) or buffer[position] != "[":
+            raise ValueError(f"{path}: ожидается JSON-массив")
+        position += 1
+
+        while True:
+            skip(" \t\r\n,")
+            if position >= len(buffer):
+                raise ValueError(f"{path}: неожиданный конец файла")
+            if buffer[position] == "]":
+                return
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    # число на границе части может быть обрезано - дочитываем
+                    if end < len(buffer) or eof:
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                more = f.read(chunk)
+                eof = not more
+                buffer, position = buffer[position:] + more, 0
+            position = end
+            yield _field(item, column)
+
+
+def iter_ndjson(path: str, column: str = "Description") -> Iterator[str]:
+    """JSON Lines: один объект (или строка) на строку файла"""
+    with open(path, encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield _field(json.loads(line), column)
+
+
+def iter_csv(path: str, column: str = "Description", delimiter: str = ",") -> Iterator[str]:
+    """CSV с заголовком; если колонки column нет - берется первая"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        index = header.index(column) if column in header else 0
+        for row in reader:
+            if len(row) > index:
+                yield row[index]
+
+
+def iter_xlsx(path: str, column: str = "Description", sheet: Optional[str] = None) -> Iterator[str]:
+    """Лист xlsx (первая строка - заголовок) в режиме read_only openpyxl"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(value) if value is not None else "" for value in header]
+        index = header.index(column) if column in header else 0
+        for row in rows:
+            if len(row) > index and row[index] is not None:
+                yield str(row[index])
+    finally:
+        workbook.close()
+
+
+def iter_python_list(path: str, name: str = "test_products") -> Iterator[str]:
+    """
+    Строки из присваивания name = [...] в .py файле.
+    Файл разбирается tokenize построчно, модуль не импортируется и не компилируется.
+    """
+    with open(path, "rb") as f:
+        tokens = tokenize.tokenize(f.readline)
+        previous: List[str] = []
+        for token in tokens:
+            # ищем "name = ["
+            if token.type in (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT, tokenize.ENCODING):
+                continue
+            previous = (previous + [token.string])[-3:]
+            if previous == [name, "=", "["]:
+                break
+        else:
+            raise ValueError(f"{path}: список {name} не найден")
+
+        depth = 1
+        parts: List[str] = []
+        for token in tokens:
+            if token.type == tokenize.STRING and depth == 1:
+                parts.append(token.string)
+            elif token.type == tokenize.OP and token.string in "([{":
+                depth += 1
+            elif token.type == tokenize.OP and token.string in ")]}":
+                depth -= 1
+                if depth == 0:
+                    if parts:
+                        yield ast.literal_eval(" ".join(parts))
+                    return
+            elif token.type == tokenize.OP and token.string == "," and depth == 1:
+                if parts:
+                    # соседние литералы склеиваются, как это делает Python
+                    yield ast.literal_eval(" ".join(parts))
+                parts = []
+    raise ValueError(f"{path}: список {name} не закрыт")
+
+
+def _iter_corpus(corpus) -> Iterator[str]:
+    with corpus:
+        yield from corpus
+
+
+def iter_skus(
+    source: Union[str, os.PathLike, Iterable[str]], column: str = "Description", name: str = "test_products"
+) -> Iterator[str]:
+    """Описания SKU из источника: итерируемого объекта или файла (формат по расширению)"""
+    if not isinstance(source, (str, os.PathLike)):
+        return (str(text) for text in source)
+
+    extension = os.path.splitext(source)[1].lower()
+    if extension == ".json":
+        return iter_json_array(source, column)
+    if extension in (".jsonl", ".ndjson"):
+        return iter_ndjson(source, column)
+    if extension == ".csv":
+        return iter_csv(source, column)
+    if extension in (".xlsx", ".xlsm"):
+        return iter_xlsx(source, column)
+    if extension == ".py":
+        return iter_python_list(source, name)
+    if extension == ".skuc":
+        from sku_corpus import SkuCorpus
+
+        return _iter_corpus(SkuCorpus(source))
+    raise ValueError(f"Неподдерживаемый формат каталога: {source}")
+
+
+def batched(texts: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Разбивка потока на списки по size элементов"""
+    iterator = iter(texts)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -60,11 +60,11 @@ def test_model():
     
     # Сохраняем модель
     print("2. Сохранение модели...")
-    extractor.save_model('text_extractor_model.pkl')
+    extractor.save_model('text_extractor_model')
     
     # Загружаем модель
     print("3. Загрузка модели...")
-    loaded_extractor = TextExtractor.load_model('text_extractor_model.pkl')
+    loaded_extractor = TextExtractor.load_model('text_extractor_model')
     
     # Тестовые примеры
     test_texts = [
@@ -0,0 +1,384 @@
+# Хранилище признаков: матрица "документ - терм" (число вхождений) для корпуса текстов.
+# Каждый текст токенизируется один раз, строка матрицы хранится на диске в формате CSR
+# (data / indices / indptr в .npy, читаются через mmap) и переиспользуется всеми моделями,
+# которые векторизуют тексты с теми же параметрами анализатора (SKU, назначения платежей).
+#
+# Все файлы только дописываются: новые тексты - в texts.jsonl, новые термы - в terms.jsonl,
+# новые строки матрицы - отдельным сегментом. meta.json (число строк, термов и список сегментов)
+# записывается атомарно последним, поэтому недописанный хвост после падения процесса отбрасывается.
+#
+# CachedTfidfVectorizer - замена TfidfVectorizer: fit добавляет тексты в хранилище и берет из него строки,
+# transform хранилище только читает (новые тексты токенизирует сам, не добавляя).
+
+import hashlib
+import json
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+
+META_NAME = "meta.json"
+TEXTS_NAME = "texts.jsonl"
+TERMS_NAME = "terms.jsonl"
+
+# открытые хранилища процесса: (каталог, ключ параметров) -> FeatureStore
+_STORES: Dict[Tuple[str, str], "FeatureStore"] = {}
+
+
+def params_key(params: Dict) -> str:
+    """Версия корпуса: хэш параметров анализатора (другие параметры - другая матрица)"""
+    data = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+def open_store(root: str = "feature_store", **params) -> "FeatureStore":
+    """Хранилище для параметров анализатора; в процессе открывается один раз и разделяется моделями"""
+    key = (os.path.abspath(root), params_key(params))
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES[key] = FeatureStore(root, **params)
+    return store
+
+
+def _read_lines(path: str, count: int) -> List:
+    """Первые count записей JSON Lines; остальное (недописанный хвост) отрезается"""
+    if not os.path.exists(path):
+        if count:
+            raise ValueError(f"{path}: файл хранилища признаков не найден")
+        return []
+    with open(path, "rb") as f:
+        data = f.read()
+    lines = data.split(b"\n", count)
+    if len(lines) <= count:
+        raise ValueError(f"{path}: в файле {len(lines) - 1} записей вместо {count}")
+    if lines[count]:
+        with open(path, "r+b") as f:
+            f.truncate(len(data) - len(lines[count]))
+    # один вызов json.loads на весь файл вместо разбора по строкам
+    return json.loads(b"[" + b",".join(lines[:count]) + b"]")
+
+
+def _append_lines(path: str, items: Sequence):
+    if not items:
+        return
+    with open(path, "ab") as f:
+        f.write(b"".join(json.dumps(item, ensure_ascii=False).encode("utf-8") + b"\n" for item in items))
+
+
+class FeatureStore:
+    """
+    Матрица числа вхождений термов для корпуса текстов.
+
+        store = open_store("feature_store", ngram_range=(1, 3), token_pattern=TOKEN_PATTERN)
+        X = store.rows(texts)  # csr_matrix (len(texts), число термов), новые тексты добавляются
+        store.flush()
+
+    params - параметры CountVectorizer, определяющие токенизацию (ngram_range, token_pattern,
+    lowercase, analyzer ...). Данные лежат в root/<хэш параметров>.
+    Словарь только растет: строки, добавленные раньше, остаются верными, у матрицы добавляются столбцы.
+    flush_every - через сколько новых текстов сбрасывать сегмент на диск
+    """
+
+    def __init__(self, root: str = "feature_store", flush_every: int = 10000, **params):
+        self.params = params
+        self.key = params_key(params)
+        self.path = os.path.join(root, self.key)
+        self.flush_every = flush_every
+        self.analyzer = CountVectorizer(**params).build_analyzer()
+        self.texts: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        # сегменты: (data, indices, indptr, имя файла или None - еще не записан)
+        self._segments: List[list] = []
+        self._pending: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._saved_texts = 0
+        self._saved_terms = 0
+        self._next_segment = 0
+        self._blocks: List[sparse.csr_matrix] = []
+        self._matrix: Optional[sparse.csr_matrix] = None
+        self._load()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _load(self):
+        meta_path = self._file(META_NAME)
+        if not os.path.exists(meta_path):
+            os.makedirs(self.path, exist_ok=True)
+            # данные без meta.json - от прерванной первой записи
+            for name in (TEXTS_NAME, TERMS_NAME):
+                if os.path.exists(self._file(name)):
+                    os.remove(self._file(name))
+            return
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        self.texts = _read_lines(self._file(TEXTS_NAME), meta["rows"])
+        self.index = {text: i for i, text in enumerate(self.texts)}
+        self.terms = _read_lines(self._file(TERMS_NAME), meta["terms"])
+        self.vocabulary = {term: i for i, term in enumerate(self.terms)}
+        for name in meta["segments"]:
+            arrays = [np.load(self._file(f"{name}.{part}.npy"), mmap_mode="r") for part in ("data", "indices", "indptr")]
+            self._segments.append(arrays + [name])
+            self._next_segment = max(self._next_segment, int(name.rsplit("_", 1)[1]) + 1)
+        self._saved_texts = len(self.texts)
+        self._saved_terms = len(self.terms)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @property
+    def n_terms(self) -> int:
+        return len(self.terms)
+
+    def _tokenize(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        counts = Counter(self.analyzer(text))
+        columns = []
+        for term in counts:
+            column = self.vocabulary.get(term)
+            if column is None:
+                column = self.vocabulary[term] = len(self.terms)
+                self.terms.append(term)
+            columns.append(column)
+        order = np.argsort(columns)
+        indices = np.asarray(columns, dtype=np.int32)[order]
+        data = np.fromiter(counts.values(), dtype=np.int32, count=len(counts))[order]
+        return indices, data
+
+    def add(self, texts: Iterable[str]) -> np.ndarray:
+        """Номера строк текстов; новые тексты токенизируются и добавляются"""
+        ids = []
+        for text in texts:
+            row = self.index.get(text)
+            if row is None:
+                row = self.index[text] = len(self.texts)
+                self.texts.append(text)
+                self._pending.append(self._tokenize(text))
+            ids.append(row)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+        return np.asarray(ids, dtype=np.int64)
+
+    def _seal(self):
+        """Накопленные строки -> сегмент в памяти (дописывается к еще не записанному сегменту)"""
+        if not self._pending:
+            return
+        lengths = [len(indices) for indices, _ in self._pending]
+        indices = np.concatenate([indices for indices, _ in self._pending]).astype(np.int32, copy=False)
+        data = np.concatenate([data for _, data in self._pending]).astype(np.int32, copy=False)
+        self._pending = []
+        if self._segments and self._segments[-1][3] is None:
+            last_data, last_indices, last_indptr, _ = self._segments.pop()
+            self._blocks = self._blocks[:len(self._segments)]
+            lengths = np.diff(last_indptr).tolist() + lengths
+            indices = np.concatenate([last_indices, indices])
+            data = np.concatenate([last_data, data])
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        self._segments.append([data, indices, indptr, None])
+        self._matrix = None
+
+    def _block(self, i: int) -> sparse.csr_matrix:
+        """Сегмент i как csr_matrix (ширина - текущее число термов)"""
+        while len(self._blocks) <= i:
+            data, indices, indptr, _ = self._segments[len(self._blocks)]
+            self._blocks.append(sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, self.n_terms)))
+        block = self._blocks[i]
+        if block.shape[1] < self.n_terms:
+            block.resize(block.shape[0], self.n_terms)
+        return block
+
+    @property
+    def matrix(self) -> sparse.csr_matrix:
+        """Вся матрица (строки - тексты в порядке добавления, столбцы - термы)"""
+        self._seal()
+        if self._matrix is None:
+            blocks = [self._block(i) for i in range(len(self._segments))]
+            if not blocks:
+                self._matrix = sparse.csr_matrix((0, self.n_terms), dtype=np.int32)
+            elif len(blocks) == 1:
+                self._matrix = blocks[0]
+            else:
+                self._matrix = sparse.vstack(blocks, format="csr")
+        elif self._matrix.shape[1] < self.n_terms:
+            self._matrix.resize(self._matrix.shape[0], self.n_terms)
+        return self._matrix
+
+    def find(self, texts: Iterable[str]) -> np.ndarray:
+        """Номера строк текстов без добавления новых (-1 - текста нет в хранилище)"""
+        return np.fromiter((self.index.get(text, -1) for text in texts), dtype=np.int64)
+
+    def rows(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """
+        Строки матрицы для текстов (с добавлением новых).
+        Строки берутся из сегментов, вся матрица не собирается - новые тексты не требуют копирования корпуса.
+        """
+        return self.rows_by_id(self.add(texts))
+
+    def rows_by_id(self, ids: np.ndarray) -> sparse.csr_matrix:
+        """Строки матрицы по номерам (только чтение)"""
+        self._seal()
+        if not len(ids):
+            return sparse.csr_matrix((0, self.n_terms), dtype=np.int32)
+        starts = np.cumsum([0] + [len(segment[2]) - 1 for segment in self._segments])
+        owners = np.searchsorted(starts, ids, side="right") - 1
+        parts = []
+        positions = []
+        for owner in np.unique(owners):
+            mask = np.flatnonzero(owners == owner)
+            parts.append(self._block(owner)[ids[mask] - starts[owner]])
+            positions.append(mask)
+        if len(parts) == 1:
+            return parts[0]
+        result = sparse.vstack(parts, format="csr")
+        return result[np.argsort(np.concatenate(positions))]
+
+    def __getitem__(self, item: Union[slice, Sequence[int]]) -> sparse.csr_matrix:
+        return self.matrix[item]
+
+    def flush(self):
+        """Запись новых текстов, термов и строк на диск"""
+        self._seal()
+        unsaved = [segment for segment in self._segments if segment[3] is None]
+        if not unsaved and self._saved_terms == len(self.terms):
+            return
+        _append_lines(self._file(TEXTS_NAME), self.texts[self._saved_texts:])
+        _append_lines(self._file(TERMS_NAME), self.terms[self._saved_terms:])
+        for segment in unsaved:
+            name = f"segment_{self._next_segment:05d}"
+            self._next_segment += 1
+            for part, array in zip(("data", "indices", "indptr"), segment[:3]):
+                np.save(self._file(f"{name}.{part}.npy"), array)
+            segment[3] = name
+        meta = {
+            "params": self.params,
+            "rows": len(self.texts),
+            "terms": len(self.terms),
+            "segments": [segment[3] for segment in self._segments],
+        }
+        tmp_path = self._file(META_NAME + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self._file(META_NAME))
+        self._saved_texts = len(self.texts)
+        self._saved_terms = len(self.terms)
+
+    def compact(self):
+        """Объединение сегментов в один (меньше файлов и быстрее открытие)"""
+        if len(self._segments) + bool(self._pending) <= 1:
+            self.flush()
+            return
+        matrix = self.matrix
+        old = [segment[3] for segment in self._segments if segment[3] is not None]
+        self._segments = [[matrix.data, matrix.indices, matrix.indptr.astype(np.int64), None]]
+        self._blocks = []
+        self.flush()
+        for name in old:
+            for part in ("data", "indices", "indptr"):
+                os.remove(self._file(f"{name}.{part}.npy"))
+        self._matrix = None
+
+
+class CachedTfidfVectorizer:
+    """
+    TfidfVectorizer поверх FeatureStore: тексты, уже встречавшиеся в хранилище, повторно не токенизируются.
+
+        vectorizer = CachedTfidfVectorizer(open_store(ngram_range=(1, 3)), max_features=2000)
+        X = vectorizer.fit_transform(texts)
+
+    Параметры токенизации берутся из хранилища, max_features и параметры TF-IDF - как у TfidfVectorizer.
+    В pickle хранилище не попадает (только его каталог и параметры): после загрузки transform
+    токенизирует тексты сам, а fit снова открывает хранилище.
+    """
+
+    def __init__(self, store: FeatureStore, max_features: Optional[int] = None, norm: Optional[str] = "l2",
+                 use_idf: bool = True, smooth_idf: bool = True, sublinear_tf: bool = False):
+        self._store: Optional[FeatureStore] = store
+        self.store_root = os.path.dirname(store.path)
+        self.store_params = store.params
+        self.max_features = max_features
+        self.norm = norm
+        self.use_idf = use_idf
+        self.smooth_idf = smooth_idf
+        self.sublinear_tf = sublinear_tf
+
+    @property
+    def store(self) -> FeatureStore:
+        if self._store is None:
+            self._store = open_store(self.store_root, **self.store_params)
+        return self._store
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_store"] = None
+        state.pop("_analyzer", None)
+        return state
+
+    def fit_transform(self, texts: Iterable[str], y=None) -> sparse.csr_matrix:
+        store = self.store
+        counts = store.rows(texts)
+        store.flush()
+        totals = np.asarray(counts.sum(axis=0)).ravel().astype(np.int64)
+        # словарь - только термы обучающих текстов в алфавитном порядке, отбор max_features
+        # по частоте - той же сортировкой, что у TfidfVectorizer (одинаковый выбор при равных частотах)
+        columns = np.flatnonzero(totals)
+        columns = columns[np.argsort([store.terms[column] for column in columns], kind="stable")]
+        if self.max_features is not None and len(columns) > self.max_features:
+            columns = np.sort(columns[(-totals[columns]).argsort()[:self.max_features]])
+            columns = columns[np.argsort([store.terms[column] for column in columns], kind="stable")]
+        self.columns_ = columns
+        self.vocabulary_ = {store.terms[column]: i for i, column in enumerate(columns)}
+        self._tfidf = TfidfTransformer(
+            norm=self.norm, use_idf=self.use_idf, smooth_idf=self.smooth_idf, sublinear_tf=self.sublinear_tf
+        )
+        return self._tfidf.fit_transform(counts[:, columns].astype(np.float64))
+
+    def fit(self, texts: Iterable[str], y=None) -> "CachedTfidfVectorizer":
+        self.fit_transform(texts)
+        return self
+
+    def _counts(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """
+        Числа вхождений термов словаря. Хранилище только читается: тексты из него берутся готовыми,
+        остальные токенизируются и в хранилище не добавляются (иначе предсказания растили бы его без предела).
+        """
+        if self._store is None:
+            # хранилище не открыто (модель загружена из pickle) - токенизация по словарю модели
+            return self._analyze(texts)
+        texts = list(texts)
+        ids = self._store.find(texts)
+        known = np.flatnonzero(ids >= 0)
+        if len(known) == len(texts):
+            return self._store.rows_by_id(ids)[:, self.columns_]
+        unknown = np.flatnonzero(ids < 0)
+        counts = self._analyze([texts[i] for i in unknown])
+        if len(known):
+            counts = sparse.vstack([self._store.rows_by_id(ids[known])[:, self.columns_], counts], format="csr")
+            counts = counts[np.argsort(np.concatenate([known, unknown]))]
+        return counts
+
+    def _analyze(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """Токенизация текстов по словарю модели (без хранилища)"""
+        analyzer = self.__dict__.get("_analyzer")
+        if analyzer is None:
+            analyzer = self._analyzer = CountVectorizer(**self.store_params).build_analyzer()
+        indptr = [0]
+        indices = []
+        data = []
+        for text in texts:
+            counts = Counter(term for term in analyzer(text) if term in self.vocabulary_)
+            indices.extend(self.vocabulary_[term] for term in counts)
+            data.extend(counts.values())
+            indptr.append(len(indices))
+        counts = sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, len(self.vocabulary_)))
+        counts.sort_indices()
+        return counts
+
+    def transform(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        return self._tfidf.transform(self._counts(texts).astype(np.float64))
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        return np.array(list(self.vocabulary_), dtype=object)
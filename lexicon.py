@@ -0,0 +1,202 @@
+# Многоязычный словарь тары, единиц измерения и упаковки для SKU.
+# Все слова словаря собраны в один автомат Ахо-Корасик: текст просматривается за один проход,
+# находятся все вхождения (в том числе пересекающиеся) с позициями.
+# Используется regex-парсером (тип тары, единица веса), ML-парсером (единица веса)
+# и каскадом для проверки ответов LLM.
+
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Тара в порядке приоритета: при нескольких совпадениях побеждает первая (по умолчанию - box)
+CONTAINER_KEYWORDS = [
+    ("jar", ["jar", "jars", "банка", "банки", "банці", "kavanoz"]),
+    ("tray", ["tray", "trays", "лоток", "лотки", "tepsi"]),
+    ("vase", ["vase", "vases", "ваза", "вазы", "vazo"]),
+    ("bag", ["bag", "bags"]),
+    ("box", ["бл", "блок", "box", "boxes", "кт"]),
+]
+
+# Единицы измерения: g - масса, ml - объем
+UNIT_KEYWORDS = [
+    ("g", ["g", "gr", "г", "гр", "kg", "кг"]),
+    ("ml", ["ml", "мл", "l", "lt", "л"]),
+]
+
+# Вес считается объемом, если в тексте есть "ml" или число с "мл" ("500мл", "0,5 мл").
+# "мл" без числа встречается внутри слов ("Хамле"), однобуквенные "l"/"л" - тем более
+VOLUME_WORDS = frozenset(["ml"])
+VOLUME_UNITS = frozenset(["мл"])
+
+# Штучная упаковка
+PACKAGING_KEYWORDS = [
+    ("pcs", ["pcs", "pc", "шт", "штук", "ad", "adet"]),
+]
+
+
+class Token(NamedTuple):
+    start: int
+    end: int
+    text: str
+    kind: str  # container / unit / packaging
+    value: str  # тип тары, единица или вид упаковки
+
+
+class AhoCorasick:
+    """Автомат Ахо-Корасик: все вхождения набора слов в текст за один проход"""
+
+    def __init__(self, words: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[str]] = [[]]
+        for word in words:
+            self._add(word)
+        self._build()
+
+    def _add(self, word: str):
+        state = 0
+        for char in word:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = next_state
+        if word not in self.output[state]:
+            self.output[state].append(word)
+
+    def _build(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                # слова, заканчивающиеся в состоянии перехода по fail, тоже найдены
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """Вхождения (позиция конца, слово) в порядке конца в тексте"""
+        goto, fail, output = self.goto, self.fail, self.output
+        root = goto[0]
+        state = 0
+        found = []
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0) if state else root.get(char, 0)
+            if output[state]:
+                for word in output[state]:
+                    found.append((position + 1, word))
+        return found
+
+
+class Lexicon:
+    """
+    Словарь SKU: вид токена -> [(значение, [слова])].
+    Поиск без учета регистра; слова ищутся как подстроки, границы слов не проверяются.
+    """
+
+    def __init__(self, entries: Dict[str, Sequence[Tuple[str, Sequence[str]]]]):
+        self.entries = entries
+        # слово -> [(вид, значение, приоритет)]
+        self.words: Dict[str, List[Tuple[str, str, int]]] = {}
+        for kind, values in entries.items():
+            for priority, (value, keywords) in enumerate(values):
+                for keyword in keywords:
+                    self.words.setdefault(keyword.lower(), []).append((kind, value, priority))
+        self.automaton = AhoCorasick(self.words)
+
+    def tokens(self, text: str, kind: Optional[str] = None) -> List[Token]:
+        """Все найденные токены словаря (в порядке начала), при kind - только этого вида"""
+        lower = text.lower()
+        # lower() может изменить длину строки (например, "İ") - тогда позиции относятся к lower
+        source = text if len(lower) == len(text) else lower
+        result = []
+        for end, word in self.automaton.find(lower):
+            for word_kind, value, _ in self.words[word]:
+                if kind is None or word_kind == kind:
+                    result.append(Token(end - len(word), end, source[end - len(word):end], word_kind, value))
+        result.sort(key=lambda token: (token.start, -token.end))
+        return result
+
+    def classify(self, text: str, default: str = "box") -> Tuple[str, str]:
+        """Тип тары и единица веса за один проход (см. container_type и weight_unit)"""
+        best = None
+        unit = "g"
+        lower = text.lower()
+        for end, word in self.automaton.find(lower):
+            if word in VOLUME_WORDS or (word in VOLUME_UNITS and _number_before(lower, end - len(word)) is not None):
+                unit = "ml"
+            for kind, value, priority in self.words[word]:
+                if kind == "container" and (best is None or priority < best[0]):
+                    best = (priority, value)
+        return (best[1] if best else default), unit
+
+    def container_type(self, text: str, default: str = "box") -> str:
+        """Тип тары с наивысшим приоритетом среди найденных"""
+        return self.classify(text, default)[0]
+
+    def weight_unit(self, text: str) -> str:
+        """ml, если в тексте есть "ml" или объем в "мл", иначе g"""
+        return self.classify(text)[1]
+
+    def unit_tokens(self, text: str) -> List[Token]:
+        """
+        Единицы измерения, которые действительно стоят в тексте как единицы: сразу после числа ("25g", "40 гр")
+        или отдельным словом. Буквы внутри слов ("G" в "Gummy", "g" в "Bag") не считаются.
+        """
+        result = []
+        for token in self.tokens(text, "unit"):
+            before = text[token.start - 1] if token.start > 0 else " "
+            after = text[token.end] if token.end < len(text) else " "
+            if before.isalpha():
+                continue
+            if after.isalpha() and _number_before(text, token.start) is None:
+                continue
+            result.append(token)
+        return result
+
+    def validate_weight(self, text: str, weight: float) -> bool:
+        """
+        Проверка веса (например, из ответа LLM): число должно стоять в тексте прямо перед единицей измерения.
+        Если единиц в тексте нет, проверять нечего - результат принимается.
+        """
+        units = self.unit_tokens(text)
+        if not units:
+            return True
+        for token in units:
+            number = _number_before(text, token.start)
+            if number is not None and abs(number - weight) < 1e-9:
+                return True
+            # вес в килограммах/литрах, а ответ - в граммах/миллилитрах
+            if number is not None and token.text.lower() in ("kg", "кг", "l", "lt", "л") and abs(number * 1000 - weight) < 1e-6:
+                return True
+        return False
+
+
+def _number_before(text: str, position: int) -> Optional[float]:
+    """Число, заканчивающееся в позиции position (допускается пробел перед единицей)"""
+    end = position
+    if end > 0 and text[end - 1] == " ":
+        end -= 1
+    start = end
+    while start > 0 and (text[start - 1].isdigit() or text[start - 1] in ",."):
+        start -= 1
+    digits = text[start:end].strip(",.").replace(",", ".")
+    try:
+        return float(digits)
+    except ValueError:
+        return None
+
+
+LEXICON = Lexicon({
+    "container": CONTAINER_KEYWORDS,
+    "unit": UNIT_KEYWORDS,
+    "packaging": PACKAGING_KEYWORDS,
+})
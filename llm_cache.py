@@ -0,0 +1,202 @@
+# Общий дисковый кеш ответов LLM (SQLite) для DeepSeek, OpenRouter и Ollama.
+# Ключ - sha256(модель, системный промпт, текст запроса, параметры запроса), поэтому повторный
+# прогон того же месяца или догрузка истории не отправляют одинаковые запросы повторно.
+# Записи живут ttl секунд; при превышении max_entries удаляются давно не читавшиеся (LRU).
+# Недетерминированные вызовы (temperature > 0, намеренная "случайность") кеш не используют:
+# use_cache=False у вызывающей функции.
+# Сохраняются только ответы, прошедшие проверку вызывающего (validate - тот же разбор, что делает
+# он сам): иначе испорченный ответ повторялся бы из кеша ttl секунд и повторы запроса были бы бесполезны.
+# Записи, не прошедшие проверку при чтении (сохраненные до ее появления), удаляются.
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+DEFAULT_LLM_CACHE_PATH = "llm_cache.sqlite"
+DEFAULT_TTL = 30 * 24 * 3600  # 30 дней
+DEFAULT_MAX_ENTRIES = 200_000
+# проверка размера кеша - раз в EVICT_EVERY записей (COUNT(*) - полный проход по индексу)
+EVICT_EVERY = 100
+
+
+def request_key(model: str, system_prompt: Optional[str], content: str, params: Optional[Dict] = None) -> str:
+    """Ключ запроса: sha256 модели, системного промпта, текста и параметров (json с сортировкой ключей)"""
+    parts = [model, system_prompt or "", content, json.dumps(params or {}, ensure_ascii=False, sort_keys=True)]
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+class LlmCache:
+    """
+    Кеш ответов LLM (текст ответа модели как есть).
+
+        cache = LlmCache()
+        answer = cache.cached(model, system_prompt, content, lambda: request(...), params)
+    """
+
+    def __init__(self, path: str = DEFAULT_LLM_CACHE_PATH, ttl: Optional[float] = DEFAULT_TTL,
+                 max_entries: Optional[int] = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # check_same_thread=False: кеш вызывается и из потоков run_in_executor
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,  -- request_key(модель, системный промпт, текст, параметры)
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,  -- ответ модели
+                created REAL NOT NULL,
+                accessed REAL NOT NULL  -- время последнего чтения (для LRU)
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed)")
+        self.conn.commit()
+        self._puts = 0
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    def get(self, model: str, system_prompt: Optional[str], content: str, params: Optional[Dict] = None) -> Optional[str]:
+        """Ответ из кеша или None (нет записи или она старше ttl)"""
+        key = request_key(model, system_prompt, content, params)
+        row = self.conn.execute("SELECT response, created FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+            if row is not None:
+                self.conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.conn.commit()
+            self.misses[model] += 1
+            return None
+        self.conn.execute("UPDATE llm_cache SET accessed = ? WHERE key = ?", (now, key))
+        self.conn.commit()
+        self.hits[model] += 1
+        return row[0]
+
+    def put(self, model: str, system_prompt: Optional[str], content: str, response: str,
+            params: Optional[Dict] = None):
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, model, response, created, accessed) VALUES (?, ?, ?, ?, ?)",
+            (request_key(model, system_prompt, content, params), model, response, now, now),
+        )
+        self.conn.commit()
+        self._puts += 1
+        if self._puts % EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Удаление устаревших записей и самых давно читавшихся сверх max_entries; возвращает число удаленных"""
+        removed = 0
+        if self.ttl is not None:
+            removed += self.conn.execute("DELETE FROM llm_cache WHERE created < ?", (time.time() - self.ttl,)).rowcount
+        if self.max_entries is not None:
+            excess = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                removed += self.conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY accessed LIMIT ?)",
+                    (excess,),
+                ).rowcount
+        self.conn.commit()
+        return removed
+
+    def delete(self, model: str, system_prompt: Optional[str], content: str, params: Optional[Dict] = None):
+        self.conn.execute("DELETE FROM llm_cache WHERE key = ?", (request_key(model, system_prompt, content, params),))
+        self.conn.commit()
+
+    @staticmethod
+    def _valid(response: str, validate: Optional[Callable[[str], Any]]) -> bool:
+        if validate is None:
+            return True
+        try:
+            validate(response)
+        except Exception:
+            return False
+        return True
+
+    def _get_valid(self, model: str, system_prompt: Optional[str], content: str, params: Optional[Dict],
+                   validate: Optional[Callable[[str], Any]]) -> Optional[str]:
+        response = self.get(model, system_prompt, content, params)
+        if response is not None and not self._valid(response, validate):
+            self.delete(model, system_prompt, content, params)
+            self.hits[model] -= 1
+            self.misses[model] += 1
+            return None
+        return response
+
+    def cached(self, model: str, system_prompt: Optional[str], content: str, call: Callable[[], str],
+               params: Optional[Dict] = None, validate: Optional[Callable[[str], Any]] = None) -> str:
+        """
+        Ответ из кеша или call() с сохранением ответа (исключения call не кешируются).
+        validate(ответ) - проверка вызывающего (например, json.loads): если она бросает исключение,
+        ответ возвращается, но не сохраняется.
+        """
+        response = self._get_valid(model, system_prompt, content, params, validate)
+        if response is None:
+            response = call()
+            if self._valid(response, validate):
+                self.put(model, system_prompt, content, response, params)
+        return response
+
+    async def cached_async(self, model: str, system_prompt: Optional[str], content: str,
+                           call: Callable[[], Awaitable[str]], params: Optional[Dict] = None,
+                           validate: Optional[Callable[[str], Any]] = None) -> str:
+        """Как cached, но call - корутина"""
+        response = self._get_valid(model, system_prompt, content, params, validate)
+        if response is None:
+            response = await call()
+            if self._valid(response, validate):
+                self.put(model, system_prompt, content, response, params)
+        return response
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Счетчики попаданий/промахов по моделям за время жизни объекта"""
+        return {
+            model: {"hits": self.hits[model], "misses": self.misses[model]}
+            for model in sorted(set(self.hits) | set(self.misses))
+        }
+
+    def print_stats(self):
+        for model, counts in self.stats().items():
+            total = counts["hits"] + counts["misses"]
+            rate = counts["hits"] / total * 100 if total else 0.0
+            print(f"Кеш LLM [{model}]: попаданий {counts['hits']}, промахов {counts['misses']} ({rate:.1f}% попаданий)")
+
+    def close(self):
+        self.conn.close()
+
+
+_CACHES: Dict[str, LlmCache] = {}
+
+
+def llm_cache(path: str = DEFAULT_LLM_CACHE_PATH) -> LlmCache:
+    """Общий кеш процесса для файла path (открывается один раз)"""
+    if path not in _CACHES:
+        _CACHES[path] = LlmCache(path)
+    return _CACHES[path]
+
+
+def cached_completion(model: str, system_prompt: Optional[str], content: str, call: Callable[[], str],
+                      params: Optional[Dict] = None, use_cache: bool = True,
+                      validate: Optional[Callable[[str], Any]] = None) -> str:
+    """
+    call() через общий кеш; use_cache=False - всегда новый запрос, ответ не сохраняется.
+    validate - проверка ответа перед сохранением (см. LlmCache.cached)
+    """
+    if not use_cache:
+        return call()
+    return llm_cache().cached(model, system_prompt, content, call, params, validate)
+
+
+async def cached_completion_async(model: str, system_prompt: Optional[str], content: str,
+                                  call: Callable[[], Awaitable[Any]], params: Optional[Dict] = None,
+                                  use_cache: bool = True, validate: Optional[Callable[[str], Any]] = None) -> str:
+    """Асинхронный вариант cached_completion"""
+    if not use_cache:
+        return await call()
+    return await llm_cache().cached_async(model, system_prompt, content, call, params, validate)
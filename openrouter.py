@@ -1,6 +1,7 @@
 # https://openrouter.ai/
 # https://www.youtube.com/watch?v=j0VfsZxdUEg
 import asyncio
+import datetime as dt
 from datetime import datetime
 import aiohttp
 from openai import OpenAI
@@ -9,6 +10,10 @@ import os
 import json
 import pandas as pd
 import asyncpg
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from packed_requests import PACKED_SYSTEM_PROMPT, run_packed_async
+from llm_cache import llm_cache
+from t_pb_incremental import process_new_rows_async
 
 # Загружаем переменные окружения из .env файла
 load_dotenv()
@@ -27,38 +32,98 @@ model_and_api_keys = [
 
 client = None
 
-# из базы pg, таб t_pb извлечем уникальные данные
-async def extract_data_from_postgresql():
+# Начало выборки при полном прогоне и при первом инкрементальном запуске
+START_DATE = dt.date(2025, 3, 1)
+# Имя задания в таблице состояния инкрементальной обработки (t_pb_incremental)
+JOB = "openrouter"
+
+
+async def connect_postgresql():
     user = os.getenv("PG_USER")
     password = os.getenv("PG_PASSWORD")
     host = os.getenv("PG_HOST_LOCAL")  # os.getenv("PG_HOST"]
     port = os.getenv("PG_PORT")
     dbname = os.getenv("PG_DBNAME")
 
-    conn = await asyncpg.connect(
+    return await asyncpg.connect(
         user=user, password=password, host=host,
         port=port, database=dbname
     )
 
+
+# из базы pg, таб t_pb извлечем уникальные данные
+async def extract_data_from_postgresql(start_date: dt.date = START_DATE):
+    conn = await connect_postgresql()
+
     records = await conn.fetch(
-        """SELECT DISTINCT osnd FROM t_pb WHERE date_time_dat_od_tim_p::date >= '01.03.2025'::date;"""
+        """SELECT DISTINCT osnd FROM t_pb WHERE date_time_dat_od_tim_p::date >= $1;""", start_date
     )
     await conn.close()
 
     return pd.DataFrame(records, columns=["osnd"])
 
 
-async def parse_with_openrouter(content: str)-> dict:
+SYSTEM_PROMPT = (
+    "Получи НДС, дату, номера договора, накладной, счета "
+    "строго в json формате: "
+    "{"
+    "за_что: str,"
+    "номер_договора: str, "
+    "номер_счета: str, "
+    "номер_накладной: str,"
+    "номер_заказа: str,"
+    "дата:date,"
+    "НДС:float,"
+    "период:str"
+    "}."
+    " Если отсутствует информация, выведи пустоту. НДС извлеки не %, а сумму. "
+    "Дату выводи в формате: dd.mm.yyyy."
+    "Период выводи в формате: mm.yyyy."
+)
+
+
+def clean_json(json_str: str) -> str:
+    """Очищаем строку от маркеров кода markdown"""
+    if json_str.startswith('```json'):
+        return json_str.replace('```json', '').replace('```', '').strip()
+    return json_str
+
+
+def parse_single_result(json_str: str) -> dict:
+    """Ответ на одно назначение: None в НДС -> 0.0, в остальных полях -> пустая строка"""
+    result_dict = json.loads(clean_json(json_str))
+
+    # Преобразуем None в 0 для поля НДС
+    if result_dict.get('НДС') is None:
+        result_dict['НДС'] = 0.0
+
+    # Проверяем и преобразуем другие поля при необходимости
+    for key in ['за_что', 'номер_договора', 'номер_счета', 'номер_накладной', 'номер_заказа', 'дата', 'период']:
+        if result_dict.get(key) is None:
+            result_dict[key] = ""
+
+    return result_dict
+
+
+async def request_openrouter(system_prompt: str, content: str, parse: Callable[[str], Any],
+                             use_cache: bool = True) -> Any:
     """
-    Парсит текст с помощью OpenRouter API
-    
-    Args:
-        content: Текст для парсинга
-        model: Модель для использования (если None, используется gemini_model)
-    
-    Returns:
-        Распарсенный JSON ответ в виде словаря Python
+    Запрос к OpenRouter с перебором моделей (3 круга по model_and_api_keys).
+    parse(json_str) - разбор ответа; при json.JSONDecodeError пробуется следующая модель.
+    use_cache - общий кеш LLM (llm_cache): ключ - список моделей, а не модель, ответившая последней;
+    кешируются только разобранные ответы.
+    Возвращает результат parse или словарь {"error": ...}
     """
+    cache_model = "openrouter"
+    cache_params = {"models": [list(item.keys())[0] for item in model_and_api_keys], "response_format": "json_object"}
+    if use_cache:
+        cached = llm_cache().get(cache_model, system_prompt, content, cache_params)
+        if cached is not None:
+            try:
+                return parse(cached)
+            except json.JSONDecodeError:
+                pass
+
     for i in range(3):
         for model_and_api_key in model_and_api_keys:
             model = list(model_and_api_key.keys())[0]
@@ -71,24 +136,7 @@ async def parse_with_openrouter(content: str)-> dict:
                 completion = client.chat.completions.create(
                     model=model,
                     messages=[
-                        {
-                            "role": "system",
-                            "content": "Получи НДС, дату, номера договора, накладной, счета "
-                            "строго в json формате: "
-                            "{"
-                            "за_что: str,"
-                            "номер_договора: str, "
-                            "номер_счета: str, "
-                            "номер_накладной: str,"
-                            "номер_заказа: str,"
-                            "дата:date,"
-                            "НДС:float,"
-                            "период:str"
-                            "}."
-                            " Если отсутствует информация, выведи пустоту. НДС извлеки не %, а сумму. "
-                            "Дату выводи в формате: dd.mm.yyyy."
-                            "Период выводи в формате: mm.yyyy.",
-                        },
+                        {"role": "system", "content": system_prompt},
                         {"role": "user", "content": content},
                     ],
                     response_format={"type": "json_object"},
@@ -100,25 +148,10 @@ async def parse_with_openrouter(content: str)-> dict:
 
                     # Преобразуем строку JSON в словарь Python
                     try:
-                        # Очищаем строку от маркеров кода и лишних символов
-                        if json_str.startswith('```json'):
-                            # Удаляем маркеры кода markdown
-                            clean_json = json_str.replace('```json', '').replace('```', '').strip()
-                        else:
-                            clean_json = json_str
-
-                        result_dict = json.loads(clean_json)
-
-                        # Преобразуем None в 0 для поля НДС
-                        if result_dict.get('НДС') is None:
-                            result_dict['НДС'] = 0.0
-
-                        # Проверяем и преобразуем другие поля при необходимости
-                        for key in ['за_что', 'номер_договора', 'номер_счета', 'номер_накладной', 'номер_заказа', 'дата', 'период']:
-                            if result_dict.get(key) is None:
-                                result_dict[key] = ""
-
-                        return result_dict
+                        result = parse(json_str)
+                        if use_cache:
+                            llm_cache().put(cache_model, system_prompt, content, json_str, cache_params)
+                        return result
                     except json.JSONDecodeError:
                         print("Ошибка при декодировании JSON")
                         print(f"Проблемная строка: {json_str}")
@@ -147,13 +180,59 @@ async def parse_with_openrouter(content: str)-> dict:
     return {"error": "Exceeded maximum retry attempts"}
 
 
-async def DeepSeekParseBankOpenRouter_main():
+async def parse_with_openrouter(content: str, use_cache: bool = True)-> dict:
+    """
+    Парсит текст с помощью OpenRouter API
+    
+    Args:
+        content: Текст для парсинга
+        use_cache: Брать ответ из общего кеша LLM (llm_cache)
+    
+    Returns:
+        Распарсенный JSON ответ в виде словаря Python
+    """
+    return await request_openrouter(SYSTEM_PROMPT, content, parse_single_result, use_cache)
+
+
+async def send_pack_to_openrouter(content: str) -> str:
+    """Один пакетный запрос (PACKED_SYSTEM_PROMPT); текст ответа или исключение - тогда пакет делится"""
+
+    def parse(json_str: str) -> str:
+        json_str = clean_json(json_str)
+        json.loads(json_str)  # невалидный JSON - следующая модель
+        return json_str
+
+    result = await request_openrouter(PACKED_SYSTEM_PROMPT, content, parse)
+    if isinstance(result, dict):
+        raise RuntimeError(result["error"])
+    return result
+
+
+async def parse_packed_with_openrouter(contents: List[str], pack_size: int = 20) -> Tuple[List[dict], Dict[str, int]]:
+    """
+    Пакетный разбор назначений (packed_requests): pack_size назначений в одном запросе.
+    Назначения без результата в пакетах разбираются по одному (parse_with_openrouter).
+    Возвращает (результаты в порядке contents, статистика пакетов)
+    """
+    packed, stats = await run_packed_async(list(enumerate(contents)), send_pack_to_openrouter, pack_size)
+    print(f"Пакетные запросы: {stats}")
+    results = []
+    for i, content in enumerate(contents):
+        results.append(packed[i] if i in packed else await parse_with_openrouter(content))
+    return results, stats
+
+
+async def DeepSeekParseBankOpenRouter_main(pack_size: int = 20):
+    """pack_size - назначений в одном запросе; 1 - по одному запросу на строку"""
     df = await extract_data_from_postgresql()
     print(df)
-    for i, row in df.iterrows():
+    contents = df["osnd"].tolist()
+    if pack_size > 1:
+        results, _ = await parse_packed_with_openrouter(contents, pack_size)
+    else:
+        results = [await parse_with_openrouter(content) for content in contents]
+    for i, (content, result) in enumerate(zip(contents, results)):
         print("-" * 80)
-        content = row["osnd"]
-        result = await parse_with_openrouter(content)
         if 'error' in result.keys():
             print(f"Ошибка при обработке контента {content}:")
             print(result['error'])
@@ -170,6 +249,24 @@ async def DeepSeekParseBankOpenRouter_main():
             f"период:{result['период']}\n"
         )
 
+async def openrouter_incremental_main(pack_size: int = 20, limit: Optional[int] = None):
+    """
+    Инкрементальный прогон (для ночного запуска): только строки t_pb после сохраненного водяного знака
+    (при первом запуске - с START_DATE), результаты - upsert в t_pb_llm_results.
+    limit - строк за проход (None - все новые).
+    """
+
+    async def parse(contents: List[str]) -> Dict[str, dict]:
+        results, _ = await parse_packed_with_openrouter(contents, pack_size)
+        return dict(zip(contents, results))
+
+    conn = await connect_postgresql()
+    try:
+        await process_new_rows_async(conn, JOB, parse, START_DATE, limit)
+    finally:
+        await conn.close()
+
+
 # Получение списка моделей. Далее из них будем отбирать бесплатные
 async def get_models():
     url = "https://openrouter.ai/api/v1/models"
@@ -0,0 +1,183 @@
+# Нормализация и дедупликация назначений платежей (osnd) перед отправкой в LLM.
+# Повторяющиеся назначения (аренда, зарплата, один и тот же шаблон счета поставщика) в t_pb
+# встречаются сотни раз - в модель отправляется одно назначение-представитель на группу,
+# результат раздается всем строкам группы (всем id_banka).
+#
+# Группы:
+#   точные - совпадают после нормализации (пробелы, регистр, кавычки);
+#   шаблонные (template=True) - совпадают после замены чисел и дат на <n>/<d>.
+# В шаблонной группе результат представителя переносится на строку подстановкой: каждое число
+# в значении поля ищется среди чисел (слотов) текста представителя и заменяется числом с той же
+# позиции в тексте строки. Если значение перенести нельзя (число вычислено моделью, совпадает с
+# несколькими слотами, которые у строки разные), строка обрабатывается отдельным запросом.
+
+import re
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+_QUOTES = str.maketrans({"«": '"', "»": '"', "“": '"', "”": '"', "„": '"', "'": '"', "`": '"', "’": '"'})
+
+# Дата (12.03.2025, 01/02/25) - один слот; иначе число с необязательной дробной частью
+_SLOT = re.compile(r"(?<!\d)(\d{1,2}[./-]\d{1,2}[./-](?:\d{4}|\d{2}))(?!\d)|\d+(?:[.,]\d+)?")
+# Слот-дата и период (03.2025) - единственная часть слота, которая переносится подстрокой
+_DATE = re.compile(r"\d{1,2}[./-]\d{1,2}[./-](?:\d{4}|\d{2})")
+_PERIOD = re.compile(r"\d{1,2}[./-](?:\d{4}|\d{2})")
+
+
+def normalize_osnd(text: str) -> str:
+    """Канонический вид: схлопнутые пробелы, нижний регистр, единые кавычки"""
+    return " ".join(str(text).translate(_QUOTES).split()).casefold()
+
+
+def template_osnd(text: str) -> Tuple[str, List[str]]:
+    """Шаблон (числа -> <n>, даты -> <d>) и список замененных слотов по порядку"""
+    slots: List[str] = []
+
+    def replace(match):
+        slots.append(match.group())
+        return "<d>" if match.group(1) else "<n>"
+
+    return _SLOT.sub(replace, text), slots
+
+
+def _same_slot(a: str, b: str) -> bool:
+    """Слоты равны как строки (запятая = точка) или как числа"""
+    a, b = a.replace(",", "."), b.replace(",", ".")
+    if a == b:
+        return True
+    try:
+        return float(a) == float(b)
+    except ValueError:
+        return False
+
+
+def _transfer_slot(value: str, source: List[str], target: List[str]) -> Optional[str]:
+    """Слот значения поля у представителя (source) -> слот у строки (target); None - неоднозначно"""
+    candidates = {target[i] for i, slot in enumerate(source) if _same_slot(value, slot)}
+    if len(candidates) == 1:
+        return candidates.pop()
+    if candidates:
+        return None
+    # часть слота - только период (03.2025) из даты (12.03.2025) при одинаковой длине дат;
+    # числа, вычисленные моделью (НДС 200 из суммы 1200.00), подстрокой не переносятся
+    if not _PERIOD.fullmatch(value):
+        return None
+    candidates = set()
+    for i, slot in enumerate(source):
+        if not _DATE.fullmatch(slot) or not _DATE.fullmatch(target[i]):
+            continue
+        offset = slot.find(value)
+        if offset >= 0 and len(slot) == len(target[i]):
+            candidates.add(target[i][offset:offset + len(value)])
+    return candidates.pop() if len(candidates) == 1 else None
+
+
+def transfer_result(data: Dict, source: List[str], target: List[str]) -> Optional[Dict]:
+    """
+    Перенос результата представителя на строку того же шаблона.
+    source, target - слоты текстов представителя и строки. None - хотя бы одно поле не переносится.
+    """
+    if source == target:
+        return dict(data)
+    result = {}
+    for field, value in data.items():
+        if value is None or value == "":
+            result[field] = value
+            continue
+        value_template, value_slots = template_osnd(str(value))
+        if not value_slots:
+            result[field] = value
+            continue
+        transferred = []
+        for slot in value_slots:
+            slot = _transfer_slot(slot, source, target)
+            if slot is None:
+                return None
+            transferred.append(slot)
+        parts = iter(transferred)
+        text = re.sub(r"<[nd]>", lambda _: next(parts), value_template)
+        if isinstance(value, (int, float)):
+            try:
+                text = float(text.replace(",", "."))
+            except ValueError:
+                return None
+        result[field] = text
+    return result
+
+
+def dedup_osnd(df: pd.DataFrame, column: str = "osnd", template: bool = False) -> Tuple[pd.Series, Dict[str, float]]:
+    """
+    Группировка строк df по нормализованному (или шаблонному) назначению.
+    Возвращает (Series: индекс строки -> индекс представителя группы, статистика).
+    Представитель - первая строка группы; в модель отправляются df.loc[representatives.unique()].
+    """
+    normalized = df[column].fillna("").map(normalize_osnd)
+    keys = normalized.map(lambda text: template_osnd(text)[0]) if template else normalized
+    first = pd.Series(df.index, index=df.index).groupby(keys.values, sort=False).transform("first")
+    stats = {
+        "rows": len(df),
+        "unique": int(df[column].nunique()),
+        "normalized": int(normalized.nunique()),
+        "groups": int(first.nunique()),
+    }
+    stats["reduction"] = round(1 - stats["groups"] / stats["rows"], 4) if stats["rows"] else 0.0
+    return first, stats
+
+
+def fan_out(df: pd.DataFrame, representatives: pd.Series, results: Dict[Hashable, Dict],
+            column: str = "osnd", template: bool = False) -> Tuple[Dict[Hashable, Dict], List[Hashable]]:
+    """
+    Раздача результатов представителей (results: индекс представителя -> результат) строкам групп.
+    Возвращает ({индекс строки: результат}, строки, для которых результат не переносится).
+    Строки групп без результата представителя в обоих списках отсутствуют.
+    """
+    out: Dict[Hashable, Dict] = {}
+    unresolved: List[Hashable] = []
+    slots: Dict[Hashable, List[str]] = {}
+
+    def row_slots(idx):
+        if idx not in slots:
+            slots[idx] = template_osnd(normalize_osnd(df.at[idx, column]))[1]
+        return slots[idx]
+
+    for idx, representative in representatives.items():
+        data = results.get(representative)
+        if data is None:
+            continue
+        if not template or idx == representative:
+            out[idx] = dict(data)
+            continue
+        result = transfer_result(data, row_slots(representative), row_slots(idx))
+        if result is None:
+            unresolved.append(idx)
+        else:
+            out[idx] = result
+    return out, unresolved
+
+
+def group_members(representatives: pd.Series) -> Dict[Hashable, List[Hashable]]:
+    """Представитель -> все строки его группы (включая его самого)"""
+    return {key: list(rows) for key, rows in representatives.groupby(representatives.values, sort=False).groups.items()}
+
+
+def main(texts: Optional[Sequence[str]] = None):
+    texts = texts or [
+        "Оплата за аренду помещения по договору №12 от 01.02.2024,  без НДС",
+        "оплата за аренду помещения по договору №12 от 01.02.2024, без НДС",
+        "Оплата по счету №1543 от 12.03.2025, в т.ч. НДС 166,67 грн.",
+        "Оплата по счету №1601 от 19.03.2025, в т.ч. НДС 250,00 грн.",
+        "Заработная плата за 03.2025",
+    ]
+    df = pd.DataFrame({"osnd": texts})
+    for template in (False, True):
+        representatives, stats = dedup_osnd(df, template=template)
+        print(f"template={template}: {stats}")
+    results = {
+        2: {"за_что": "оплата по счету", "номер_счета": "1543", "дата": "12.03.2025", "НДС": 166.67, "период": "03.2025"},
+    }
+    print(fan_out(df, representatives, results, template=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# Пакетные запросы к LLM для назначений платежей: в один запрос помещается N пронумерованных
+# назначений, модель возвращает JSON-массив результатов с номерами строк.
+# Системный промпт передается один раз на пакет, число запросов сокращается в N раз.
+# Ответ проверяется: каждый элемент должен иметь номер из пакета и поля результата;
+# строки, для которых результата нет (или ответ не разобран, или запрос упал), отправляются
+# повторно половинами пакета - вплоть до одиночных строк.
+
+import json
+import re
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+# Поля результата и значения "нет информации"
+EMPTY_RESULT = {
+    "за_что": "",
+    "номер_договора": "",
+    "номер_счета": "",
+    "номер_накладной": "",
+    "номер_заказа": "",
+    "дата": "",
+    "НДС": 0.0,
+    "период": "",
+}
+
+PACKED_SYSTEM_PROMPT = (
+    "Тебе дан список назначений платежей, каждое - в отдельной строке в формате \"номер: текст\". "
+    "Для каждого назначения получи НДС, дату, номера договора, накладной, счета, заказа. "
+    "Ответ - строго JSON-объект {\"results\": [...]}, где для каждой строки входа ровно один элемент: "
+    "{"
+    "id: int (номер строки), "
+    "за_что: str, "
+    "номер_договора: str, "
+    "номер_счета: str, "
+    "номер_накладной: str, "
+    "номер_заказа: str, "
+    "дата: date, "
+    "НДС: float, "
+    "период: str"
+    "}. "
+    "Если отсутствует информация, выведи пустоту. НДС извлеки не %, а сумму. "
+    "Дату выводи в формате: dd.mm.yyyy. "
+    "Период выводи в формате: mm.yyyy. "
+    "за_что - выводи коротко. Например: за товар, за услугу, комиссия... "
+)
+
+_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def normalize_result(data: Dict) -> Dict:
+    """Результат строки: все поля EMPTY_RESULT (None и отсутствующие - пустые), НДС - число"""
+    result = {}
+    for field, empty in EMPTY_RESULT.items():
+        value = data.get(field)
+        if value is None:
+            value = empty
+        elif field == "НДС":
+            try:
+                value = float(str(value).replace(" ", "").replace(",", "."))
+            except ValueError:
+                value = empty
+        else:
+            value = str(value)
+        result[field] = value
+    return result
+
+
+def build_pack_content(texts: Sequence[str]) -> str:
+    """Пронумерованные (с 1) назначения, по одному в строке"""
+    return "\n".join(f"{i}: {' '.join(str(text).split())}" for i, text in enumerate(texts, 1))
+
+
+def parse_pack_response(raw: str, size: int) -> Dict[int, Dict]:
+    """
+    Разбор ответа на пакет из size строк: {номер строки (с 1): результат}.
+    Принимаются {"results": [...]}, голый массив и объект {"номер": {...}}.
+    Элементы с чужими или повторными номерами и не-объекты отбрасываются.
+    """
+    data = json.loads(_FENCE.sub("", raw.strip()))
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        items = data["results"]
+    elif isinstance(data, list):
+        items = data
+    elif isinstance(data, dict):
+        items = [{**value, "id": key} for key, value in data.items() if isinstance(value, dict)]
+    else:
+        raise ValueError("ответ не является массивом результатов")
+
+    results = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            row = int(str(item.get("id")).strip())
+        except ValueError:
+            continue
+        if 1 <= row <= size and row not in results:
+            results[row] = normalize_result(item)
+    return results
+
+
+def make_packs(items: Sequence[Tuple[Hashable, str]], pack_size: int, max_chars: int) -> Iterator[List]:
+    """Разбивка (ключ, текст) на пакеты не более pack_size строк и max_chars символов"""
+    pack: List = []
+    chars = 0
+    for key, text in items:
+        if pack and (len(pack) >= pack_size or chars + len(text) > max_chars):
+            yield pack
+            pack, chars = [], 0
+        pack.append((key, text))
+        chars += len(text)
+    if pack:
+        yield pack
+
+
+class PackStats:
+    """Статистика пакетной обработки"""
+
+    def __init__(self):
+        self.rows = 0
+        self.requests = 0
+        self.splits = 0
+        self.failed = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"rows": self.rows, "requests": self.requests, "splits": self.splits, "failed": self.failed}
+
+
+def _accept(pack: List, raw: Optional[str], results: Dict, stats: PackStats) -> List:
+    """Результаты пакета в results; возвращает строки пакета без результата"""
+    parsed = {}
+    if raw is not None:
+        try:
+            parsed = parse_pack_response(raw, len(pack))
+        except (ValueError, TypeError) as e:
+            print(f"Ответ на пакет из {len(pack)} строк не разобран: {e}")
+    missing = []
+    for row, (key, text) in enumerate(pack, 1):
+        if row in parsed:
+            results[key] = parsed[row]
+        else:
+            missing.append((key, text))
+    return missing
+
+
+def _split(pack: List, missing: List, stats: PackStats) -> List[List]:
+    """Пакеты для повтора: половины недостающих строк (одиночная строка - отказ)"""
+    if not missing:
+        return []
+    if len(pack) == 1:
+        stats.failed += 1
+        return []
+    stats.splits += 1
+    if len(missing) < len(pack):
+        # часть строк получена - остальные повторяем пакетом, он уже меньше исходного
+        return [missing]
+    middle = len(missing) // 2
+    return [missing[:middle], missing[middle:]]
+
+
+def run_packed(items: Sequence[Tuple[Hashable, str]], send: Callable[[str], str], pack_size: int = 20,
+               max_chars: int = 8000) -> Tuple[Dict[Hashable, Dict], Dict[str, int]]:
+    """
+    Пакетная обработка (ключ, текст). send(content) - один запрос к модели с PACKED_SYSTEM_PROMPT,
+    возвращает текст ответа. Возвращает ({ключ: результат}, статистика); ключей без результата нет в словаре.
+    """
+    stats = PackStats()
+    stats.rows = len(items)
+    results: Dict[Hashable, Dict] = {}
+    queue = list(make_packs(items, pack_size, max_chars))
+    while queue:
+        pack = queue.pop()
+        stats.requests += 1
+        try:
+            raw = send(build_pack_content([text for _, text in pack]))
+        except Exception as e:
+            print(f"Ошибка запроса для пакета из {len(pack)} строк: {e}")
+            raw = None
+        queue.extend(_split(pack, _accept(pack, raw, results, stats), stats))
+    return results, stats.as_dict()
+
+
+async def solve_pack_async(pack: List, send: Callable[[str], Awaitable[str]], results: Dict,
+                           stats: PackStats, reraise: Tuple = ()):
+    """
+    Асинхронная обработка одного пакета с повторами половинами.
+    Исключения типов reraise (например, RateLimitError) не считаются отказом и пробрасываются.
+    """
+    queue = [pack]
+    while queue:
+        current = queue.pop()
+        stats.requests += 1
+        try:
+            raw = await send(build_pack_content([text for _, text in current]))
+        except reraise:
+            raise
+        except Exception as e:
+            print(f"Ошибка запроса для пакета из {len(current)} строк: {e}")
+            raw = None
+        queue.extend(_split(current, _accept(current, raw, results, stats), stats))
+
+
+async def run_packed_async(items: Sequence[Tuple[Hashable, str]], send: Callable[[str], Awaitable[str]],
+                           pack_size: int = 20, max_chars: int = 8000) -> Tuple[Dict[Hashable, Dict], Dict[str, int]]:
+    """Как run_packed, но send - корутина; пакеты обрабатываются последовательно"""
+    stats = PackStats()
+    stats.rows = len(items)
+    results: Dict[Hashable, Any] = {}
+    for pack in make_packs(items, pack_size, max_chars):
+        await solve_pack_async(pack, send, results, stats)
+    return results, stats.as_dict()
@@ -0,0 +1,141 @@
+# Параллельный парсинг больших каталогов номенклатуры.
+# Каталог (список строк или файл: JSON как Catalog_nomenclature.json, JSON Lines, CSV, xlsx) читается
+# потоком и режется на части, части разбираются в ProcessPoolExecutor, результаты идут в исходном порядке.
+# В работе одновременно не больше 2 частей на процесс, поэтому память не растет с размером каталога.
+# Таблица шаблонов компилируется один раз в каждом процессе (initializer).
+
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from catalog_reader import batched, iter_skus
+from pattern_matcher import CompiledPatternMatcher
+
+PARSERS = ("re", "my")
+
+# Размер части для потока неизвестной длины (файл каталога)
+STREAM_CHUNK = 5000
+
+# Парсер части каталога, создается initializer'ом в каждом процессе
+_chunk_parser: Optional[Callable[[List[str]], pd.DataFrame]] = None
+
+
+def _make_chunk_parser(parser_name: str) -> Callable[[List[str]], pd.DataFrame]:
+    """Создает функцию разбора части каталога; шаблоны компилируются здесь"""
+    if parser_name == "re":
+        from product_parser_re import ProductParser
+
+        parser = ProductParser()
+        return parser.parse_batch
+
+    if parser_name == "my":
+        import test_patterns_my
+
+        matcher = CompiledPatternMatcher(test_patterns_my.nomenclature_pattern, 0)
+
+        def parse_chunk(chunk: List[str]) -> pd.DataFrame:
+            return pd.DataFrame([test_patterns_my.extract_data_from_text(text, matcher) for text in chunk])
+
+        return parse_chunk
+
+    raise ValueError(f"Неизвестный парсер: {parser_name}. Допустимые: {', '.join(PARSERS)}")
+
+
+def _init_worker(parser_name: str):
+    global _chunk_parser
+    _chunk_parser = _make_chunk_parser(parser_name)
+
+
+def _parse_chunk(chunk: List[str]) -> pd.DataFrame:
+    return _chunk_parser(chunk)
+
+
+def load_catalogue(source: Union[str, Iterable[str]], column: str = "Description") -> List[str]:
+    """
+    Загрузка описаний SKU списком.
+    source - список строк или путь к файлу каталога (.json, .jsonl, .csv, .xlsx, .py, .skuc), см. catalog_reader.
+    """
+    return list(iter_skus(source, column))
+
+
+def _chunk_size(total: int, workers: int, chunk_size: Optional[int]) -> int:
+    """По умолчанию ~4 части на процесс, но не меньше 100 и не больше 10000 строк"""
+    if chunk_size:
+        return chunk_size
+    return max(100, min(10_000, math.ceil(total / (workers * 4))))
+
+
+def iter_catalogue(
+    source: Union[str, Iterable[str]],
+    parser: str = "re",
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    column: str = "Description",
+) -> Iterator[pd.DataFrame]:
+    """Потоковый параллельный парсинг: DataFrame по каждой части, части в порядке входа"""
+    if parser not in PARSERS:
+        raise ValueError(f"Неизвестный парсер: {parser}. Допустимые: {', '.join(PARSERS)}")
+
+    workers = workers or os.cpu_count() or 1
+    if not chunk_size:
+        # длина известна только у списка; для файлов - фиксированный размер части
+        chunk_size = _chunk_size(len(source), workers, None) if isinstance(source, (list, tuple)) else STREAM_CHUNK
+    chunks = batched(iter_skus(source, column), chunk_size)
+
+    if workers == 1:
+        parse_chunk = _make_chunk_parser(parser)
+        for chunk in chunks:
+            yield parse_chunk(chunk)
+        return
+
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None:
+        # одна часть - нет смысла поднимать пул процессов
+        yield _make_chunk_parser(parser)(first)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(parser,)) as pool:
+        # ограниченное окно задач: новая часть читается, когда забран результат самой старой
+        pending = deque([pool.submit(_parse_chunk, first), pool.submit(_parse_chunk, second)])
+        for chunk in chunks:
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_parse_chunk, chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+def parse_catalogue(
+    source: Union[str, Iterable[str]],
+    parser: str = "re",
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    column: str = "Description",
+) -> pd.DataFrame:
+    """Параллельный парсинг каталога. Строки результата идут в порядке входа"""
+    frames = list(iter_catalogue(source, parser, workers, chunk_size, column))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    start = datetime.now()
+    df = parse_catalogue("Catalog_nomenclature.json", parser="re")
+    print(f"Разобрано строк: {len(df)}; успешно: {int(df['parsed'].sum())}")
+    print(f"Время: {datetime.now() - start}")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    df.to_excel(f"parser_results_{timestamp}.xlsx", index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# Бенчмарк наборов шаблонов номенклатуры.
+# Для каждого набора (модуль с nomenclature_pattern) на корпусах products.py, products_source.py
+# и Catalog_nomenclature.json считает по каждому шаблону: число попыток, совпадений и "побед"
+# (первое совпадение), среднее и p99 время поиска; проверяет шаблоны на катастрофический
+# бэктрекинг (таймауты на "накачанных" строках в отдельном процессе); считает точность по
+# размеченным data_initial_dict. Результат сохраняется в JSON для отслеживания регрессий.
+
+import importlib
+import json
+import multiprocessing
+import platform
+import re
+import time
+from array import array
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from catalog_reader import iter_json_array
+
+DEFAULT_PATTERN_SETS = ("nomenclature_extract_pattern", "nomenclature_extract_pattern_optimized")
+
+# Медленный поиск (мс) - признак возможного бэктрекинга на реальных данных
+SLOW_MATCH_MS = 10.0
+
+
+def load_pattern_set(module_name: str) -> List[Tuple[str, Callable]]:
+    return importlib.import_module(module_name).nomenclature_pattern
+
+
+def load_corpora(catalog_path: str = "Catalog_nomenclature.json") -> Dict[str, List[str]]:
+    """Корпуса SKU: products.py, products_source.py и каталог 1С"""
+    from products import test_products
+    from products_source import test_products as source_products
+
+    return {
+        "products": list(test_products),
+        "products_source": list(source_products),
+        "catalog": list(iter_json_array(catalog_path)),
+    }
+
+
+def _percentile(sorted_values: Sequence[int], q: float) -> int:
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+def profile_patterns(
+    patterns: List[Tuple[str, Callable]], texts: Sequence[str], flags: int = re.IGNORECASE, mode: str = "search"
+) -> Dict:
+    """
+    Прогон первого совпадения по текстам с замером времени каждого поиска.
+    mode - "search" (как ProductParser) или "match" (как test_patterns.py)
+    """
+    compiled = [re.compile(pattern, flags) for pattern, _ in patterns]
+    methods = [getattr(c, mode) for c in compiled]
+    timings = [array("q") for _ in patterns]
+    matches = [0] * len(patterns)
+    hits = [0] * len(patterns)
+    slow = [0] * len(patterns)
+    slow_ns = SLOW_MATCH_MS * 1_000_000
+    results: List[Optional[Tuple]] = []
+    perf_counter_ns = time.perf_counter_ns
+
+    start = time.perf_counter()
+    for text in texts:
+        result = None
+        for index, method in enumerate(methods):
+            t0 = perf_counter_ns()
+            match = method(text)
+            elapsed = perf_counter_ns() - t0
+            timings[index].append(elapsed)
+            if elapsed > slow_ns:
+                slow[index] += 1
+            if match:
+                matches[index] += 1
+                try:
+                    result = tuple(patterns[index][1](match))
+                except (ValueError, IndexError):
+                    continue
+                hits[index] += 1
+                break
+        results.append(result)
+    total_time = time.perf_counter() - start
+
+    report = []
+    for index, (pattern, _) in enumerate(patterns):
+        values = sorted(timings[index])
+        report.append({
+            "index": index,
+            "pattern": pattern,
+            "attempts": len(values),
+            "matches": matches[index],
+            "hits": hits[index],
+            "mean_us": round(sum(values) / len(values) / 1000, 3) if values else 0.0,
+            "p99_us": round(_percentile(values, 0.99) / 1000, 3),
+            "max_us": round(values[-1] / 1000, 3) if values else 0.0,
+            "slow": slow[index],
+        })
+    return {
+        "texts": len(texts),
+        "parsed": sum(r is not None for r in results),
+        "total_time_s": round(total_time, 4),
+        "patterns": report,
+        "results": results,
+    }
+
+
+def accuracy(patterns: List[Tuple[str, Callable]], labelled: Sequence[Dict], flags: int = re.IGNORECASE,
+             mode: str = "search") -> Dict:
+    """Точность по размеченным данным (data_initial_dict): совпадение веса, штук и контейнеров"""
+    profile = profile_patterns(patterns, [item["text"] for item in labelled], flags, mode)
+    correct = 0
+    errors = []
+    for item, result in zip(labelled, profile["results"]):
+        expected = (float(item["weight"]), int(item["pieces"]), int(item["containers"]))
+        if result is not None:
+            try:
+                got = (float(str(result[0]).replace(",", ".")), int(result[1]), int(result[2]))
+            except (TypeError, ValueError, IndexError):
+                got = None
+        else:
+            got = None
+        if got == expected:
+            correct += 1
+        else:
+            errors.append({"text": item["text"], "expected": expected, "got": got})
+    return {
+        "labelled": len(labelled),
+        "correct": correct,
+        "accuracy": round(correct / len(labelled), 4) if labelled else 0.0,
+        "errors": errors,
+    }
+
+
+def stress_inputs(length: int = 1000) -> List[str]:
+    """Строки, на которых шаблоны с вложенными квантификаторами уходят в экспоненциальный перебор"""
+    return [
+        "1" * length + "!",
+        "1 " * (length // 2) + "!",
+        "1x" * (length // 2) + "!",
+        "1,1 " * (length // 4) + "!",
+        "12g*" * (length // 4) + "!",
+        "1KT1AD" * (length // 6) + "!",
+        "а" * length + "1",
+    ]
+
+
+def _stress_worker(pattern: str, flags: int, mode: str, inputs: List[str], start: int, conn):
+    method = getattr(re.compile(pattern, flags), mode)
+    for i in range(start, len(inputs)):
+        t0 = time.perf_counter()
+        method(inputs[i])
+        conn.send((i, time.perf_counter() - t0))
+    conn.close()
+
+
+def check_backtracking(pattern: str, flags: int = re.IGNORECASE, mode: str = "search",
+                       timeout: float = 1.0, inputs: Optional[List[str]] = None) -> Dict:
+    """
+    Запускает шаблон на стресс-строках в отдельном процессе.
+    Поиск, не уложившийся в timeout секунд, засчитывается как таймаут, падение процесса - как сбой;
+    в обоих случаях процесс перезапускается со следующей строки.
+    """
+    inputs = inputs or stress_inputs()
+    timeouts = 0
+    crashes = 0
+    worst = 0.0
+    start = 0
+    while start < len(inputs):
+        parent, child = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_stress_worker, args=(pattern, flags, mode, inputs, start, child), daemon=True
+        )
+        process.start()
+        child.close()
+        while start < len(inputs):
+            if not parent.poll(timeout):
+                process.kill()
+                timeouts += 1
+                start += 1
+                break
+            try:
+                i, elapsed = parent.recv()
+            except EOFError:
+                # процесс упал на inputs[start]
+                crashes += 1
+                start += 1
+                break
+            worst = max(worst, elapsed)
+            start = i + 1
+        process.join()
+        parent.close()
+    return {"timeouts": timeouts, "crashes": crashes, "worst_s": round(worst, 4)}
+
+
+def benchmark(pattern_sets: Sequence[str] = DEFAULT_PATTERN_SETS, corpora: Optional[Dict[str, List[str]]] = None,
+              flags: int = re.IGNORECASE, mode: str = "search", stress_timeout: float = 1.0,
+              labelled: Optional[Sequence[Dict]] = None) -> Dict:
+    """
+    Полный отчет по наборам шаблонов.
+    labelled - размеченные примеры для точности (по умолчанию data_initial_dict),
+    например SyntheticSkuGenerator().labelled(100000)
+    """
+    if labelled is None:
+        from products_source import data_initial_dict as labelled
+
+    corpora = corpora if corpora is not None else load_corpora()
+    texts = [text for corpus in corpora.values() for text in corpus]
+
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "mode": mode,
+        "flags": int(flags),
+        "corpora": {name: len(corpus) for name, corpus in corpora.items()},
+        "pattern_sets": {},
+    }
+    for module_name in pattern_sets:
+        patterns = load_pattern_set(module_name)
+        profile = profile_patterns(patterns, texts, flags, mode)
+        profile.pop("results")
+        for item, (pattern, _) in zip(profile["patterns"], patterns):
+            item.update(check_backtracking(pattern, flags, mode, stress_timeout))
+        profile["accuracy"] = accuracy(patterns, labelled, flags, mode)
+        report["pattern_sets"][module_name] = profile
+    return report
+
+
+def print_summary(report: Dict):
+    for name, profile in report["pattern_sets"].items():
+        acc = profile["accuracy"]
+        print(f"\n{name}: разобрано {profile['parsed']}/{profile['texts']} за {profile['total_time_s']:.3f}s, "
+              f"точность {acc['correct']}/{acc['labelled']} ({acc['accuracy']:.1%})")
+        print(f"{'#':>3} {'попыток':>8} {'побед':>7} {'mean,us':>9} {'p99,us':>9} {'таймауты':>9}  шаблон")
+        for item in profile["patterns"]:
+            print(f"{item['index']:>3} {item['attempts']:>8} {item['hits']:>7} {item['mean_us']:>9.2f} "
+                  f"{item['p99_us']:>9.2f} {item.get('timeouts', 0):>9}  {item['pattern']}")
+
+
+def main():
+    report = benchmark()
+    print_summary(report)
+
+    filename = f"pattern_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nОтчет сохранен в {filename}")
+
+
+if __name__ == "__main__":
+    main()
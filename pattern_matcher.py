@@ -0,0 +1,357 @@
+# Скомпилированный движок для таблиц шаблонов номенклатуры.
+# Таблица шаблонов - список кортежей (pattern, extractor), где extractor(match) -> (weight, pieces, containers).
+# Все шаблоны компилируются один раз. Для каждого шаблона заранее вычисляется "сигнатура" -
+# набор символов (цифры, буквы единиц измерения: g, гр, KT, AD, шт, бл, x ...), без которых он
+# не может совпасть. Перед поиском сигнатура текста сравнивается с сигнатурами шаблонов,
+# и re.search запускается только для подходящих. Порядок шаблонов и правило
+# "первое совпадение выигрывает" сохраняются.
+# Адаптивный режим (PatternStats + reorder_patterns) переставляет шаблоны по частоте срабатываний.
+# Переставляются только пары, непересечение которых подтверждено выборкой (каждый шаблон совпал
+# хотя бы с MIN_OBSERVED проверенными текстами, и ни разу - с одним текстом вместе), или пары с явно
+# заданным порядком (precedence); остальные сохраняют исходный порядок ("первое совпадение выигрывает").
+
+import json
+import os
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, FrozenSet
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+# Условный "символ" - в тексте есть хотя бы одна десятичная цифра (\d, [0-9])
+DIGIT = "\\d"
+_ASCII_DIGITS = frozenset("0123456789")
+# Символы, которые совпадают с ключом при re.IGNORECASE, но не через lower() (ſ -> s, ᲀ -> в ...)
+_FOLD_VARIANTS = frozenset("ſᲀᲁᲂᲃᲄᲅᲆᲇ")
+
+Requirement = FrozenSet[str]
+
+# Сколько проверенных текстов должен совпасть шаблон, чтобы его пары без общих совпадений считались
+# непересекающимися
+MIN_OBSERVED = 10
+
+
+class PatternMatch(NamedTuple):
+    index: int  # позиция шаблона в исходной таблице
+    pattern: str  # исходный шаблон
+    match: re.Match
+    values: Tuple  # результат extractor(match)
+
+
+def _is_safe_literal(ch: str) -> bool:
+    """Символ, для которого re.IGNORECASE сводится к lower()/upper() (без турецкой i и т.п.)"""
+    return ("\x20" <= ch <= "\x7e" and ch not in "iI") or "Ѐ" <= ch <= "ӿ" or ch in "×·№"
+
+
+def _literal_key(code: int, ignorecase: bool) -> Optional[str]:
+    ch = chr(code)
+    if ignorecase:
+        return ch.lower() if _is_safe_literal(ch) else None
+    return ch
+
+
+def _class_requirement(items, ignorecase: bool) -> List[Requirement]:
+    """Требование для символьного класса [...]: хотя бы один из символов"""
+    keys: Set[str] = set()
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            key = _literal_key(av, ignorecase)
+            if key is None:
+                return []
+            keys.add(key)
+        elif op is sre_constants.CATEGORY and av is sre_constants.CATEGORY_DIGIT:
+            keys.add(DIGIT)
+        elif op is sre_constants.RANGE and ord("0") <= av[0] <= av[1] <= ord("9"):
+            keys.add(DIGIT)
+        else:
+            # NEGATE, \w, \s, широкие диапазоны - ничего гарантировать нельзя
+            return []
+    return [frozenset(keys)] if keys else []
+
+
+def _requirements(subpattern, ignorecase: bool) -> List[Requirement]:
+    """
+    Необходимые условия совпадения шаблона.
+    Возвращает список множеств: в тексте должен быть хотя бы один символ из каждого множества.
+    """
+    result: List[Requirement] = []
+    for op, av in subpattern:
+        if op is sre_constants.LITERAL:
+            key = _literal_key(av, ignorecase)
+            if key is not None:
+                result.append(frozenset((key,)))
+        elif op is sre_constants.IN:
+            result.extend(_class_requirement(av, ignorecase))
+        elif op is sre_constants.SUBPATTERN:
+            _group, add_flags, del_flags, p = av
+            if not add_flags and not del_flags:
+                result.extend(_requirements(p, ignorecase))
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) or op is getattr(
+            sre_constants, "POSSESSIVE_REPEAT", None
+        ):
+            min_count, _max_count, p = av
+            if min_count >= 1:
+                result.extend(_requirements(p, ignorecase))
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            result.extend(_requirements(av, ignorecase))
+        elif op is sre_constants.BRANCH:
+            # Для альтернативы берем по самому узкому условию из каждой ветки и объединяем их
+            keys: Set[str] = set()
+            for alternative in av[1]:
+                branch = _requirements(alternative, ignorecase)
+                if not branch:
+                    keys = set()
+                    break
+                keys |= min(branch, key=len)
+            if keys:
+                result.append(frozenset(keys))
+        # ASSERT, ASSERT_NOT, AT, ANY, CATEGORY, NOT_LITERAL, GROUPREF... - условий не дают
+    return result
+
+
+def pattern_signature(pattern: "re.Pattern") -> List[Requirement]:
+    """Сигнатура скомпилированного шаблона (пустой список - шаблон проверяется всегда)"""
+    if not isinstance(pattern.pattern, str):
+        return []
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return []
+    ignorecase = bool(pattern.flags & re.IGNORECASE)
+    return list(dict.fromkeys(_requirements(parsed, ignorecase)))
+
+
+def text_signature(text: str, ignorecase: bool) -> Set[str]:
+    """Набор символов текста в том же виде, что и ключи сигнатур шаблонов"""
+    if ignorecase:
+        chars = set(text.lower())
+        if not text.isascii() and not chars.isdisjoint(_FOLD_VARIANTS):
+            chars.update(text.upper().lower())
+    else:
+        chars = set(text)
+    if not chars.isdisjoint(_ASCII_DIGITS) or (not text.isascii() and any(ch.isdecimal() for ch in chars)):
+        chars.add(DIGIT)
+    return chars
+
+
+class CompiledPatternMatcher:
+    """
+    Предкомпилированная таблица шаблонов с предварительным отбором кандидатов.
+    match() возвращает тот же результат, что и последовательный перебор:
+
+        for pattern, extractor in patterns:
+            match = re.search(pattern, text, flags)
+            ...
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, Callable]], flags: int = re.IGNORECASE):
+        self.patterns = list(patterns)
+        self.flags = flags
+        self.compiled: List[re.Pattern] = []
+        self.extractors: List[Callable] = []
+        # (обязательные символы, группы "хотя бы один из") для каждого шаблона
+        self.signatures: List[Tuple[FrozenSet[str], Tuple[Requirement, ...]]] = []
+
+        for pattern, extractor in self.patterns:
+            compiled = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+            requirements = pattern_signature(compiled)
+            required = frozenset(key for req in requirements if len(req) == 1 for key in req)
+            any_of = tuple(req for req in requirements if len(req) > 1)
+            self.compiled.append(compiled)
+            self.extractors.append(extractor)
+            self.signatures.append((required, any_of))
+
+        self._ignorecase = bool(flags & re.IGNORECASE) or any(
+            c.flags & re.IGNORECASE for c in self.compiled
+        )
+        self._mixed_case = self._ignorecase and not all(c.flags & re.IGNORECASE for c in self.compiled)
+        # все символы, встречающиеся в сигнатурах: текст проецируется на них,
+        # и список кандидатов кешируется по проекции
+        self._keys = frozenset(
+            key for required, any_of in self.signatures for req in (required,) + any_of for key in req
+        )
+        self._candidates_cache = {}
+        # порядок перебора (индексы исходной таблицы) и счетчики побед каждого шаблона
+        self.order: List[int] = list(range(len(self.compiled)))
+        self.hits: List[int] = [0] * len(self.compiled)
+
+    def __len__(self) -> int:
+        return len(self.compiled)
+
+    def set_order(self, order: Sequence[int]):
+        """Задает порядок перебора шаблонов (перестановка индексов исходной таблицы)"""
+        if sorted(order) != list(range(len(self.compiled))):
+            raise ValueError("Порядок должен быть перестановкой индексов таблицы шаблонов")
+        self.order = list(order)
+        self._candidates_cache = {}
+
+    def _select(self, chars: FrozenSet[str], raw_chars: Optional[FrozenSet[str]]) -> Tuple[int, ...]:
+        result = []
+        for index in self.order:
+            required, any_of = self.signatures[index]
+            signature = chars
+            if raw_chars is not None and not self.compiled[index].flags & re.IGNORECASE:
+                # шаблон чувствителен к регистру - сравниваем с исходными символами
+                signature = raw_chars
+            if required <= signature and all(not req.isdisjoint(signature) for req in any_of):
+                result.append(index)
+        return tuple(result)
+
+    def candidates(self, text: str, signature: Optional[Set[str]] = None) -> Tuple[int, ...]:
+        """
+        Индексы шаблонов (в порядке перебора), которые в принципе могут совпасть с текстом.
+        signature - готовый text_signature(text, ignorecase) для нескольких таблиц, проверяющих один текст
+        """
+        if signature is None:
+            signature = text_signature(text, self._ignorecase)
+        chars = self._keys.intersection(signature)
+        raw_chars = None
+        if self._mixed_case:
+            raw_chars = self._keys.intersection(text_signature(text, False))
+        cache_key = (chars, raw_chars)
+        result = self._candidates_cache.get(cache_key)
+        if result is None:
+            result = self._candidates_cache[cache_key] = self._select(chars, raw_chars)
+        return result
+
+    def match(self, text: str, signature: Optional[Set[str]] = None) -> Optional[PatternMatch]:
+        """Первый шаблон, который совпал и чей extractor отработал без ошибок"""
+        for index in self.candidates(text, signature):
+            match = self.compiled[index].search(text)
+            if match:
+                try:
+                    values = self.extractors[index](match)
+                except (ValueError, IndexError):
+                    continue
+                self.hits[index] += 1
+                return PatternMatch(index, self.patterns[index][0], match, values)
+        return None
+
+    def match_all(self, texts: Iterable[str]) -> List[Optional[PatternMatch]]:
+        return [self.match(text) for text in texts]
+
+    def matching(self, text: str) -> List[int]:
+        """Все шаблоны, совпадающие с текстом (индексы исходной таблицы по возрастанию)"""
+        return sorted(index for index in self.candidates(text) if self.compiled[index].search(text))
+
+
+def _pattern_key(pattern) -> str:
+    return str(getattr(pattern, "pattern", pattern))
+
+
+class PatternStats:
+    """
+    Статистика срабатываний шаблонов, накапливаемая между запусками (JSON-файл).
+    Шаблоны идентифицируются текстом, поэтому статистика переживает правку таблицы.
+
+    hits - сколько раз шаблон дал результат
+    sampled - сколько текстов проверено всеми шаблонами (observe)
+    observed - с каким числом проверенных текстов совпал шаблон
+    conflicts - пары шаблонов, совпавших с одним и тем же проверенным текстом
+    """
+
+    def __init__(self, path: str = "pattern_stats.json"):
+        self.path = path
+        self.texts = 0
+        self.sampled = 0
+        self.hits: Dict[str, int] = {}
+        self.observed: Dict[str, int] = {}
+        self.conflicts: Set[Tuple[str, str]] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.texts = data.get("texts", 0)
+            self.sampled = data.get("sampled", 0)
+            self.hits = data.get("hits", {})
+            # старый формат (список всех шаблонов без проверки) не переносится
+            observed = data.get("observed", {})
+            self.observed = observed if isinstance(observed, dict) else {}
+            self.conflicts = {tuple(pair) for pair in data.get("conflicts", [])}
+
+    def save(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "texts": self.texts,
+                    "sampled": self.sampled,
+                    "hits": self.hits,
+                    "observed": self.observed,
+                    "conflicts": sorted(self.conflicts),
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    def record(self, matcher: CompiledPatternMatcher, texts: int = 0):
+        """Переносит счетчики побед из matcher (и обнуляет их там)"""
+        for index, count in enumerate(matcher.hits):
+            if count:
+                key = _pattern_key(matcher.patterns[index][0])
+                self.hits[key] = self.hits.get(key, 0) + count
+                matcher.hits[index] = 0
+        self.texts += texts
+
+    def observe(self, matcher: CompiledPatternMatcher, texts: Iterable[str]):
+        """
+        Проверяет тексты всеми шаблонами: считает совпадения каждого шаблона
+        и запоминает пары шаблонов, совпавших с одним текстом
+        """
+        keys = [_pattern_key(pattern) for pattern, _ in matcher.patterns]
+        for text in texts:
+            found = matcher.matching(text)
+            self.sampled += 1
+            for i, first in enumerate(found):
+                self.observed[keys[first]] = self.observed.get(keys[first], 0) + 1
+                for second in found[i + 1:]:
+                    self.conflicts.add((keys[first], keys[second]))
+
+    def disjoint(self, first: str, second: str, min_observed: int = MIN_OBSERVED) -> bool:
+        """Непересечение шаблонов подтверждено: оба совпадали с проверенными текстами, но ни разу вместе"""
+        return (
+            self.observed.get(first, 0) >= min_observed
+            and self.observed.get(second, 0) >= min_observed
+            and (first, second) not in self.conflicts
+            and (second, first) not in self.conflicts
+        )
+
+
+def reorder_patterns(
+    patterns: Sequence[Tuple[str, Callable]],
+    stats: PatternStats,
+    precedence: Iterable[Tuple[int, int]] = (),
+    min_observed: int = MIN_OBSERVED,
+) -> List[int]:
+    """
+    Порядок перебора, минимизирующий число попыток: чаще срабатывающие шаблоны раньше.
+    Пара шаблонов может поменяться местами, только если:
+      - ее непересечение подтверждено выборкой (stats.disjoint с min_observed), или
+      - ее порядок задан явно в precedence (индекс, который должен идти раньше; индекс после).
+    Остальные пары (совпадавшие с одним текстом, редкие и не проверенные шаблоны) сохраняют исходный порядок.
+    """
+    keys = [_pattern_key(pattern) for pattern, _ in patterns]
+    count = len(keys)
+    before: List[Set[int]] = [set() for _ in range(count)]
+
+    declared: Set[FrozenSet[int]] = set()
+    for first, second in precedence:
+        before[second].add(first)
+        declared.add(frozenset((first, second)))
+    for second in range(count):
+        for first in range(second):
+            if frozenset((first, second)) not in declared and not stats.disjoint(keys[first], keys[second], min_observed):
+                before[second].add(first)
+
+    order: List[int] = []
+    placed: Set[int] = set()
+    while len(order) < count:
+        available = [i for i in range(count) if i not in placed and before[i] <= placed]
+        if not available:
+            raise ValueError("Противоречивые ограничения порядка шаблонов")
+        best = max(available, key=lambda i: (stats.hits.get(keys[i], 0), -i))
+        order.append(best)
+        placed.add(best)
+    return order
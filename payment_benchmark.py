@@ -0,0 +1,60 @@
+# Бенчмарк извлечения полей из назначений платежей (payment_purpose) на payments_source.test_texts.
+# Печатает скорость (строк в секунду) для всех полей вместе и для каждого поля отдельно,
+# а также долю строк, в которых поле найдено.
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from payment_purpose import PaymentPurposeExtractor
+
+
+def _rate(func: Callable[[str], object], texts: List[str], repeat: int) -> Dict:
+    found = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            result = func(text)
+            if _is_found(result):
+                found += 1
+    elapsed = time.perf_counter() - start
+    rows = len(texts) * repeat
+    return {
+        "rows": rows,
+        "seconds": round(elapsed, 4),
+        "rows_per_second": round(rows / elapsed) if elapsed else 0,
+        "found": round(found / rows, 4) if rows else 0.0,
+    }
+
+
+def _is_found(result) -> bool:
+    if isinstance(result, dict):
+        return any(value is not None for value in result.values())
+    return result is not None
+
+
+def benchmark(texts: Optional[List[str]] = None, repeat: int = 5) -> Dict[str, Dict]:
+    if texts is None:
+        from payments_source import test_texts
+
+        texts = list(test_texts)
+    extractor = PaymentPurposeExtractor()
+    report = {
+        "all": _rate(extractor.extract_fields, texts, repeat),
+        "date": _rate(extractor._extract_date, texts, repeat),
+        "document": _rate(lambda text: extractor._extract_document_info(text)["type"], texts, repeat),
+        "vat": _rate(extractor._extract_vat, texts, repeat),
+        "total_amount": _rate(extractor._extract_total_amount, texts, repeat),
+    }
+    extractor.close()
+    return report
+
+
+def main():
+    report = benchmark()
+    print(f"{'поле':<14} {'строк':>8} {'сек':>8} {'строк/с':>10} {'найдено':>8}")
+    for name, item in report.items():
+        print(f"{name:<14} {item['rows']:>8} {item['seconds']:>8.3f} {item['rows_per_second']:>10} {item['found']:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
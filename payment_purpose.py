@@ -8,10 +8,254 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import RandomForestClassifier
 import logging
 
+from pattern_matcher import CompiledPatternMatcher, text_signature
+from training_log import TrainingLog
+from feature_store import CachedTfidfVectorizer, open_store
+
 # Настройка логирования
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Шаблоны полей назначения платежа компилируются один раз при импорте модуля.
+# Для каждого поля шаблоны перебираются в порядке приоритета (первое совпадение выигрывает),
+# CompiledPatternMatcher пропускает шаблоны, обязательных символов которых нет в тексте.
+
+# Словарь месяцев
+MONTHS = {
+    'січня': '01', 'лютого': '02', 'березня': '03', 'квітня': '04',
+    'травня': '05', 'червня': '06', 'липня': '07', 'серпня': '08',
+    'вересня': '09', 'жовтня': '10', 'листопада': '11', 'грудня': '12',
+    'января': '01', 'февраля': '02', 'марта': '03', 'апреля': '04',
+    'мая': '05', 'июня': '06', 'июля': '07', 'августа': '08',
+    'сентября': '09', 'октября': '10', 'ноября': '11', 'декабря': '12'
+}
+
+# Шаблон для дат с месяцем прописью (ищется в тексте в нижнем регистре)
+WORD_DATE_RE = re.compile(r'(\d{1,2})\s+([а-яіїє]+)\s+(\d{4})')
+
+# Поддерживаемые форматы (разбираются в _parse_date)
+DATE_FORMATS = ['%d.%m.%Y', '%d.%m.%y', '%d/%m/%Y', '%d-%m-%Y']
+
+DATE_PATTERNS = [
+    # После слов "від"/"от"
+    r'(?:від|от)\s+(?P<date>\d{2}[./-]\d{2}[./-]\d{2,4})',
+    # С указанием года (р/г)
+    r'(?P<date>\d{2}[./-]\d{2}[./-]\d{2,4})\s*(?:р|року|г|года)',
+    # Дата в начале текста
+    r'^(?P<date>\d{2}[./-]\d{2}[./-]\d{2,4})',
+    # Дата в специальном формате
+    r'(?P<date>\d{2}[./-]\d{2}[./-]\d{2,4})\s*(?:р\.?|г\.?)',
+    # Просто дата в тексте (последний приоритет)
+    r'(?P<date>\d{2}[./-]\d{2}[./-]\d{2,4})'
+]
+
+DOC_PATTERNS = {
+    'договор': [
+        # Договор поставки
+        r'договор[уа]?\s+поставк[иі](?:\s+\([^)]+\))?\s*[№N#]?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # Номер после №
+        r'(?:дог(?:овір|овор|\.)|договор[уа]?|contract)\s*[№N#]\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # После слова "згідно"
+        r'(?:зг|згідно|с-но)\s+(?:дог|дог\.|договор[уа]?)\s*[№N#]?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # Сокращенная форма дог.
+        r'(?:дог|дог\.|договор[уа]?|contract)\s+[№N#]?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # Договор с номером в конце
+        r'договір\s+поставки\s+товарів\s+(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|$)',
+        # По договорам
+        r'по\s+договор[уа]?м?[: ]+(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|$)',
+        # За договором
+        r'за\s+договором\s+(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)'
+    ],
+    'накладная': [
+        # Список накладных через запятую
+        r'накладн(?:ої|ых|их)[:;, ]+(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
+        # После слова "згідно"
+        r'(?:зг|згідно|с-но)\s+(?:накл(?:адна|\.)|накладн(?:ої|ых|их))\s*(?:№|N|#)?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
+        # Видаткова накладна
+        r'видатков(?:ої|их|а)\s*накл(?:адна|\.)\s*(?:№|N|#)?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
+        # Стандартный формат
+        r'(?:накл(?:адна|\.)|РН|ВН)\s*(?:№|N|#)?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # Сокращенная форма
+        r'(?:накл|н/н)\s*(?:№|N|#)?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
+        # Просто номер после №
+        r'№\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_,;]+)(?=\s|від|$)'
+    ],
+    'налогЗП': [
+        # НДФЛ (шаблоны накладных, повторявшиеся здесь, никогда не срабатывали - они проверяются раньше)
+        r'(?P<number>НДФЛ)'
+    ],
+    'счет': [
+        # Список счетов через пробелы
+        r'(?:сч(?:ет|\.)|СЧ)\.\s+(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_\s]+)(?=\s|Н\.?Д|$)',
+        # Стандартный формат
+        r'(?:рах(?:унок|\.)|сч(?:ет|\.)|рах-фактура)\s*[№N#]\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # Счет-фактура
+        r'(?:рах(?:унок|\.)|сч(?:ет|\.)|сч[её]т-фактура)\s*[№N#]\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # Сокращенная форма
+        r'(?:РАХ|СЧТ)\.\s*[№N#]?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # После слова "згідно"
+        r'(?:зг|згідно)\s+рах\s*(?:№|N|#)?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
+        # Счет номер
+        r'(?:счет|счёт|рахунок)\s+номер\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|от|$)'
+    ],
+    'акт': [
+        r'(?:акт|акту)\s*(?:№|N|#)?\s*(?P<number>[A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?:\s|$)'
+    ]
+}
+
+# "Без ПДВ" (ищется в тексте в нижнем регистре) или "ПДВ - 0%"
+VAT_FREE_RE = re.compile(r'без\s+пдв')
+VAT_ZERO_RE = re.compile(r'(?:ПДВ|НДС)\s*[-—]\s*0\s*%')
+DIGIT_SPACE_RE = re.compile(r'(\d)\s+(\d)')
+
+VAT_PATTERNS = [
+    # ПДВ 20% - 100.00 грн
+    r'(?:ПДВ|НДС)\s*[-—]*\s*20\s*%\s*[-—:=]*\s*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
+    # в т.ч. ПДВ 20% - 100.00
+    r'в\s*т\.?\s*ч\.?\s*(?:ПДВ|НДС)\s*[-—]*\s*20\s*%\s*[-—:=]*\s*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
+    # ПДВ (20%) - 100.00
+    r'(?:ПДВ|НДС)\s*\(?20\s*%\)?\s*[-—:=]*\s*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
+    # ПДВ_20%_:_100.00
+    r'(?:ПДВ|НДС)[_ ]*20[_ ]*%[_ ]*[:=][_ ]*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
+    # в т.ч. ПДВ - 100.00
+    r'в\s*т\.?\s*ч\.?\s*(?:ПДВ|НДС)\s*[-—:=]*\s*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
+    # ПДВ - 100.00 грн
+    r'(?:ПДВ|НДС)\s*[-—:=]*\s*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
+    # в т.ч. ПДВ 100.00
+    r'в\s*т\.?\s*ч\.?\s*(?:ПДВ|НДС)\s*[-—:=]*\s*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
+    # ПДВ 100.00
+    r'(?:ПДВ|НДС)\s*(?P<amount>\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?'
+]
+
+AMOUNT_PATTERNS = [
+    # Сумма с указанием валюты
+    r'(?:сум[аі]|вартість)\s*(?P<amount>\d+[.,]\d+)\s*(?:грн|UAH)',
+    # Сумма после слова "сума/сумі"
+    r'(?:сум[аі]|вартість)\s*(?P<amount>\d+[.,]\d+)',
+    # Сумма с единицей валюты
+    r'(?P<amount>\d+[.,]\d+)\s*(?:грн|UAH)',
+    # После фразы "на суму"
+    r'на\s*суму\s*(?P<amount>\d+[.,]\d+)',
+    # Просто число с копейками
+    r'(?P<amount>\d{3,}[.,]\d{2})'
+]
+
+
+def normalize_amount(amount_str):
+    """
+    Нормализует строку с суммой в число с плавающей точкой.
+    Обрабатывает:
+    - Замену запятой на точку
+    - Удаление пробелов между цифрами
+    - Удаление символов подчеркивания
+    """
+    if not amount_str:
+        return None
+
+    # Удаляем пробелы между цифрами и заменяем запятую на точку
+    amount_str = DIGIT_SPACE_RE.sub(r'\1\2', amount_str)
+    amount_str = amount_str.replace(',', '.').replace('_', '')
+
+    try:
+        return float(amount_str)
+    except ValueError:
+        return None
+
+
+def parse_date(date_str):
+    """
+    Дата в формате DATE_FORMATS -> 'гггг-мм-дд' (ValueError, если ни один формат не подходит).
+    Разбор без strptime: шаблон уже гарантирует вид дд?мм?гг(гг), проверяем разделители и длину года
+    """
+    day, month, year = date_str[0:2], date_str[3:5], date_str[6:]
+    separator = date_str[2]
+    if separator != date_str[5] or not (len(year) == 4 or (len(year) == 2 and separator == '.')):
+        raise ValueError(date_str)
+    year = int(year)
+    if len(date_str) == 8:
+        # %y: 69-99 -> 19xx, 00-68 -> 20xx
+        year += 1900 if year >= 69 else 2000
+    return datetime(year, int(month), int(day)).strftime('%Y-%m-%d')
+
+
+def _parse_date(match):
+    # ValueError - ни один формат не подошел, пробуем следующий шаблон
+    return parse_date(match.group('date'))
+
+
+def _document(doc_type):
+    def extract(match):
+        return {'type': doc_type, 'number': match.group('number').strip()}
+    return extract
+
+
+def _amount(match):
+    return normalize_amount(match.group('amount'))
+
+
+# Признак "значение не подошло" в _first_match (None - допустимое значение поля)
+_NO_MATCH = object()
+
+
+def _candidate_matrix(matcher, texts, signatures=None):
+    """
+    Матрица (текст x шаблон): может ли шаблон в принципе совпасть с текстом (см. CompiledPatternMatcher).
+    signatures - готовые text_signature текстов, общие для нескольких таблиц
+    """
+    groups = {}
+    for row, text in enumerate(texts):
+        candidates = matcher.candidates(text, None if signatures is None else signatures[row])
+        groups.setdefault(candidates, []).append(row)
+    possible = np.zeros((len(texts), len(matcher)), dtype=bool)
+    for candidates, rows in groups.items():
+        if candidates:
+            possible[np.ix_(rows, candidates)] = True
+    return possible
+
+
+def _first_match(texts, matcher, group, convert, word_date_re=None, lower=None, signatures=None):
+    """
+    Векторный перебор шаблонов matcher в порядке приоритета: значение первого совпавшего шаблона.
+    convert(строка) -> значение; ValueError - шаблон считается несовпавшим (для дат),
+    None - поле не найдено, но перебор останавливается (как в методах _extract_*)
+    """
+    values = pd.Series(None, index=texts.index, dtype=object)
+    remaining = pd.Series(True, index=texts.index)
+
+    if word_date_re is not None:
+        # дата с месяцем прописью - только первое вхождение, как в _extract_date
+        parts = lower.str.extract(word_date_re).dropna()
+        parts = parts[parts[1].isin(MONTHS.keys())]
+        values[parts.index] = parts[2] + '-' + parts[1].map(MONTHS) + '-' + parts[0].str.zfill(2)
+        remaining[parts.index] = False
+
+    def safe_convert(value):
+        try:
+            return convert(value)
+        except ValueError:
+            return _NO_MATCH
+
+    possible = _candidate_matrix(matcher, texts, signatures)
+    for index, (pattern, _) in enumerate(matcher.patterns):
+        mask = remaining & possible[:, index]
+        if not mask.any():
+            continue
+        found = texts[mask].str.extract(pattern, flags=re.IGNORECASE)[group].dropna()
+        converted = found.map(safe_convert)
+        converted = converted[converted.map(lambda value: value is not _NO_MATCH)]
+        values[converted.index] = converted
+        remaining[converted.index] = False
+    return values
+
+
+DATE_MATCHER = CompiledPatternMatcher([(pattern, _parse_date) for pattern in DATE_PATTERNS], re.IGNORECASE)
+DOC_MATCHER = CompiledPatternMatcher(
+    [(pattern, _document(doc_type)) for doc_type, patterns in DOC_PATTERNS.items() for pattern in patterns],
+    re.IGNORECASE,
+)
+VAT_MATCHER = CompiledPatternMatcher([(pattern, _amount) for pattern in VAT_PATTERNS], re.IGNORECASE)
+AMOUNT_MATCHER = CompiledPatternMatcher([(pattern, _amount) for pattern in AMOUNT_PATTERNS], re.IGNORECASE)
+
 
 class PaymentPurposeExtractor:
     """
@@ -19,11 +263,17 @@ class PaymentPurposeExtractor:
     Использует комбинацию регулярных выражений и машинного обучения.
     """
 
-    def __init__(self):
+    def __init__(self, feature_store=None):
+        # Каталог хранилища признаков (feature_store.py): тексты для обучения токенизируются один раз
+        self.feature_store = feature_store
         # Пути к файлам для сохранения/загрузки модели и данных
         self.model_path = Path('payment_model.pkl')
         self.vectorizer_path = Path('vectorizer.pkl')
         self.training_data_path = Path('training_data.pkl')
+        # Журнал тренировочных данных: примеры дописываются пачками, файл не переписывается целиком
+        self.training_log_path = Path('training_data.log')
+        self.training_log = TrainingLog(str(self.training_log_path), flush_every=200)
+        self._migrate_training_data()
 
         # Загружаем существующую модель или создаем новую
         if self.model_path.exists() and self.vectorizer_path.exists():
@@ -38,15 +288,29 @@ class PaymentPurposeExtractor:
             logger.info("Создание новой модели")
             self._initialize_new_model()
 
-        # Загружаем или создаем тренировочные данные
-        if self.training_data_path.exists():
-            try:
-                with open(self.training_data_path, 'rb') as f:
-                    self.training_data = pickle.load(f)
-            except Exception:
-                self.training_data = {'texts': [], 'labels': []}
-        else:
-            self.training_data = {'texts': [], 'labels': []}
+    def _migrate_training_data(self):
+        """Перенос тренировочных данных из training_data.pkl в журнал (один раз, пока журнал пуст)"""
+        if len(self.training_log) or not self.training_data_path.exists():
+            return
+        try:
+            with open(self.training_data_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.error(f"Ошибка загрузки {self.training_data_path}: {e}")
+            return
+        for text, label in zip(data.get('texts', []), data.get('labels', [])):
+            self.training_log.append({'text': text, 'label': label})
+        self.training_log.flush()
+        logger.info(f"Перенесено {len(self.training_log)} примеров из {self.training_data_path} в {self.training_log_path}")
+
+    @property
+    def training_data(self):
+        """Тренировочные данные из журнала: {'texts': [...], 'labels': [...]}"""
+        data = {'texts': [], 'labels': []}
+        for record in self.training_log:
+            data['texts'].append(record['text'])
+            data['labels'].append(record['label'])
+        return data
 
     def _initialize_new_model(self):
         """Инициализация новой модели и обучение на базовом наборе данных"""
@@ -69,12 +333,10 @@ class PaymentPurposeExtractor:
         ]
 
         # Сохраняем тренировочные данные
-        self.training_data = {
-            'texts': initial_texts,
-            'labels': initial_labels
-        }
-        with open(self.training_data_path, 'wb') as f:
-            pickle.dump(self.training_data, f)
+        if not len(self.training_log):
+            for text, label in zip(initial_texts, initial_labels):
+                self.training_log.append({'text': text, 'label': label})
+            self.training_log.flush()
 
         logger.info("Тренировочные данные инициализированы")
 
@@ -95,26 +357,10 @@ class PaymentPurposeExtractor:
             pickle.dump(self.vectorizer, f)
 
     def _normalize_amount(self, amount_str):
-        """
-        Нормализует строку с суммой в число с плавающей точкой.
-        Обрабатывает:
-        - Замену запятой на точку
-        - Удаление пробелов между цифрами
-        - Удаление символов подчеркивания
-        """
-        if not amount_str:
-            return None
-
-        # Удаляем пробелы между цифрами и заменяем запятую на точку
-        amount_str = re.sub(r'(\d)\s+(\d)', r'\1\2', amount_str)
-        amount_str = amount_str.replace(',', '.').replace('_', '')
-
-        try:
-            return float(amount_str)
-        except ValueError:
-            return None
+        """Нормализует строку с суммой в число с плавающей точкой (см. normalize_amount)"""
+        return normalize_amount(amount_str)
 
-    def _extract_date(self, text):
+    def _extract_date(self, text, lower=None, signature=None):
         """
         Извлекает дату из текста.
         Поддерживает форматы:
@@ -124,136 +370,31 @@ class PaymentPurposeExtractor:
         - дд-мм-гггг
         - дд месяц гггг
         """
-        # Словарь месяцев
-        months = {
-            'січня': '01', 'лютого': '02', 'березня': '03', 'квітня': '04',
-            'травня': '05', 'червня': '06', 'липня': '07', 'серпня': '08',
-            'вересня': '09', 'жовтня': '10', 'листопада': '11', 'грудня': '12',
-            'января': '01', 'февраля': '02', 'марта': '03', 'апреля': '04',
-            'мая': '05', 'июня': '06', 'июля': '07', 'августа': '08',
-            'сентября': '09', 'октября': '10', 'ноября': '11', 'декабря': '12'
-        }
-
-        # Шаблон для дат с месяцем прописью
-        word_date = r'(\d{1,2})\s+([а-яіїє]+)\s+(\d{4})'
-        match = re.search(word_date, text.lower())
+        lower = text.lower() if lower is None else lower
+        match = WORD_DATE_RE.search(lower)
         if match:
             day, month_name, year = match.groups()
-            if month_name in months:
+            if month_name in MONTHS:
                 day = day.zfill(2)
-                return f"{year}-{months[month_name]}-{day}"
-
-        date_patterns = [
-            # После слов "від"/"от"
-            r'(?:від|от)\s+(\d{2}[./-]\d{2}[./-]\d{2,4})',
-            # С указанием года (р/г)
-            r'(\d{2}[./-]\d{2}[./-]\d{2,4})\s*(?:р|року|г|года)',
-            # Дата в начале текста
-            r'^(\d{2}[./-]\d{2}[./-]\d{2,4})',
-            # Дата в специальном формате
-            r'(\d{2}[./-]\d{2}[./-]\d{2,4})\s*(?:р\.?|г\.?)',
-            # Просто дата в тексте (последний приоритет)
-            r'(\d{2}[./-]\d{2}[./-]\d{2,4})'
-        ]
+                return f"{year}-{MONTHS[month_name]}-{day}"
 
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(1)
-                try:
-                    for fmt in ['%d.%m.%Y', '%d.%m.%y', '%d/%m/%Y', '%d-%m-%Y']:
-                        try:
-                            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
-                        except ValueError:
-                            continue
-                except ValueError:
-                    continue
-        return None
+        found = DATE_MATCHER.match(text, signature)
+        return found.values if found else None
 
-    def _extract_document_info(self, text):
+    def _extract_document_info(self, text, signature=None):
         """
         Извлекает информацию о документе: тип и номер.
         Поддерживает:
         - Договоры (договір/договор/дог)
         - Накладные (накладна/накл/РН/ВН)
+        - НДФЛ
         - Счета (рахунок/счет)
         - Акты
         """
-        doc_patterns = {
-            'договор': [
-                # Договор поставки
-                r'договор[уа]?\s+поставк[иі](?:\s+\([^)]+\))?\s*[№N#]?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Номер после №
-                r'(?:дог(?:овір|овор|\.)|договор[уа]?|contract)\s*[№N#]\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # После слова "згідно"
-                r'(?:зг|згідно|с-но)\s+(?:дог|дог\.|договор[уа]?)\s*[№N#]?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Сокращенная форма дог.
-                r'(?:дог|дог\.|договор[уа]?|contract)\s+[№N#]?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Договор с номером в конце
-                r'договір\s+поставки\s+товарів\s+([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|$)',
-                # По договорам
-                r'по\s+договор[уа]?м?[: ]+([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|$)',
-                # За договором
-                r'за\s+договором\s+([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)'
-            ],
-            'накладная': [
-                # Список накладных через запятую
-                r'накладн(?:ої|ых|их)[:;, ]+([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # После слова "згідно"
-                r'(?:зг|згідно|с-но)\s+(?:накл(?:адна|\.)|накладн(?:ої|ых|их))\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # Видаткова накладна
-                r'видатков(?:ої|их|а)\s*накл(?:адна|\.)\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # Стандартный формат
-                r'(?:накл(?:адна|\.)|РН|ВН)\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Сокращенная форма
-                r'(?:накл|н/н)\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # Просто номер после №
-                r'№\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_,;]+)(?=\s|від|$)'
-            ],
-            'налогЗП': [
-                # Список накладных через запятую
-                r'накладн(?:ої|ых|их)[:;, ]+([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # После слова "згідно"
-                r'(?:зг|згідно|с-но)\s+(?:накл(?:адна|\.)|накладн(?:ої|ых|их))\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # Видаткова накладна
-                r'видатков(?:ої|их|а)\s*накл(?:адна|\.)\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # Стандартный формат
-                r'(?:накл(?:адна|\.)|РН|ВН)\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Сокращенная форма
-                r'(?:накл|н/н)\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_,]+)(?=\s|від|$)',
-                # Просто номер после №
-                r'НДФЛ)'
-            ],
-            'счет': [
-                # Список счетов через пробелы
-                r'(?:сч(?:ет|\.)|СЧ)\.\s+([A-Za-zА-Яа-яІіЇїЄє\d\-/_\s]+)(?=\s|Н\.?Д|$)',
-                # Стандартный формат
-                r'(?:рах(?:унок|\.)|сч(?:ет|\.)|рах-фактура)\s*[№N#]\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Счет-фактура
-                r'(?:рах(?:унок|\.)|сч(?:ет|\.)|сч[её]т-фактура)\s*[№N#]\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Сокращенная форма
-                r'(?:РАХ|СЧТ)\.\s*[№N#]?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # После слова "згідно"
-                r'(?:зг|згідно)\s+рах\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|$)',
-                # Счет номер
-                r'(?:счет|счёт|рахунок)\s+номер\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?=\s|від|от|$)'
-            ],
-            'акт': [
-                r'(?:акт|акту)\s*(?:№|N|#)?\s*([A-Za-zА-Яа-яІіЇїЄє\d\-/_]+)(?:\s|$)'
-            ]
-        }
+        found = DOC_MATCHER.match(text, signature)
+        return found.values if found else {'type': None, 'number': None}
 
-        for doc_type, patterns in doc_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return {
-                        'type': doc_type,
-                        'number': match.group(1).strip()
-                    }
-        return {'type': None, 'number': None}
-
-    def _extract_vat(self, text):
+    def _extract_vat(self, text, lower=None):
         """
         Извлекает сумму НДС (ПДВ) из текста.
         Поддерживает различные форматы записи:
@@ -263,39 +404,18 @@ class PaymentPurposeExtractor:
         - в т.ч. ПДВ 314.42
         - Без ПДВ
         """
+        lower = text.lower() if lower is None else lower
         # Проверяем на "Без ПДВ" или "ПДВ - 0%"
-        if re.search(r'без\s+пдв', text.lower()) or re.search(r'(?:ПДВ|НДС)\s*[-—]\s*0\s*%', text):
+        if VAT_FREE_RE.search(lower) or VAT_ZERO_RE.search(text):
             return 0.0
 
         # Заменяем разделители в числах и нормализуем текст
-        text = re.sub(r'(\d)\s+(\d)', r'\1\2', text)
+        text = DIGIT_SPACE_RE.sub(r'\1\2', text)
         text = text.replace('_', ' ')
         text = text.replace('=', ' = ').replace(':', ' : ')
 
-        vat_patterns = [
-            # ПДВ 20% - 100.00 грн
-            r'(?:ПДВ|НДС)\s*[-—]*\s*20\s*%\s*[-—:=]*\s*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
-            # в т.ч. ПДВ 20% - 100.00
-            r'в\s*т\.?\s*ч\.?\s*(?:ПДВ|НДС)\s*[-—]*\s*20\s*%\s*[-—:=]*\s*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
-            # ПДВ (20%) - 100.00
-            r'(?:ПДВ|НДС)\s*\(?20\s*%\)?\s*[-—:=]*\s*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
-            # ПДВ_20%_:_100.00
-            r'(?:ПДВ|НДС)[_ ]*20[_ ]*%[_ ]*[:=][_ ]*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
-            # в т.ч. ПДВ - 100.00
-            r'в\s*т\.?\s*ч\.?\s*(?:ПДВ|НДС)\s*[-—:=]*\s*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
-            # ПДВ - 100.00 грн
-            r'(?:ПДВ|НДС)\s*[-—:=]*\s*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
-            # в т.ч. ПДВ 100.00
-            r'в\s*т\.?\s*ч\.?\s*(?:ПДВ|НДС)\s*[-—:=]*\s*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?',
-            # ПДВ 100.00
-            r'(?:ПДВ|НДС)\s*(\d+[.,]\d+)(?:\s*(?:грн|UAH|Грн))?'
-        ]
-
-        for pattern in vat_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return self._normalize_amount(match.group(1))
-        return None
+        found = VAT_MATCHER.match(text)
+        return found.values if found else None
 
     def _extract_total_amount(self, text):
         """
@@ -305,37 +425,102 @@ class PaymentPurposeExtractor:
         - 100.00 грн
         - на суму 100.00
         """
-        amount_patterns = [
-            # Сумма с указанием валюты
-            r'(?:сум[аі]|вартість)\s*(\d+[.,]\d+)\s*(?:грн|UAH)',
-            # Сумма после слова "сума/сумі"
-            r'(?:сум[аі]|вартість)\s*(\d+[.,]\d+)',
-            # Сумма с единицей валюты
-            r'(\d+[.,]\d+)\s*(?:грн|UAH)',
-            # После фразы "на суму"
-            r'на\s*суму\s*(\d+[.,]\d+)',
-            # Просто число с копейками
-            r'(\d{3,}[.,]\d{2})'
-        ]
+        found = AMOUNT_MATCHER.match(text)
+        return found.values if found else None
 
-        for pattern in amount_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return self._normalize_amount(match.group(1))
-        return None
+    def extract_fields(self, text):
+        """
+        Извлекает поля из текста назначения платежа (без обновления тренировочных данных).
+        Текст в нижнем регистре готовится один раз и используется всеми полями.
+        """
+        lower = text.lower()
+        # набор символов текста - общий для шаблонов даты и документа
+        signature = text_signature(text, True)
+        doc_info = self._extract_document_info(text, signature)
+        return {
+            'date': self._extract_date(text, lower, signature),
+            'document_type': doc_info.get('type'),
+            'document_number': doc_info.get('number'),
+            'vat_amount': self._extract_vat(text, lower)
+        }
+
+    def extract_frame(self, df, column='osnd', update_training=False):
+        """
+        Извлечение полей для целой колонки DataFrame (например, выписки из t_pb).
+        Одинаковые тексты обрабатываются один раз; для каждого поля шаблоны применяются
+        векторно (Series.str.extract) в порядке приоритета только к еще не разобранным строкам.
+        Результат совпадает с extract_fields. Возвращает копию df с колонками
+        date, document_type, document_number, vat_amount.
+        update_training - добавить разобранные тексты в тренировочные данные (как extract_info)
+        """
+        texts = df[column].where(df[column].notna(), '').astype(str)
+        unique = pd.Series(texts.unique(), dtype=object)
+        fields = self._extract_unique(unique)
+
+        if update_training:
+            found = fields.notna().any(axis=1)
+            for text, row in zip(unique[found], fields[found].to_dict('records')):
+                self._update_training_data(text, {key: None if pd.isna(value) else value for key, value in row.items()})
+            self.training_log.flush()
+
+        # раскладываем результаты обратно на все строки
+        positions = pd.Index(unique).get_indexer(texts)
+        result = df.copy()
+        for name in fields.columns:
+            # dtype=object: пропуски остаются None (иначе pandas выводит строковый тип с NaN)
+            column_values = [None if pd.isna(value) else value for value in fields[name].to_numpy()[positions]]
+            result[name] = pd.Series(column_values, index=result.index, dtype=object)
+        return result
+
+    def _extract_unique(self, texts):
+        """Поля для Series уникальных текстов (векторная версия extract_fields)"""
+        lower = texts.str.lower()
+        # наборы символов текстов - общие для шаблонов даты и документа
+        signatures = [text_signature(text, True) for text in texts]
+        fields = pd.DataFrame(
+            {
+                'date': _first_match(texts, DATE_MATCHER, 'date', parse_date, WORD_DATE_RE, lower, signatures),
+                'document_type': None,
+                'document_number': None,
+                'vat_amount': None,
+            },
+            index=texts.index,
+            dtype=object,
+        )
+
+        remaining = pd.Series(True, index=texts.index)
+        possible = _candidate_matrix(DOC_MATCHER, texts, signatures)
+        index = 0
+        for doc_type, patterns in DOC_PATTERNS.items():
+            for pattern in patterns:
+                mask = remaining & possible[:, index]
+                index += 1
+                if not mask.any():
+                    continue
+                number = texts[mask].str.extract(pattern, flags=re.IGNORECASE)['number'].dropna()
+                fields.loc[number.index, 'document_type'] = doc_type
+                fields.loc[number.index, 'document_number'] = number.str.strip()
+                remaining[number.index] = False
+
+        # НДС: "Без ПДВ"/"ПДВ - 0%", затем шаблоны по тексту с нормализованными разделителями
+        zero = lower.str.contains(VAT_FREE_RE) | texts.str.contains(VAT_ZERO_RE)
+        fields.loc[zero, 'vat_amount'] = 0.0
+        rest = texts[~zero]
+        rest = (
+            rest.str.replace(DIGIT_SPACE_RE, r'\1\2', regex=True)
+            .str.replace('_', ' ', regex=False)
+            .str.replace('=', ' = ', regex=False)
+            .str.replace(':', ' : ', regex=False)
+        )
+        fields.loc[rest.index, 'vat_amount'] = _first_match(rest, VAT_MATCHER, 'amount', normalize_amount)
+        return fields
 
     def extract_info(self, text):
         """
         Извлекает всю информацию из текста назначения платежа и обновляет модель
         """
         # Извлекаем информацию с помощью регулярных выражений
-        doc_info = self._extract_document_info(text)
-        result = {
-            'date': self._extract_date(text),
-            'document_type': doc_info.get('type'),
-            'document_number': doc_info.get('number'),
-            'vat_amount': self._extract_vat(text)
-        }
+        result = self.extract_fields(text)
 
         # Если нашли информацию с помощью регулярных выражений,
         # добавляем в тренировочные данные
@@ -346,21 +531,33 @@ class PaymentPurposeExtractor:
 
     def _update_training_data(self, text, result):
         """
-        Обновляет тренировочные данные
+        Обновляет тренировочные данные (запись в буфер журнала, сброс на диск пачками)
         """
-        # Добавляем новый пример в тренировочные данные
-        self.training_data['texts'].append(text)
-        self.training_data['labels'].append(result)
-
-        # Сохраняем обновленные данные
         try:
-            with open(self.training_data_path, 'wb') as f:
-                pickle.dump(self.training_data, f)
-            # logger.info("Тренировочные данные успешно обновлены")
+            self.training_log.append({'text': text, 'label': result})
         except Exception as e:
             logger.error(f"Ошибка при сохранении тренировочных данных: {e}")
 
+    def compact_training_data(self):
+        """Уплотнение журнала: удаление повторяющихся примеров"""
+        before = len(self.training_log)
+        after = self.training_log.compact()
+        logger.info(f"Журнал тренировочных данных уплотнен: {before} -> {after} примеров")
+
+    def close(self):
+        """Сброс буфера тренировочных данных на диск"""
+        self.training_log.close()
+
+    def _make_vectorizer(self):
+        if self.feature_store:
+            return CachedTfidfVectorizer(open_store(self.feature_store))
+        return TfidfVectorizer()
+
     def train(self, texts, labels):
+        if not hasattr(self, 'vectorizer') or (
+            self.feature_store and not isinstance(self.vectorizer, CachedTfidfVectorizer)
+        ):
+            self.vectorizer = self._make_vectorizer()
         X = self.vectorizer.fit_transform(texts)
         self.model.fit(X, labels)
         self._save_model()
@@ -392,21 +589,13 @@ def main():
     """
     extractor = PaymentPurposeExtractor()
 
-    test_texts = extract_data_from_postgresql().values.tolist()
-    test_texts = [text[0] for text in test_texts]
-
-    results = []
-    for text in test_texts:
-        try:
-            info = extractor.extract_info(text)
-            info['text'] = text
-            results.append(info)
-        except Exception as e:
-            logger.error(f"Ошибка при обработке текста: {e}")
-            continue
+    # Векторная обработка всей колонки: одинаковые osnd разбираются один раз
+    df = extractor.extract_frame(extract_data_from_postgresql(), 'osnd', update_training=True)
+    df = df.rename(columns={'osnd': 'text'})[['date', 'document_type', 'document_number', 'vat_amount', 'text']]
 
-    # Создаем DataFrame
-    df = pd.DataFrame(results)
+    # Сбрасываем на диск оставшиеся примеры и удаляем повторы
+    extractor.compact_training_data()
+    extractor.close()
 
     # сохраним в Excel
     df.to_excel('payment_purpose.xlsx', index=False)
@@ -1,11 +1,15 @@
+import time
+import numpy as np
 import pandas as pd
 import re
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import GridSearchCV, RandomizedSearchCV, train_test_split
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-from sklearn.metrics import classification_report
+from sklearn.metrics import accuracy_score, classification_report, mean_absolute_error
+from sklearn.utils.class_weight import compute_class_weight
 from product_parser_re import main_product_parser_re
-import random
+from feature_store import CachedTfidfVectorizer, open_store
+from synthetic_skus import SyntheticSkuGenerator
 
 
 def get_df():
@@ -22,89 +26,184 @@ def get_df():
             "container_type_pred",
         ]
     ] = df_source[['sku','weight','weight_unit','pieces','containers','container_type']]
-
-
-def generate_synthetic_data_from_patterns(pattern, num_samples):
-    synthetic_data = []
-
-    for _ in range(num_samples):
-        # Выбираем случайный паттерн
-        # pattern = random.choice(pattern)
-
-        # Генерируем случайные значения для паттерна
-        product_name = f"Product_{random.randint(1, 100)}"
-        weight = round(random.uniform(0.1, 100),1)
-        pieces = random.randint(1, 100)
-        containers = random.randint(1, 50)
-        container_type = random.choice(["tray", "jar", "box"])
-
-        # Создаем новый SKU на основе паттерна
-        # sku = re.sub(r"\((\w+)\)", f"({product_name})", pattern)
-        sku = product_name
-        sku = sku.replace("g", f"{weight}g")
-        sku = sku.replace("pcs", f"{pieces}pcs")
-        sku = sku.replace(container_type, f"{containers}{container_type}")
-
-        # Добавляем новые данные в список
-        synthetic_data.append([sku, weight, "g", pieces, containers, container_type])
-
-    # Создаем DataFrame из синтетических данных
-    return pd.DataFrame(
-        synthetic_data,
-        columns=[
-            "sku",
-            "weight",
-            "weight_unit",
-            "pieces",
-            "containers",
-            "container_type",
-        ],
-    )
-
-def training(df):
-    # Векторизация текста
-    vectorizer = TfidfVectorizer()
+    return df
+
+
+def generate_synthetic_data_from_patterns(pattern, num_samples, seed=None):
+    """
+    Синтетические размеченные SKU (synthetic_skus): названия из корпусов и реальные формы фасовки.
+    pattern не используется - шаблоны строк заданы в synthetic_skus.TEMPLATES.
+    """
+    return SyntheticSkuGenerator(seed=seed).frame(num_samples)
+
+
+# Параметры поиска: сетка для каждой модели, число деревьев при поиске и при ранней остановке.
+# Вес по TF-IDF: на тысячах признаков max_features=1.0 слишком медленный (2k строк - 50 с поиска)
+WEIGHT_PARAM_GRID = {
+    "max_depth": [None, 10, 20],
+    "min_samples_leaf": [1, 2, 4],
+    "max_features": ["sqrt", 0.3],
+}
+# Вес по предсказаниям regex-парсера (как в исходной модели): признаков три, в каждом разбиении - все
+NUMERIC_WEIGHT_PARAM_GRID = {**WEIGHT_PARAM_GRID, "max_features": [1.0]}
+CONTAINER_PARAM_GRID = {
+    "max_depth": [None, 20],
+    "min_samples_leaf": [1, 2],
+    "class_weight": [None, "balanced"],
+}
+SEARCH_ESTIMATORS = 50
+ESTIMATORS_STEP = 25
+MAX_ESTIMATORS = 500
+NUMERIC_FEATURES = ["weight_pred", "pieces_pred", "containers_pred"]
+
+
+def _numeric_features(df):
+    """Числовые предсказания regex-парсера (None, если колонок *_pred нет)"""
+    if not all(column in df.columns for column in NUMERIC_FEATURES):
+        return None
+    return df[NUMERIC_FEATURES].apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy(dtype=float)
+
+
+def _search(estimator, grid, X, y, cv, n_iter, n_jobs, random_state):
+    """Поиск параметров по сетке (или случайный, если вариантов больше n_iter) с кросс-валидацией"""
+    candidates = int(np.prod([len(values) for values in grid.values()]))
+    if candidates > n_iter:
+        search = RandomizedSearchCV(estimator, grid, n_iter=n_iter, cv=cv, n_jobs=n_jobs, random_state=random_state)
+    else:
+        search = GridSearchCV(estimator, grid, cv=cv, n_jobs=n_jobs)
+    search.fit(X, y)
+    return search.best_params_, search.best_score_
+
+
+def _early_stopping(model, X_train, y_train, X_val, y_val, score, max_estimators, step, patience):
+    """
+    Наращивание леса (warm_start) по step деревьев, пока оценка на валидации растет.
+    Останавливается после patience шагов без улучшения или на max_estimators; лишние деревья отбрасываются.
+    """
+    if getattr(model, "class_weight", None) == "balanced":
+        # веса классов считаются один раз: с warm_start данные всех шагов одинаковы
+        classes = np.unique(y_train)
+        weights = compute_class_weight("balanced", classes=classes, y=y_train)
+        model.set_params(class_weight=dict(zip(classes, weights)))
+    model.set_params(warm_start=True, n_estimators=step)
+    best_score, best_count, stale = -np.inf, step, 0
+    while True:
+        model.fit(X_train, y_train)
+        current = score(y_val, model.predict(X_val))
+        if current > best_score:
+            best_score, best_count, stale = current, model.n_estimators, 0
+        else:
+            stale += 1
+        if stale >= patience or model.n_estimators + step > max_estimators:
+            break
+        model.n_estimators += step
+    model.estimators_ = model.estimators_[:best_count]
+    model.set_params(n_estimators=best_count, warm_start=False)
+    return best_score
+
+
+def training(df, feature_store=None, n_jobs=-1, cv=3, n_iter=10, test_size=0.2, max_estimators=MAX_ESTIMATORS,
+             patience=2, weight_tolerance=0.01, random_state=42):
+    """
+    Обучение моделей веса (RandomForestRegressor) и типа контейнера (RandomForestClassifier).
+    Вес обучается на предсказаниях regex-парсера (weight_pred, pieces_pred, containers_pred), если они есть,
+    иначе - на TF-IDF текста; тип контейнера - на TF-IDF.
+
+    Параметры подбираются поиском с кросс-валидацией (cv блоков, n_iter вариантов, n_jobs процессов),
+    затем лес наращивается с ранней остановкой по валидационной выборке (test_size).
+    Число итераций ограничено, время каждого этапа печатается.
+    weight_tolerance - относительная погрешность, при которой вес считается угаданным.
+    Возвращает {"weight_model", "container_model", "vectorizer", "report"}.
+    """
+    timings = {}
+    start = time.perf_counter()
+
+    # Векторизация текста; с feature_store (каталог хранилища признаков) SKU токенизируются один раз
+    vectorizer = CachedTfidfVectorizer(open_store(feature_store)) if feature_store else TfidfVectorizer()
     X_vec = vectorizer.fit_transform(df["sku"])
-
-    # Обучение модели для предсказания веса
-    weight_model = RandomForestRegressor()
-    weight_model.fit(df[["weight_pred", "pieces_pred", "containers_pred"]], df["weight"])
-
-    # Обучение модели для предсказания типа контейнера
-    container_model = RandomForestClassifier()
-    container_model.fit(X_vec, df["container_type"])
-
-    # Предсказание и сравнение результатов
-    df["weight_pred_ml"] = weight_model.predict(
-        df[["weight_pred", "pieces_pred", "containers_pred"]]
-    )
-    df["container_type_pred_ml"] = container_model.predict(X_vec)
-
-    # Сравнение результатов
-    accuracy = (df["weight_pred_ml"] == df["weight"]).mean()
-    print(f"Accuracy: {accuracy * 100:.2f}%")
-
-    # Обучение до тех пор, пока данные не совпадут
-    while accuracy < 1.0:
-        # Обучение модели заново
-        weight_model.fit(
-            df[["weight_pred", "pieces_pred", "containers_pred"]], df["weight"]
-        )
-        container_model.fit(X_vec, df["container_type"])
-
-        # Предсказание и сравнение результатов
-        df["weight_pred_ml"] = weight_model.predict(
-            df[["weight_pred", "pieces_pred", "containers_pred"]]
-        )
-        df["container_type_pred_ml"] = container_model.predict(X_vec)
-
-        # Сравнение результатов
-        accuracy = (df["weight_pred_ml"] == df["weight"]).mean()
-        print(f"Accuracy: {accuracy * 100:.2f}%")
+    numeric = _numeric_features(df)
+    X_weight = X_vec if numeric is None else numeric
+    timings["vectorize"] = time.perf_counter() - start
+
+    rows = np.arange(len(df))
+    y_type = df["container_type"].to_numpy()
+    # стратификация по типу контейнера возможна, если каждого типа хотя бы по 2 примера
+    # и в обеих выборках хватает строк на все типы
+    counts = pd.Series(y_type).value_counts()
+    val_size = int(np.ceil(test_size * len(df)))
+    stratify = y_type if counts.min() >= 2 and min(val_size, len(df) - val_size) >= len(counts) else None
+    train_rows, val_rows = train_test_split(rows, test_size=test_size, random_state=random_state, stratify=stratify)
+    y_weight = df["weight"].to_numpy(dtype=float)
+
+    def weight_accuracy(y_true, y_pred):
+        return float(np.mean(np.isclose(y_pred, y_true, rtol=weight_tolerance)))
+
+    models = {}
+    report = {}
+    for name, model, grid, X, y, score in (
+        ("weight", RandomForestRegressor(random_state=random_state),
+         WEIGHT_PARAM_GRID if numeric is None else NUMERIC_WEIGHT_PARAM_GRID, X_weight, y_weight,
+         lambda y_true, y_pred: -mean_absolute_error(y_true, y_pred)),
+        ("container_type", RandomForestClassifier(random_state=random_state), CONTAINER_PARAM_GRID, X_vec, y_type,
+         accuracy_score),
+    ):
+        # блоков кросс-валидации не больше, чем примеров самого редкого класса
+        folds = cv if name == "weight" else min(cv, int(pd.Series(y[train_rows]).value_counts().min()))
+        stage = time.perf_counter()
+        if folds >= 2:
+            model.set_params(n_estimators=SEARCH_ESTIMATORS)
+            params, cv_score = _search(model, grid, X[train_rows], y[train_rows], folds, n_iter, n_jobs, random_state)
+            model.set_params(**params)
+        else:
+            params, cv_score = {}, None
+        timings[f"{name}_search"] = time.perf_counter() - stage
+
+        stage = time.perf_counter()
+        model.set_params(n_jobs=n_jobs)
+        _early_stopping(model, X[train_rows], y[train_rows], X[val_rows], y[val_rows], score,
+                        max_estimators, ESTIMATORS_STEP, patience)
+        timings[f"{name}_fit"] = time.perf_counter() - stage
+
+        predicted = model.predict(X[val_rows])
+        report[name] = {
+            "params": params,
+            "cv_score": cv_score,
+            "n_estimators": model.n_estimators,
+            "accuracy": (weight_accuracy if name == "weight" else accuracy_score)(y[val_rows], predicted),
+        }
+        if name == "weight":
+            report[name]["mae"] = mean_absolute_error(y[val_rows], predicted)
+            if numeric is not None:
+                # точность самого regex-парсера на той же валидации - для сравнения
+                report[name]["baseline_accuracy"] = weight_accuracy(y[val_rows], numeric[val_rows, 0])
+        models[name] = model
+
+    # Предсказание на всех данных
+    df["weight_pred_ml"] = models["weight"].predict(X_weight)
+    df["container_type_pred_ml"] = models["container_type"].predict(X_vec)
+    timings["total"] = time.perf_counter() - start
+    report["timings"] = timings
+
+    print(f"Строк: {len(df)} (обучение {len(train_rows)}, валидация {len(val_rows)})")
+    for name in ("weight", "container_type"):
+        item = report[name]
+        line = f"{name}: точность {item['accuracy'] * 100:.2f}%, деревьев {item['n_estimators']}, параметры {item['params']}"
+        if "mae" in item:
+            line += f", MAE {item['mae']:.3f}"
+        if "baseline_accuracy" in item:
+            line += f", regex-парсер {item['baseline_accuracy'] * 100:.2f}%"
+        print(line)
+    print(", ".join(f"{stage} {seconds:.2f} c" for stage, seconds in timings.items()))
+    return {
+        "weight_model": models["weight"],
+        "container_model": models["container_type"],
+        "vectorizer": vectorizer,
+        "report": report,
+    }
 
 
 if __name__ == "__main__":
     sample = generate_synthetic_data_from_patterns(
         "(\d+(?:[.,]\d+)?)\s*(?:g|gr|gx|г|гр|G|GR|ml|мл)\s*[xXхХ×]\s*(\d+)(?:\s*(?:pcs|pc|шт|p))?\s*[xXхХ×]\s*(\d+)",10,)
     print(sample.to_string())
-    # training(sample)
+    # training(sample, n_jobs=-1)
@@ -1,47 +1,128 @@
 import re
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Optional
 from datetime import datetime
-from products import test_products
 from nomenclature_extract_pattern import nomenclature_pattern
+from catalog_reader import batched, iter_skus
+from lexicon import LEXICON
+from pattern_matcher import CompiledPatternMatcher, PatternMatch, PatternStats, reorder_patterns
+from sku_cache import SkuCache, pattern_table_version, text_version
 import os
 import shutil
 
 
+# Обратные ссылки (\1, (?P=name)) ломаются, если обернуть шаблон во внешнюю группу
+_BACKREFERENCE = re.compile(r"\\\d|\(\?P=")
+
+
+class _GroupsMatch:
+    """Строка Series.str.extract с интерфейсом re.Match (group, groups, groupdict, [])"""
+
+    def __init__(self, string: str, groups: Tuple, groupindex: Dict[str, int]):
+        self.string = string
+        self._groups = groups  # группа 0 - все совпадение
+        self._groupindex = groupindex
+
+    def _group(self, key):
+        number = self._groupindex[key] if isinstance(key, str) else key
+        if not 0 <= number < len(self._groups):
+            raise IndexError("no such group")
+        return self._groups[number]
+
+    def group(self, *keys):
+        if len(keys) <= 1:
+            return self._group(keys[0] if keys else 0)
+        return tuple(self._group(key) for key in keys)
+
+    def __getitem__(self, key):
+        return self._group(key)
+
+    def groups(self, default=None):
+        return tuple(default if value is None else value for value in self._groups[1:])
+
+    def groupdict(self, default=None):
+        return {name: default if self._group(name) is None else self._group(name) for name in self._groupindex}
+
+
 class ProductParser:
-    def __init__(self):
+    CACHE_NAME = "re"
+    # сколько первых шаблонов порядка перебора разбирается векторно (Series.str.extract)
+    VECTOR_PATTERNS = 4
+
+    def __init__(
+        self,
+        cache: Optional[SkuCache] = None,
+        adaptive: bool = False,
+        stats_path: str = "pattern_stats.json",
+        observe_limit: int = 1000,
+        precedence: Sequence[Tuple[int, int]] = (),
+    ):
+        """
+        adaptive - порядок шаблонов по статистике stats_path (по умолчанию выключен: результат
+        не зависит от файла статистики в рабочей директории)
+        observe_limit - сколько новых SKU за время жизни парсера проверяются всеми шаблонами на пересечения
+        precedence - пары индексов таблицы (раньше, позже) с явно заданным порядком
+        """
         self.patterns = nomenclature_pattern
+        # шаблоны компилируются один раз, перебираются только возможные кандидаты
+        self.matcher = CompiledPatternMatcher(self.patterns, re.IGNORECASE)
+        # кеш результатов; версия меняется вместе с таблицей шаблонов и словарем тары/единиц
+        self.cache = cache
+        self.cache_version = text_version(pattern_table_version(self.patterns), repr(LEXICON.entries))
+        # адаптивный порядок: частые шаблоны раньше, статистика хранится между запусками
+        self.adaptive = adaptive
+        self.observe_limit = observe_limit
+        self.stats = PatternStats(stats_path) if adaptive else None
+        # разобранные шаблонами SKU, еще не учтенные в статистике, и остаток выборки для observe
+        self._unrecorded = 0
+        self._observe_left = observe_limit
+        if adaptive:
+            self.matcher.set_order(reorder_patterns(self.patterns, self.stats, precedence))
+            if self.matcher.order != list(range(len(self.patterns))):
+                self.cache_version = text_version(self.cache_version, ",".join(map(str, self.matcher.order)))
+
+    def _collect_stats(self, texts: pd.Series):
+        """Учет SKU, разобранных шаблонами (не из кеша); пока не исчерпан observe_limit - проверка всеми шаблонами"""
+        self._unrecorded += len(texts)
+        sample = texts.iloc[:self._observe_left]
+        if len(sample):
+            self.stats.observe(self.matcher, sample)
+            self._observe_left -= len(sample)
+
+    def save_stats(self):
+        """Сохраняет статистику срабатываний (адаптивный режим); вызывается в конце прогона"""
+        if self.stats is None:
+            return
+        self.stats.record(self.matcher, self._unrecorded)
+        self._unrecorded = 0
+        self.stats.save()
 
     def _detect_container_type_re(self, text: str) -> str:
         """Detect container type using regular expressions"""
-        text_lower = text.lower()
-
-        if any(x in text_lower for x in ["jar", "jars", "банка", "банки", "банці","kavanoz"]):
-            return "jar"
-        elif any(x in text_lower for x in ["tray", "trays", "лоток", "лотки", "tepsi"]):
-            return "tray"
-        elif any(x in text_lower for x in ["vase", "vases", "ваза", "вазы", "vazo"]):
-            return "vase"
-        elif any(x in text_lower for x in ["bag", "bags"]):
-            return "bag"
-        elif any(x in text_lower for x in ["бл", "блок", "box", "boxes", "кт"]):
-            return "box"
-        return "box"  # default
-
-    def parse_product(self, text: str) -> Dict:        
+        return LEXICON.container_type(text)
+
+    def parse_product(self, text: str) -> Dict:
+        if self.cache is not None:
+            cached = self.cache.get(text, self.CACHE_NAME, self.cache_version)
+            if cached is not None:
+                cached["sku"] = text
+                return cached
+            result = self._parse_product(text)
+            self.cache.put(text, self.CACHE_NAME, self.cache_version, result)
+            return result
+        return self._parse_product(text)
+
+    def _parse_product(self, text: str) -> Dict:
         weight, pieces, containers = 0.0, 1, 1
-        weight_unit = "ml" if "ml" in text.lower() else "g"
+        container_type, weight_unit = LEXICON.classify(text)
         parsed = False
         pattern = ""
-        for pattern, extractor in self.patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    weight, pieces, containers = extractor(match)
-                    parsed = True
-                    break
-                except (ValueError, IndexError):
-                    continue
+        found = self.matcher.match(text)
+        if found:
+            weight, pieces, containers = found.values
+            pattern = found.pattern
+            parsed = True
 
         if parsed:
             return {
@@ -50,7 +131,7 @@ class ProductParser:
                 "weight_unit": weight_unit,
                 "pieces": pieces,
                 "containers": containers,
-                "container_type": self._detect_container_type_re(text),
+                "container_type": container_type,
                 "pattern": pattern,
                 "parsed": True 
             }
@@ -66,43 +147,152 @@ class ProductParser:
             "parsed": False
         }
 
-    def parse_products(self, products: List[str]) -> pd.DataFrame:
-        """Парсинг списка продуктов"""
-        data = []
-        success = 0
-        failed = 0
-
-        for text in products:
-            result = self.parse_product(text)
-            data.append(result)
-            if result["parsed"]:
-                success += 1
+    def parse_batch(self, products: Iterable[str]) -> pd.DataFrame:
+        """
+        Пакетный парсинг: возвращает DataFrame с колонками как у parse_product, в порядке входа.
+        Одинаковые SKU разбираются один раз, тип тары и единица веса считаются по колонке целиком.
+        """
+        skus = pd.Series(list(products), dtype=object)
+        unique = pd.Series(skus.unique(), dtype=object)
+
+        if self.cache is None:
+            frame = self._parse_unique(unique)
+            missing = unique
+        else:
+            cached = self.cache.get_many(unique, self.CACHE_NAME, self.cache_version)
+            missing = unique[~unique.isin(cached.keys())].reset_index(drop=True)
+            frame = self._parse_unique(missing)
+            if len(frame):
+                self.cache.put_many(zip(frame["sku"], frame.to_dict("records")), self.CACHE_NAME, self.cache_version)
+            if cached:
+                from_cache = pd.DataFrame([{**result, "sku": text} for text, result in cached.items()])
+                frame = pd.concat([frame, from_cache], ignore_index=True) if len(frame) else from_cache
+            frame = frame.set_index("sku", drop=False).loc[unique].reset_index(drop=True)
+
+        if self.adaptive:
+            self._collect_stats(missing)
+
+        # раскладываем результаты обратно на все строки входа
+        positions = pd.Index(unique).get_indexer(skus)
+        return frame.iloc[positions].reset_index(drop=True)
+
+    def parse_stream(self, source, batch_size: int = 10_000, column: str = "Description") -> Iterator[pd.DataFrame]:
+        """
+        Потоковый парсинг: source - итерируемый объект или файл каталога (см. catalog_reader).
+        Возвращает DataFrame (как parse_batch) на каждые batch_size строк.
+        """
+        for batch in batched(iter_skus(source, column), batch_size):
+            yield self.parse_batch(batch)
+        self.save_stats()
+
+    def _extract_leading(self, unique: pd.Series) -> List[Optional[Tuple[int, Tuple]]]:
+        """
+        Первый проход: Series.str.extract по VECTOR_PATTERNS первым шаблонам порядка перебора.
+        Возвращает (индекс шаблона, значения) или None - строка разбирается построчным matcher.
+        Строки, где обработчик шаблона отказал, тоже уходят в построчный разбор (он повторит весь перебор).
+        """
+        found: List[Optional[Tuple[int, Tuple]]] = [None] * len(unique)
+        texts = unique.to_numpy(dtype=object)
+        # позиции строк, еще не совпавших ни с одним шаблоном первого прохода
+        pending = np.arange(len(unique))
+        for index in self.matcher.order[:self.VECTOR_PATTERNS]:
+            if not len(pending):
+                break
+            compiled = self.matcher.compiled[index]
+            if _BACKREFERENCE.search(compiled.pattern):
+                break
+            try:
+                # внешняя группа отличает совпадение от неучаствующих групп
+                wrapped = re.compile(f"({compiled.pattern})", compiled.flags)
+            except re.error:
+                # (?i) в начале шаблона и т.п. - дальше построчно, чтобы не нарушить порядок
+                break
+            groups = pd.Series(texts[pending], dtype=object).str.extract(wrapped, expand=True)
+            matched = groups[0].notna().to_numpy()
+            groups = groups[matched].astype(object)
+            rows = groups.where(groups.notna(), None).itertuples(index=False)
+            groupindex = {name: number + 1 for name, number in compiled.groupindex.items()}
+            extractor = self.matcher.extractors[index]
+            for position, row in zip(pending[matched], rows):
+                try:
+                    values = extractor(_GroupsMatch(texts[position], tuple(row), groupindex))
+                except (ValueError, IndexError, TypeError, AttributeError, KeyError):
+                    continue
+                found[position] = (index, values)
+                self.matcher.hits[index] += 1
+            # дальше - только строки без совпадения: совпавшие решены или ждут построчного разбора
+            pending = pending[~matched]
+        return found
+
+    def _parse_unique(self, unique: pd.Series) -> pd.DataFrame:
+        """Разбор уникальных SKU в DataFrame (строки в порядке unique)"""
+        leading = self._extract_leading(unique)
+        found: List[Optional[PatternMatch]] = []
+        for text, result in zip(unique, leading):
+            if result is None:
+                found.append(self.matcher.match(text))
             else:
+                index, values = result
+                found.append(PatternMatch(index, self.matcher.patterns[index][0], None, values))
+        parsed = np.fromiter((m is not None for m in found), dtype=bool, count=len(found))
+        values = [m.values if m is not None else (0.0, 1, 1) for m in found]
+        weight, pieces, containers = (list(column) for column in zip(*values)) if values else ([], [], [])
+
+        # тип тары и единица веса - один проход словаря по каждому SKU
+        classified = [LEXICON.classify(text) for text in unique]
+        container_type = np.array([c for c, _ in classified], dtype=object)
+        weight_unit = np.array([u for _, u in classified], dtype=object)
+
+        return pd.DataFrame(
+            {
+                "sku": unique,
+                "weight": np.where(parsed, weight, 0.0),
+                "weight_unit": np.where(parsed, weight_unit, ""),
+                "pieces": np.where(parsed, pieces, 1),
+                "containers": np.where(parsed, containers, 1),
+                "container_type": np.where(parsed, container_type, ""),
+                "pattern": [m.pattern if m is not None else "" for m in found],
+                "parsed": parsed,
+            }
+        )
+
+    def parse_products(self, products: List[str], verbose: bool = True, export: bool = True) -> pd.DataFrame:
+        """Парсинг списка продуктов"""
+        df = self.parse_batch(products)
+        self.save_stats()
+        success = int(df["parsed"].sum())
+        failed = len(df) - success
+
+        if verbose:
+            for text in df.loc[~df["parsed"], "sku"]:
                 print(f"Failed to parse: {text}")
-                failed += 1
 
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        if data:
+        if len(df):
             # сортировка по убыванию. Вначеле успешно распарсенные
             df = df.sort_values("parsed", ascending=False)
 
             # Удаляем колонку parsed
             df = df.drop("parsed", axis=1)
 
-            # Display results
-            print("\nProducts table:")
-            print(df.to_string(index=False))  # Выводим таблицу продуктов
+            if verbose:
+                # Display results
+                print("\nProducts table:")
+                print(df.to_string(index=False))  # Выводим таблицу продуктов
+
+            if export:
+                # Save results
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                df.to_excel(f"parser_results_{timestamp}.xlsx", index=False)
 
-            # Save results
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            df.to_excel(f"parser_results_{timestamp}.xlsx", index=False)
+        if not verbose:
+            return df
 
         # Statistics
         total = success + failed
         print(f"\nStatistics:")
         print(f"Total products: {total}")
-        print(f"Successfully parsed: {success} ({success/total*100:.1f}%)")
+        if total:
+            print(f"Successfully parsed: {success} ({success/total*100:.1f}%)")
         if failed > 0:
             print(f"Failed to parse: {failed} ({failed/total*100:.1f}%)")
 
@@ -129,10 +319,15 @@ def create_backup(model_path):
 
 
 def main_product_parser_re():
+    # корпус импортируется только здесь, а не при импорте модуля парсера
+    from products import test_products
 
     # Создаем парсер и запускаем
-    parser = ProductParser()
-    return parser.parse_products(test_products)
+    cache = SkuCache()
+    parser = ProductParser(cache)
+    df = parser.parse_products(test_products)
+    cache.print_stats()
+    return df
 
 
 if __name__ == "__main__":
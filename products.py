@@ -1,3476 +1,22 @@
-test_products = [
-    """"Alpella" молочный шоколад с фундуком 80г*18шт*6бл/Хамле №8012""",
-    """"Alpella" шоколадная палочка 40г*18шт*6бл/Хамле №08021""",
-    """"Alpella" шоколадная палочка 40г*18шт*6бл/Хамле №8020""",
-    """"Alpella" шоколадная палочка с фундуком 40г*18шт*6бл/Хамле №08020""",
-    """"Alpella" шоколадная палочка с фундуком 40г*18шт*6бл/Хамле №8021""",
-    """"BISKREM" печенье с шоколадом 110г*24шт*6бл № 01145-03""",
-    """"BISKREM" печенье с шоколадом 40г*24шт*12бл № 01141-04""",
-    """"BISKREM" печенье с шоколадом 60г*24шт*9бл № 01143-05""",
-    """"CHOCOMILK" молочный батончик 20г*24шт*6бл № 00502-09""",
-    """"COCONAT" вафли в шоколаде с фундуком 37г*24шт*6бл № 00287-04""",
-    """"COCOSTAR" кокосовый батончик с молочным шоколадом 28г*24шт*6бл № 00274-09""",
-    """"COKOKREM" шоколадная паста 180г*6шт № 00061-00""",
-    """"COKOKREM" шоколадная паста 300г*6шт № 00047-00""",
-    """"DELUXE" вафли с апельсиновым кремом 40г*240шт № 00193-03""",
-    """"DELUXE" вафли с банановым кремом 40г*240шт № 00194-03""",
-    """"DELUXE" вафли с ореховым кремом 40г*240шт № 00195-03""",
-    """"DIDO" вафли в шоколаде 31г*36шт*6бл № 00288-06""",
-    """"DIDO" вафли в шоколаде 34г*18шт*6бл № 00285-07""",
-    """"DIDO" вафли в шоколаде 50г*12шт*6бл № 00289-01""",
-    """"DIDO" вафли в шоколаде с карамелью 41г*24шт*6бл № 01305-00""",
-    """"GOLDEN" шоколад с орехом 80г*6шт*6бл № 00253-03""",
-    """"HALLEY" печенье сэндвич с суфле покрытое шоколадом 30г*36шт*6бл № 00340-05""",
-    """"HALLEY" печенье сэндвич с суфле покрытое шоколадом 88г*24шт № 00342-04""",
-    """"HOBBY" вафли в молочном шоколаде 17г*24шт*6бл № 00284-08""",
-    """,""",
-    """/""",
-    """/""",
-    """01 Оборудование к установке""",
-    """02 Нематеріальні активи""",
-    """03 МБП""",
-    """05 Товари""",
-    """06 Услуги""",
-    """07 Новинки""",
-    """08 Виды грузоместа""",
-    """1""",
-    """1С Бухгалтерия 8""",
-    """5825 Цукерка жувальна PARTY 1кг х12 """,
-    """742 EVİZA FİXT TATL.STICK SAKIZ KARPUZ 14GR 12X24 / 742 Жувальна гумка "FİXT" кавун 14 гр 24Х12бл""",
-    """744 EVİZA FİXT TATL.STICK SAKIZ MENTOL 14GR 12X24 / 744 Жувальна гумка "FİXT" ментол 14гр 24Х12бл""",
-    """745 EVİZA FİXT TATL.STICK SAKIZ TROPİKAL 14GR 12X24 / 745 Жувальна гумка "FİXT" тропік 14гр 24Х12 бл""",
-    """747 EVİZA FİXT TATL.STICK SAKIZ PORTAKAL 14GR 12X24 /747 Жувальна гумка "FİXT" апельсин 14гр 24Х12бл""",
-    """80012 Цукерки жувальні "Docile CREAM MIX PENCILS " (олівці) ,  15 гр * 12*12 бл""",
-    """80013 Цукерки жувальні "CREAM MIX PENCILS" (олівці) 12шт*70гр""",
-    """80051 Цукерки жувальні COLORED STRAWBERRY PENCILS UNICORN BIG 26gX24X6""",
-    """80076 Цукерки жувальні COLORED STRAWBERRY PENCILS DINO BIG 26gX24X6 """,
-    """80127 Цукерка жувальна GELATINES WORMS 80 г х24""",
-    """88902 Цукерка жувальна BLACK BERRIES 1кг х12 """,
-    """88903 Цукерка жувальна RED BERRIES 1кг х12""",
-    """89111 Цукерки жувальні "SOUR  STRAWBERRY PENCILS "(олівці) з получним смаком 70гр х12 х6""",
-    """89113 Цукерки жувальні "SOUR COLORED STRAWBERRY PENCILS "(олівці) з получним смаком 70гр х12 х6""",
-    """8x1kg McBON COFFEE/KAHVELI  Цукерки карамель з кавовою начинкою   "McBON  COFFEE ", 1 кг х 8 шт""",
-    """8x1kg McBON FRUITY/ MEYVELI Цукерки карамель з фрукт начинкою "McBON FRUIT and MILKY , 1 кг х 8 шт""",
-    """8x1kg McBON FRUITY/ MEYVELI Цукерки карамель з фруктовою начинкою "McBON FRUIT", 1 кг х 8 шт""",
-    """8x1kg McBON MILKY/ SUTLU Цукерки карамель з молочною начинкою   "McBON  MILKY ", 1 кг х 8 шт""",
-    """8x1kg McBON SOUR/ EKSILI Цукерки карамель з начинкою кисла вишня  "McBON  SOUR ", 1 кг х 8 шт""",
-    """9210 Цукерки жувальні "SOUR COLORED STRAWBERRY PENCILS UNICORN" (олівці)  15 гр * 12*12 бл""",
-    """9221 Цукерки жувальні "Docile STRAWBERRY PENCILS" (олівці) з получним смаком,  15 гр * 12*12 бл""",
-    """9222 Цукерки жувальні "Docile SOUR STRAWBERRY PENCILS" (олівці) з получним смаком , 15 гр * 12*12 бл""",
-    """9223 Цукерки жувальні "SOUR TUTTI-FRUTTI PENCILS" (олівці)  15 гр * 12*12 бл""",
-    """9224 Цукерки жув. "Docile SOUR COLORED STRAWBERRY PENCILS"(олівці) з получним смаком,15 гр * 12*12бл""",
-    """9225 Цукерки жувальні "STRAWBERRY PENCILS" (олівці) з полуничним смаком V2 12шт*70гр""",
-    """9226 Цукерки жувальні "SOUR STRAWBERRY PENCILS" (олівці) з полуничним смаком V2 12шт*70гр""",
-    """9227 Цукерки жувальні "SOUR TUTTI-FRUTTI PENCILS" (олівці) V2 12шт*70гр""",
-    """9228 Цукерки жувальні "SOUR STRAWBERRY COLORED PENCILS" (олівці) з полуничним смаком V2 12шт*70гр""",
-    """9229 Цукерки жувальні "SOUR STRAWBERRY BELTS" (стрічки) з полуничним смаком V2 12шт*70гр""",
-    """9230 Цукерки жувальні "SOUR STRAWBERRY COLORED BELTS" (стрічки) з полуничним смаком V2 12шт*70гр""",
-    """9231 Цукерки жувальні "SOUR COLORED STRAWBERRY PENCILS UNICORN" (олівці) з полуничним смаком 12шт*70""",
-    """ADEL""",
-    """ALBENI" драже шоколадное с карамелью 110г*16шт № 00358-03""",
-    """ALBENI" драже шоколадное с карамелью 50г*24шт*4бл № 00358-04""",
-    """Alpella" молочный шоколад 80г*18шт*6бл/Хамле №8010""",
-    """ALVIEN (KATAKIT) = BEST FOOD""",
-    """ANI""",
-    """ANL""",
-    """ANTAT""",
-    """Apple IPhone 7 Plus 128 GB (product) """,
-    """ARNAS (Оливковое масло)""",
-    """ATASEHIR OTOMOTYV (Хусейн)""",
-    """AYSULTAN SEKERLEME""",
-    """BALOCCO""",
-    """BANETTI (Вермишель)""",
-    """BATEAUX жувальна гумка в пластинках с ароматом банана 13 г х 20 шт х 30 бл""",
-    """BATEAUX жувальна гумка в пластинках с ароматом кавуна 13 г х 20 шт х 30 бл""",
-    """BATEAUX жувальна гумка в пластинках с ароматом м'яти 13 г х 20 шт х 30 бл""",
-    """BATEAUX жувальна гумка в пластинках с ароматом полуниці 13 г х 20 шт х 30 бл""",
-    """Baфлі «Biscolata DuoMax» з горіховим кремом в молочному шоколаді 44г Х12шт Х12 бл  """,
-    """Baфлі «Biscolata DuoMax» з молочним кремом в молочному шоколаді 44 г  Х12шт Х12 бл  """,
-    """Baфлі «Crazy» з какао кремом в молочному шоколаді з хрустким рисом 30г Х24шт Х6 бл """,
-    """Baфлі «Gofresh» з молочним  кремом в глазурі 25г  Х24шт Х6 бл  """,
-    """Bebeto Жувальна гумка "Ведмедики"  8гр  100х8""",
-    """Bebeto Жувальна гумка "Диня-Кавун"  25гр  12х12""",
-    """Bebeto Жувальна гумка "Полуниця"  25гр 12х12""",
-    """Bebeto Жувальна гумка "Топ Шок. Кавун"  5,4гр  200х8""",
-    """Bebeto Жувальна гумка "Туті Фруті"  25гр  12х12""",
-    """Bebeto Жувальні цукерки "Kислий вибух Полуниця "  15гр 48х6""",
-    """Bebeto Жувальні цукерки "Kислий вибух. Кола"  15гр  48х6""",
-    """Bebeto Жувальні цукерки "Kислий вибух. Туті Фруті"  15гр  48х6""",
-    """Bebeto Жувальні цукерки "Kислий вибух. Фруктове асорті"  8гр  150х8""",
-    """Bebeto Жувальні цукерки "Kислі палички. Кола" 35гр  24х8""",
-    """Bebeto Жувальні цукерки "Kислі палички. Лимон" 35гр  24х8""",
-    """Bebeto Жувальні цукерки "Kислі палички. Полуниця"  35гр 24х8""",
-    """Bebeto Жувальні цукерки "Kислі палички. Туті Фруті"  35гр 24х8""",
-    """Bebeto Жувальні цукерки "Kислі палички. Яблуко"  35гр 24х8""",
-    """Bebeto Жувальні цукерки "Асорті"  18гр 36х8""",
-    """Bebeto Жувальні цукерки "Кавун" 80гр  12х6""",
-    """Bebeto Жувальні цукерки "Кобра Ікс"  30гр 24х8""",
-    """Bebeto Жувальні цукерки "Круті Боби. Тропічне асорті" 60гр  18х6""",
-    """Bebeto Жувальні цукерки "Круті Боби. Ягідне асорті" 60гр  18х6""",
-    """Bebeto Жувальні цукерки "Мікс видів: Зіркове тіст; Веселі Ведмедики; Кавун; Напій Кола" 35гр х24х4""",
-    """Bebeto Жувальні цукерки "Мікс видів: Морозиво; Персикові кільця; Кавун; Веселі Ведмедики" 80гр 12х4""",
-    """Bebeto Жувальні цукерки "Мікс Круті Боби" 60гр  18х4""",
-    """Bebeto Жувальні цукерки "Морозиво" 80гр 12х6""",
-    """Bebeto Жувальні цукерки "Персикові кільця" 80гр 12х6""",
-    """Bebeto Жувальні цукерки "Спагеті Веселка" 80гр  12х6""",
-    """Bebeto Жувальні цукерки "Спагеті Полуниця" 80гр   12х6""",
-    """Bebeto Жувальні цукерки "Спагеті Яблуко" 80гр  12х6""",
-    """Bebeto Жувальні цукерки "Фаст Фуд" 30гр  24х8""",
-    """Bebeto Жувальні цукерки "Ягоди" 70 гр  12х6 """,
-    """Bebeto Цукерки льодяники  "Mоджі Лолі" 16гр  120х4""",
-    """Bebeto Цукерки льодяники з цукровою пудрою " Діпс Кислинка" 12гр  36х8""",
-    """Bebeto Цукерки льодяники з цукровою пудрою " Діпс Кола" 12гр 36х8""",
-    """Bebeto Цукерки льодяники з цукровою пудрою "Діпс Полуниця" 12гр  36х8""",
-    """Bebeto Цукерки маршмелоу "Tвіст"  12гр 48х6""",
-    """Bebeto Цукерки маршмелоу "Білий та Рожевий"  135 гр 24х1""",
-    """Bebeto Цукерки маршмелоу "Білий та Рожевий" 30гр 12х6""",
-    """Bebeto Цукерки маршмелоу "Веселковий Tвіст"  135 гр 24х1""",
-    """Bebeto Цукерки маршмелоу "Веселковий Tвіст"  630гр 8х1""",
-    """Bebeto Цукерки маршмелоу "Зірка" 30гр  12х6""",
-    """Bebeto Цукерки маршмелоу "Морозиво" 30гр 12х6""",
-    """BETA (Чай)""",
-    """BIGBLAST жувальна гумка в обгортці з ароматом апельсина 4 гр 100 Х10 бл""",
-    """BIGBLAST жувальна гумка в обгортці з ароматом банана та полуниці 4 гр 100 Х10 бл""",
-    """BIGBLAST жувальна гумка в обгортці з ароматом кавуна 4 гр 100 Х10 бл""",
-    """BIGBLAST жувальна гумка в обгортці з ароматом коли 4 гр 100 Х10 бл""",
-    """BIGBLAST жувальна гумка в обгортці з ароматом м'яти 4 гр 100 Х10 бл""",
-    """BIGBLAST жувальна гумка в обгортці з ароматом полуниці 4 гр 100 Х10 бл""",
-    """BIRLIK GENERATOR (генераторы)""",
-    """Black cherry canned food""",
-    """BLOX жувальна гумка в пластинках з ароматом кавуна 5 шт 12,5 гр 20 Х 30 бл""",
-    """BLOX жувальна гумка в пластинках з ароматом м'яти PEPPERMINT  5 шт 12,5 гр 20 Х 30 бл""",
-    """BLOX жувальна гумка в пластинках з ароматом м'яти SPEARMINT  5 шт 12,5 гр 20 Х 30 бл""",
-    """BLOX жувальна гумка в пластинках з ароматом полуниці 5 шт 12,5 гр 20 Х 30 бл""",
-    """CAMSIL """,
-    """CC Mystery Stick MIX  candy 2 г 50 шт Х 100 блок """,
-    """Choco Spread on Stand  Farmand паста (ЛЕНТА)   15gr 15 шт Х 18 бл""",
-    """Chocosmart mix in box  Farmand  драже  (бабочка,авто,самолет) )  11gr 24 шт Х 6 бл""",
-    """CIT-CIT (Чит-Чит) /орешки/""",
-    """Cocoa Cream Farmand паста в тюбиках 30gr 24 шт Х 4 бл""",
-    """COSBY Цукерка льодяник в упакуванні "Капсула" 9 г Х 20""",
-    """COSBY Яйце з молочним і шоколадним кремом з кріпсами,сюрприз ДІВЧАТКА 20 г 24Х4""",
-    """COSBY Яйце з молочним і шоколадним кремом з кріпсами,сюрприз ХЛОПЧИКИ 20 г 24Х4""",
-    """Crazy  egg 40 gr (набір 8 шт.)""",
-    """DAMAKRA""",
-    """DAMLA GUMMY (OILED) BEAR (4G) 1 KG (4GR) PLASTIC BOX/ Жувальні цукерки DAMLA BEAR (ведмедики) 1кгх12""",
-    """DAMLA GUMMY (OILED) BEAR (4G) 1 KG BAG (12X1) / Жувальні цукерки DAMLA BEAR (ведмедики) 1кгх12 """,
-    """DAMLA GUMMY (OILED) BIG BEAR 80 GR BAG (12X6) - Жувальні цукерки DAMLA BEAR (ведмедики) 80гр 12х6""",
-    """DAMLA GUMMY (OILED) BIG COLA 80 GR BAG (12X6) - Жувальні цукерки DAMLA COLA (кола) 80гр 12х6 """,
-    """DAMLA GUMMY (OILED) BIG FRUIT GARDEN 80 GR BAG (12X6) - Жувальні цукерки  (фруктовий сад) 80 г 12х6""",
-    """DAMLA GUMMY (OILED) COLA (4G) 1 KG (4GR) PLASTIC BOX / Жувальні цукерки DAMLA COLA (кола) 1кгх12 """,
-    """DAMLA GUMMY (OILED) CROCODILE (7,5GR) 1 KG PLASTIC BOX / Жувальні цук. DAMLA CROCO  (крокодили) 1х12""",
-    """DAMLA GUMMY (OILED) CROCODILE (7,5GR) 1 KG PLASTIC BOX / Жувальні цук. DAMLA CROCO  (крокодили) 1х12""",
-    """DAMLA GUMMY (OILED) FRUIT GARDEN (4G) 1 KG (4GR) PLASTIC BOX 1кгх12 PLASTIC BOX""",
-    """DAMLA GUMMY (OILED) FRUIT GARDEN (4G) 1 KG BAG (12X1) /Жувальні цукерки DAMLA  ФРУКТОВИЙ САД1 кг x12""",
-    """DAMLA GUMMY (OILED) WORM (8G) 1 KG (8GR) PLASTIC BOX /Жувальні цукерки DAMLA WORM  (хробачки) 1кгх12""",
-    """DAMLA GUMMY (OILED) WORM 80 GR BAG (12X6) - Жувальні цукерки DAMLA WORM (хробачки) 80гр 12х6 """,
-    """DAMLA SOUR BELTS 15 GR COLA CARTON BOX (72X6) (YURT ICI) (LICORICE) 15грх72штх6бл """,
-    """DAMLA SOUR BELTS 15 GR RAINBOW CARTON BOX (72X6) (YURT ICI) (LICORICE)  15грх72штх6бл """,
-    """DAMLA SOUR BELTS 15 GR STRAWBERRY  CARTON BOX (72X6) (YURT ICI) (LICORICE) 15грх72штх6бл """,
-    """DAMLA SOUR GUMMY&FOAM RING (8G) 1 KG BAG (12X1) / Жувальні цукерки DAMLA FOAM RING (в цукрі)  1кгх12""",
-    """Dexters Драже з шоколадом "ДІНАЕГГ" 80 г 12Х4 """,
-    """DIMES GIDA SAN VE TIC AS""",
-    """Dimes Напиток безалкогольный соковый на ароматизаторах негазированный пастеризованный 0.25L""",
-    """DOGUS (Чипсы)""",
-    """DUNYA (BEBETO)""",
-    """DUNYA (KERVAN)""",
-    """ELVAN""",
-    """ENDAY; SMARTGUM (UNIGUM) """,
-    """ENPA (MESH stick tea & coffee)""",
-    """ERCAN (СILSAN) """,
-    """ERNET""",
-    """EXIT жувальна гумка без цукру  в подушечках в баночці з ароматом кавуна  60,8   6 X 8 бл """,
-    """EXIT жувальна гумка без цукру  в подушечках в баночці з ароматом м'яти PEPPERMINT   60,8   6 X 8 бл """,
-    """EXIT жувальна гумка без цукру  в подушечках в баночці з ароматом полуниці  60,8   6 X 8 бл """,
-    """EXIT жувальна гумка без цукру  в подушечках з ароматом м'яти 13,5  20 X 20 бл""",
-    """EXIT жувальна гумка без цукру  в подушечках з ароматом полуниці 13,5  20 X 20 бл""",
-    """EXIT жувальна гумка без цукру в подушечках в баночці WHITE  60,8   6 X 8 бл """,
-    """EXIT жувальна гумка без цукру в подушечках з ароматом кавуна 13,5  20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках 11 гр 5 видів  MULTIPACK MIXED   5шт х  80 бл""",
-    """EXIT жувальна гумка в пластинках на СТЕНДІ 11 гр. - 5 видів Х 20шт  MIXED FLAVOUR Х 100шт""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру  з ароматом апельсина  ORANGE  11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру  з ароматом кориці  11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру  з ароматом лимонада 11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру  з ароматом м'яти SPEARMINT 11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру з ароматом кавуна  11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру з ароматом м'яти PEPPERMINT  11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру з ароматом полуниці 11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-5шт без цукру з ароматом тропічних фруктів  11 гр 20 X 20 бл""",
-    """EXIT жувальна гумка в пластинках-стік без цук. з ароматом м'яти PEPPERMINT 2,2 гр 200 X 10 бл""",
-    """EXIT жувальна гумка в пластинках-стік без цук. з тропічним ароматом TROPICAL  2,2 гр 200 X 10 бл""",
-    """EXIT жувальна гумка в пластинках-стік без цук.з ароматом  апельсина ORANGE   2,2 гр 200 X 10 бл""",
-    """EXIT жувальна гумка в пластинках-стік без цук.з ароматом кавуна WATERMELON  2,2 гр 200 X 10 бл""",
-    """EXIT жувальна гумка в пластинках-стік без цук.з ароматом м'яти SPEARMINT 2,2 гр 200 X 10 бл""",
-    """EXIT жувальна гумка по 12 пластинок, без цукру з ароматом кавуна  26,4 гр Х10шт. X 20 бл""",
-    """EXIT жувальна гумка по 12 пластинок, без цукру з ароматом кориці  26,4 гр Х10шт. X 20 бл""",
-    """EXIT жувальна гумка по 12 пластинок, без цукру з ароматом ЛИМОНАДА  26,4 гр Х10шт. X 20 бл""",
-    """EXIT жувальна гумка по 12 пластинок, без цукру з ароматом м'яти PEPPERMINT  26,4 гр Х10шт. X 20 бл""",
-    """EXIT жувальна гумка по 12 пластинок, без цукру з ароматом м'яти SPEARMINT  26,4 гр Х10шт. X 20 бл""",
-    """EXIT жувальна гумка по 12 пластинок, без цукру з ароматом полуниці  26,4 гр Х10шт. X 20 бл""",
-    """EXIT жувальна гумка по 12 пластинок, без цукру з ароматом тропічних фруктів  26,4 гр Х10шт. X 20 бл""",
-    """EXIT жувальна гумка-драже в баночці  без цукру зі смаком апельсина та вітаміном "C"  60,8   6 X 8 бл""",
-    """EXIT жувальна гумка-драже в баночці  без цукру зі смаком лимона та вітаміном "C"  60,8   6 X 8 бл """,
-    """FITBAR - "Курага+Фундук" (суміш пресованих сухофруктів з подрібненими горіхами) 30 г Х 20""",
-    """FITBAR- "Інжир+Фундук" (суміш пресованих сухофруктів з подрібненими горіхами) 30 г Х20 """,
-    """FITBAR- "Фінік+Фундук" (суміш пресованих сухофруктів з подрібненими горіхами) 30 гХ 20""",
-    """G&Y Антибактеріальні серветки для рук 90 шт  Х 12""",
-    """GALAXY EXTRA MİNİ жувальна гумка в пластинках с ароматом апельсина 11 г х 24 шт х 24 бл""",
-    """GALAXY EXTRA MİNİ жувальна гумка в пластинках с ароматом кавуна 11 г х 24 шт х 24 бл""",
-    """GALAXY EXTRA MİNİ жувальна гумка в пластинках с ароматом м'яти 11 г х 24 шт х 24 бл""",
-    """GALAXY EXTRA MİNİ жувальна гумка в пластинках с ароматом полуниці 11 г х 24 шт х 24 бл""",
-    """GALAXY EXTRA MİNİ жувальна гумка в пластинках с ароматом тропічних фруктів 11 г х 24 шт х 24 бл""",
-    """GALAXY EXTRA жувальна гумка в пластинках с ароматом кавуна 14,5 г х 20 шт х 20 бл""",
-    """GALAXY EXTRA жувальна гумка в пластинках с ароматом м'яти 14,5  г х 20 шт х 20 бл""",
-    """GALAXY EXTRA жувальна гумка в пластинках с ароматом полуниці 14,5 г х 20 шт х 20 бл""",
-    """GALAXY EXTRA жувальна гумка в пластинках с ароматом тропічних фруктів 14,5 г х 20 шт х 20 бл""",
-    """Gumball Filled Jam (Earth)  Жувальна гумка з наповнювачем "ЗЕМЛЯ " 12гр*50шт*12бл""",
-    """Gumball Filled Jam Жувальна гумка з наповнювачем "ФУТБОЛ " 12гр*50шт*12бл""",
-    """Happy egg 40 gr (набір 8 шт.)""",
-    """Hazelnut Cocoa Cream Farmand паста (банка)  15gr 24 шт Х 6 бл""",
-    """HLEKS""",
-    """IHSAR (Сарай)""",
-    """İLHAM """,
-    """Janitex Антибактеріальні вологі серветки 72 шт  Х12 """,
-    """Janitex Антибактеріальні вологі серветки з вмістом спирту 75 %  80 шт  Х24""",
-    """Janitex Вологі серветки з вмістом спирту 70% 40 шт  X 36""",
-    """Janitex Вологі серветки з вмістом спирту 75 %  80 шт  Х 12""",
-    """JANITEX; OMEGA (серветки)""",
-    """JELİDO 135G ROLLER MARSHMALLOW/JELIDO Цукерки маршмелоу " ROLLER ", 135гр Х 24 шт""",
-    """JELİDO 135G TWIST MARSHMALLOW/JELIDO Цукерки маршмелоу " TWIST ", 135гр Х 24 шт""",
-    """JELIDO 15G MARSHMALLOW MIX/JELIDO Цукерки маршмелоу " MIX", 18гр Х 24 шт Х 8 бл""",
-    """JELIDO PINK&WHITE M.MALLOW 135GX24/JELIDO Цукерки маршмелоу "PINK&WHITE ", 135гр Х 24 шт""",
-    """KAPMA Джезерьє  з фісташками 50 г""",
-    """KAPMA Джезерьє з  арахісом 50 г""",
-    """KAPMA Джезерьє з лісовим горіхом 50 г""",
-    """Kent Boringer""",
-    """Kenton""",
-    """La cafe Драже "Шоколадний мікс" 230 г Х24 """,
-    """LEONIAN""",
-    """MELODY жувальна гумка с ароматом апельсина 3 г х 100 шт Х10 бл""",
-    """MELODY жувальна гумка с ароматом банана 3 г х 100 шт Х 10 бл """,
-    """MELODY жувальна гумка с ароматом кавуна 3 г х 100 шт Х 10 бл""",
-    """MELODY жувальна гумка с ароматом полуниці 3 г х 100 шт Х 10 бл""",
-    """MERTSAN""",
-    """Mesh Чай - ДЕТОКС 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай абрикосовий 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай АНТИСТРЕС  ромашковий 32 г (2,1 г Х 16 шт) Х 12""",
-    """Mesh Чай гранатовий 35 г (2,1 г Х 16 шт) Х 12""",
-    """Mesh Чай для мам- годувальниць  32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай з вітаміном С 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай з лісових ягід  32 г (2 г Х 16 шт )  Х 12""",
-    """Mesh Чай з лісових ягід  32 г (2 г Х 16 шт )  Х 12""",
-    """Mesh Чай з лісових ягід 2 г """,
-    """Mesh Чай з фенхелю 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай з фенхелю 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай з чебрецем 14 г (0,8 г Х 16 шт) Х 12""",
-    """Mesh Чай з шавлії 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай з шавлії 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай з шипшини 40 г (2,5 г Х 16 шт )  Х 12""",
-    """Mesh Чай з шипшини, 2 г Х 300 шт х 1 кор""",
-    """Mesh Чай Заспокійливий вечірній чай  32г X 12""",
-    """Mesh Чай зелений 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай зелений зі смаком манго 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай зелений, 2 г Х 300 шт х 1 кор""",
-    """Mesh Чай лимоно-iмбірний  32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай м’ятний 28,8  г (1,8 г Х 16 шт ) Х 12""",
-    """Mesh Чай РОЙБОС ванільний 32 г ( 2 г 16 шт )  Х 12""",
-    """Mesh Чай ромашковий 35 г (2,1 г Х 16 шт) Х 12""",
-    """Mesh Чай чорний  з бергамотом 32 г (2 гХ 16 шт ) Х 12""",
-    """Mesh Чай чорний  з бергамотом, 2 г Х 300 шт х 1 кор""",
-    """Mesh Чай чорний , 2 г Х 300 шт х 1 кор""",
-    """Mesh Чай чорний 2 г """,
-    """Mesh Чай чорний 32 г (2 г Х 16 шт) Х 12""",
-    """Mesh Чай яблучний 32 г (2 г Х 16 шт) Х 12""",
-    """MINIYUM Chewy Stick Candy (Assorted) PVC 120x6,7g -Цукерки жув MINIYUM Stick Candy (асорті) 7г 120х8""",
-    """MISSO""",
-    """MONDELEZ Missbon Цукерки льодяники з кавовою начинкою 43 гр. 24штХ12бл """,
-    """MONDELEZ Missbon Цукерки льодяники з начинкою Вишня -Малина 43 гр. 24штХ12бл """,
-    """MONDELEZ Missbon Цукерки льодяники з начинкою Класік з молочною начинкою, 43 гр. 24штХ12бл """,
-    """MONDELEZ Missbon Цукерки льодяники з начинкою Яблуко- полуниця, 43 гр. 24штХ12бл """,
-    """Monitor Samsung 18.5" S19F350H (LS19F350HNIXCI)""",
-    """Monitor Samsung 23.5" S24F350H (LS24F350FHIXCI)""",
-    """MR. BABOL GUM жувальна гумка с ароматом банана 20 г х 20 шт х 24 бл""",
-    """MR. BABOL GUM жувальна гумка с ароматом кавуна 20г х 20 шт х 24 бл""",
-    """MR. BABOL GUM жувальна гумка с ароматом полуниці 20 г х 20 шт х 24 бл""",
-    """MR. BABOL GUM жувальна гумка с ароматом тропічних фруктів 20 г х 20 шт х 24 бл""",
-    """MUHENDISLIK""",
-    """NEW BALLOON жувальна гумка (з тату) с ароматом апельсина 18 г х 20 шт х 24 бл""",
-    """NEW BALLOON жувальна гумка (з тату) с ароматом банана 18 г х 20 шт х 24 бл""",
-    """NEW BALLOON жувальна гумка (з тату) с ароматом кавуна 18 г х 20 шт х 24 бл""",
-    """NEW BALLOON жувальна гумка (з тату) с ароматом полуниці 18 г х 20 шт х 24 бл""",
-    """NEW BALLOON жувальна гумка (з тату) с ароматом тропічних фруктів 18 г х 20 шт х 24 бл""",
-    """NOODLE BAG CHICKEN / Вермішель швидкого приготування BANETTI зі смаком курки, 75 гр*40 шт""",
-    """NOODLE BAG CURRY/ Вермішель швидкого приготування BANETTI зі смаком карі, 75 гр*40 шт""",
-    """NOODLE BAG TOMATO/ Вермішель швидкого приготування BANETTI зі смаком томатів, 75 гр*40 шт""",
-    """NOODLE BAG VEGETABLE/ Вермішель швидкого приготування BANETTI з овочевою приправою, 75 гр*40 шт""",
-    """Noodle Cup Chıcken/ Вермішель шв приготування у паперовому стакані BANETTI зі смаком курки, 65 г Х16""",
-    """Noodle Cup Tomato/ Вермішель шв  пригот у паперовому стакані BANETTI зі смаком томатів, 65 г Х 16 шт""",
-    """Noodle Cup Vegatable/ Вермішель шв пригот у папер стакані BANETTI з овочевою приправою, 65 г Х 16""",
-    """O’ye Драже "Камінці" 20 г 24Х8""",
-    """OBA FOOD (Pasta Lucia / Вермишель)""",
-    """OBA Mie Локшина швидкого приготування зі смаком курки (60 грХ40 шт) БЕЗ ПРИПРАВОЧНОЇ ОЛІЇ""",
-    """OBA Mie Локшина швидкого приготування зі смаком овочів (60 грХ40 шт) БЕЗ ПРИПРАВОЧНОЇ ОЛІЇ""",
-    """ORIGINAL.GOURMET (ОриджиналГурмет)""",
-    """Pallets Epal (паллеты)""",
-    """Pasha Доміно  1,5 кг""",
-    """Pasha Доміно  400 г""",
-    """Pasha Доміно 200 г""",
-    """Pasha Зімбабве 1,5 кг""",
-    """Pasha Зімбабве 200 г""",
-    """Pasha Зімбабве 400 г""",
-    """Pasha Курага  грецький горіх 150 гр""",
-    """Pasha Курага  грецький горіх 300 гр""",
-    """Pasha Лукум """,
-    """Pasha Лукум Ассорті 1,5 кг""",
-    """Pasha Лукум з Апельсином  1,5 кг""",
-    """Pasha Лукум з апельсином 400 г""",
-    """Pasha Лукум з бананом  200 г""",
-    """Pasha Лукум з ваніллю 400 г""",
-    """Pasha Лукум з гранатом 200 г""",
-    """Pasha Лукум з журавлиною 1,5 кг""",
-    """Pasha Лукум з журавлиною 200 г""",
-    """Pasha Лукум з м’ятою  400 г""",
-    """Pasha Лукум з полуницею  200 г""",
-    """Pasha Лукум з Полуницею 1,5 кг""",
-    """Pasha Лукум з трояндою 200 г""",
-    """Pasha Лукум з трояндою 400 г""",
-    """Pasha Лукум з Яблуком 1,5 кг""",
-    """Pasha Лукум Міні  1,5 кг""",
-    """Pasha Лукум Міні  400 г""",
-    """Pasha Лукум Міні 200 г""",
-    """Pasha Лукум Наречена грецький горіх 1,5 кг""",
-    """Pasha Лукум Наречена грецький горіх 200 г""",
-    """Pasha Лукум Наречена грецький горіх 400 гр""",
-    """Pasha Нуга 1,5 кг""",
-    """Pasha Нуга 400 г""",
-    """Pasha Принцеса 1,5 кг""",
-    """Pasha Принцеса 200 г""",
-    """Pasha Принцеса 400 г""",
-    """Pasha Рол гранат басма мигдаль 1,5 кг""",
-    """Pasha Рол гранат басма мигдаль 200 г""",
-    """Pasha Рол гранат басма фундук 1,5 кг""",
-    """Pasha Рол гранат басма фундук 200 г """,
-    """Pasha Рол гранат басма фундук 400 г""",
-    """Pasha Султан басма мигдаль 200 г""",
-    """Pasha Султан -лукум з мигдалем басма 1.5 кг""",
-    """Pasha Султан -лукум з фундуком  басма 1.5 кг""",
-    """Pasha Султан нуга 200 г""",
-    """Pasha Султан-лукум з фундуком басма 400 гр""",
-    """Pasha Султан-лукум рол, Веселка 1,5 кг""",
-    """Pasha Султан-лукум рол, Веселка 200 гр""",
-    """Pasha Султан-лукум рол, Веселка 400 гр""",
-    """Pasha Фітіль  Банан 400 г""",
-    """Pasha Фітіль  Ожина 400 г""",
-    """Pasha Фітіль  Султан  400 г""",
-    """Pasha Фітіль Апельсин  400 г""",
-    """Pasha Фітіль Апельсин 1,5 кг""",
-    """Pasha Фітіль Банан 1,5 кг""",
-    """Pasha Фітіль Гранат 1,5 кг""",
-    """Pasha Фітіль Гранат 400 г""",
-    """Pasha Фітіль з арахісом Апельсин 200 г""",
-    """Pasha Фітіль з арахісом Гранат 200 г""",
-    """Pasha Фітіль з арахісом Ожина 200 г""",
-    """Pasha Фітіль з арахісом Яблуко 200 г""",
-    """Pasha Фітіль Ожина  1,5 кг""",
-    """Pasha Фітіль Султан  1,5 кг""",
-    """Pasha Фітіль Яблоко 1,5 кг""",
-    """Pasha Фітіль Яблуко 400 г""",
-    """Pasha Чізерія 1,5 кг""",
-    """Pasha Чізерія 200 г""",
-    """Pasha Чізерія 400 г""",
-    """Pasha Чорнослив грецький горіх 150 гр""",
-    """Pasha Чорнослив грецький горіх 300 гр""",
-    """PLAY TOYS (ПлейТойс)""",
-    """PPU""",
-    """Prestige (Престиж)""",
-    """REFREŞ жувальна гумка (з тату) с ароматом кавуна 14,5 г х 20 шт х 12 бл""",
-    """REFREŞ жувальна гумка (з тату) с ароматом коли 14,5 г х 20 шт х 12 бл""",
-    """REFREŞ жувальна гумка (з тату) с ароматом м'яти 14,5 г х 20 шт х 12 бл""",
-    """REFREŞ жувальна гумка (з тату) с ароматом полуниці 14,5 г х 20 шт х 12 бл""",
-    """SAADET""",
-    """Saloon """,
-    """SARAN (SARVAN)""",
-    """SATÜRN (Сатурн)""",
-    """Scanmix Term-Armix клейова суміш (25кг)""",
-    """SERT SEKER ( веселка ) цукерки на паличці  в пласт банці 50 шт Х 8 б""",
-    """SERT SEKER ( ролл ) цукерки на паличці  в пласт банці 50 шт Х 8 б""",
-    """SERT SEKER (олівець) цукерки на паличці  в пласт банці  50 шт Х 8 б""",
-    """SERT SEKER (спіральки) цукерки на паличці  в пласт банці  50 шт Х 8 б""",
-    """SHPR Балка BOX/BK 1800мм (профіль 80х40х1,5мм)""",
-    """SHPR Балка BOX/BK 2700мм (профіль 130х40х1,5мм)""",
-    """SHPR Захист стійки кутовий 4 мм""",
-    """SHPR Рама 3000х1100мм (профіль 90х70х1,5мм)""",
-    """SHPR Рама 4500х1100мм (профіль 90х70х1,5мм)""",
-    """SHPR Стяжка 90-200 мм""",
-    """Sima apple marmalade""",
-    """SIMA APRICOT CANNED FOOD""",
-    """Sima apricot marmalade""",
-    """Sima Cherry candy""",
-    """Sima Chestnut canoy""",
-    """Sima peach canned food""",
-    """Sima pear canned food""",
-    """Sima quince canned food""",
-    """Sima tutti frutti""",
-    """Sima tutti frutti  gel strawebery""",
-    """Sima tutti frutti gel peach""",
-    """Sima Tutti Frutti Gel Rasprberry""",
-    """Sima Tutti frutti gel scur chtrry""",
-    """SIMSEK (Шимшек)""",
-    """SLIM (DOCILE)""",
-    """SOLEN""",
-    """SUN FRESH жувальна гумка в подушечках з ароматом кавуна 13,2 гр 20 X 9 бл NEW""",
-    """SUN FRESH жувальна гумка в подушечках з ароматом кавуна 16,2 гр 20 X 9 бл""",
-    """SUN FRESH жувальна гумка в подушечках з ароматом кислої вишні 13,2 гр 20 X 9 бл NEW""",
-    """SUN FRESH жувальна гумка в подушечках з ароматом кислої вишні 16,2 гр 20 X 9 бл""",
-    """SUN FRESH жувальна гумка в подушечках з ароматом м’яти 13,2 гр 20 X 9 бл NEW""",
-    """SUN FRESH жувальна гумка в подушечках з ароматом м'яти 16,2 гр 20 X 9 бл""",
-    """TANAY (CAYKUR) (Чай)""",
-    """TAYAS""",
-    """TAYAS GOLD COIN CHOCOLATES PVC 500G/ Шоколадні цукерки ( монети) "COIN CHOCOLATE" , 500 г Х12""",
-    """test""",
-    """The Mill Gourmet Аджука (Спред для сніданків) ГОСТРА - 320 гр Скляна Банка Х12""",
-    """The Mill Gourmet Апельсинове Варення  - 470 гр Скляна Банка Х12""",
-    """The Mill Gourmet Вялені на Сонці Томати (Обсмаж. на Грилі зі Спеціями) - 380 гр Скляна Банк Х12""",
-    """The Mill Gourmet Зелені Оливки Каламата - 730 гр Скляна Банка Х12""",
-    """The Mill Gourmet Натурально Ферментовані Чорні Оливки - 450 гр Скляна Банка Х12""",
-    """The Mill Gourmet Оливки на Грилі (з чесником та спеціями) - 380 гр Скляна Банка Х12 """,
-    """The Mill Gourmet Паста з Вялених на Солнці Томатів - 750 гр Скляна Банка Х12 """,
-    """The Mill Gourmet Паста з гострого Перцю - 750 гр Скляна Банка Х12 """,
-    """The Mill Gourmet Паста з солодкого Перцю - 750 гр Скляна  Банка Х12""",
-    """The Mill Gourmet Салат з Оливок (з горіхом , лим. та вяленими томатами) - 380 гр Скляна Банка Х12""",
-    """The Mill Gourmet Салат з Оливок на Грилі  (з вяленими томатами) - 380 гр Скляна Банка Х12""",
-    """The Mill Gourmet Чорні Оливки Каламата - 730 гр Скляна  Банка Х12""",
-    """TIBTRAP""",
-    """TORKU""",
-    """Torku 4Х4 Батончик з нугою арахісом та карамеллю в шок. глазурі 18гр 24*6 бл """,
-    """Torku 4Х4 Батончик з нугою арахісом та карамеллю в шок. глазурі 32гр 24*6 бл """,
-    """Torku 4Х4 Батончик з нугою та карамеллю в шок. глазурі 32гр 24*6 бл """,
-    """Torku 4Х4 Батончик з нугою та карамеллю в шок. глазурі 50гр 24*6 бл """,
-    """Torku 4Х4 Батончик з нугою, карамеллю та арахісом  в шок. глазурі 50гр 24*6 бл """,
-    """Torku Carafest Цукерки з карамельним  смаком та молочним  наповнювачем 1000гр Х8 """,
-    """Torku Coffefest Цукерки з молочним смаком та кав. наповнювачем 1000гр Х8 """,
-    """Torku Gala Тістечко з карамеллю в шок. глазурі 50гр 24Х6 бл""",
-    """Torku Gala Тістечко з лісовими ягодами в шок.глазурі і 50гр 24Х6 бл""",
-    """Torku Milkyfest Цукерки з молочним смаком та фруктовим наповнювачем 1000гр Х8 """,
-    """Torku Play Jelly Желейні цукерки мікс 36шт*20гр Х 8 бл """,
-    """Torku Play Jelly Желейні цукерки фруктовий мікс 1000гр Х 12""",
-    """Torku Premio Печиво Сендвіч з какао та мол. кремом 57 гр 24*4 бл""",
-    """Torku Premio Печиво Сендвіч з какао та мол. кремом 95 гр 24шт""",
-    """Torku Tam Печиво цільнозернове вівсяне 125 гр Х 12""",
-    """Torku Tam Печиво цільнозернове вівсяне 375 гр Х 12""",
-    """Torku Tam Печиво цільнозернове пшеничне 3*131гр Х 14шт """,
-    """Torku Tofily Жув. цукерки з нач. фруктовим ароматом 1000гр Х8 """,
-    """ULKER "ALBENI SLIM"шоколадный батончик и печенье покрытое молочным шоколадом 47г*18шт*6бл № 00357-04""",
-    """ULKER "ALBENI" кекс в шоколадной глазури 35г*18шт*9бл № 00337-06""",
-    """ULKER "COKONAT" вафли в шоколаде с фундуком 32г*24шт*6бл № 00275-09""",
-    """ULKER "GOLDEN"  горький шоколад с какао 40г*12шт*6бл № 00212-03""",
-    """ULKER "GOLDEN"  горький шоколад с какао 80г*6шт*6бл № 00262-03""",
-    """ULKER "GOLDEN"  шоколад молочный 40г*12шт*6бл № 00210-03""",
-    """ULKER "GOLDEN"  шоколад молочный 80г*6шт*6бл № 00250-03""",
-    """ULKER "GOLDEN"  шоколад молочный 80г*6шт*6бл № 00260-03""",
-    """ULKER "GOLDEN"  шоколад с 70% какао 100г*6шт*6бл № 00249-01""",
-    """ULKER "GOLDEN"  шоколад с 70% какао 80г*6шт*6бл № 00249-02""",
-    """ULKER "GOLDEN"  шоколад с орехом 100г*6шт*6бл № 00249-04""",
-    """ULKER "GOLDEN" шоколад с какао 80г*6шт*6бл № 00252-03""",
-    """ULKER "GOLDEN" шоколад с фисташками 80г*6шт*6бл № 00254-03""",
-    """ULKER "KREMINI" Конфеты с апельсиновым кремом 50г*20шт*12бл № 00537-08""",
-    """ULKER "KREMINI" Конфеты с молочным кремом 50г*20шт*12бл № 00553-08""",
-    """ULKER "YUPO" шоколадное яйцо с игрушкой внутри 20г*288шт № 01411-09""",
-    """ULKER "YUPO" шоколадное яйцо с игрушкой внутри 60г*96шт № 01411-09""",
-    """ULKER (Улькер)""",
-    """UNION candy""",
-    """VANELLI""",
-    """Vanelli "Waffle Cake chocolate Angry Birds 40 гр 24штХ6 бл""",
-    """VENUS (BURSA)""",
-    """Автомобиль AUDI  A4""",
-    """Автомобиль LAND ROVER RR L460  (SALKA9B47PA047243) білий1""",
-    """Автомобиль LAND ROVER RR L460  (SALKA9B94PA206038) чорний2""",
-    """Автомобиль VOLVO""",
-    """Адаптер USB Wi-fi мережевий """,
-    """Акустична система """,
-    """АЛЬЯНС УКРАИНА""",
-    """Анкета""",
-    """Антизшивач (антистеплер)""",
-    """Арахис, кг""",
-    """Арахис,250 г""",
-    """Арахіс оброблений смажений з сіллю (60 гр.*12шт/уп)""",
-    """Арахіс смажений в хрусткій оболонці з соусом (150 гр*12 шт/уп)""",
-    """Арахіс смажений з сіллю необроблений (70 гр.*12 шт/уп)""",
-    """Арахіс смажений з соусом (60гр*12шт/уп)""",
-    """Аренда кухні""",
-    """Аренда склада+офиса""",
-    """Аренда юр. адреса (виртуальній офис)""",
-    """Аренда: електроенергія+вода""",
-    """Асорті "Барбекю Мікс"60 г Х50""",
-    """Асорті горіхів та ядер насіння гарбуза "Коктейл Солті" 60 гХ12""",
-    """АТС Panasonik KX-TEM824UA + 2 psc KX-T7730UA + 1 pcs KX-T7735UA (аналогова гибридна)""",
-    """Аудиторсько--консультативні послуги""",
-    """Балка стелажа SN 1535 мм (оцинкована) """,
-    """Балка стелажа SN 1840 мм (оцинкована) """,
-    """Балка стелажа SN 2450 мм (оцинкована) """,
-    """Батарейки АА (упаковка)""",
-    """Батарейки ААА (упаковка)""",
-    """Батончик  "LUNA" хрусткі вафлі з карамеллю вкриті молочним шоколадом 28гр Х24 шт Х6 бл""",
-    """Батончик " CocoRun " з кокосовою нугою вкритий молочно-шоколадною глазур'ю 20 гр 24 шт Х6 бл""",
-    """Батончик "ALPELLA"вафля с лес.орех.в белом.шок.38г*24шт*6бл/ №894""",
-    """Батончик "ALPELLA"вафля с лесн.орех.в горьк.шок.38г*24шт*6бл/№895""",
-    """Батончик "ALPELLA"вафля с лесн.орех.в мол.шок. 38г*24шт*6бл/№893""",
-    """Батончик "BİEN" вафлі в шоколаді 32гр х6 х 24""",
-    """Батончик "CASH " з нугою та карамеллю вкритий молочним шоколадом 20 гр 24 шт Х 6 бл""",
-    """Батончик "Cocostar" с кокосом покрыт. мол.шок. 44г*24шт*6бл""",
-    """Батончик "COCOTAT" з кокосовою начинкою у глазурі, 800гр*10 шт """,
-    """Батончик "Coсonat" вафля с арахис. крем. и фундуком покрыт. мол.шок. 264г*12шт""",
-    """Батончик "Coсonat" вафля с арахис. крем. и фундуком покрыт. мол.шок. 32г*24шт*6бл""",
-    """Батончик "DAY&NIGHT" з полуничною начинкою у глазурі 22гр х6 х 24""",
-    """Батончик "DIDO" вафлі в шоколаді 35 гр Х 24шт Х 6 бл""",
-    """Батончик "DIDO" вафлі в шоколаді 38 гр Х 24 Х 6""",
-    """Батончик "DIDO" вафлі в шоколаді 38 гр Х 24шт Х 6 бл""",
-    """Батончик "FRUIT BAR" з апельсиновою нугою вкритий молочно-шоколадною глазур'ю 21 гр 24 шт Х 6 бл""",
-    """Батончик "LUNA" карамель и вафля покрыт. мол.шок. 33г*24шт*6бл""",
-    """Батончик "Maestro" нуга, карамель и арахис покрыт. мол.шок. 40г*24шт*6бл""",
-    """Батончик "Metro NUT" нуга и карамель покрыт. мол.шок. 40г*24шт*6бл""",
-    """Батончик "Metro" нуга и карамель покрыт. мол.шок. 40г*24шт*6бл""",
-    """Батончик "Metro" с карамелью и нугой в молочном шоколаде 40г*24шт*6бл/Хамле №350-10""",
-    """Батончик "METRO" с карамелью, арахисом и нугой, покрытый молочным шоколадом 40г*24шт*6бл № 00393-06""",
-    """Батончик "METRO" с нугой № 00410-02""",
-    """Батончик "METRO" с нугой и карамелью, покрытый молочным шоколадом 40г*24шт*6бл № 00350-09""",
-    """Батончик "METRO" с нугой, покрытый шоколадом (3 кг) Mini 17г*176шт № 00348-03""",
-    """Батончик "METRO" с нугой, покрытый шоколадом 40г*24шт*6бл № 00350-09""",
-    """Батончик "METRO" с орехом, покрытый шоколадом 40г*24шт*6бл № 00393-06""",
-    """Батончик "METRO" с орехом, покрытый шоколадом 40г*24шт*6бл № 00393-07""",
-    """Батончик "Piko" вафля и карамель с воздушным рисом в шок. 25г*24шт*6бл""",
-    """Батончик "ROXY" молочний з карамеллю 22гр х6 х 24""",
-    """Батончик "ROXY" фруктовий з карамеллю 22гр х6 х 24""",
-    """Батончик "SINGLE" з нугою, арахісом,карамеллю і молочним шоколадом 22гр х24х6""",
-    """Батончик "SNACK" з нугою та карамеллю вкритий молочно-шоколадною глазур'ю 20 гр  24 шт Х 6 бл """,
-    """Батончик "SNACK" з нугою та карамеллю вкритий молочно-шоколадною глазур'ю 27 гр  24 шт Х 6 бл """,
-    """Батончик "TRIXY" з карамеллю 22гр х24х6""",
-    """Батончик (стик) JOYDİ з нугою, карамеллю у шоколаді 47 гр х 24 шт х 6 бл""",
-    """Батончик «Boombastic» з арахісом, карамеллю, хрустким рисом в молочному шоколаді  45г  Х24шт Х6 бл """,
-    """Батончик «Boombastik» з кокосом, карамеллю і хрустким рисом  в молочному шоколаді 35г  Х12шт Х6 бл """,
-    """Батончик «Maxbar» в молочному шоколаді з карамеллю і нугою 40г  Х24шт Х6 бл  """,
-    """Батончик «Twingo Karamel» в молочному шоколаді з карамеллю і печивом 42г  Х24шт Х6 бл              """,
-    """Батончик «Wınergy» з карамеллю,нугою та арахісом в молочному шоколаді 30г  Х24шт Х6 бл              """,
-    """Батончик Munch из злаков и арахиса 30г*18шт*8бл""",
-    """Батончик Munch из злаков и фундука 30г*18шт*8бл""",
-    """Батончик ROXY з карамелю 22грх6х24""",
-    """Бензин А-95""",
-    """Бензин А-95""",
-    """Бензин А-95 Pulls""",
-    """Бензинова електрогенераторна установка модель FGL3500LE (потужність 3,5кВА)""",
-    """Билеты авиа""",
-    """Билеты ж/д""",
-    """Бисквит "Peki" с абрикосовым кремом 150г*16шт/Хамле №7306-5""",
-    """Бисквит "Peki" с абрикосовым кремом 30г*80шт/Хамле №7306-30""",
-    """Бисквит "Peki" с какао и кремом сгущенного молока 150г*16шт/Хамле №7301-5""",
-    """Бисквит "Peki" с какао и кремом сгущенного молока 30г*80шт/Хамле №7301-30""",
-    """Бисквит "Peki" с какао кремом 150г*16шт/Хамле №7305-5""",
-    """Бисквит "Peki" с какао кремом 30г*80шт/Хамле №7305-30""",
-    """Бисквит "Сонатик" сгущенное молоко+кальций 30г*48шт №90""",
-    """Бисквит "Сонатик" шоколадно-молочный 30г*48шт №92""",
-    '''Бисквит "Шоколадное пирожное BIANCO"''',
-    """Бисквит марка "BALCONI" 280гр*15шт""",
-    """Бисквит марка "BALCONI" 280гр*15шт""",
-    """Бисквит марка "BALCONI" 300гр*15шт""",
-    """Бисквит марка "BALCONI" 300гр*15шт""",
-    """Біндери для паперу 15 мм Economix 12 шт """,
-    """Біндери для паперу 19 мм Economix, 12 шт""",
-    """Біндери для паперу 25 мм Economix, 12 шт""",
-    """Біндери для паперу 32 мм Economix, 12 шт""",
-    """Біндери для паперу 41 мм Economix, 12 шт""",
-    """Біндери для паперу 51 мм Economix, 12 шт""",
-    """Бісквіт "BONA FESTA" ваніль з какао та карамельним соусом 25 гр х24х6""",
-    """Бісквіт "BONA FESTA" ваніль з какао та карамельним соусом 50 гр х24х6""",
-    """Бісквіт "BONA FESTA" ваніль з какао та шоколадним соусом  25 гр х24х6""",
-    """Бісквіт "BONA FESTA" ваніль з какао та шоколадним соусом  50 гр х24х6""",
-    """Бісквіт "BONA FESTA" ванільний з вершковим соусом 25 гр х24х6""",
-    """Бісквіт "BONA FESTA" ванільний з вершковим соусом 50 гр х24х6""",
-    """Бісквіт "DOUBLE UP" ваніль з какао та ванільним соусом 55гр х24х6""",
-    """Бісквіт "DOUBLE UP" ваніль з какао та шоколадним соусом 55гр х24х6""",
-    """Бісквіт "DOUBLE UP" ваніль з какао та шоколадним соусом 60гр х24х6""",
-    """Бісквіт (кекс) «Boombastic» шоколадний з маршмеллоу в молочному шоколаді  40г Х12шт Х6 бл """,
-    """Бісквіт (кекс) «Luppo  Dream Bar» шоколадний з карамеллю  в молочному шоколаді  50г Х12шт Х6 бл""",
-    """Бісквіт (кекс) «Luppo Dream Bar CACAO  » шоколадний з какао начин.  в мол. шоколаді  50г Х12шт Х6 бл""",
-    """Бісквіт (суміш для бісквіту) 350 грамХ8шт Kenton""",
-    """Бісквіт FELLIK вкритий  какао гранулами маршмеллоу  18 гр х 80 шт""",
-    """Бісквіт FELLIK вкритий різнокольоровими та какао гранулами маршмеллоу  18 гр х 80 шт""",
-    """Бісквіт MINI TROY сендвіч з маршмеллоу у какао глазурі  50 гр х 24 шт х 6 бл""",
-    """Бісквіт TIO MIO ваніль з какао та шоколад соусом 42 гр 24*6 """,
-    """бісквіт TIOMIO  ваніль какао 42 гр 24*6""",
-    """Бланки (Видатковий касовий ордер)""",
-    """Бланки (Прибутковий касовий ордер)""",
-    """Бланки Pостэк ТД3""",
-    """Бланки Pостэк ТД4""",
-    """Бланки КТС (добавочный лист)""",
-    """Бланки КТС (основной лист)""",
-    """Блендер""",
-    """Блок для нотаток з клейким шаром""",
-    """Блок для нотаток з клейким шаром 75 х75 мм """,
-    """Блокнот А4""",
-    """Блокнот А5""",
-    """Блокнот А5+ 60 арк., бічна спіраль""",
-    """Блокнот А6""",
-    """Блокноти""",
-    """Бойлер ATLANTIC OPRO Sample R100 (N4L)""",
-    """Больничный""",
-    """бонус к зарплате менеджера""",
-    """брокерські послуги""",
-    """Брошуры( рекламная продукция)""",
-    """Буклет товарний""",
-    """Бутель РС 18,9 л""",
-    """Бытовка в клад""",
-    """ВАФЕЛЬНИЙ РІЖОК " OZMO CORNET" з какао та молочно-шок. начинкою, фунд. та кол. драже 25 гр 24шт Х4бл""",
-    """ВАФЕЛЬНИЙ РІЖОК " OZMO CORNET" з какао та шок-банан. начинкою, фунд. та кол. драже  25 гр 24шт Х4бл""",
-    """Вафельний ріжок "MINICCO CORNET " зі смаком арахісу 25гр 24Х4бл""",
-    """Вафельний ріжок "MINICCO CORNET " зі смаком лісового горіха  25гр 24Х4бл""",
-    """Вафельний Ріжок "TIO CORNET" зі смаком лісового горіха і ванілі та кольоровим драже 25гр х24х4""",
-    """Вафельний Ріжок "TIO CORNET" зі смаком лісового горіха та кольоровим драже 25гр х24х4""",
-    """Вафельний ріжок Ozmo Cornet з кольоровим драже  25 гр 24шт Х4бл""",
-    """Вафельний ріжок Ozmo Cornet з полуничною начинкою та кол. драже   25 гр 24шт Х4бл""",
-    """Вафельні трубочки CRISS CROSS з горіховою начинкою 18 гр.  24Х12бл""",
-    """Вафельні трубочки Love it з малиновою  начинкою 210гр  18шт""",
-    """Вафельні трубочки Love it з полуничною   начинкою 210гр  18шт""",
-    """Вафельный батончик CHOCOMOON в темной глазури 26г*24шт*6бл""",
-    """Вафельный батончик Goflex Maxi 50г*24шт*6бл""",
-    """Вафельный батончик Jupiter 17г*24шт*12бл""",
-    """Вафельный батончик Jupiter 25г*24шт*6бл""",
-    """Вафельный батончик Lupti с кокосом в белой глазури 52г*24шт*6бл""",
-    """Вафельный батончик Lupti с кокосом в темной глазури 52г*24шт*6бл""",
-    """Вафли "Dido" в шоколаде 40г*24шт*6бл/Хамле №285-6""",
-    """Вафли"Карика" с какао кремом 400г*10шт/Хамле №525""",
-    """Вафли"Карика" с какао кремом 400г*12шт/Хамле №525-2""",
-    """Вафли"Карика" с молочным кремом 400г*10шт/Хамле №522""",
-    """Вафли"Карика" с молочным кремом 400г*12шт/Хамле №522-2""",
-    """Вафли"Карика" с фруктовым кремом 400г*10шт/Хамле №531""",
-    """Вафли"Карика" с фруктовым кремом 400г*12шт/Хамле №531-2""",
-    """Вафли"Карика"с какао 400г*10шт/Хамле №521""",
-    """Вафли"Карика"с какао 400г*12шт/Хамле №521-2""",
-    """Вафли"Радуга" с ванилином 400г*12шт/Хамле №510""",
-    """Вафлі  "ANGELS" зі смаком горіха у білій глазурі 30 гр х24 х6""",
-    """вафлі "Angels"зі смаком горіха у білій глазурі 30грх24х6""",
-    """Вафлі "Biscolata Minis Fındıklı" з горіховим кремом в молочному шоколаді 117г  Х24шт""",
-    """Вафлі "BISKIATO NUTS" з фундуком покриті молочним шоколадом 231гр х12шт""",
-    """Вафлі "MINI CUBES" з горіховим кремом 125 г х 24 шт""",
-    """Вафлі "MINI CUBES" з какао-кремом 125 г х 24 шт""",
-    """Вафлі "MINI CUBES" з молочно-ванільним кремом 125 г х 24 шт""",
-    """Вафлі "POCKET" з горіховим кремом 25 г х 25 шт х 8 бл""",
-    """Вафлі "POCKET" з какао-кремом 25 г х 25 шт х 8 бл""",
-    """Вафлі "POCKET" з молочно-ванільним кремом 25 г х 25 шт х 8 бл""",
-    """Вафлі "SNACK" з горіховим кремом 45 г х 30 шт х 4 бл""",
-    """Вафлі "SNACK" з какао-кремом 45 г х 30 шт х 4 бл""",
-    """Вафлі "SNACK" з молочно-ванільним кремом 45 г х 30 шт х 4 бл""",
-    """Вафлі "WINK" з карамеллю,рисовими кульками і молочним шоколадом 25гр х24х6""",
-    """Вафлі «Boombastik» з горіховим кремом і хрустким рисом в молочному шоколаді 32 г  Х12шт Х6 бл  """,
-    """Вафлі «Vip cacao» з какао кремом в молочній глазурі 25г Х24шт Х6 бл """,
-    """Вафлі «Vip cacao» з какао кремом в молочній глазурі 40г Х24шт Х6 бл """,
-    """Вафлі «Тriplex» з молоком та какао кремом та фундуком 20г  Х24шт Х6 бл              """,
-    """Вафлі FULLKAT X-TREME з горіховим кремом у какао- глазурі 65 гр 24штХ6 бл """,
-    """Вафлі FULLKAT X-TREME з горіховим кремом у какао- глазурі 70 гр 24штХ6 бл """,
-    """Вафлі FULLKAT X-TREME з какао кремом у білому шоколаді і 65 гр 24штХ6 бл """,
-    """Вафлі FULLKAT X-TREME з какао кремом у білому шоколаді і 70 гр 24штХ6 бл """,
-    """Вафлі NUTRIX LARGE з какао кремом та арахісом у какао глазурі 55 гр х 24 шт х 6 бл """,
-    """Вафлі NUTRIX LARGE з какао кремом та арахісом у какао глазурі 60 гр х 24 шт х 6 бл """,
-    """Вафлі VILLANI з какао та какао кремом  40 гр х 24 шт х 6 бл""",
-    """Вафлі VILLANI з какао та какао кремом  50 гр х 24 шт х 6 бл""",
-    """Вафлі VILLANI з какао та полуничним кремом  40 гр х 24 шт х 6 бл""",
-    """Вафлі VILLANI з какао та полуничним кремом  50 гр х 24 шт х 6 бл""",
-    """Вафлі VILLANI шоколадні з какао, кокосом та полуничним кремом  40 гр х 24 шт х 6 бл""",
-    """Вафлі VILLANI шоколадні з какао, кокосом та полуничним кремом  50 гр х 24 шт х 6 бл""",
-    """Вафлі Wafers XXL горіховим кремом у білій глазурі 55 гр х 12 шт х 12 бл""",
-    """Вафлі Wafers XXL горіховим кремом у білій глазурі 55 гр х 24 шт х 6 бл""",
-    """Вафлі Wafers XXL горіховим кремом у какао - глазурі 55 гр х 24 шт х 6 бл""",
-    """Вафлі WAFERS з какао та ванільним смаком 450 грХ 12 шт""",
-    """Вафлі в шоколаді "ÇIKOLATALI" зі смаком фундука 35грХ36штХ6 бл""",
-    """Вафлі в шоколаді з фундуком "COKONAT"33грХ24штХ6 бл""",
-    """Вафлі вкриті молочним шоколадом 35гр х 6 х 36""",
-    """Вафля KATAKIT PREMIUM з какао кремом у молочному шоколаді 40 гр х 24 шт х 6 бл""",
-    """Вафля KATAKIT PREMIUM з какао кремом у чорному  шоколаді 40 гр х 24 шт х 6 бл""",
-    """Вафля Limousine з какао кремом у білій глазурі  45гр. Х 24штХ6 """,
-    """Вафля Limousine з какао кремом у какао глазурі 45гр. Х 24штХ6 """,
-    """Вафля хрустка "RİCO" з рисовими кульками вкрита кондитерською глазур'ю  22гр х24х6""",
-    """Ввод остатков""",
-    """Веб-хостінг """,
-    """ВЕД Експертне підтвердження контрактних цін""",
-    """ВЕД Заповнення ВМД""",
-    """Ведение бухучета""",
-    """Вершки збиті 48 грамХ24 Kenton """,
-    """Ветеринарно-санітарний огляд харчових продуктів""",
-    """Вибухова карамель "SHOOGY  BOOM" Кола  7гр. Х 40шт.Х6 бл.""",
-    """Вибухова карамель "SHOOGY  BOOM" Лимон  7гр. Х 40шт.Х6 бл.""",
-    """Вибухова карамель "SHOOGY  BOOM" Полуниця   7гр. Х 40шт.Х6 бл.""",
-    """Вибухова карамель "SHOOGY  BOOM" Помаранч 7гр. Х 40шт.Х6 бл.""",
-    """Вибухова карамель "SHOOGY  BOOM" Туті Фруті  7гр. Х 40шт.Х6 бл.""",
-    """Вивіз сміття""",
-    """Виготовлення лайтбокса""",
-    """видача (подовження) дозволу на застосування праці іноземців""",
-    """Виділення телефонних номерів""",
-    """Визитки""",
-    """Визитки изготовление""",
-    """визовий збор""",
-    """Виїзд спеціаліста """,
-    """Вимірювач артеріального тиску""",
-    """Візитна карта""",
-    """Візок несамохідний гідравлічний LHM230""",
-    """Візок несамохідний гідравлічний TOYOTA LHM230B P/P 1150""",
-    """Візок ручний Скіф 1240*565*630 мм до 180кг (FT-2003)""",
-    """Віник-сорго підвищенного гатунку""",
-    """Вітрина 1000*418*1900 для выставки""",
-    """Вішалка для одягу 125А чорн. """,
-    """Вішалка стояча для одягу""",
-    """Вода "Живой Істочнік" 18,9 л""",
-    """Вода 18,9 л""",
-    """Водонагрівач бойлер Bosch""",
-    """Водонагрівач електричний над мийкою""",
-    """Водяной пистолет 5гр*12шт**6бл""",
-    """Возврат долга""",
-    """Воздушное "MARSHMALLOW"  13грХ30штХ20 бл""",
-    """Возмещение транспортных расходов""",
-    """Восточные сладости Gulbaba ассорти Multipakmix (5*30г)  150г*48шт""",
-    """Восточные сладости Gulbaba с арахисом в морковной нуге 50г*21шт*8бл""",
-    """Восточные сладости Gulbaba с фисташкой в морковной нуге 50г*21шт*8бл""",
-    """Восточные сладости Gulbaba с фундуком в морковной нуге 50г*21шт*8бл""",
-    """выдача справки""",
-    """Выставка""",
-    """Гели для душа""",
-    """Гель для душа Біла свіжість 500 млХ12шт Saloon """,
-    """Гель для душа Ванілін 500 млХ12шт Saloon """,
-    """Гель для душа Екзотичні квіти 500 млХ12шт Saloon """,
-    """Гель для душа Орхідея і Малина 500 млХ12шт Saloon """,
-    """Глазур цукрова (жовтий колір) 100 грам Kenton""",
-    """Глазур цукрова (рожевий колір) 100 грам Kenton""",
-    """Глазур цукрова (синій колір) 100 грам Kenton""",
-    """Глазур цукрова (червоний колір) 100 грам Kenton""",
-    """Горіхи мікс, 100 г""",
-    """Горіхи мікс, 200 г""",
-    """Горіхова паста з какао 350 Х 12 """,
-    """Горошек PIKOLIN, (Поречский КЗ) ТУ, ж/б, 425гр*24шт""",
-    """Горошек конс. в/с PIKOLIN (Поречский КЗ) ГОСТ, ж/б, 425гр*24шт""",
-    """Грузчики """,
-    """Грузчики загрузка машины реализация""",
-    """ГСМ""",
-    """ГСМ""",
-    """Гумка для олівця""",
-    """Гумки для грошей Economix, ассорті""",
-    """Двері металеві""",
-    """Дегустация продукции""",
-    """Десерт "Марбелла" вечерний 132г*15шт №325""",
-    """Десерт "Марбелла" клубника со сливками 132г*15шт №321""",
-    """Детектор валют TechnoVDS VDS-51F mini White""",
-    """Джерело безперебойного живлення UPS 900VA""",
-    """Дизайнерські послуги""",
-    """Дизельна електрогенераторна установка модель FDL13500SE (потужність 13,75кВА) """,
-    """Дизельна електрогенераторна установка модель FDL13500SE3 (потужність 13,75кВА)""",
-    """Дизельна електрогенераторна установка модель FULL-FR44 (потужність 44кВА)""",
-    """Дизельна електрогенераторна установка модель FULL-FR60 (потужність 60кВА)""",
-    """Дизельна електрогенераторна установка модель KDE11SS (потужність 10,5кВА) KAMA BY REIS BRAND CANINET""",
-    """Дизпаливо""",
-    """Дизпаливо Mustang + ДП-Арт-Євро5-ВО""",
-    """Дизпаливо Pulls Diesrl""",
-    """Дизпаливо ДП-3--Арт-Євро5-ВО""",
-    """Дизпаливо ДП-Л-Арт-Євро5-ВО""",
-    """Дильсафа Лукум апельсиновий з лісовим горіхом 50 г""",
-    """Дильсафа Лукум ваниль з фісташками 50 г""",
-    """Дильсафа Лукум гранат з фісташками 50 г""",
-    """Дильсафа Лукум лимоновий з лісовим горіхом 50 г""",
-    """Дирокол (Діркопробивач)""",
-    """Диспенсер - пистолет для скотча (без НДС)""",
-    """Диспенсер - пістолет для клейкої стрічки """,
-    """Диспенсер - пістолет для пакувальної клейкої стрічки""",
-    """Дитяча розмальовка OZMO """,
-    """Діловий щоденник SOLEN """,
-    """Діркопробивач One Hole, на 1 отвір  (4,5 мм)""",
-    """добові""",
-    """Доводчик дверний""",
-    """додаткові транзакції""",
-    """Дозвіл на працевлаштування""",
-    """Документы""",
-    """Долг """,
-    """Долг АЛЬЯНСА Фатиху""",
-    """Доставка""",
-    """Доступ до платформи""",
-    """Доступ до сервісу на "EDI NETWORK", Комарх, Вчасно""",
-    """Драже  "BIBERONE" 18гр х30х20 бл""",
-    """Драже "1924" фрукты и орехи покрытые молочным шоколадом 250гр*12шт № 91005137""",
-    """Драже "1924" фрукты и орехи покрытые шоколадом 250гр*12шт № 91005138""",
-    """Драже "Docile MINTY "  асорті на паперовому стенді, 14 гр 36 X 6 NEW""",
-    """Драже "Docile MINTY "  асорті на паперовому стенді, 14 гр 36 X12""",
-    """Драже "Docile MINTY" з м’ятним  смаком 14 г 12 шт Х 12""",
-    """Драже "Docile MINTY" з полуничним смаком 14 г 12 шт Х 12""",
-    """Драже "Docile MINTY" зі смаком апельсина 14 г 12 шт Х 12""",
-    """Драже "Docile MINTY" зі смаком м’яти та апельсина 14 г 12 шт Х 12""",
-    """Драже "OZMO POPSY" з молочного щоколаду у цукровій глазурі 24 гр 24штХ 6бл""",
-    """Драже "Престиж" 400гр*12шт № 91005174""",
-    """Драже "Престиж" 400гр*12шт № 91005177""",
-    """Драже "Престиж" 700гр*12шт № 91005167""",
-    """Драже "Престиж" 700гр*12шт № 91005176""",
-    """Драже BONIBON з молочного шоколаду у цукровій глазурі, 24,3 гр х 24 шт х 12 бл.""",
-    """Драже кондитерське (золотистий колір) 75 грам Kenton""",
-    """Драже кондитерське (рожево-білий колір) 75 грам Kenton""",
-    """Драже кондитерське (синьо-білий колір) 75 грам Kenton""",
-    """Драже кондитерське (сріблястий колір) 75 грам Kenton""",
-    """Драже фрукты и орехи в шоколаде 200гр*24шт № 91005139""",
-    """Дріжджі сухі 10 грамХ8 бл Kenton""",
-    """Дротяна клавиатура Genius КВ -110 USB CВ Black (31300700113)""",
-    """Друкована продукція рекламні каталоги брошури рекламні -1пак.""",
-    """ДСП 2800х2070 16 мм""",
-    """Експедиційні послуги до міжнародних перевезень""",
-    """Електричний штабелер CDD15J з мачтою STD 3500мм, вилами 1150мм, бат. 24V, 100Ah, встр. зар. пристр.""",
-    """Електроконвектор""",
-    """ЕлектрочайникTefal KO29913E""",
-    """Етикетка - наліпка""",
-    """Етикетка 100*100 термоеко.(500) в.40""",
-    """Етикетка 40*60 ТОП (1 тис. в рул.)""",
-    """Етикетка 40/25 н/г вт.40 (2 тис. в рул.)""",
-    """Етикетка 40/25 н/г ЕКО (1 тис. в рул.)""",
-    """Етикетка 40/25 термотоп вт.40 (2 тис. в рул.)""",
-    """Етикетка 40/60 ТОП (1 тис. в рул.)""",
-    """Етикетка 48*70 термотоп вт.40 (1 тис. в рул.)""",
-    """Етикетка 58*40 ТОП (1 тис. в рул.)""",
-    """Етикетка 58/40 н/г вт.40 (1 тис. в рул.)""",
-    """Етикетка 58/40 термотоп вт.40 (1 тис. в рул.)""",
-    """Етикетка 75/50 н/г вт.40 (1 тис. в рул.)""",
-    """Етикетка 75/50 термотоп вт.40 (1 тис. в рул.)""",
-    """Етикетка напівглянець 39х40/1000 ГТ(друк)""",
-    """Етикетка напівглянець 40х25/1000 ГТ(друк)""",
-    """Етикетка напівглянець 52х30/1000 ГТ(друк)""",
-    """Етикетка напівглянець 52х40/1000 ГТ(друк)""",
-    """Етикетка напівглянець 58х30/1000 ГТ(друк)""",
-    """Етикетка напівглянець 58х40/1000 ГТ(друк)""",
-    """Етикетка напівглянець 58х59/1000 ГТ(друк)""",
-    """Етикетка напівглянець 65х35/1000 ГТ(друк)""",
-    """Етикетка напівглянець 75х49/1000 ГТ(друк)""",
-    """Етикетка напівглянець 95х45/1000""",
-    """Етикетка напівглянець 95х95/1000 ГТ(друк)""",
-    """Етикетка Ріббон 45мм х 300м""",
-    """Етикетка Ріббон 65мм х 300м""",
-    """Етикетка Ріббон 80мм х 300м""",
-    """Етикетка самоклеюча 30х20 Termo ЕКО в рулоні""",
-    """Етикетка самоклеюча 40х25/1000 ТОП""",
-    """Етикетка самоклеюча 58х40/1000 ТОП""",
-    """Етикетка самоклеюча 75х50/1000 ТОП""",
-    """Етикетки Ozmo """,
-    """Етикетки на картоновий стенд""",
-    """Етикетки на картоновий стенд""",
-    """Євроконверт Е65 прозорий на кнопці  180 мкм фактура "глянець" жовтий""",
-    """Євроконверт Е65 прозорий на кнопці  180 мкм фактура "глянець" зелений""",
-    """Євроконверт Е65 прозорий на кнопці  180 мкм фактура "глянець" синій""",
-    """Євроконверт Е65 прозорий на кнопці  180 мкм фактура "глянець" червоний""",
-    """Жеват.резинка"РatBoom" апел.-ананас 28г*20шт*10бл № 0938""",
-    """Жеват.резинка"РatBoom" апел.-ананас(938)(10бл*20шт)""",
-    """Жеват.резинка"РatBoom" вишн-лимон 28г*20шт*10бл № 0932""",
-    """Жеват.резинка"РatBoom" вишн-лимон(932)(10бл*20шт)""",
-    """Жеват.резинка"РatBoom" клуб-ананас 28г*20шт*10бл № 0933""",
-    """Жеват.резинка"РatBoom" клуб-ананас(933)(10бл*20шт)""",
-    """Жеват.резинка"РatBoom" мята-ментол 28г*20шт*10бл № 0936""",
-    """Жеват.резинка"РatBoom" перечная мята-ментол (936)(10бл*20шт)""",
-    """Жеват.резинка"РatBoom" яблоко-лимон 28г*20шт*10бл № 0934""",
-    """Жеват.резинка"РatBoom" яблоко-лимон(934)(10бл*20шт)""",
-    """Жевательная конфета "ФРУСТИНО" 750гр*12шт*апельсин""",
-    """Жевательная конфета "ФРУСТИНО" 750гр*12шт*лимон""",
-    """Жевательная резинка "PROGUM TURBO" 220гр*36шт.""",
-    """Жевательная резинка "PROGUM TURBO" 220гр*40шт.""",
-    """Жевательная резинка "PROGUM TURBO" 4,5гр*100шт*20бл.""",
-    """Жевательный мармелад Sweet Line клубника 50г*24шт*8бл""",
-    """Жевательный мармелад Sweet Line кола 50г*24шт*8бл""",
-    """Желе "Mini Queen Cup Jelly" 26грХ48штХ6""",
-    """Животные из пластмассы 10гр*9шт**6бл""",
-    """Животные из пластмассы 10гр*9шт*6бл""",
-    """Животные из пластмассы 10гр*9шт*6бл""",
-    """Животные из пластмассы 6гр*12шт**6бл""",
-    """Животные из пластмассы 6гр*12шт**6бл""",
-    """Жилет поліестровий з логотипом SOLEN""",
-    """Жорсткий диск Toshiba""",
-    """Жувальна гумка  " LONG BUBBLE STICK "  9 г 50 шт Х 40 """,
-    """Жувальна гумка  "DOUBLE BUBBLE" 20 гр з тату зі смаком кавуна   20Х24 бл""",
-    """Жувальна гумка  "DOUBLE BUBBLE" 20 гр з тату зі смаком Полуниці  20Х24 бл""",
-    """Жувальна гумка  "DOUBLE BUBBLE" 20 гр з тату зі смаком яблука   20Х24 бл""",
-    """Жувальна гумка  "DOUBLE BUBBLE" Оригинал  20 гр з тату  20Х24 бл""",
-    """Жувальна гумка  кульки  "Фруктовий сад" стрічка 1,8гр х48 х12 NEW""",
-    """Жувальна гумка "3D Fruits" 10гр х30шт х20""",
-    """Жувальна гумка "4D Gummy" 18гр х24шт х12""",
-    """Жувальна гумка "AIRBALL PANDA" з ароматом кавуна 3,5 гр 100штХ 24""",
-    """Жувальна гумка "AIRBALL PANDA" з ароматом кавуна 3,5 гр 200штХ 12""",
-    """Жувальна гумка "Cow Eyes" 7гр х60шт х12""",
-    """Жувальна гумка "Crazy roll Gum" ( рулетка) , 10грх24х24""",
-    """Жувальна гумка "CUBE GUM" у пластиковому контейнері 3 г 165 шт Х 12 блок""",
-    """Жувальна гумка "Dinosuar  Eyes" 7 гр х60шт х12""",
-    """Жувальна гумка "DOUBLE BUBBLE" 20 гр з тату  зі смаком банана 20Х24 бл""",
-    """Жувальна гумка "GUMMY ROLL" 6гр Х60Х12бл""",
-    """Жувальна гумка "ILHAM SPEEDY BOY" з іграшкою 2шт*3,5гр   48штХ 6бл""",
-    """Жувальна гумка "ONEO"  з полуничним смаком 60 гр. Х 12 шт. Х 8 бл.""",
-    """Жувальна гумка "ROLLY GUMY"  12гр х24 х24""",
-    """Жувальна гумка "SUPER CAR" у пластиковому контейнері 6 г 48 штХ 12 бл""",
-    """Жувальна гумка "Whistle  Motor gum "  6 gr  30 шт Х20 бл""",
-    """Жувальна гумка "Whistle Football  gum "  6 gr  30 шт Х20 бл""",
-    """Жувальна гумка "Апельсин"  4гр х125 х24""",
-    """Жувальна гумка "Апельсин"  4гр х125 х24""",
-    """Жувальна гумка "Апельсин"  4гр х125 х24 """,
-    """Жувальна гумка "Баскетбол " в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Диня" в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Енерджі-гум" (блістер24) 24гр х24х8""",
-    """Жувальна гумка "Зомбі та вампіри" 1500 грх6""",
-    """Жувальна гумка "Зомбі та вампіри" 1500 грх6 NEW""",
-    """Жувальна гумка "Кавун"  4гр х125 х24""",
-    """Жувальна гумка "Кавун"  4гр х125 х24""",
-    """Жувальна гумка "Кавун"  4гр х125 х24 """,
-    """Жувальна гумка "Кавун" 1000гр х6""",
-    """Жувальна гумка "Кавун" 1500 гр х6""",
-    """Жувальна гумка "Кавун" 1500 гр х6 NEW""",
-    """Жувальна гумка "Кавун" в обгортці 3,5гр х100х12""",
-    """Жувальна гумка "Кавун" в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Кавун" в обгортці 3,5гр х250х6""",
-    """Жувальна гумка "Крик вампіра" (фарбує язик) 1000гр х6""",
-    """Жувальна гумка "Крик вампіра" (фарбує язик) в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Лимон"  4гр х125 х24""",
-    """Жувальна гумка "Лимон"  4гр х125 х24""",
-    """Жувальна гумка "Лимон"  4гр х125 х24 """,
-    """Жувальна гумка "Лимон" 1500 гр х 6""",
-    """Жувальна гумка "Мега Шок Зелене яблуко" 3,6гр х200х6""",
-    """Жувальна гумка "Мега Шок Кола" 3,6гр х200х6""",
-    """Жувальна гумка "Мега Шок Полуниця" 3,6гр х200х6""",
-    """Жувальна гумка "Мозок зомбі" (фарбує язик)  1000гр х6""",
-    """Жувальна гумка "Мозок зомбі" (фарбує язик) в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Пасхальне яйце " 1500 гр х 6 NEW""",
-    """Жувальна гумка "Пейнтбол" в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Піратські бочки" (Кола) в обгортці 3,5гр х100х12""",
-    """Жувальна гумка "Піратські бочки" (Кола) в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Піратські бочки" 1500 гр х 6 NEW""",
-    """Жувальна гумка "Піратські бочки" і 1500 гр х 6""",
-    """Жувальна гумка "Полуниця"  4гр х125 х24""",
-    """Жувальна гумка "Полуниця"  4гр х125 х24""",
-    """Жувальна гумка "Полуниця"  4гр х125 х24 """,
-    """Жувальна гумка "Полуниця" 1000гр х6""",
-    """Жувальна гумка "Полуниця" 1500 гр х6""",
-    """Жувальна гумка "Полуниця" 1500 гр х6 NEW""",
-    """Жувальна гумка "Полуниця" в обгортці 3,5гр х100х12""",
-    """Жувальна гумка "Полуниця" в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Полуниця" в обгортці 3,5гр х250х6""",
-    """Жувальна гумка "Регби  " в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Супер Футбол Поле 11" (блістер24) 22 гр 24х6""",
-    """Жувальна гумка "Теннис " в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Теннис" 1500 гр х6""",
-    """Жувальна гумка "Теннис" 1500 гр х6 NEW""",
-    """Жувальна гумка "Фруктовий сад" стрічка 2,2гр х40х12""",
-    """Жувальна гумка "Фруктовий салат" 1000гр х12""",
-    """Жувальна гумка "Фруктовий салат" 4,45гр 225шт Х6""",
-    """Жувальна гумка "Фруктовое ассорти Fizzy " 1500 гр х 6""",
-    """Жувальна гумка "Фруктовое ассорти Fizzy " 1500 гр х 6 NEW""",
-    """Жувальна гумка "Футбол" 1000гр х6""",
-    """Жувальна гумка "Футбол" 1500 грх6""",
-    """Жувальна гумка "Футбол" 1500 грх6 NEW""",
-    """Жувальна гумка "Футбол" в обгортці 3,5гр х100х12""",
-    """Жувальна гумка "Футбол" в обгортці 3,5гр х200х6""",
-    """Жувальна гумка "Хубба Бубба " ( рулетка) , 10грх24х24""",
-    """Жувальна гумка "Яблуко"  4гр х125 х24""",
-    """Жувальна гумка "Яблуко"  4гр х125 х24""",
-    """Жувальна гумка "Яблуко"  4гр х125 х24 """,
-    """Жувальна гумка "Яйце динозавра"  1000гр х6""",
-    """Жувальна гумка "Яйце динозавра" 1500 гр х 6""",
-    """Жувальна гумка "Яйце динозавра" 1500 гр х 6 NEW""",
-    """Жувальна гумка "Яйце динозавра" в обгортці 3,5гр х200х6""",
-    """Жувальна гумка 4грх125х24""",
-    """Жувальна гумка Bubby Tutti Frutti 225* 6пач""",
-    """Жувальна гумка Eksitra апельсин 3,5 гр 100Х20бл""",
-    """Жувальна гумка Eksitra вишня -лимон 3,5 гр 100Х20бл""",
-    """Жувальна гумка Eksitra Кола  3,5 гр100Х20бл""",
-    """Жувальна гумка Eksitra лимон-полуниця 3,5 гр 100Х20бл""",
-    """Жувальна гумка Eksitra фруктовий мікс 3,5 гр 100Х20бл""",
-    """Жувальна гумка Fruit dent "Кавун" (блістер24) 24грx24х 8""",
-    """Жувальна гумка Fruit dent "Полуниця" (блістер24) 24грx24х 8 """,
-    """Жувальна гумка Fruit dent "ТРОПІКИ " (блістер24) 24гр х24х8""",
-    """Жувальна гумка Fruit dent "Тутті-фрутті" (блістер24) 24гр х24х8""",
-    """Жувальна гумка FRUIT DENT драже 40 гр Х 8шт Х12бл""",
-    """Жувальна гумка HALLOWEEN 42гр  24штХ 6бл""",
-    """Жувальна гумка Love is  зі смаком банан-полуниця, 4,2 г х 100 шт х20 бл""",
-    """Жувальна гумка Love is зі смаком ананас-апельсин, 4,2 г х 100 шт х20 бл""",
-    """Жувальна гумка Love is зі смаком кисла вишня-лемон, 4,2 г х 100 шт х20 бл""",
-    """Жувальна гумка Love is зі смаком кокос-ананас, 4,2 г х 100 шт х20 бл""",
-    """Жувальна гумка Love is зі смаком яблуко-лимон, 4,2 г х 100 шт х20 бл""",
-    """Жувальна гумка NEWBOL  "Полуниця" в обгортці 3,5гр х100х10 NEW""",
-    """Жувальна гумка NEWBOL "Кавун" в обгортці 3,5гр х100х10 NEW""",
-    """Жувальна гумка POMPITO 5.25гр  1000Х12 """,
-    """Жувальна гумка RED "Червона лихоманка гум" (блістер24) 24 гр 24х8""",
-    """Жувальна гумка Sour Ball "Кислі кульки Зелене яблуко" в обгортці 3,5гр х200х6, шт""",
-    """Жувальна гумка TOY"Ігровий гум" (блістер24) 9грх24х12""",
-    """Жувальна гумка TOY"Ігровий гум" (блістер24) 9грх24х6""",
-    """Жувальна гумка X-FRESH "Кавун" 14гр х30 х24.""",
-    """Жувальна гумка X-FRESH "Кавун" 14гр х30 х24бл""",
-    """Жувальна гумка X-FRESH "Мята" 14гр х30 х24бл""",
-    """Жувальна гумка X-FRESH "Полуниця" 14гр х30 х24бл""",
-    """Жувальна гумка в обгортці  "ILHAM MIX"  1000 гр Х8 шт""",
-    """Жувальна гумка в пластинах 12гр х24х30""",
-    """Жувальна гумка в пляшці "Cola Bottle Gum", 6 гр x24х24""",
-    """Жувальна гумка в пляшці "Cola Bottle Gum", 7 гр x24х24""",
-    """Жувальна гумка драже "ILHAM POCKET GUM" 18гр    24штХ 12бл""",
-    """Жувальна гумка з іграшкою "Jumping toy gummy" 3.5грХ30штХ20бл""",
-    """Жувальна гумка з тату " PATRIOT GUM Tatoo" 3,6 г 100 шт Х 24 б """,
-    """Жувальна гумка з тату " PATRIOT GUM Tatoo" 3,7 г 100 шт Х 24 б """,
-    """Жувальна гумка з тату "Love is /Хубба буба"  зі смаком апельсина  17 г 5шт    20 шт Х24""",
-    """Жувальна гумка з тату "Love is /Хубба буба"  зі смаком банана 17 г 5шт    20 шт Х24""",
-    """Жувальна гумка з тату "Love is /Хубба буба"  зі смаком кавуна  17 г 5шт    20 шт Х24""",
-    """Жувальна гумка з тату "Love is /Хубба буба"  зі смаком полуниці  17 г 5шт    20 шт Х24""",
-    """Жувальна гумка з ТАТУ 200шт*12бл""",
-    """Жувальна гумка стрічка  "Зомбі та вампіри" 18 гр.  48 шт Х 12 бл """,
-    """Жувальна гумка фруктове асорті  (форми фруктів) "ILHAM ASSORTED DISPLAY" 40гр  24штХ 6 бл""",
-    """Жувальна гумка фруктове асорті на вішалці (кульки)  "ILHAM ASSORTED HANGER" 40гр  24штХ 6 бл""",
-    """Жувальна гумка Х-Fresh Gum, 14 грх20 штх24 бл.""",
-    """Жувальна гумка"DOUBLE BUBBLE" 20 гр з тату  зі смаком коли  20Х24бл""",
-    """Жувальна гумка-кульки (4,5 гр*20мм) в пакеті "AIR BALL"  1 кг фруктовий мікс   Х12 """,
-    """Жувальна гумка-кульки в пакеті "AIR BALL" в пластиковому контейнері 720штХ 4 """,
-    """Жувальна гумка-олівець "KLAS" фруктовий мікс 4гр 150 шт Х12""",
-    """Жувальна гумка-рулетка  "DOUBLE BUBBLE" з фруктовим смаком 10 гр  48 шт Х12""",
-    """Жувальна цукерка  у пластиковому контейнері  "Chewy Candy LOL ", 9 гр x100х10""",
-    """Жувальна цукерка  у пластиковому контейнері  "Chewy Candy Love is ", 9гр x100х10""",
-    """Жувальна цукерка "BIRTHDAY CAKE" 12гр х20шт х12""",
-    """Жувальна цукерка "Bubble Cream" 20грХ20штх12бл""",
-    """Жувальна цукерка "SMILEY FACE" 2гр х200шт х12""",
-    """Жувальна цукерка "STRAWBERRY" 2гр х200шт х12""",
-    """Жувальна цукерка "Toothpaste Pudding" 35грХ30штХ12""",
-    """Жувальна цукерка TOFITA  зі смаком апельсина , 47 г х 20 шт х 12 бл.""",
-    """Жувальна цукерка TOFITA  зі смаком вишні , 47 г х 20 шт х 12 бл.""",
-    """Жувальна цукерка TOFITA  зі смаком лимона , 47 г х 20 шт х 12 бл.""",
-    """Жувальна цукерка TOFITA  зі смаком ожини , 47 г х 20 шт х 12 бл.""",
-    """Жувальна цукерка TOFITA  зі смаком полуниці , 47 г х 20 шт х 12 бл.""",
-    """Жувальна цукерка з іграшкою "Toy gun+gummy" 3.5грХ30штХ20бл""",
-    """Жувальна цукерка з іграшкою "Toy motor+ Gummy" 3.5грХ30штХ20бл""",
-    """Жувальні цукерки  Cola/Orange/Lemon 10 гр Х50 Х12 бл""",
-    """Жувальні цукерки "Мікс: Шалені пал. Полун.- Ваніль; Шнурки. Супер белтс. Фрукт мікс" 75гр  12х6""",
-    """Жувальні цукерки "Шалені палички. Фруктове асорті" 8,5гр  156х8""",
-    """Жувальні цукерки "Шалені палички. Шипучі. Туті Фруті" 8,5гр  156х8""",
-    """Жувальні цукерки BRAIN  10 гр Х50 Х12 бл""",
-    """Жувальні цукерки CC Stick Candy (Long) 9гр х50 х40бл""",
-    """Жувальні цукерки COLA  GUMMY  8 гр Х30 Х20 бл""",
-    """Жувальні цукерки DEVIL 8 гр Х30 Х20 бл""",
-    """Жувальні цукерки DUCK 10 гр Х50 Х12 бл """,
-    """Жувальні цукерки DUCK GUMMY 10гр х50 х12бл""",
-    """Жувальні цукерки EYEBALL 10 гр Х50 Х12 бл""",
-    """Жувальні цукерки Fastfood Gummy 9гр х30шт х20""",
-    """Жувальні цукерки LADY BIRD 8 гр Х30 Х20 бл""",
-    """Жувальні цукерки NEW EYEBALL 10 гр Х50 Х12 бл""",
-    """Жувальні цукерки STRAWBERRY GUMMY  8 гр Х30 Х20 бл""",
-    """Жувальні цукерки Sushi Gummy  15 гр х20шт х24""",
-    """Жувальні цукерки Sushi Gummy  9 гр х30шт х20""",
-    """Жувальні цукерки Watermelon (кавун) 10 гр Х50 Х12 бл""",
-    """Жувальні цукерки МАНГО 10 гр Х50 Х12 бл""",
-    """Жувальні цукерки ПОЛУНИЦЯ  10 гр Х50 Х12 бл""",
-    """Журнал реестрації вихідноїї кореспонденції А4 """,
-    """Журнал реестрації вхідної кореспонденції А4 """,
-    """Журнал реестрації наказів А4 """,
-    """Журнал реестрації перевірок А4 """,
-    """Заварник 800 мл. скло, пластик""",
-    """Закладки (стікери) з клейким шаром """,
-    """Замок""",
-    """Записник  OZMO """,
-    """Зар.плата """,
-    """зарплата""",
-    """Засіб для видалення бруду Універсальний (багатоцільовий)  750 млХ12шт  ERNET """,
-    """Засіб для видалення жиру 750 млХ12шт  ERNET """,
-    """Засіб для видалення накипу і бруду 750 млХ12шт ERNET """,
-    """Засіб для чищення""",
-    """Засіб для чищення ванних кімнат 750 млХ12шт ERNET""",
-    """Засіб для чищення духовок 750 млХ12шт  ERNET """,
-    """Засіб для чищення кухні 750 млХ12шт  ERNET""",
-    """Засіб для чищення нержавіючих поверхонь 750 млХ12шт  ERNET""",
-    """затраты""",
-    """Збір в Пенсійний фонд 7,5%""",
-    """Зволожувач для пальців""",
-    """Зелені надломлені (Кирма) оливки The Mill (141-160 4XL) 710 гр х12 - Скляна банка """,
-    """Зелені оливки фаршировані перцем The Mill (181-230 2XL-XL) 680 гр х12 - Скляна банка """,
-    """Зошит загальний""",
-    """Зразки продукції для виставки   Dimes 7/24 Нектар мультифруктовий пастеризованний со злаками 200мл.""",
-    """Зразки продукції для виставки   Dimes Нектар Манго 1000мл.""",
-    """Зразки продукції для виставки   Dimes Нектар мультифруктовый пастерізованний со злаками 1000мл.""",
-    """Зразки продукції для виставки  Dimes Life-Light мультивітамінний нектар 1000мл""",
-    """Зразки продукції для виставки  Dimes Moments вижатий апельсиновий сок 0,7L""",
-    """Зразки продукції для виставки  Dimes мультивітамінний нектар 1000мл""",
-    """Зразки продукції для виставки  Футболки з рекламою DIMES""",
-    """Зразки продукції для виставки Dimes """,
-    """Зразки продукції для виставки Dimes 100% апельсиновый напиток 1000мл.""",
-    """Зразки продукції для виставки Dimes Active вишневый нектар 1000мл""",
-    """Зразки продукції для виставки Dimes Active вишневый нектар 250мл""",
-    """Зразки продукції для виставки Dimes Active-Напиток безалког. соковый со вкусом вишни негаз.паст 200 """,
-    """Зразки продукції для виставки Dimes Classic мультифруктовый нектар 250мл""",
-    """Зразки продукції для виставки Dimes Classic-персиковый нектар 200 мл""",
-    """Зразки продукції для виставки Dimes Limonata - Напиток безалкогольный соковый на ароматизаторах нега""",
-    """Зразки продукції для виставки Dimes Limonata Напиток безалкогольный соковый на ароматизаторах негази""",
-    """Зразки продукції для виставки Dimes Moments вижатий гранатовий сік 700мл.""",
-    """Зразки продукції для виставки Dimes Moments вижатий гранатовий сок 250мл.""",
-    """Зразки продукції для виставки Dimes Moments вижатий яблочный сок 250мл.""",
-    """Зразки продукції для виставки Dimes Moments вижатий яблучний сок 700мл.""",
-    """Зразки продукції для виставки Dimes Moments вижатый апельсиновий сок 250мл""",
-    """Зразки продукції для виставки Dimes Moments вижатый апельсиновий сок 700мл.""",
-    """Зразки продукції для виставки Dimes Premium-100% ананасовый напиток1000мл""",
-    """Зразки продукції для виставки Dimes Premium-100% ананасовый сок1000мл""",
-    """Зразки продукції для виставки Dimes Premium-100% апельсиновый сок 1000мл.""",
-    """Зразки продукції для виставки Dimes Premium-100% гранатовий сік 1000мл.""",
-    """Зразки продукції для виставки Dimes Premium-100% мультівитаминний сок 1000мл.""",
-    """Зразки продукції для виставки Dimes Premium-100% сок манго-яблоко 1000мл.""",
-    """Зразки продукції для виставки Dimes Premium-100% яблочный сок 250 мл""",
-    """Зразки продукції для виставки Dimes Premium-100% яблучний сок 1000мл""",
-    """Зразки продукції для виставки Dimes вижатий мультивитамінний сок 250мл.""",
-    """Зразки продукції для виставки Dimes вишневый нектар L 330""",
-    """Зразки продукції для виставки Dimes гранатовий нектар 1000мл""",
-    """Зразки продукції для виставки Dimes мультифруктовый нектар 200 мл""",
-    """Зразки продукції для виставки Dimes Напиток безалкогольный соковый со вкусом ананаса и кокоса негази""",
-    """Зразки продукції для виставки Dimes Напиток безалкогольный соковый со вкусом ананаса и кокоса негази""",
-    """Зразки продукції для виставки Dimes Напиток безалкогольный соковый со вкусом банана и клубники негаз""",
-    """Зразки продукції для виставки Dimes Напиток безалкогольный соковый со вкусом вишни негазированный па""",
-    """Зразки продукції для виставки Dimes персиковый нектар 1000мл""",
-    """Зразки продукції для виставки Dimes персиковый нектар 250мл""",
-    """Зразки продукції для виставки Dimes персиковый нектар 330 л""",
-    """Зразки продукції для виставки Dimes-100% Xpress C мультивитаминний сок 1000мл.""",
-    """Зразки продукції для виставки вироби зі скла механічного виготовлення склянки з логотипом -2 уп """,
-    """Зразки продукції для виставкиDimes Напиток безалкогольный сок со вкусом граната негазирований пастер""",
-    """Зразки продукції для виставкиDimes Напиток безалкогольный соковый со вкусом клубники и арбуза негази""",
-    """зшивач "10 Economixs до 12 арк, метал.корус""",
-    """зшивач №10 Economix до 10 арк, пласт.корус""",
-    """Зшивач №24/6 economix. до 25 арк, пласт корпус """,
-    """Зшивач №24/6, 26/6  Economix до 20 арк., метал корпус""",
-    """Зшивач №24/6, 26/6  МІНІ Economix до 10 арк., пласт. корпус""",
-    """Зшивач №24/6, 26/6, 26/8  Economix до 30 арк., метал корпус""",
-    """Зшивач №24/6. 26/6 Economics, до 25 арк пласт .корпус червоний """,
-    """Игрушка-яйцо "Вырастай-Ка"арт.ZAV-1/12шт""",
-    """Игрушка-яйцо "Вырастай-Ка"арт.ZAV-1/36шт Инд.упаковка""",
-    """ИГРУШКИ""",
-    """Изготовление печатной продукции (наклейки, баннері)""",
-    """иное""",
-    """Іграшка з драже "WATER GUN" "Водяний Пістолет" 10гр х24х6 бл""",
-    """Іграшка з драже "WATER GUN" Губка 10гр х24х6 бл""",
-    """Іграшка машинка з маршмелоу "Super Car with marshmallow" 2.5грХ30штХ24""",
-    """Іграшка пістолет з драже Cowboy Super Pistol 5 гр X12 X6 бл""",
-    """Інспектування автотранспортних засобів""",
-    """Інспектування ветеринарно-санітарного стану автомобіля""",
-    """Інформаційні послуги""",
-    """Кабель Ultra USB 2.0 AM-BM 1,5м (UC22-0150)""",
-    """Кабель КПВ-ВП(350)4х2х0,50 (UTP cat.5),305m ,Одескабель""",
-    """Кава Corsico Gran Crema 80/20 мелена 0,250""",
-    """Кава Corsico Nero Espresso мелена 0,250""",
-    """Кава Gemini Crema мелена 250 г (4820156430461)""",
-    """Кава Ionia Original  мелена 250 г (8005883111166)""",
-    """Кава LAVAZZA мелена 0,250""",
-    """Кава Mesh  бразильська  швидкорозчинна Classic 32 г (2 г Х 16 шт )  Х 12""",
-    """Кава Mesh  бразильська швидкорозчинна Gold  32 г (2 г Х 16 шт )  Х 12""",
-    """Кава рочинна """,
-    """Какао 100% 25 грамХ24Х12бл Kenton""",
-    """Какао 100% 80 грамХ24шт Kenton""",
-    """Какао-драже "MIMIDOTS" в коробці 15гр Х24шт  Х12""",
-    """Какао-драже "MIMIDOTS" в коробці-стенді 15гр Х24шт Х12""",
-    """Какао-драже "MIMIDOTS" пластиковій банці 10грХ50 шт Х12""",
-    """Какао-драже 3,5 гр "CHOCO BALL " у пластиковому контейнері (банка) 1 кг Х12""",
-    """Какао-драже кольорове "Choco Point" у цукровій глазурі (блістер) 20 г Х24 Х12 бл""",
-    """Какао-драже кольорове "CHOCO PUNTO" у цукровій глазурі (блістер) 10г х24 х24бл""",
-    """Какао-драже кольорове "Choco Punto" у цукровій глазурі (блістер) 18 г Х24 Х12 бл""",
-    """Какао-драже кольорове "CHOCO PUNTO" у цукровій глазурі (блістер) 18г х24""",
-    """Какао-драже кольорове L.O.L. у цукровій глазурі 12 г Х 24 Х 12 бл""",
-    """Какао-напиток "Детский" 80г*20шт""",
-    """Какао-напиток "Детский" 80г*40шт""",
-    """Какао-напиток "Золотой вкус" 90г*20""",
-    """Какао-напиток "Российский" 100г*20шт""",
-    """Какао-напиток "Шокомикс" 20г*25шт""",
-    """Календар настінний""",
-    """Календар настінний малий""",
-    """Калькулятор CITIZEN""",
-    """Калькулятор CITIZEN""",
-    """Калькулятор SDC-888T, Citizen""",
-    """Калькулятор кишеньковий Optima 8 розр., розмір 96*60*10мм""",
-    """Калькулятор настольний Optima 12 разр., размер 170*122*32мм""",
-    """Калькулятор настольний Optima 12 розрядов, розмер 200*150*27мм""",
-    """Камера морозильна Elenberg MF 186-O""",
-    """Канцтовари""",
-    """Канцтовары, заправка принтера""",
-    """Капкейк (суміш для капкейков) 350 грамХ8шт Kenton""",
-    """Карта України""",
-    """Картонна підставка""",
-    """Картридж """,
-    """Картридж відновлення""",
-    """Картридж для принтера для ч/б друку Canon i-Sensys LBP226DW (3516C007)""",
-    """Картридж для принтера для ч/б друку HP""",
-    """Картридж заправка """,
-    """Картридж ремонт""",
-    """Картрідж заміна фотобарабану""",
-    """Каталог""",
-    """Каталоги SOLEN """,
-    """Кварц-грунт під штукатурку Standart S(10л)""",
-    """Кекс "Albeni" какао с карамельной начинкой в шоколаде 40г*18шт*9бл/№338-19""",
-    """Кекс "ARMONI" шоколадний з начинкою    30 гр 24Х6 """,
-    """Кекс "Brownie"c какао и шоколадом 240г*12шт/Хамле №1005-6""",
-    """Кекс "Brownie"шоколадный с вишн.дж.240г*12шт/Хамле №1004-6""",
-    """Кекс "CANKEK"  ванільний   25 гр 24Х6 """,
-    """Кекс "CANKEK"  з кусочками фруктів  25 гр 24Х6 """,
-    """Кекс "CHOCO LIPS" шоколадний з какао кремом у білій шоколадній  глазурі 40 гр 24Х6 бл""",
-    """Кекс "CHOCO LIPS" шоколадний з какао кремом у шоколадній глазурі 40 гр 24Х6 бл""",
-    """Кекс "OFF TIME" шоколадний з кокосовою начинкою у какао глазурі 33гр 24Х6 бл""",
-    """Кекс "PANDORO " з кремом тірамісу 800 г х 12 шт""",
-    """Кекс "PANDORO " з лимонним кремом  800 г х 12 шт""",
-    """Кекс "PANDORO" з ванільно-імбірним кремом 800 г х 12 шт""",
-    """Кекс "PANETTONE GOCCIOLOTTO" з шматочками шоколаду  800 г х 12 шт""",
-    """Кекс "PANETTONE MANDORLATO" з ізюмом, цукатами та горiхами  750 г х 12 шт""",
-    """Кекс "PANETTONE" класичний  100 г х 32 шт""",
-    """Кекс «INVITE »  BERRYBALL кекс з полуничним  смаком  55гр х24х 6""",
-    """Кекс «INVITE » COCOBALL кекс з кокосовим смаком  55гр х24х 6""",
-    """Кекс «INVITE »FINGER  з вершковим кремом 40грХ24Х6""",
-    """Кекс «INVITE »FINGER  з вершковим кремом 45грХ24Х6""",
-    """Кекс «INVITE» MILKBALL кекс з ванільним смаком  55гр х24х 6""",
-    """Кекс «INVITE» з гірким шоколадом 35гр х24х 6""",
-    """Кекс «INVITE» з какао-кремом    45гр х24х 4""",
-    """Кекс «INVITE» з какао-кремом  міні -рулет дует  45гр х24х 6""",
-    """Кекс «INVITE» кекс з вершковим соусом 45гр х24х 6""",
-    """Кекс «Luppo »  з  маршмеллоу та карамельною  начинкою у мол. шоколаді 182 г Х12шт""",
-    """Кекс «Luppo »  з какао і маршмеллоу в молочному шоколаді 25 г Х24шт Х6 """,
-    """Кекс «Luppo »  з какао і маршмеллоу в молочному шоколаді 30г Х24шт Х6 """,
-    """Кекс «Luppo »  з какао та маршмеллоу та вишневою начинкою у мол. шоколаді 182 г Х12шт""",
-    """Кекс «Luppo »  з маршмеллоу в молочному шоколаді 184г Х12шт""",
-    """Кекс «Luppo »  з маршмеллоу в молочному шоколаді 25 г Х24шт Х6 """,
-    """Кекс «Luppo »  з маршмеллоу в молочному шоколаді 30г Х24шт Х6 """,
-    """Кекс «Luppo » з какао і маршмеллоу в молочному шоколаді 184г Х12шт """,
-    """Кекс «Luppo » з какао і маршмеллоу в молочному шоколаді 55г Х24шт""",
-    """Кекс «Luppo Delish »з шок-кремовою начинкою вкритий какао та марш.в кокос. стружкою 36гр 12шт Х12бл""",
-    """Кекс «Luppo Red Velvet »  з маршмеллоу та полуничною начинкою в білому шоколаді  182г Х12шт""",
-    """Кекс ALVIEN MAYBE мраморний з какао соусом 45 гр х 24 шт х 6 бл""",
-    """Кекс ALVIEN MAYBE мраморний з карамельним соусом  45 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з банановою начинкою  у какао-молочній глазурі 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з банановою начинкою  у какао-молочній глазурі 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з вишневою начинкою у какао-молочній глазурі 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з вишневою начинкою у какао-молочній глазурі 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з карамельною начинкою у какао-молочній глазурі 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з карамельною начинкою у какао-молочній глазурі 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з карамельною начинкою у какао-молочній глазурі(Мавпочка) 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з малиновою  начинкою у какао-молочній глазурі 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з начинкою какао у глазурі 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з начинкою какао у глазурі 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з начинкою какао у какао-молочній глазурі 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з начинкою какао у какао-молочній глазурі 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з шоколадним кремом і кольоровими гранулами 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT з шоколадним кремом і кольоровими гранулами 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT мраморний з какао начинкою 40 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO DONUT мраморний з какао начинкою 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO GOODWAY у шоколаді з молочним кремом 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO KARA KIZ шоколадний з вишневою начинкою 35 гр х 24 шт х 4 бл""",
-    """Кекс BRAWO KARA KIZ шоколадний з какао кремом 35 гр х 24 шт х 4 бл""",
-    """Кекс BRAWO SNOW BOARD з горіховим кремом вкритий какао гранулами  50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO SNOW BOARD шоколадний з кокосом 50 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO WHOO з какао та молочним кремом  45 гр х 24 шт х 6 бл""",
-    """Кекс BRAWO WHOO з молочним кремом 45 гр х 24 шт х 6 бл""",
-    """Кекс CASSY WHITE з какао у білому шоколаді 35 гр х 24 шт х 6 бл""",
-    """Кекс CASSY з какао кремом у шоколадній глазурі 35 гр х 24 шт х 6 бл""",
-    """Кекс CASSY з какао та шоколадним кремом 35 гр х 24 шт х 6 бл""",
-    """Кекс DR.DONUT з какао соусом у глазурі 40 гр х 24 шт х 6 бл""",
-    """Кекс DR.DONUT з карамельним соусом у глазурі 40 гр х 24 шт х 6 бл""",
-    """Кекс HIGHWAY з какао та ванільною начинкою 55 гр х 24 шт х 6 бл""",
-    """Кекс HIGHWAY мраморний з банановою начинкою 60 гр х 24 шт х 6 бл""",
-    """Кекс HIGHWAY мраморний з какао начинкою 60 гр х 24 шт х 6 бл""",
-    """Кекс HIGHWAY мраморний з малиновою начинкою 60 гр х 24 шт х 6 бл""",
-    """Кекс KATAKIT DELUXE шоколадний з мол. кремом у білій глазурі з кокосовою стружкою 55 гр х 24 шт х6бл""",
-    """Кекс KATAKIT GOODI з молочним кремом у білому шоколаді  45гр Х24шт Х6 бл """,
-    """Кекс KATAKIT какао з маршмеллоу у білому шоколаді з кокосовою стружкою 45 гр х 24 шт х 6 бл""",
-    """Кекс KATAKIT шоколадний з молочним кремом у біл. шоколаді з кокосовою стружкою 50 гр х 24 шт х 6 бл""",
-    """Кекс KATAKITз маршмеллоу ушоколаді з кокосовою стружкою 45 гр х 24 шт х 6 бл""",
-    """Кекс LETS'GO шоколадний батончик з ванільним кремом у какао глазурі 25 гр х 24 шт х 6 бл""",
-    """Кекс LETS'GO шоколадний батончик з ванільним кремом у какао глазурі 50 гр х 24 шт х 6 бл""",
-    """Кекс Powernut шоколадний  з арахісом та карамеллю у білому  шоколаді 30гр 6блХ24шт""",
-    """Кекс Powernut шоколадний  з арахісом та карамеллю у молочному шоколаді 30гр 6блХ24шт""",
-    """Кекс ROYSкрытый шоколоадной глазурьюі 50гр х4 х 36""",
-    """Кекс SOGGY з какао та з какао кремом 35гр 24шт Х6бл""",
-    """Кекс SPOOKY BEAR з шоколадним кремом у глазурі з білого шоколаду та кокос.стружкою 50 гр 24шт Х6 бл""",
-    """Кекс SPOOKY BEAR з шоколадним кремом у глазурі з білого шоколаду та кокос.стружкою 55 гр 24шт Х6 бл""",
-    """Кекс SPOOKY BEAR з шоколадним кремом у глазурі з білого шоколаду та кокос.стружкою 60 гр 24шт Х6 бл""",
-    """Кекс SPOOKY BEAR з шоколадним кремом у какао-молочній глазурі 50 гр 24шт Х6 бл""",
-    """Кекс SPOOKY BEAR з шоколадним кремом у какао-молочній глазурі 55 гр 24шт Х6 бл""",
-    """Кекс SPOOKY BEAR з шоколадним кремом у какао-молочній глазурі 60 гр 24шт Х6 бл""",
-    """Кекс STAR з ванільно-полуничним кремом-желе  25 гр х 24 шт х 6 бл""",
-    """Кекс STAR з какао-кремом  25 гр х 24 шт х 6 бл""",
-    """Кекс STAR з кремом фундук 25 гр х 24 шт х 6 бл""",
-    """Кекс TAT PARE з вишневою начинкою у какао глазурі 25гр 6блХ24шт""",
-    """Кекс TAT PARE з начинкою какао та фундуком у какао глазурі 25гр 6блХ24шт""",
-    """Кекс TAT PARE з полуничною начинкою у какао глазурі 25гр 6блХ24шт""",
-    """Кекс TONTINES з какао кремом у какао глазурі 45 гр х 24 шт х 6 бл""",
-    """Кекс святковий "TORTE IN FESTA" з йогуртовою начинкою та шоколадними шматочками 400 г х 18 шт""",
-    """Кекс святковий "TORTE IN FESTA" з фісташковим та фундуковим кремом 400 г х 18 шт""",
-    """Кекс суфле «Luppo Suffle Chocolate» з шоколадним  кремом 40г""",
-    """Кекс суфле «Luppo Suffle Findikli» з горіховим кремом 40г""",
-    """Кекс «Luppo »  з маршмеллоу в молочному шоколаді 55г Х 24шт""",
-    """Кекс"Brownie"c какао и шоколадом 40г*40шт/Хамле №1005""",
-    """Кекс"Brownie"шоколадный с вишн.дж.40г*40шт/Хамле №1004""",
-    """Кекс"Cake" абрикос 180г*15шт/Хамле №706-150""",
-    """Кекс"Cake" какао 180г*15шт/Хамле №705-150""",
-    """Кекс"Cake" клубника 180г*15шт/Хамле №703-150""",
-    """Кекс"Cake" мозаика 180г*15шт/Хамле №700-150""",
-    """Кекс"Choco Cake" с абрик. кр. покрытый мол.шок. 55г*24шт4бл/Хамле №1016""",
-    """Кекс"Choco Cake" с вишн. кр. покрытый мол.шок. 55г*24шт*4бл/Хамле №1014""",
-    """Кекс"Choco Cake" с какао. кр. покрытый мол.шок. 55г*24шт*4бл/Хамле №1015""",
-    """Кекс"Choco Cake" с клубн. кр. покрытый мол.шок. 55г*24шт4бл/Хамле №1013""",
-    """Кекс"Peki" какао 180г*15шт/Хамле №7205""",
-    """Кекс"Peki" мозаика 180г*15шт/Хамле №7200""",
-    """Кекс"Кекс"c абрикосовым джемом 210г*12шт/Хамле 706-6""",
-    """Кекс"Кекс"c абрикосовым джемом 35г*40шт/Хамле 706""",
-    """Кекс"Кекс"c вишневым джемом 210г*12шт/Хамле 704-6""",
-    """Кекс"Кекс"c вишневым джемом 35г*40шт/Хамле 704""",
-    """Кекс"Кекс"c какао 210г*12шт/Хамле 705-6""",
-    """Кекс"Кекс"c какао 35г*40шт/Хамле 705""",
-    """Кекс"Кекс"c клубничным джемом 210г*12шт/Хамле 703-6""",
-    """Кекс"Кекс"c клубничным джемом 35г*40шт/Хамле 703""",
-    """Кекс"Соната" абрикос 220г*15шт/Хамле 706-1""",
-    """Кекс"Соната" вишня 220г*15шт/Хамле 704-1""",
-    """Кекс"Соната" какао 220г*15шт/Хамле 705-1""",
-    """Кекс"Соната" клубника 220г*15шт/Хамле 703-1""",
-    """Кекс"Соната" лимон 220г*15шт/Хамле 707-1""",
-    """Кекс"Соната" мозаика 220г*15шт/Хамле 700-1""",
-    """Кекс"Соната" с изюмом 220г*15шт/Хамле 709-1""",
-    """Кекс"Соната" яблоко 220г*15шт/Хамле 702-1""",
-    """КЕНТОН Украина""",
-    """Кешью смажений з сіллю (60 гр.*12 шт/уп)""",
-    """Килимок для миши""",
-    """Клавіатура дротова Genius Smart KB-100 USB Blak (31300005410)""",
-    """Клей - пастка неотруйна для мишей і комах 125 млХ24шт  TIBTRAP""",
-    '''Клей "Суперклей"''',
-    """Клей ПВА""",
-    """Клей-олівець """,
-    '''Ключи для "М.Е.Док"''',
-    """Ключи для "М.Е.Док" виїзд спеціаліста""",
-    """Ключи для "М.Е.Док" сертифікат електронного підпису""",
-    """Кнопки-цвяшки EKONOMIX, 36 шт""",
-    """Кнопки-цвяшки Optima в пласт.коробці, 36 шт""",
-    """Коврики в авто VOLVO (Фатих)""",
-    """Козинак Gromax MultipakMix (5*20г) 100г*48шт""",
-    """Козинак арахисовый Meyna  35г*18шт*12бл.""",
-    """Козинак арахисовый с медом и кунжутом Meyna  20г*28шт*12бл.""",
-    """Козинак арахисовый с медом и кунжутом Meyna  25г*28шт*8бл.""",
-    """Козинак из семян подсолнечника Meyna  20г*28шт*8бл.""",
-    """Козинак с кунжутом Meyna  25г*28шт*8бл.""",
-    """Козинак с миндалем Meyna  25г*12шт*10бл.""",
-    """Козинак с фундуком Meyna  25г*28шт*8бл.""",
-    """Коктейльні зелені оливки The Mill (111-140 5XL-6XL) 700 гр х12 - Скляна банка """,
-    """Коктель горіхів та насіння гарбуза (70 гр.*12 шт./уп)""",
-    """колёса на авто VOLVO""",
-    """Командировки""",
-    """Комиссионные 5%""",
-    """Комиссия банка""",
-    """комісія банку за видачу довідки""",
-    """Компенсация отпуска""",
-    """Компенсація вартості спожитої води""",
-    """Компенсація вартості спожитої електроенергії """,
-    """Компенсація вартості спожитої електроенергії у вересні 2016р.""",
-    """Компенсація вартості спожитої електроенергії у жовтні 2016р.""",
-    """Комплектуючі конструкції стелажа """,
-    """Компьютер everes@ 1020_8410 """,
-    '''Компьютерна программа "M.E.Doc"''',
-    """Комп'ютер Artline Business (B28 v05) з монітором, клавіатурою, мишею у комплекті""",
-    """Комп'ютер Artline Business (B41 v03) з монітором, клавіатурою, мишею у комплекті""",
-    """Комп'ютер Everest Home& Office 1020 з монітором, клавіатурою, мишею у комплекті""",
-    """Комп'ютер Everest Home& Office 1020 з монітором, клавіатурою, мишею у комплекті""",
-    """Комп'ютер Everest Home& Office 1040 з монітором, клавіатурою, мишею у комплекті""",
-    """Комутатор TP-LINK TL-SF1005D""",
-    """Комутатор Zyxel GS-1100-24""",
-    """Конверт В4 (250*353) (0+0) скл, бічний клапан , крафт, з розширенням 40мм ,130/м2""",
-    """Конверт С4 (50 шт.) (0+1) скл, бічний клапан, 90/м2""",
-    """Конверт С5 (100 шт.)""",
-    """Конверт С5 (25 шт.)""",
-    """Конверт С5 (50 шт.)""",
-    """Конверти C6 (100 шт)""",
-    """Конверти C6 (50 шт)""",
-    """Конверти DL (50 шт)""",
-    """Конверти Е65 (10 шт) """,
-    """Конверти Е65 (100 шт)""",
-    """Конверти Е65 (25 шт)""",
-    """Конверти Е65 (50 шт)""",
-    """Кондитерские подарочные наборы (рюкзак) 12шт/Хамле №050""",
-    """Кондитерські вироби в асортименті""",
-    """Кондиционер""",
-    """Кондиционер на склад""",
-    """Конектор RJ45 5e категорії 8P8C""",
-    """КОНСЕРВЫ""",
-    """Конструктор"Собирай-ка"18шт(дерево)*2бл.арт.ZAV-2b""",
-    """Конструктор"Собирай-ка"36шт(дерево)*2бл.арт.ZAV-3m""",
-    """Консульский збір та консультаційні послуги""",
-    """Консультаційні послуги з організації поїздок""",
-    """Консультаційні послуги з оформлення документів (kz)""",
-    """Консультаційні послуги з оформлення документів (vz)""",
-    """Консультаційно-інформаційні послуги у формі участі в конференції""",
-    """Консультування з питань інформатизації по адаптації та використанню програмного забеспечення 1С""",
-    """Контейнер 20-футовий "Калинівський ринок", сектор 4, місце 551 К/С""",
-    """Конфета "UFO FISEK" DRAJE 20г*24шт*8бл № 330-05""",
-    """Конфеты "Kremini" 50г*20шт*12бл №01834-00""",
-    """Конфеты "Кончерто" 3 кг ассорти №860-03""",
-    """Конфеты "Кончерто" с какао кремом и рисовыми хлопьями  500 гр*12 шт №865-01""",
-    """Конфеты "Кончерто" с кокосовым, клубничным, какао, ореховым кремом 500гр*12шт №860-05""",
-    """Конфеты "Мастерпринц" пралин с начинкой  из молочного шоколада 182гр*12шт № 91005076""",
-    """Конфеты "Мастерпринц" пралин с начинкой  из молочного шоколада 395гр*10шт № 91005077""",
-    """Конфеты "Сити Кокомис" (14гр*24шт)*12бл № 40146-20""",
-    """Конфеты "Супермо" темный и молочный шоколад со сливочной/ореховой начинкой 350гр*8шт № 91005041""",
-    """Конфеты "Супремо" темный и молочный шоколад со сливочной/ореховой начинкой 350гр*8шт № 91005041""",
-    """Конфеты Молочный шоколад с какао-фундуковым кремом 365гр*10шт № 91005063""",
-    """Конфеты Молочный шоколад с какао-фундуковым кремом 365гр*10шт № 91005064""",
-    """Конфеты освежающие марка "SEKERLI" 12гр*24шт*12бл""",
-    """Конфеты шоколадные марка "WITORS" 270гр*6шт""",
-    """Конфеты"Yopo zoo mix" 20г*24шт*6бл/Хамле №456-05""",
-    """Коректор стрічковий""",
-    """Коректор-ручка Kores,10 г""",
-    """Корж"Невский" светлый 400гр*10шт""",
-    """Корж"Невский" темный 400гр*10шт""",
-    """Коригуюча рідина Kores 20 мл""",
-    """Користування доменом""",
-    """Кориця "Kent Boringer" мелена 15 гр 20штХ 4бл""",
-    """Коробка""",
-    '''Коробка печения "Цирк"''',
-    """Корпоративные услуги""",
-    """Костюм робочий утеплений""",
-    """Кофе NESCAFE Classic растворимый 100г""",
-    """Кофе NESCAFE Classic растворимый 50г""",
-    """КОФЕ, КАКАО""",
-    """Кофейный напиток"Аромат"100г*24шт""",
-    """Кофейный напиток"Летний"100г*24шт""",
-    """Кофейный напиток"Любительский"100г*24шт""",
-    """Кофейный напиток"Столичный"100г*24шт""",
-    """Кошик для паперу 12 л""",
-    """Красний перец,50""",
-    """Крекер "Artur Fish" рибки, 90 г х 24 шт""",
-    """Крекер "Artur Mix" фігурний, 90 г х 24 шт""",
-    """Крекер "CHEST" з сиром і сіллю 65гр х24х6""",
-    """Крекер "CIZI" 42г*36шт № 00089-02""",
-    """Крекер "CIZI" 68г*12шт № 00099-08""",
-    """Крекер "CIZI" 68г*24шт*6бл № 00095-02""",
-    """Крекер "CIZI" MINI 45г*36шт № 00094-01""",
-    """Крекер "CIZI" с сыром 63г*24шт № 00097-03""",
-    """Крекер "CIZI" с сыром 65г*24шт*6бл № 00089-04""",
-    """Крекер "CIZI" с сыром 70г*24шт № 00098-00""",
-    """Крекер "ÇIZІ" зі смаком сиру 63 гр X 24шт""",
-    """Крекер "ÇIZІ" зі смаком сиру 65 гр X 24шт""",
-    """Крекер "ÇIZІ" зі смаком сиру 70 гр X 24шт""",
-    """Крекер "Clip" с зеленью и вкусом сметаны 150г*18шт №223""",
-    """Крекер "Clip" с кунжутом 40г*40шт №204""",
-    """Крекер "Clip" с кунжутом 50г*40шт №202""",
-    """Крекер "Clip" со вкусом сыра 150г*18шт №222""",
-    """Крекер "Clip" соленый 150г*18шт №220""",
-    """Крекер "Clip" соленый 40г*40шт №203""",
-    """Крекер "Croco Brezel" кренделі з сіллю, 300 г х 12 шт""",
-    """Крекер "Croco Cheese" зі смаком сиру, 100 г х 12 шт""",
-    """Крекер "Croco Ham" зі смаком шинки, 100 г х 12 шт""",
-    """Крекер "Croco Pizza" зі смаком піци, 100 г х 12 шт""",
-    """Крекер "Croco Pizza" зі смаком піци, 150 г х 12 шт""",
-    """Крекер "Croco Salted" з сіллю, 100 г х 12 шт""",
-    """Крекер "Croco Sesame" з кунжутом, 150 г х 12 шт""",
-    """Крекер "Croco Special Digestive" з висівками, 150 г х 12 шт""",
-    """Крекер "Croco Top Salt" з сіллю, 150 г х 12 шт""",
-    """Крекер "Croco" з кунжутом і маком, 100 г х 12 шт""",
-    """Крекер "HALLEY" с карам. нач. 300гр*12шт.№ 395-01""",
-    """Крекер "Лорд соломка" сладкий 2 кг №211""",
-    """Крекер "Лорд соломка" сладкий 40г*40шт №212""",
-    """Крекер "Лорд соломка" соленый 2 кг №209""",
-    """Крекер "Лорд соломка" соленый 2 кг №210""",
-    """Крекер "Лорд соломка" соленый 40г*40шт №200""",
-    """Крекер "Соломка" с кунжутом 1,25 кг *4шт/Хамле №434-5""",
-    """Крекер "Соломка" с кунжутом 1,25 кг /Хамле №434-4""",
-    """Крекер "Соломка" с кунжутом 50гр*40шт./Хамле №434""",
-    """Крекер "Соломка" с солью 1,5 кг /Хамле №433-4""",
-    """Крекер "Соломка" с солью 1,5 кг*4шт /Хамле №433-5""",
-    """Крекер "Соломка" с солью 40гр*40шт./Хамле №433""",
-    """Крекер "Соломка" сладкая 2 кг * 4шт/Хамле №431-5""",
-    """Крекер "Соломка" сладкая 2 кг /Хамле №431-4""",
-    """Крекер "Соломка" сладкая 40г*40шт /Хамле №431""",
-    """Крекер "Чудо крекер" 500гр*10шт./Хамле №283""",
-    """Крекер "Чудо крекер" 5кг/Хамле №383-2""",
-    """Крекер ( крендельки ) 180 гр х 18 шт""",
-    """Крекер ( крендельки ) 30 гр х 40 шт""",
-    """Крекер ( крендельки ) 400 гр х 12 шт""",
-    """Крекер ( рибка ) 180 гр х 18 шт""",
-    """Крекер ( рибка ) 30 гр х 60 шт""",
-    """Крекер ( соломка) з кунжутом  135 гр х 24 шт""",
-    """Крекер ( соломка) з кунжутом  35 гр х 40 шт""",
-    """Крекер ( соломка) з сіллю 150 гр х 24 шт""",
-    """Крекер ( соломка) з сіллю 30 гр х 40 шт""",
-    """Крекер ( соломка) з сіллю 35 гр х 24 шт х 6 бл.""",
-    """Крекер Cralıps Nacho з сиром 100гр Х18шт""",
-    """Крекер Cralıps Taco з папрікою 100гр Х18шт""",
-    """Крекер Greta 7 злаків з оливковою олією  120 г Х24 """,
-    """Крекер GRETA ZEYTIN KEKIK (24MP4AD 30G) з оливковою олією та чебрецем 120 гр х 24 шт""",
-    """Крекер Greta з оливковою олією, часником та м 'ятою 120 г Х24""",
-    """Крекер зі смаком піцци  180 гр х 18 шт""",
-    """Крекер зі смаком сиру  40 гр х 24 шт""",
-    """Крекер зі смаком сиру 160 гр х 10 шт""",
-    """Крекер кренделі з сіллю "Прітіc Tiні" (Pretties Tiny) 200 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Tiні" (Pretties Tiny) 227 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Вафел" (Pretties Waffle) 200 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Вафел" (Pretties Waffle) 255 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Кідс" (Pretties Kids) 200 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Кідс" (Pretties Kids) 227 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Міні" (Pretties Mini) 200 г х 21 шт""",
-    """Крекер кренделі з сіллю "Прітіc Міні" (Pretties Mini) 200 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Міні" (Pretties Mini) 255 г х 21 шт""",
-    """Крекер кренделі з сіллю "Прітіc Міні" (Pretties Mini) 255 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Міні" (Pretties Mini) 35 г х 24 шт""",
-    """Крекер кренделі з сіллю "Прітіc Міні" (Pretties Mini) 42,5 г х 24 шт""",
-    """Крекер кренделі з сіллю "Флатзел Блек енд Вайт Сезам" (Flatzel black & white sesame) 85 г х 24 шт""",
-    """Крекер кренделі з сіллю "Флатзел Мікс Сідс" (Flatzel mix seeds) 85 г х 24 шт""",
-    """Крекер кренделі з сіллю "Флатзел Оріджинал" (Flatzel Original) 85 г х 24 шт""",
-    """Крекер у формі мигдалю   180 гр  х 18 шт""",
-    """Крекер"CLIP"(Клип) с кунжутом 50гр*40шт.""",
-    """Крекер"Миндаль" 4кг/Хамле №381-2""",
-    """Крекер(соломка )  зі смаком сиру  35 гр х 40 шт""",
-    """Крекер-сендвіч з сирним кремом "CIZI VIC" 82 гр  X 24шт""",
-    """Крекер-сендвіч з сирним кремом "CIZI VIC" 90 гр  X 24шт""",
-    """Крем для торта Ванільний 50 грамХ12штХ2блKenton""",
-    """Крем для торта Шоколадний 55 грамХ12штХ2бл Kenton""",
-    """Кренделі шматочками "Crackzel Honey Mustard Onion" зі смаком цибулі в гірчично-медов соусі 65 г x 24""",
-    """Кренделі шматочками "Crackzel Honey Mustard Onion" зі смаком цибулі в гірчично-медов соусі 85 г x 24""",
-    """Кренделі шматочками "Crackzel Hot Buffalo Wings " зі смаком курячих крилець Баффало 65 г х 24 шт""",
-    """Кренделі шматочками "Crackzel Sweet Corn" зі смаком солодкої кукурудзи 65 г х 24""",
-    """Кренделі шматочками "Кракцел Весабі" (Crackzel Wasabi) зі смаком васабі 65 г х 24 шт""",
-    """Кренделі шматочками "Кракцел Галік Бред" (Crackzel Garlic Bread) зі смаком часнику 65 г х 24 шт""",
-    """Кренделі шматочками "Кракцел Сірача" (Crackzel Sriracha) зі смаком соусу шрірачі  65 г х 24 шт""",
-    """Кренделі шматочками "Кракцел Халапеньо" (Crackzel Jalapeno) зі смаком халапеньо 65 г х 24 шт""",
-    """Кренделі шматочками "Кракцел Халапеньо" (Crackzel Jalapeno) зі смаком халапеньо 85 г х 24 шт""",
-    """Кренделі шматочками "Кракцел Чедар Чіз" (Crackzel Cheddar Cheese) зі смаком сиру чеддер 65 г х 24 шт""",
-    """Кресло Barsky Batman""",
-    """Кресло Анхель""",
-    """Кресло Атлант D-Кофе-Милк""",
-    """Кресло Бета""",
-    """Кресло Бета""",
-    """Кресло Бета""",
-    """Кресло Марсель""",
-    """Кресло Марсель""",
-    """Кресло Марсель №34""",
-    """Кресло Марсель №34""",
-    """Кресло Примтекс""",
-    """Кресло Х-2852 Classic Cream""",
-    """Кристали декоративні ( рубіновий колір) 95 грам Kenton""",
-    """Кристали декоративні (золотистий колір) 95 грам Kenton""",
-    """Кристали декоративні (мідний колір) 95 грам Kenton""",
-    """Кристали декоративні (рожевий колір) 95 грам Kenton""",
-    """Кристали декоративні (синій колір) 95 грам Kenton""",
-    """Крісло Ektor (XY-301A-1) екошкіра бежева""",
-    """Крісло Pira ECO-07""",
-    """Крісло Бета GTP chrom OH-5 FJ-02""",
-    """Круасан "BIEN"з какао кремом  240гр х 9""",
-    """Круасан "INVITE" з вишневим джемом 50гр х20х4""",
-    """Круасан "INVITE"з карамеллю 50гр х20х4""",
-    """Круасан "INVITE"з шоколадом 50гр х20х4""",
-    """Кубики карамельні 85 грам Kenton""",
-    """Кубики фруктові цукрові  (апельсин) 85 грам Kenton""",
-    """Кубики фруктові цукрові  (малина) 85 грам Kenton""",
-    """Кубики фруктові цукрові  (яблуко) 85 грам Kenton""",
-    """Куклы из пластмассы 10гр*9шт**6бл""",
-    """Куклы из пластмассы 10гр*9шт**6бл""",
-    """Куклы из пластмассы 5гр*12шт*6бл""",
-    """Куклы из пластмассы 5гр*12шт*6бл""",
-    """Куклы из пластмассы 6гр*12шт**6бл""",
-    """Кукурудза смажена з соусом Барбекю (50гр.*12шт/уп)""",
-    """Кукурудза смажена з соусом Барбекю(120гр.*12шт/уп)""",
-    """Кукуруза в/с DЭKO ФУД, ГОСТ, ж/б, 425мл(400гр)*12шт""",
-    """Кукуруза в/с GLOBOSS, ГОСТ, ж/б, 425мл(400гр)*12шт""",
-    """Кукуруза,250 г""",
-    """Кукуруза,70 г""",
-    """Кукуруза,кг""",
-    """Кулер CRISTAL YLR3-5V116""",
-    """Кульки печива з глазур’ю "Car Model"12р х30х12""",
-    """Курабьє (суміш для курабьє) 295 грамХ8 Kenton""",
-    """Куркума  "Kent Boringer" мелена 15 гр 20штХ 4бл""",
-    """Курьерскские услуги""",
-    """Ламинат (laminate flooring AC4) 32.class""",
-    """Леза змінні до канц.ножа (10 шт.)""",
-    """Леза змінні до канц.ножа 18 мм""",
-    """Линейка деревянная""",
-    """Линейка металева""",
-    """Линейка пластиковая """,
-    """Листівка""",
-    """Листівка""",
-    """Листівка А4""",
-    """Листкове тістечко "KAT KAT TAT" з абрикосовою начинкою 32гр Х24шт Х6 бл""",
-    """Листкове тістечко "KAT KAT TAT" з кремом какао та фундука 28гр Х24шт Х6 бл""",
-    """Листкове тістечко "KAT KAT TAT" з полуничною начинкою 32гр Х24Х6""",
-    """Листкове тістечко "KAT KAT TAT" з полуничною начинкою 32гр Х24шт Х6 бл """,
-    """Ліхтарик на голову""",
-    """Логістичні послуги""",
-    """Логістичні послуги (кросс-докінг)""",
-    """Лопата 3 шт""",
-    """ЛОРД""",
-    """Лоток горизонтальний Economix""",
-    """Лоток горизонтальний Компакт""",
-    """Льодяник - Пустушка 10гр х36 х 8""",
-    """Льодяник на паличці "SATÜRN" TOPPY зі смаком Карамелі+Тоффі  (16GR*100*6PVC) """,
-    """Льодяник на паличці "SATÜRN" TOPPY зі смаком Тропік  (16GR*100*6PVC) """,
-    """Льодяник на паличці SOURRR "SATÜRN" TOPPY зі смаком  Яблуко-Лимон  (16GR*100*6PVC) """,
-    """Льодяники "Rose" в тубусі 50гр х30 """,
-    """М"яка карамель "Стики Микс" 7грх40штх24бл""",
-    """МАКАРОННІ ВИРОБИ CHARLESTONE (РІЖКИ ) 400 GR Х20 in carton """,
-    """МАКАРОННІ ВИРОБИ FARFELLA  (БАНТИКИ) 400 GR Х20 in carton 1.7мм """,
-    """МАКАРОННІ ВИРОБИ FUSULLI  (СПІРАЛІ ВЕЛИКІ) 400 GR Х20 iin carton """,
-    """МАКАРОННІ ВИРОБИ PENNE RIGATE (ПІР’Я) 400 GR Х20 iin carton """,
-    """МАКАРОННІ ВИРОБИ SPAGHETTI (СПАГЕТІ) 400 GR Х20 in carton 1.7мм """,
-    """МАКАРОННІ ВИРОБИ VERMICELLI (ВЕРМІШЕЛЬ) 400 GR Х20 iin carton """,
-    """Макетування""",
-    """Марка поштова стандартна U""",
-    """Маркер перманентний 1-3 мм червоний""",
-    """Маркер перманентний 1-3 мм, чорний""",
-    """Маркер перманентний 1-3 мм,синий""",
-    """Маркер перманентний BUROMAX, 2-4 мм чорний""",
-    """Маркер перманентний ECONOMIX, 1-3мм чорний""",
-    """Маркер перманентний SCHNEIDER MAXX 160 1-3 мм,синий""",
-    """Маркер перманентний SCHNEIDER MAXX 160 1-3 мм,чорний""",
-    """Маркер перманентний, чорний""",
-    """Маркер текстовий кольоровий""",
-    """Маркери набір в блістері 4 текстові """,
-    """Маркетинг - Введення нового асортименту на полицях в магазині""",
-    """МАРКЕТИНГОВІ ПОСЛУГИ""",
-    """Маршмелоу "Animal shape + heart marshmallow stick" 11грХ30штХ24""",
-    """Маршмелоу "Eyeball Marshmallow" 4грХ100штХ12""",
-    """Маршмелоу на паличці "ICE LOLLY MARSHMALOW" 12гр х30 х20""",
-    """Маршрутизатор ASUS RT-AX58U""",
-    """Маршрутизатор ASUS RT-FC3200""",
-    """Маршрутизатор Mikro Tik hEX RB750Gr3""",
-    """Маршрутизатор TP-LINK TL-SG116""",
-    """Маслины "Прошу к столу!" (без косточки), 280гр*12шт""",
-    """Масло """,
-    """Мастика""",
-    """Мастика цукрова (білий колір) 400 грамХ8шт Kenton""",
-    """Мастика цукрова (жовтий колір) 400 грам Х8шт Kenton""",
-    """Мастика цукрова (зелений колір) 400 грамХ8шт Kenton""",
-    """Мастика цукрова (рожевий колір) 400 грамХ8шт Kenton""",
-    """Мастика цукрова (синій колір) 400 грамХ8шт Kenton""",
-    """Мастика цукрова (тілесний колір) 400 грамХ8шт Kenton""",
-    """Мастика цукрова (червоний колір) 400 грамХ8шт Kenton""",
-    """Мастика цукрова (чорний колір) 400 грамХ8шт Kenton""",
-    """Материалы ( хоз.)""",
-    """Материалы (канцтовары)""",
-    """Материальная помощь""",
-    """Мафін кекс «INVITE» з шоколадною начинкою 25гр х24х6""",
-    """Мафін кекс «INVITE» шоколадний з вишневою начинкою 25гр х24х6""",
-    """мебель и принтер""",
-    """Мегачипсы Extremum 100шт""",
-    """Мережевий зарядний пристрый""",
-    """Мережений фільтр PowerPlant 3м, 3*1,0мм", 8А 5 розеток. євростандарт (JY-1052/3) PPSA08V30S5""",
-    """Металева стійка  BEBETO""",
-    """Металевий стенд навісний коробки (10шт. в 1 коробці)""",
-    """Металевий стенд підвісний BEBETO""",
-    """Металевий шкільний пенал Ozmo """,
-    """Микроволновка""",
-    """Мильні бульбашки "Cat Bottle Bubble Water" 50млХ24штХ12""",
-    """Мильні бульбашки "Cola bottle Bubble Water" 50млХ24штХ12""",
-    """Мильні бульбашки "Umbrella Bubble Water" 55млХ24штХ12""",
-    """Мильні бульбашки Toys Candy Bear з драже 3 гр 100 мл Х24 Х6 бл""",
-    """Мильні бульбашки Toys Candy Chicken з драже 3гр 32мл х 12 х 6бл""",
-    """Мильні бульбашки Toys Candy Dolphin з драже 3 гр 100мл Х24 Х6 бл""",
-    """Мильні бульбашки Toys Candy Frog з драже 3 гр 100 мл Х24 Х6 бл""",
-    """Мильні бульбашки Toys Candy Pigeon з драже 3 гр 32мл х 12 х 6бл""",
-    """Мильні бульбашки з драже 25мл 24 шт Х 12 бл """,
-    """Минибискв."Соло" ванил.с абрикос.дж.30г*20шт*4бл/Хамле №776-30""",
-    """Минибискв."Соло" ванил.с абрикос.дж.35г*20шт*4бл/Хамле №776""",
-    """Минибискв."Соло" ванил.с вишн.дж.30г*20шт*4бл/Хамле №774-30""",
-    """Минибискв."Соло" ванил.с вишн.дж.35г*20шт*4бл/Хамле №774""",
-    """Минибискв."Соло" ванил.с клуб.дж.30г*20шт*4бл/Хамле №773-30""",
-    """Минибискв."Соло" ванил.с клуб.дж.35г*20шт*4бл/Хамле №773""",
-    """Минибискв."Соло" с какао и мол.кр.30г*20шт*4бл/Хамле №775-30""",
-    """Минибискв."Соло" с какао и мол.кр.35г*20шт*4бл/Хамле №775""",
-    """Минибискв."Соло"ванил.с абр.дж.150г*16/Хамле №796-30""",
-    """Минибискв."Соло"ванил.с абр.дж.175г*16/Хамле №796""",
-    """Минибискв."Соло"ванил.с вишня.дж.150г*16/Хамле №794-30""",
-    """Минибискв."Соло"ванил.с вишня.дж.175г*16/Хамле №794""",
-    """Минибискв."Соло"ванил.с клуб.дж.150г*16/Хамле №793-30""",
-    """Минибискв."Соло"ванил.с клуб.дж.175г*16/Хамле №793""",
-    """Минибискв."Соло"с какао и мол.кр.150*16/Хамле-795-30""",
-    """Минибискв."Соло"с какао и мол.кр.175*16/Хамле-795""",
-    """Мини-бисквит "Rulette" абрикосовый 140г*12шт №077-1""",
-    """Мини-бисквит "Rulette" какао 140г*12шт №075-1""",
-    """Мини-бисквит "Rulette" клубничный 140г*12шт №076-1""",
-    """Минибисквит"Соло" ванил.с абрикос.дж.35г*20шт*4бл/Хамле №0776""",
-    """Минибисквит"Соло" ванил.с вишн.дж.35г*20шт*4бл/Хамле №0774""",
-    """Минибисквит"Соло" с какао и мол.кр.35г*20шт*4бл/Хамле №0775""",
-    """Мини-рулет "ALPELLA" абрикосовый 140г*12шт №510""",
-    """Мини-рулет "ALPELLA" вишневый 140г*12шт №511""",
-    """Мини-рулет "ALPELLA" клубничный 140г*12шт №512""",
-    """Мини-рулет "ALPELLA" с какао 140г*12шт №514""",
-    """Миша Esperanza Titanum TM 111R Red""",
-    """Миша GENIUS DX-110 """,
-    """Миша Logitech M100""",
-    """Миша Logitech M170""",
-    """Миша Sven RX -112""",
-    """Миша комп'ютерна""",
-    """Міні Рулет "INVITE" бісквітний ванільний зі шматочками шоколаду 40гр х24х6""",
-    """Міні Рулет "INVITE" бісквітний ванільний покритий глазур'ю і кокосовою стружкою  40гр х24х6""",
-    """Міні Рулет "INVITE" бісквітний шоколадний зі шматочками шоколаду 40гр х24х6""",
-    """Млинці (суміш солодка) 200 грамХ8 Kenton """,
-    """Млинці (суміш солона) 200 грамХ8 Kenton""",
-    """Молочный шоколад "Зонтик" 30гр*30шт*4бл № 91005065""",
-    """Монітор Samsung""",
-    """Моноблок Artline Business B27 (B27v29)""",
-    """Монтаж """,
-    """Монтаж металоконструкцій""",
-    """Мыло""",
-    """Мыло примотки""",
-    """Мышь мунипулятор для ноутбука""",
-    """Мясо говядина и баранина""",
-    """Мясо куриное""",
-    """Набір кондитерських виробів "OZMO SCHOOL" в коробці з шкільним пеналом всередині 12шт """,
-    """набір кулькових ручок SOLEN""",
-    """Набір настільний Economix""",
-    """Набір настільний Nota Bene""",
-    """Набір настільний з 12 предметів (Органайзер)""",
-    """Набір плічок дерев'яних 45см 6 шт.""",
-    '''Набор №1 "Раскопай-ка" 24шт*6бл.fhn/SDS1/8+Соломка с кунжутом50г/Хамле"''',
-    """Набор конфет "Богем" 200гр*12шт № 91005027""",
-    """Набор конфет "Богем" 400гр*12шт № 91005029""",
-    """Набор юного археолога (развивающий)"Раскопай-ка" 24шт*6бл.fhn/SDS1/8""",
-    """Набор юного археолога(развивающий с красками)"Раскопай-ка"12шт*2бл.арт.PDS1/6""",
-    """Набор юного археолога(развивающий,светящийся)"Раскопай-ка"18шт*3бл.артGDS1/6""",
-    """Надання права користування програмою""",
-    """Накладка на стрелу амортизирующая""",
-    """Накопитель внешний (флешка)""",
-    """накопичувач Kingston SSDNiw V300 120GB 2.5*SATAIIIMLC""",
-    """Накопичувач Kingston SSDNiw V300 120GB 2.5*SATAIIIMLC""",
-    """Накопичувач Samsung 500GB""",
-    """Накопичувач Samsung 970 Evo Plus 500GB M.2 PCle 3.0x4 V-NAND MLC""",
-    """Накопичувач SSD Kingston NOW A400 240 GB 2.5" SATAIII TLC""",
-    """Наліпки (наклейки)""",
-    """Напій  безалкогольний "Twisst Mocktails - Mojito " 240 г Х12""",
-    """Напій "Drink It" 70мл х24х6 бл""",
-    """Напій безалкогольний "Twisst Mocktails - Irish Cream " 240 г Х12""",
-    """Напій безалкогольний "Twisst Mocktails -Pina Colada " 240 г Х12""",
-    """Напій кавовий розчинний CAMEL  Cappuccino Choco, 25 гр.х20 шт х 12 бл.""",
-    """Насіння солоне,200 г""",
-    """Насіння соняшника біле смажене з сіллю (100 гр.*22 шт/уп.)""",
-    """Насіння,200 г""",
-    """Ніж канцелярський 18 мм Economix, пласт. корпус""",
-    """Ніж канцелярський 18мм Optima, метал""",
-    """Ніж канцелярський 9 мм Economix, пласт. корпус""",
-    """Ножиці  пласт.  ручки з гум вставками  """,
-    """Ножиці 16 см""",
-    """Ножиці 20 см""",
-    """Ножиці 23 см""",
-    """Ноутбук Aser Nitro 5 AN515-43 """,
-    """Ноутбук Asus Zen Book Flip UX 461FA-E1141T""",
-    """Ноутбук HP Laptop 15s-fq2043ua (7X8E2EA) Chalkboard Grey""",
-    """Ноутбук Lenovo ThinBook 15 G2 ITL""",
-    """Ноутбук Lenovo V17 G2 ITL (82NX00DRRA) Iron Grey""",
-    """Ноутбук НР 250 G7 (7QL27ES)""",
-    """Нуга "Фундуком" 3кг""",
-    """Нут жовтий смажений (180 гр.*12шт/уп)""",
-    """Нут жовтий смажений (70 гр.*12шт/уп)""",
-    """обеды""",
-    """Обігрівач комбінований Aygas""",
-    '''Обкладинка паперова "Справа"''',
-    """Обогреватель для склада""",
-    """Обогреватель інфрачервоний""",
-    """Обробка даних та видача сертифіката ключа""",
-    """Обьявления о вакансиях""",
-    """Огурцы с зеленью в заливке REAN (Белгородская обл.), 6-9 см, ст/б, 720мл*8шт""",
-    """Оказание услуг по Контракту №2013-34 от 01.01.2013""",
-    """Океан Компани (рахат-лукум)""",
-    """Оливки SLER (без косточки), 280гр*12шт""",
-    """Оливки SLER фар.лимоном, 280гр*12шт""",
-    """Оливки SLER фар.перцем, 280гр*12шт""",
-    """Оливкова Олія 100% Extra Virgin холодного віджиму "The Mill" 1000 мл Х 12""",
-    """Оливкова Олія 100% Extra Virgin холодного віджиму "The Mill" 1000 мл Х 12""",
-    """Оливкова Олія 100% Extra Virgin холодного віджиму "The Mill" 250 мл Х 30""",
-    """Оливкова Олія 100% Extra Virgin холодного віджиму "The Mill" 500 мл Х 16""",
-    """Оливкова Олія 100% Extra Virgin холодного віджиму "The Mill" 500 мл Х 16""",
-    """Оливкова Олія Extra Virgin The Mill 5000 мл - Жестяна каністра  Х 4 """,
-    """Оливкова Олія Класична The Mill 1000 мл Х 12 Скляна бутилка""",
-    """Олівець "MAGIС PEN XL" 12грх30х6 бан""",
-    """Олівець графітний """,
-    """Олівець графітний з гумкою""",
-    """Олівець механічний 0,5 мм""",
-    """Олівець механічний 0,5 мм""",
-    """Олівець чорнографітний""",
-    """Олівець чорнографітний шестигранний """,
-    """Олівці""",
-    """Олія соняшникова рафінована українська 5л""",
-    """Оплата """,
-    """оплата багажа""",
-    """организационно-методическое обеспечение участия в выствке""",
-    """организационные услуги в Турции""",
-    """Організація перевезення відправлень """,
-    """Організація перевезень, компенсація вартості морських портів""",
-    """Оргтехника оборудование""",
-    """Оренда контейнера для сміття""",
-    """Оренда юр. адреси""",
-    """Оренда/суборенда приміщення""",
-    """Ответхранение""",
-    """оформление выставочного места""",
-    """Оформлення торгової марки""",
-    """Охранная сигнализация""",
-    """Пакет для сміття""",
-    """Пакети""",
-    """Пакети для сміття з запахом лаванди середній розмір (55x60 сm) 30л. 20 шт в рулоні х 25 ERNET""",
-    """Пакети для сміття з запахом лимона середній розмір (55x60 см) 30л. 20 шт в рулоні х25 ERNET""",
-    """Пакети для сміття з запахом полуниці середній розмір (55x60 сm) 30л. 20 шт в рулоні х25  ERNET""",
-    """Пакети оновлень програми M.E.Doc""",
-    """паливо""",
-    """Палички ватні NOVITA Soft в поліетиленовому пакеті 100шт.""",
-    """Паллет""",
-    """Пам'ять Kingston DDR3-1600 8192 PC3-12800 """,
-    """Папір А4, 80 г/м 500 арк""",
-    """Папір А5, 80 г/м 500 арк""",
-    """Папір для нотаток """,
-    """Папір для нотаток 90х90мм 1000арк люкс""",
-    """Папір для нотаток 90х90мм 500арк клітинка в чорному пластиковому боксі""",
-    """Папір для нотаток з клейким шаром""",
-    """Папкa  А4 з файлами""",
-    """Папка Buromax Red and Black з боковим притиском А4""",
-    """Папка А4 пластикова на гумках""",
-    """Папка до підпису""",
-    """Папка ПАНОРАМА А4 38мм 4 D""",
-    """Папка паперова на завязках "Справа "А4 , Украина """,
-    """Папка пластикова А4 Economix на 2 кільця""",
-    """Папка-конверт А4 """,
-    """Папка-конверт А4 прозора на кнопке Economix 180 мкм """,
-    """Папка-конверт А4 прозора на кнопке Economix 180 мкм """,
-    """Папка-конверт А5 прозора на кнопці Economix 180 мкм """,
-    """Папка-куточок А4 Economix 180мкм""",
-    """Папка-куточок А4 Economix 180мкм жовта""",
-    """Папка-куточок А4 Economix 180мкм фиолетова""",
-    """Папка-куточок А4 Economix 50мкм""",
-    """Папка-куточок В4 прозора на кнопци Economix 180мкм, фиолетова""",
-    """Папка-куточок В4 прозора на кнопци Economix 180мкм,глянець,жовта""",
-    """Папка-куточок В5 прозора на кнопци Economix 180мкм,глянець зелена""",
-    """Папка-куточок В5 прозора на кнопци Economix 180мкм,глянець прозора""",
-    """Папка-куточок В5 прозора на кнопци Economix 180мкм,глянець синя""",
-    """Папка-куточок В5 прозора на кнопци Economix 180мкм,глянець,жовта""",
-    """Папка-планшет А4 Economix з притиском""",
-    """Папка-реєстратор  А4  """,
-    """Папка-реєстратор  А4 50мм""",
-    """Папка-реєстратор  А4 Economix 70мм кольорова""",
-    """Папка-реєстратор  А4 Economix 70мм, помаранчева""",
-    """Папка-реєстратор  А4 Economix 70мм, синя""",
-    """Папка-реєстратор  А4 Economix 70мм, червона""",
-    """Папка-реєстратор А4 Format, 70мм, червона""",
-    """Папка-швидкозшивач паперовий А4""",
-    """Папка-швидкозшивач пластикова А4""",
-    """Патч-кордAtcom CAT5e RJ45 UTP 2 м Сірий (4963)""",
-    """Патч-панель 24-портова 19", UTP кат.5Е PP-KUTP24""",
-    """Пенал відкритий S4-30-19""",
-    """Пенное мыло""",
-    """Перевезення вантажів""",
-    """Перевезення вантажів за межами митної території""",
-    """Перевод денег Турция""",
-    """Перепредъявление транспортных услуг в соответствии с п.3.5 договора поставки""",
-    """Перець червоний  "Kent Boringer" мелений 15 гр 20штХ 4бл""",
-    """Перець червоний  "Kent Boringer" пластівці 15 гр 20штХ 4бл""",
-    """Перець чорний "Kent Boringer" горошок 15 гр 20штХ 4бл""",
-    """Перець чорний "Kent Boringer" мелений 15 гр 20штХ 4бл""",
-    """Персональний комп"ютер Everest Home & Office 1020 (1020_8416)""",
-    """Печ. "ALBENI BİTES" з карамеллю і нугою в молочному шоколаді з крихтами печива 63гр Х 24шт""",
-    """Печ. "ALBENI BİTES" з карамеллю і нугою в молочному шоколаді з крихтами печива 72гр Х 24шт""",
-    """Печ. "Альбени"в шок.гл. (батончик) 40г*24шт*6бл""",
-    """Печ. сах."Вальс" 200г*24шт  лимон""",
-    """Печ. сах."Вальс" 200г*24шт  топл.молоко""",
-    """Печ. сах."До чаю" 200г*24шт  кокос""",
-    """Печ. сах."До чаю" 200г*24шт  топл.молоко""",
-    """Печ. сах."Салют" 150г*24шт с молочным вкусом""",
-    """Печ."Albeni Bites" с карамелью, покрытое молочным шоколадом 150г*12шт/№50361-09""",
-    """Печ."Albeni Bites" с карамелью, покрытое молочным шоколадом 3кг/№50347-15""",
-    """Печ."Albeni Bites" с карамелью, покрытое молочным шоколадом 500г*12шт/№50347-50""",
-    """Печ."Albeni Bites" с карамелью, покрытое молочным шоколадом 80г*24шт/№00347-13""",
-    """Печ."Albeni mini" покрытый молоч.шок.и карамелью500г*12шт/№347-50""",
-    """Печ."Albeni Slim"(батончик) покрытый молоч. шок. и карамелью 47г*18шт*6бл /№0357-14""",
-    """Печ."Albeni Slim"(батончик)покрытый молоч.шок.и карамелью 47г*18шт*6бл/№357-14 (357-04)""",
-    """Печ."Albeni Super"(батончик) покрытый молоч. шок. и карамелью 55г*24шт*6бл /№355-00""",
-    """Печ."Albeni Super"(батончик)покрытый молоч.шок.и карамелью55г*24шт*6бл/№355""",
-    """Печ."Albeni" (плитка) с карамелью и шоколадным покрытием  95г*12шт*4бл/№00498-14""",
-    """Печ."Albeni" (плитка) с карамелью и шоколадным покрытием  95г*15шт*6бл/№00498-15""",
-    """Печ."Albeni" nougat с карамелью и нугой в молочном шоколаде 40г*24шт*6бл/№01355-10""",
-    """Печ."Albeni" с карамелью и нугой в молочном шоколаде 40г*24шт*6бл/№01355-10""",
-    """Печ."Albeni"(батончик)покрытый молоч. шок.и карамелью 40г*24шт*6бл/№0345""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.40г*24шт/6бл""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.и карамелью18г*40шт*12бл/№0347-09""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.и карамелью18г*40шт*12бл/№347-09""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.и карамелью200г*24шт/№346""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.и карамелью30г*24шт*6бл/№0344-07""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.и карамелью30г*24шт*6бл/№344-07""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.и карамелью3кг/№347""",
-    """Печ."Albeni"(батончик)покрытый молоч.шок.и карамелью40г*24шт*6бл/№345""",
-    """Печ."Albeni"(круг)покрытый молоч.шок.и карамелью160г*24шт/№356-00""",
-    """Печ."Albeni"(круг)покрытый молоч.шок.и карамелью240г*16шт/№356-01""",
-    """Печ."Albeni"(круг)покрытый молоч.шок.и карамелью40г*24шт*6бл/№0339-01""",
-    """Печ."Albeni"(круг)покрытый молоч.шок.и карамелью40г*24шт*6бл/№339-01""",
-    """Печ."Albeni"(круглые)покрытый мол.шок.и карам.(40г*8)гр*12шт/№338-08""",
-    """Печ."Albeni"(палочки)покрытый молоч.шок.и карамелью40г*24шт*6бл/№0358-09""",
-    """Печ."Albeni"(палочки)покрытый молоч.шок.и карамелью40г*24шт*6бл/№358-09""",
-    """Печ."Biskrem duo" 220г*12шт/№1150-08""",
-    """Печ."BISKREM KREM ELMALI" 135г*24шт/00144-02""",
-    """Печ."Chocobiс"(батончик)покрытый молоч.шок.и карамелью30г*24шт*6бл/Хамле""",
-    """Печ."Dido"(батончик)покрытый молоч.шок.и карамелью40г*24шт*6бл/№285-06""",
-    """Печ."Kremali" сандвич с кремом 75г*24шт/Хамле №51106-40""",
-    """Печ."Luna mini"(вафля)покрытый молоч.шок.и карамелью 3 кг/№375-03""",
-    """Печ."Luna mini"(вафля)покрытый молоч.шок.и карамелью16г*187шт (3 кг)/№374-03""",
-    """Печ."Luna mini"(вафля)покрытый молоч.шок.и карамелью20г*150шт (3 кг)/№00375-03""",
-    """Печ."Luna"(вафля)покрытый молоч.шок. и карамелью 33г*24шт*6бл /№0374""",
-    """Печ."Luna"(вафля)покрытый молоч.шок.и карамелью165г*24шт/№375-02""",
-    """Печ."Luna"(вафля)покрытый молоч.шок.и карамелью28г*24шт*6бл/№374-01""",
-    """Печ."Luna"(вафля)покрытый молоч.шок.и карамелью28г*24шт*6бл/№374-1""",
-    """Печ."Luna"(вафля)покрытый молоч.шок.и карамелью33г*24шт*6бл/№374""",
-    """Печ."Luna"(вафля)покрытый молоч.шок.и карамелью43г*24шт*6бл/№0374-05""",
-    """Печ."Luna"(вафля)покрытый молоч.шок.и карамелью43г*24шт*6бл/№374-05""",
-    """Печ."Luna"(вафля)покрытый молоч.шок.и карамелью500г*12шт/№374-50""",
-    """Печ."Luna+Albeni MIX" покрытый молоч.шок.и карамелью500г*12шт/№340-50""",
-    """Печ."TANZ"(вафля) с лесн.орехом покрытая молоч.шок. 30г*24шт*6бл/Хамле 810""",
-    """Печ."Алатау"какао 200г*28шт/Хамле №415""",
-    """Печ."Алатау"какао крем и сгущ.мол./Хамле 200г*28 №416""",
-    """Печ."Алатау"сгущ.мол.200г*28шт/Хамле №418""",
-    """Печ."Алатау"фрукт.ассорти 200г*28шт/Хамле №411""",
-    """Печ."Булсет" 175г*18шт/Хамле №432""",
-    """Печ."До чаю" с кокосовым вкусом 180г*24шт №113""",
-    """Печ."До чаю" со вкусом топленого молока 180г*24шт №112""",
-    """Печ."До чаю" со вкусом топленого молока 4кг №117""",
-    """Печ."Золотое" 3 кг/Хамле №338-03""",
-    """Печ."К утреннему кофе" ванильно-сливочное 4 кг №642""",
-    """Печ."К утреннему кофе" сгущенное молоко 180г*24шт №640""",
-    """Печ."К утреннему кофе" сгущенное молоко 4кг №643""",
-    """Печ."К утреннему кофе" со вкусом кокоса 180г*24шт №641""",
-    """Печ."К чаю" 5кг/Хамле №390-3""",
-    """Печ."Клоун" вкус апельсина 29г*56шт №22""",
-    """Печ."Клоун" вкус клубники 1,160кг №23""",
-    """Печ."Кремали"  мультиупаковка апельсин 240г*12шт/Хамле №104""",
-    """Печ."Кремали"  мультиупаковка банан 240г*12шт/Хамле №107""",
-    """Печ."Кремали"  мультиупаковка ваниль 240г*12шт/Хамле №106""",
-    """Печ."Кремали"  мультиупаковка какао 240г*12шт/Хамле №105""",
-    """Печ."Кремали"  мультиупаковка клубника 240г*12шт/Хамле №103""",
-    """Печ."Кремали"  мультиупаковка сгущ. молоко 240г*12шт/Хамле №108""",
-    """Печ."Кремали" апельсин 60г*24шт/Хамле №144""",
-    """Печ."Кремали" банан 60г*24шт/Хамле №167""",
-    """Печ."Кремали" ваниль 60г*24шт/Хамле №146""",
-    """Печ."Кремали" какао 60г*24шт/Хамле №145""",
-    """Печ."Кремали" клубника 60г*24шт/Хамле №143""",
-    """Печ."Кремали" с аром.сгущ.мол.60г*24шт/Хамле №168""",
-    """Печ."Кремали"апельс. 3кг/Хамле №344-1""",
-    """Печ."Кремали"ваниль  3кг/Хамле №342-1""",
-    """Печ."Кремали"вес.банан 3кг/Хамле №347-1""",
-    """Печ."Кремали"какао 3кг/Хамле №345-1""",
-    """Печ."Кремали"клубника3кг/Хамле №343-1""",
-    """Печ."Кремали"со сгущ.мол.3кг/Хамле №348-1""",
-    """Печ."Кремикс" апельсин 60г*24шт/Хамле №254""",
-    """Печ."Кремикс" ваниль 60г*24шт/Хамле №256""",
-    """Печ."Кремикс" какао 60г*24шт/Хамле №255""",
-    """Печ."Кремикс" клубника 60г*24шт/Хамле №253""",
-    """Печ."Кремикс" орех 60г*24шт/Хамле №257""",
-    """Печ."Кремикс" с аром.сгущ.мол.60г*24шт/Хамле №258""",
-    """Печ."Кремикс"апельсин3кг/Хамле №254-1""",
-    """Печ."Кремикс"ваниль3кг/Хамле №256-1""",
-    """Печ."Кремикс"какао3кг/Хамле №255-1""",
-    """Печ."Кремикс"клубника3кг/Хамле №253-1""",
-    """Печ."Кремикс"орех3кг/Хамле №257-1""",
-    """Печ."Кремикс"сгущенное молоко3кг/Хамле №258-1""",
-    """Печ."Кремка" с начинкой какао 3,5кг №753-1""",
-    """Печ."Кремка" с начинкой со вкусом клубники 3,5кг №754-1""",
-    """Печ."Кремка" с начинкой со вкусом топленого молока 3,5кг №755-1""",
-    """Печ."Лорамель" с маршмаллоу глазированное 52г*30шт №311""",
-    """Печ."Лорамель" с начинкой с молочным вкусом 39г*40шт №317""",
-    """Печ."Лорамель" с начинкой со вкусом банана 39г*40шт №315""",
-    """Печ."Лорамель" с начинкой со вкусом клубники 39г*40шт №316""",
-    """Печ."Лорд" с начинкой ванильной 60г*24шт №860""",
-    """Печ."Лорд" с начинкой какао 60г*24шт №863""",
-    """Печ."Лорд" с начинкой со вкусом апельсина 60г*24шт №862""",
-    """Печ."Лорд" с начинкой со вкусом клубники 60г*24шт №861""",
-    """Печ."Лорд" с начинкой фундук 60г*24шт №864""",
-    """Печ."Лучистое"зат.с какао 170г*24шт/Хамле №435""",
-    """Печ."Лучистое"зат.со сгущ мол. 170г*24шт/Хамле №438""",
-    """Печ."Лучистое"зат.со сгущ мол. 170г*24шт/Хамле №438 (уд)""",
-    """Печ."Ляззат"сах.75г*24шт/Хамле №152""",
-    """Печ."Макси танго какао" 150г*24шт""",
-    """Печ."Макси танго клубничный" 150г*24шт""",
-    """Печ."Макси танго молочный" 150г*24шт""",
-    """Печ."Макси Танго" какао 150г*24шт  №812""",
-    """Печ."Макси Танго" клубничный вкус 150г*24шт №811""",
-    """Печ."Макси Танго" молочный 150г*24шт №810""",
-    """Печ."Макси Танго" с какао 150г*24шт №812""",
-    """Печ."Медео"зат./Хамле 140гр*24шт №114""",
-    """Печ."Мираж"клуб. 50г*60шт/Хамле №183""",
-    """Печ."Мираж"клубн.100г*24шт/Хамле №177""",
-    """Печ."Мираж"кокос 100г*24шт/Хамле №176""",
-    """Печ."Мираж"кокос 50гр*60шт/Хамле №182""",
-    """Печ."Мираж"лимон 100г*24шт/Хамле №178""",
-    """Печ."Мираж"лимон 50г*60шт/Хамле №184""",
-    """Печ."Мираж"молоч. 100г*24шт/Хамле №175""",
-    """Печ."Мираж"молоч. 50г*60шт/Хамле №181""",
-    """Печ."Наша марка" 760г*10шт/Хамле №291""",
-    """Печ."Наша марка"/Хамле 4кг 391-4""",
-    """Печ."Наша марка"/Хамле(6кг) №391-3""",
-    """Печ."Наша марка"190 г*24шт/Хамле №191""",
-    """Печ."Нежность"с сгущ аром .4,2кг/Хамле №392-04""",
-    """Печ."Нежность"с сгущ аром .6кг/Хамле №392-3""",
-    """Печ."Нежность"с сливочным ароматом 4,2кг/Хамле №389-04""",
-    """Печ."Нежность"с сливочным ароматом 6кг/Хамле №389-3""",
-    """Печ."Песочное" 2,5 кг/Хамле №600-00""",
-    """Печ."Привет"апельсин 80гр*24шт/Хамле №137""",
-    """Печ."Привет"ваниль 80гр*24шт/Хамле №130""",
-    """Печ."Привет"какао 80гр*24шт/Хамле №138""",
-    """Печ."Привет"клубн.80гр*24шт/Хамле №136""",
-    """Печ."Привет"малина 80г*24шт/Хамле №139""",
-    """Печ."Пуфи" с начинкой со вкусом клубники 100г*15шт №32""",
-    """Печ."Пуфи" с начинкой со вкусом кокоса 100г*15шт №31""",
-    """Печ."С кунжутом" (колечко)3,5кг/Хамле №""",
-    """Печ."С кунжутом" (колечко)3кг/Хамле №370-3""",
-    """Печ."Салют" с молочным вкусом 185г*24шт №120""",
-    """Печ."Салют" с молочным вкусом 3кг №127""",
-    """Печ."Самовар"сахарное 130гр*24шт/Хамле №122""",
-    """Печ."Сандвич" бисквит 3,5кг/Хамле №397-3""",
-    """Печ."Супер Шоу" сандвич с крем. лесн.ореха в шок. гл. 100г*36шт/Хамле №420-01""",
-    """Печ."Супер Шоу" сандвич с крем. лесн.ореха в шок. гл. 100г*40шт/Хамле №420-10""",
-    """Печ."Супер Шоу" сандвич с крем. лесн.ореха в шок. гл. 3кг/Хамле №420-03""",
-    """Печ."Супер Шоу" сандвич с крем. лесн.ореха в шок. гл. 50г*24шт*4бл/Хамле №420""",
-    """Печ."Супер Шоу" сандвич с крем. лесн.ореха в шок. гл. 50г*72шт/Хамле №420-1""",
-    """Печ."Супер Шоу" сандвич сгущ. мол. в шок. гл. 100г*36шт/Хамле №421-01""",
-    """Печ."Супер Шоу" сандвич сгущ. мол. в шок. гл. 100г*40шт/Хамле №421-10""",
-    """Печ."Супер Шоу" сандвич сгущ. мол. в шок. гл. 3кг/Хамле №421-03""",
-    """Печ."Супер Шоу" сандвич сгущ. мол. в шок. гл. 50г*24шт*4бл/Хамле №421""",
-    """Печ."Супер Шоу" сандвич сгущ. мол. в шок. гл. 50г*72шт/Хамле №421-1""",
-    """Печ."Тамаша"с кунжутом/Хамле 85 г*24шт№161""",
-    """Печ."Тамаша"с маком 3кг/Хамле №375-3""",
-    """Печ."Танго" апельсин 75г*24шт  №402""",
-    """Печ."Танго" с какао и начинкой  75г*24шт №403""",
-    """Печ."Танго" с какао и начинкой 4кг №443""",
-    """Печ."Танго" с начинкой ванильной 4кг №440""",
-    """Печ."Танго" с начинкой ванильной 75г*24шт №400""",
-    """Печ."Танго" с начинкой со вкусом апельсина 4кг №442""",
-    """Печ."Танго" с начинкой со вкусом апельсина 75г*24шт №402""",
-    """Печ."Танго" с начинкой со вкусом клубники 4кг №441""",
-    """Печ."Танго" с начинкой со вкусом клубники 75г*24шт №401""",
-    """Печ."Танго" с начинкой со вкусом сгущенного молока  75г*24шт №405""",
-    """Печ."Улыбка" 17г*100шт/Хамле №428-1""",
-    """Печ."Фингер" ванильное 4кг №435""",
-    """Печ."Фингер" с какао 4кг №436""",
-    """Печ."Цирк"какао крем 15г*60шт/Хамле №422""",
-    """Печ."Чокобис" 4кг кремали с  клуб. кремом в шок. гл. № 863-1""",
-    """Печ."Чокобис" 4кг кремали с апел. кремом в шок. гл. № 864-1""",
-    """Печ."Чокобис" 4кг кремали с какао в шок. гл. № 865-1""",
-    """Печ."Чокобис" 4кг кремали с кремом в шок. гл. № 862-1""",
-    """Печ."Южное" 5кг/Хамле №396-3""",
-    """Печ."Яблочко от Хамле" 4 кг/Хамле №386-4""",
-    """Печ."Яблочко" 3,5кг/Хамле №386-3""",
-    """Печ.сах. "ALPELLA Мария" со вкусом топленого молока 150г*24шт №130""",
-    """Печ.сах. "ALPELLA" с начинкой со вкусом клубники 75г*24шт №411""",
-    """Печ.сах. "ALPELLA" с начинкой со вкусом кофе 75г*24шт №413""",
-    """Печ.сах. "ALPELLA" с начинкой со вкусом сгущенного молока 75г*24шт №410""",
-    """Печ.сах. "ALPELLA" с начинкой со вкусом фундука 75г*24шт №412""",
-    """Печ.сах. "Лора" с маршмаллоу глазированное 30г*60шт №300""",
-    """Печ.сах. "Лора" с маршмаллоу со вкусом банана глазированное 30г*60шт №301""",
-    """Печ.сах. "Лора" с маршмаллоу со вкусом клубники глазированное 30г*60шт №302""",
-    """Печатка""",
-    """Печать баннера""",
-    """Печать календарей""",
-    """Печать наклеек""",
-    """Печенье "BISKREM"  205г*12шт № 00151-02""",
-    """Печенье "BISKREM" 44г*24шт*12бл № 1141-05""",
-    """Печенье "BISKREM" с какао кремом 205г*12шт № 00151-02""",
-    """Печенье "Cocostar" покрытое шоколадом и кокосовой стружкой 240г*12шт/Хамле №00498-11""",
-    """Печенье "Cocostar" покрытое шоколадом и кокосовой стружкой 30г*6шт*16бл/Хамле №00498-12""",
-    """Печенье "Cocostar" покрытое шоколадом и кокосовой стружкой 88г*12шт*6бл/Хамле №00498-10""",
-    """Печенье "Cocostar" покрытое шоколадом и кокосовой стружкой 88г*24шт/Хамле №00498-13""",
-    """Печенье "HANIMELLER" ассорти 180г*12шт № 00131-05""",
-    """Печенье Ассорти "SAMANYOLU" 220г*12шт № 01186-05""",
-    """Печенье Ассорти 310г*12шт № 01187-05""",
-    """Печенье Ассорти 310г*12шт № 01187-06""",
-    """Печенье марка "BALOCCO" 340гр*12шт""",
-    """Печенье марка "BALOCCO" 340гр*12шт""",
-    """Печенье марка "LAMBERTZ" 1000гр*4шт""",
-    """Печенье-сендвич "IKRAM" с фундуком 58г*36шт № 00591-05""",
-    """Печенье-сендвич "TEMPO" какао с кремом 45г*24шт № 01104-09""",
-    """Печенье-сендвич "TEMPO" какао с кремом 72г*24шт № 00104-07""",
-    """Печенье-сендвич "TEMPO" с ванильным кремом 72г*24шт № 00106-07""",
-    """Печиво "ALBENI" з  карамеллю і нугою в молочному шоколаді з крихтами печива 144грХ12шт""",
-    """Печиво "ALBENI" з  карамеллю і нугою в молочному шоколаді з крихтами печива 144грХ12шт""",
-    """Печиво "BASTONCINI" пісочне з лимонною цедрою 350 г х 12 шт""",
-    """Печиво "BERNA" з маршмеллоу та какао гранулами 18гр х27""",
-    """Печиво "BERNA" з маршмеллоу та кокосовою стружкою 18гр х27""",
-    """Печиво "BERNA" з маршмеллоу та кольоровими гранулами 18гр х27""",
-    """Печиво "Bien Gel Keyfim" мозаїчне з шоколадною начинкою 110гр х18""",
-    """Печиво "Biscolata mood COCONUT" з кремовою начинкою з білого шоколаду та кокосу   115 гр Х24 """,
-    """Печиво "Biscolata mood COCONUT" з кремовою начинкою з білого шоколаду та кокосу   125гр Х24 """,
-    """Печиво "Biscolata Pia Raspberry" з малиновою начинкою та чорним шоколадом 100г Х24шт""",
-    """Печиво "Biscolata Pia Raspberry" з малиновою начинкою та чорним шоколадом 25г Х24шт Х6 бл """,
-    """Печиво "Biscolata Pia Сhocolate" з шоколадним кремом та чорним гірким  шоколадом 25г Х24шт Х6 бл""",
-    """Печиво "Biscolata Pia Сhocolate" з шоколадним кремом та чорним шоколадом 100г Х24шт """,
-    """Печиво "BISKA" з шоколадною начинкою 100гр х24х6""",
-    """Печиво "BISKIATO" декоровано глазур'ю 68гр х24х6""",
-    """Печиво "BISKIATO" з какао 65гр х24х6""",
-    """Печиво "BISKIATO" сендвіч з шоколадним кремом 160гр х24""",
-    """Печиво "BİSKREM DUO" з какао кремом 150грХ18 шт""",
-    """Печиво "BISKREM" з шоколадом 100гр Х 18шт""",
-    """Печиво "BISKREM" з шоколадом 110гр Х 24шт Х 6 бл""",
-    """Печиво "BISKREM" з шоколадом 170гр Х  18шт""",
-    """Печиво "BISKREM" з шоколадом 200гр Х 15шт""",
-    """Печиво "BISKREM" з шоколадом 205гр Х 12шт""",
-    """Печиво "BREAKFAST" зі злаками без цукру 325 г х 10 шт""",
-    """Печиво "BREAKFAST" цільнозернове  зі злаками без цукру 330 г х 10 шт""",
-    """Печиво "BREAKFAST" цільнозернове  зі злаками, яблуком та корицею 350 г х 10 шт""",
-    """Печиво "CHOCO PAYE" cендвіч з маршмел. і карамеллю покрите  глазур'ю і кокосовою стружкою 57гр х24х6""",
-    """Печиво "CHOCO PAYE" з маршмеллоу покрите шоколадною глазур'ю 100гр х24""",
-    """Печиво "CHOCO PAYE" з маршмеллоу покрите шоколадною глазур'ю 120гр х24""",
-    """Печиво "CHOCO PAYE" з маршмеллоу покрите шоколадною глазур'ю 216гр х12""",
-    """Печиво "CHOCO PAYE" з маршмеллоу покрите шоколадною глазур'ю і кокосовою стружкою 216гр х12""",
-    """Печиво "CHOCO PAYE" сендвіч з маршмеллоу покрите білою глазур'ю і кокосовою стружкою 57гр х24х6""",
-    """Печиво "CHOCO PAYE" сендвіч з маршмеллоу покрите глазур'ю і кокосовою стружкою 57гр х24х6""",
-    """Печиво "CHOCO PAYE"cендвіч з маршм.  покрите глазур'ю кокосовою стружкою та смаком банану 57гр х24х6""",
-    """Печиво "CIAMBELLE" пісочне з вершками 350 г х 12 шт""",
-    """Печиво "CIOKO  NOVELLINI" пісочне з шоколадом і свіжим молоком 350 г х 10 шт""",
-    """Печиво "CRUSCHELLE" цільнозернове 350 г х 12 шт""",
-    """Печиво "Double Up" сендвіч покритий молочним шоколадом 27грх24х6""",
-    """Печиво "FACCINE" пісочне з шоколадом і фундуком 350 г х 12 шт""",
-    """Печиво "GEMMOLE" цільнозернове з пророщеними зернами спельти, пшениці та гречки 350 г х 12 шт""",
-    """Печиво "GOCCIOLOTTI" пісочне зі шматочками шоколаду 350 г х 12 шт""",
-    """Печиво "GORONA MARIE" 120гр х24""",
-    """Печиво "GORONA MARIE" з апельсиновим смаком 120гр х24""",
-    """Печиво "GORONA MARIE" з какао 120гр х24""",
-    """Печиво "HALLEY MINI " 77гр Х 24шт""",
-    """Печиво "HALLEY" 300 гр Х 12 шт """,
-    """Печиво "HALLEY" 300гр Х 12шт """,
-    """Печиво "HALLEY" 30гр Х 24шт""",
-    """Печиво "HALLEY" 30гр Х 36шт Х 6 бл""",
-    """Печиво "İnvite" з кунжутом 70гр х24х6""",
-    """Печиво "LADYBIRD" з молочним кремом вкрите молочним, чорним та білим шоколадом  22 г * 24 шт* 6 бл""",
-    """Печиво "MONDINE" пісочне з рисовим борошном та молоком 350 г х 12 шт""",
-    """Печиво "NOVELLINI" пісочне зі свіжим молоком і медом 350 г х 10 шт""",
-    """Печиво "OZMO BURGER" сендвич з молочним і шоколадним кремом та рисовими кульками 40г Х12шт Х6 бл """,
-    """Печиво "Ozmo Hoppo Çikolatalı" з шоколадним кремом 40 г Х12шт Х4 бл """,
-    """Печиво "Ozmo Hoppo Çikolatalı" з шоколадним кремом 90 г Х24шт""",
-    """Печиво "Ozmo Hoppo Strawberry" з полуничним кремом 40 г Х12шт Х4 бл """,
-    """Печиво "PASTEFROLLE" пісочне з яєчними жовтками 350 г х 12 шт""",
-    """Печиво "PETIT BEURRE" двокольорове 300гр х10""",
-    """Печиво "Pötıtbör Bıscuıts" 175гр Х 16шт Х 4бл""",
-    """Печиво "RUNGU" Danish Cookies  з/б 340gx12""",
-    """Печиво "RUSTICOTTE" цільнозернове з насінням чіа та льоном 350 г х 12 шт""",
-    """Печиво "SACCOTTELLI" вівсяне з кукурудзяними пластівцями та шматочками шоколаду 350 г х 12 шт""",
-    """Печиво "SARACENE" цільнозернове гречане зі шматочками шоколаду 350 г х 12 шт""",
-    """Печиво "SAVOIARDI" бісквітне 200 г х 15 шт""",
-    """Печиво "SFOGLIATINE" листкове глазуроване з абрикосом 200 г х 15 шт""",
-    """Печиво "SFOGLIATINE" листкове з цукром 200 г х 15 шт""",
-    """Печиво "Simley " сендвіч з маршмеллоу покрите глазур'ю 19гр.Х 24 Х 6""",
-    """Печиво "VITA MIA" з лісовими ягодами і хрустким рисом 280 г х 10 шт""",
-    """Печиво "VITA MIA" зі шматочками шоколаду без цукру 290 г х 10 шт""",
-    """Печиво "X-ONE" з карамеллю вкрите какао-глазур'ю  21 г * 24 шт* 6 бл""",
-    """Печиво "ZUPPOLE" пісочне зі свіжим молоком і цукровою посипкою 350 г х 12 шт""",
-    """Печиво "РОССО" з ванільним кремом та глазур’ю 34гр х24 х 6""",
-    """Печиво "РОССО" з какао кремом та глазур’ю 34гр х24 х 6""",
-    """Печиво «BISCOLATA  STARZ» з кремом кофе мока  в молочному шоколаді 88г Х24шт""",
-    """Печиво «BISCOLATA  STARZ» з молочним кремом  в молочному шоколаді 82г Х24шт """,
-    """Печиво «BISCOLATA  STARZ» з молочним кремом  в молочному шоколаді 88г Х24шт """,
-    """Печиво «Biscolata Mood Bitter» з какао з кремом чорного шоколаду 115 г Х24шт""",
-    """Печиво «Biscolata Mood bitter» з какао з кремом чорного шоколаду 125г Х24шт""",
-    """Печиво «Biscolata Mood Bitter» з какао з кремом чорного шоколаду 40г Х12шт Х4 бл """,
-    """Печиво «Biscolata Mood» з шоколадно-кремовою начинкою 115г Х24шт""",
-    """Печиво «Biscolata Mood» з шоколадно-кремовою начинкою 40г Х12шт Х4 бл          """,
-    """Печиво ALVIEN TOPLINE седвіч з маршмеллоу у какао глазуі  216 гр х 12 шт """,
-    """Печиво ALVIEN TOPLINE седвіч з маршмеллоу у какао глазуі з кокосовою стружкою 216 гр х 12 шт """,
-    """Печиво ALVIEN TOPLINE седвіч з маршмеллоу у какао глазуі з кокосовою стружкою 56 гр х 24 шт х 6 бл""",
-    """Печиво ALVIEN TOPLINE сендвіч з маршмеллоу у білій глазурі з кокосовою стружкою 56 гр х 24 шт х 6 бл""",
-    """Печиво Bambil з маршмеллоу та какао гранулами 100гр Х24шт""",
-    """Печиво Bambil з маршмеллоу та кокосовою стружкою 100гр Х24шт""",
-    """Печиво Bistella з какао кремом 150 грХ 12шт""",
-    """Печиво Bistella мраморне з какао кремом 150 грХ 12шт""",
-    """Печиво BON VISAGE сендвіч з какао та фундуком  25 гр х 24 шт х 6 бл""",
-    """Печиво BON VISAGE сендвіч з какао та фундуком  50 гр х 24 шт х 6 бл""",
-    """Печиво Bonita Pool з карамеллю, молочним шоколадом та кольоровими кульками 25гр 6блХ24шт""",
-    """Печиво BRAWO PIE сендвіч з маршмеллоу  вкрите какао-глазур'ю з кокосовою стружкою  216 гр х 12 шт  """,
-    """Печиво BRAWO PIE сендвіч з маршмеллоу вкрите гірким шоколадом 216 гр х 12 шт""",
-    """Печиво BRAWO PIE сендвіч з маршмеллоу вкрите какао-глазур'ю 216 гр х 12 шт""",
-    """Печиво BRAWO PIE сендвіч з маршмеллоу у какао глазурі  240 гр х 12 шт""",
-    """Печиво CHAMPS CRUNCHY DARK зі шматочками шоколаду 120 г Х 24 шт """,
-    """Печиво Çikilop сендвіч з маршмеллоу у какао глазурі 216 гр. Х12шт""",
-    """Печиво Çikilopçuk сендвіч з маршмеллоу у какао глазурі 130гр, Х12шт """,
-    """Печиво Çikilopçuk сендвіч з маршмеллоу у какао глазурі та кокосовою стружкою 130гр, Х12шт """,
-    """Печиво CIMBOO з маршмеллоу у банановій глазурі  35  гр х 24 шт х 6 бл""",
-    """Печиво CIMBOO з маршмеллоу у банановій глазурі  50 гр х 24 шт х 6 бл""",
-    """Печиво CIMBOO з маршмеллоу у банановій глазурі 30гр х24шт х6бл""",
-    """Печиво CIMBOO з маршмеллоу у какао глазурі  35 гр х 24 шт х 6 бл""",
-    """Печиво CIMBOO з маршмеллоу у какао глазурі  50 гр х 24 шт х 6 бл""",
-    """Печиво CIMBOO з маршмеллоу у какао глазурі 30 гр х24шт х6бл""",
-    """Печиво CIMBOO з маршмеллоу у полуничній   глазурі  35 гр х 24 шт х 6 бл""",
-    """Печиво CIMBOO з маршмеллоу у полуничній глазурі 30 гр х24шт х6бл""",
-    """Печиво CIMBOO з маршмеллоу у фісташковій глазурі 50 гр х 24 шт х 6 бл""",
-    """Печиво COCO TROY сендвіч з маршмеллоу у білій глазурі з кокосовою стружкою  50 гр х 24 шт х 6 бл""",
-    """Печиво COCO TROY сендвіч з маршмеллоу у білій глазурі з кокосовою стружкою  58 гр х 24 шт х 6 бл""",
-    """Печиво COCO TROY сендвіч з маршмеллоу у какао глазурі з кокосовою стружкою  50 гр х 24 шт х 6 бл""",
-    """Печиво COCO TROY сендвіч з маршмеллоу у какао глазурі з кокосовою стружкою  58 гр х 24 шт х 6 бл""",
-    """Печиво DOUGHNUT WHEELS сендвіч з маршмелоу 210 гр Х 12 шт""",
-    """Печиво JASMINE бісквит з маршмеллоу зі смаком банана у какао глазурі  25 гр х 30 шт х 12 бл""",
-    """Печиво KATAKIT ELEGANCE сендвіч шоколадне з маршмеллоу у шоколаді 60 гр х 24 шт х 6 бл""",
-    """Печиво LETS'GO сендвіч шоколадне з ванільним кремом 36 гр х 24 шт х 12 бл""",
-    """Печиво LETS'GO сендвіч шоколадне з ванільним кремом 72 гр х 24 шт х 6 бл""",
-    """Печиво Love it сендвіч з лимонною  начинкою 88гр 24шт""",
-    """Печиво Love it сендвіч з малиновою начинкою 88гр 24шт""",
-    """Печиво MADELINA з маршмеллоу у глазурі 30 гр х 36 шт""",
-    """Печиво MAMMI TWIST сендвіч з полуничним желе-маршмеллоу у какао глазурі 135 гр х 24 шт""",
-    """Печиво Papita milky з молочним кремом , мол. шоколадом і кол. драже 12box 24pcs 33g""",
-    """Печиво Papita Party  з молочною начинкою та  чорним шоколадом і кольоровим драже  63г  Х24шт""",
-    """Печиво Papita Party з молочною начинкою та  молочним шоколадом і  кольоровим драже  63г  Х24шт """,
-    """Печиво Papita з карамельною начинкою та молочним шоколадом  12box 24pcs 33g""",
-    """Печиво Papita з кокосовим кремом з молочним шоколадом  12box 24pcs 33g""",
-    """Печиво POLEMIC сендвіч з какао начинкою 68 гр х 24 шт х 6 бл""",
-    """Печиво POLEMIC сендвіч з полуничною начинкою 68 гр х 24 шт х 6 бл""",
-    """Печиво Prens сендвіч з какао кремом 300гр  Х12шт""",
-    """Печиво Prens сендвіч з какао кремом та фундуком 25гр 12блХ24шт""",
-    """Печиво TROY сендвіч з маршмеллоу у какао глазурі  240 гр х 12 шт""",
-    """Печиво TROY сендвіч з маршмеллоу у какао глазурі  60 гр х 48 шт""",
-    """Печиво TROY сендвіч з маршмеллоу у какао глазурі з полуничною  начинкою  200гр х 12 шт""",
-    """Печиво для дитячого харчування "BEBE" з вітамінами та мінералами 400 гр. Х 8 шт.""",
-    """Печиво з інжирною начинкою  "Delites" 120 г х 24 шт""",
-    """Печиво з маршмеллоу "COCOMEL" 12гр Х 45шт Х 6 бл""",
-    """Печиво з маршмеллоу "COCOMEL" 13гр Х 45шт Х 6 бл""",
-    """Печиво з маршмеллоу "COCOMEL" з полуничним смаком  48гр (12грх4шт) х 30""",
-    """Печиво з маршмеллоу "COCOMEL" з полуничним смаком  52гр (13грх4шт) х 30""",
-    """Печиво з маршмеллоу "COCOMEL" з полуничним смаком 12гр Х 45шт Х 6 бл""",
-    """Печиво з маршмеллоу "COCOMEL" з полуничним смаком 13гр Х 45шт Х 6 бл""",
-    """Печиво з полуничним кремом та білим шоколадом "PINK PIE" 1000 г х 6 шт""",
-    """Печиво з фініковою начинкою  "Delites" 120 г х 24 шт""",
-    """Печиво з яблучною начинкою  "Delites" 120 г х 24 шт""",
-    """Печиво злакове "ALTINBASAK" 46 гр. Х 24 """,
-    """Печиво Преміум Ассорті 300гр Х 1 Х 10""",
-    """Печиво сендвіч ванільне "RONDO" з ванільним кремом 76 гр. Х 24 шт""",
-    """Печиво сендвіч шоколадне "RONDO" з шоколадним кремом 76гр Х 24шт.""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВС. ПЛАСТ, НАСІННЯМ ЛЬОНУ, КУНЖ, АРАХІСОМ, МЕДОМ, МИГД 150 г х 20""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВСЯНИМИ ПЛАСТІВ, АРАХ,ФУНД, НАСІННЯМ ЧІА, МАЛИН, ЖУРАВ 150 г Х18""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВСЯНИМИ ПЛАСТІВ, АРАХ,ФУНД, НАСІННЯМ ЧІА, МАЛИН, ЖУРАВ 150 г Х20""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВСЯНИМИ ПЛАСТІВ, КУНЖУТОМ, АРАХ, ІНЖИР, НАСІННЯМ СОНЯШН 150 гХ20""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВСЯНИМИ ПЛАСТІВЦЯМ, НАСІННЯМ СОНЯШНИКА, НАСІННЯМ ЛЬОНУ 150 г х 18""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВСЯНИМИ ПЛАСТІВЦЯМ, НАСІННЯМ СОНЯШНИКА, НАСІННЯМ ЛЬОНУ 150 г х 20""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВСЯНИМИ ПЛАСТІВЦЯМИ, АРАХІСОМ, КАКАО 150 г х 18""",
-    """ПЕЧИВО ЦІЛЬНОЗЕРНОВЕ "GRANADA" З ВІВСЯНИМИ ПЛАСТІВЦЯМИ, АРАХІСОМ, КАКАО 150 г х 20шт""",
-    """Печиво цукрове "HAYLAYF"  64 гр X 24 бл""",
-    """Печиво цукрове "HAYLAYF"  72 гр X 24 бл""",
-    """Печиво-cендвіч "LAMORE"з ванільним смаком 150гр х 24""",
-    """Печиво-cендвіч "LAMORE"з шоколадним смаком 150гр х 24""",
-    """Печиво-батончик BROWNIE  з полуничною начинкою TM "Delites" ПВХ 120 г х 24 шт """,
-    """Печиво-батончик BROWNIE  з чорничною начинкою TM "Delites " ПВХ 120 г х 24 шт""",
-    """Печиво-батончик з інжирною  начинкою TM "Delites" ПВХ 150 г х 24 шт""",
-    """Печиво-батончик з інжирною начинкою  "Delites" 25 г х 24 шт х 6 бл""",
-    """Печиво-батончик з інжирною начинкою TM "Delites" ПВХ 120 г  х 24 шт""",
-    """Печиво-батончик з полуничною  начинкою TM "Delites" ПВХ 150 г х 24 шт""",
-    """Печиво-батончик з полуничною начинкою  "Delites" 25 г х 24 шт х 6 бл""",
-    """Печиво-батончик з полуничною начинкою TM "Delites" ПВХ 120 г х  24 шт""",
-    """Печиво-батончик з фініковою  начинкою TM "Delites" ПВХ 150 г х 24 шт""",
-    """Печиво-батончик з фініковою начинкою  "Delites" 25 г х 24 шт х 6 бл""",
-    """Печиво-батончик з фініковою начинкою TM "Delites" ПВХ 120 г х 24 шт""",
-    """Печиво-батончик з чорничною начинкою  "Delites" 25 г х 24 шт х 6 бл""",
-    """Печиво-батончик з чорничною начинкою TM "Delites" ПВХ 120 г х 24 шт""",
-    """Печиво-батончик з яблучною начинкою  "Delites" 25 г х 24 шт Х 6 бл""",
-    """Печиво-батончик з яблучною начинкою TM "Delites" ПВХ 120 г х 24 шт""",
-    """Печиво-батончик з яблучною начинкою TM "Delites" ПВХ 150 г х 24 шт""",
-    """Печиво-сендвіч  "SAKLIKÖY"  113грх24шт""",
-    """Печиво-сендвіч  "SAKLIKOY" з кремом фундука 113гр х  24""",
-    """Печиво-сендвіч "ÇOKOPRENS" з шоколадно горіховою начинкою 300грх12шт """,
-    """Печиво-сендвіч "ÇOKOPRENS" з шоколадно горіховою начинкою 30грх24шт """,
-    """Печиво-сендвіч "İKRAM" з горіховим кремом 92грх24шт """,
-    """Печиво-сендвіч "İKRAM" з какао  та шоколадним кремом 92грх24шт """,
-    """Піддони 1200х800х144""",
-    """Підкладка Panta Plast 648*509 мм Прозора (0318-001)""",
-    """Підключення ліній односторонньої дії""",
-    """Підпокр. пароіз. плівка MASTERFOL FOIL S  (75м2)""",
-    """Підставка настільна Economix, обертається на 360", пластик, чорна""",
-    """Підставка під папір для нотаток 90х90х90мм пластик чорна""",
-    """Підставка під с/блок  S9-00-02""",
-    """Підставка під системний блок""",
-    """Пінотворне мило Лаванда 300 млХ12 Saloon """,
-    """Пінотворне мило Малина 300 млХ12 Saloon """,
-    """Пінотворне мило Цитрус і Манго 300 млХ12 Saloon """,
-    """Планшет А 4 Economix з притиском, чорний""",
-    """ПЛАСТИЛІН 5 кольорів""",
-    """ПЛАСТИЛІН 6 кольорів""",
-    """Плата розширення Panasonic KX-TE82480X для KX-TEM824/TES824 8 SLT Option Card + 2 CO""",
-    """Плівка поліпропіленова пакувальна 200 мм""",
-    """Плівка поліпропіленова пакувальна 250 мм""",
-    """Плівка поліпропіленова пакувальна 360 мм""",
-    """Погрузчик Марка CPD/15G""",
-    """Подарункова коробка з картону""",
-    """Подарункова коробка з картону""",
-    """Подарункова коробка з картону""",
-    """Подарункова коробка з картону""",
-    """Подарунковий набір  чаю асорті  зі скл. чашкою Х10""",
-    """Подарунковий набір з двох видів чаю (лим. імбірний та лісові ягоди) зі скл. чашкою Х10""",
-    """Поддон Евро 1200*800""",
-    """Подовжувач електричний""",
-    """Подставка настольная "Цилiндри"на 6 отделений Economix,пластик чорна """,
-    """Подставка под папiр для нотаток Economix, 90/90/90мм, пластик ,димчата """,
-    """Полиграфические услуги""",
-    """Помпа Lyli""",
-    """Поновлення програмного забеспечення""",
-    """Пончики (суміш для пончиків) 355 грамХ8 Kenton""",
-    """Портфель пластиковий А4 Economix на блискавці, 2 відділення, червоний""",
-    """Послуга з консолiдацiи замовлень на поставку , згидно п.3.1.9 Дог. Надання Послуг """,
-    """Послуга з надання щомiсячного звiту про обсяги реалiзованого товару Замовника згiно п 3.3.7 Дог. Н.П""",
-    """Послуга з организации руху товарiв, згiдно п.3.3,1 Дог. Надання Послуг """,
-    """Послуга зi забезп. видпов. асорт.i достат. к-сти розм. товару в мi сцях продажу , згiдно """,
-    """Послуга зi збору iнформации про продукцiю, згiдно п. 3.3.6 Дог.Надання Послуг""",
-    """Послуга зi стимулювання та розширення ринку збуту, згiдно п. 3.3.5.1 Дог.Надання Послуг""",
-    """Послуга складського зберігання""",
-    """Послуги  по доставці  товару  клієнтам""",
-    """Послуги з оформлення туристичного страхування""",
-    """Послуги з предпродажной подготовки товара """,
-    """Послуги з розмитнення товару""",
-    """Послуги з сервісного обслуговування""",
-    """Послуги з хостингу""",
-    """послуги зберігання та стоянки автотранспорту""",
-    """Послуги зв"язку""",
-    """Послуги передпродажної підготовки товару""",
-    """Послуги передпродажної підготовки товару """,
-    """Послуги передпродажної підготовки товару """,
-    """Послуги перекладу""",
-    """Послуги по доставці документів""",
-    """Послуги по стікеруванню товару""",
-    """Послуги складського зберігання на складі за адресою : 03164, м.Київ, вул.Малинська, буд.20 у жовтні""",
-    """Пособие "Управленческий учёт затрат и результатов на ТП и предприятиях, вып.работы """,
-    """Постачання компонентів сумісної роботи з ключем АЦСК""",
-    """Постачання пакетів оновлення програмного забеспечення 1С""",
-    """Постачання пакетів оновлення програмного забеспечення М.Е.Док""",
-    """Поштові послуги """,
-    """Пошук та підбір персоналу""",
-    """Ппослуги з доступу до мережі Інтернет (МАЛИНСЬКА 20)""",
-    """Представительские""",
-    """премия""",
-    """Претензия за недовоз товара""",
-    """Прикраси для NOVUS""",
-    """Прилавок 1000*418*1100 для выставки""",
-    """Принтер для ч/б друку Canon i-Sensys LBP226DW (3516C007)""",
-    """Приставний елемент S1-3612""",
-    """Приставний елемент к офисному столу""",
-    """Прінтер (багатофункціональний пристрій) HP LaserJet Pro M426fdw  Wi-Fi (W1A28А)""",
-    """Прінтер (багатофункціональний пристрій) HP LaserJet Pro M426fdw with Wi-Fi (F6W15A)""",
-    """Прінтер LaserJet Pro M203dw""",
-    """Прінтер термоетикеток TSC TE210 (99-065A301-00LF00)""",
-    """Программа 1С 8""",
-    """програмний продукт Avast File Server Security""",
-    """Продовження дії ліцензії на використання програми""",
-    """Продукты""",
-    """Продукты кухня""",
-    """Прожектор вуличний""",
-    """Проживание в гостиннице""",
-    """Профіль ПВХ з сіткою  10+10N (125)""",
-    """ПРОЧИЕ ПРОДУКТЫ""",
-    """Пудинг желе "BANANA PUDDING" 68гр х12 х12""",
-    """Пудинг желе "CUPPY PUDDING" 30гр х60 х8""",
-    """Пудинг желе "АНАНАС" 68гр х12шт х12""",
-    """Пудинг зі смаком  шоколаду 40 грамХ12штХ2бл Kenton """,
-    """Пудинг зі смаком ванілі 40 грамХ12штХ2бл Kenton""",
-    """Пудинг зі смаком карамелі 40 грамХ12штХ2бл Kenton""",
-    """Пудинг зі смаком полуниці 40 грамХ12штХ2бл Kenton""",
-    """Пудинг-желе з посипкою "DOUGHNUT PUDDING AND PIN CANDY" 14гр х30 х20""",
-    """Пудинг-желе міні "ANGLE JAR" 13гр х100 х6""",
-    """Пудинг-желе міні "BENBEN BEAR JAR" 13гр х100 х6""",
-    """Пудинг-желе міні "BULL" 13гр х100 х6""",
-    """Пудинг-желе міні "CUTE DRAGON JAR" 13гр х100 х6""",
-    """Пудинг-желе міні "DOG" 13гр х100 х6""",
-    """Пудинг-желе міні "MOUSE" 13гр х100 х6""",
-    """Размещение вакансий на сайте""",
-    """Разница по инвойсу""",
-    """Разработка логотипа""",
-    """Разработка сайта""",
-    """Рама стелажа SN 2500*800 мм (оцинкована) """,
-    """Рама стелажа SN 3500*800 мм (оцинкована) """,
-    """Растаможка""",
-    """Растаможка""",
-    """Растаможка 10% тамож. пошлина""",
-    """Растаможка 20% НДС""",
-    """Растаможка брокер Алексей""",
-    """Растаможка ветконтроль""",
-    """Рахат-лукум апельсиновий з фісташками фітіль """,
-    """Рахат-лукум барбарис Зереш фітіль """,
-    """Рахат-лукум ваніль фітіль """,
-    """Рахат-лукум вишня фітіль """,
-    """Рахат-лукум гранат  з фісташками Ведро""",
-    """Рахат-лукум Гранат Кубики""",
-    """Рахат-лукум гранат Шехзаде 200 г""",
-    """Рахат-лукум гранатовий фітіль з пелюстками""",
-    """Рахат-лукум джезерье  з фісташками Ведро""",
-    """Рахат-лукум Диня Фитиль""",
-    """Рахат-лукум звичайний з лісовим горіхом Шехзаде 200 г""",
-    """Рахат-лукум Звичайний Кубики""",
-    """Рахат-лукум лимонний фітіль """,
-    """Рахат-лукум мята  з фісташками Ведро""",
-    """Рахат-лукум подв. фісташка  кг.Кубики""",
-    """Рахат-лукум подвійний  з фісташкою Шехзаде 200 г""",
-    """Рахат-лукум Троянда Кубики""",
-    """Рахат-лукум троянда Шехзаде 200 г""",
-    """Рахат-лукум Фруктовий кг.Кубики""",
-    """Рахат-лукум фруктовий Шехзаде 200 г""",
-    """Рахат-лукум фундук  кг.Кубики""",
-    """Ребро жорсткості на ярус стелажа SN 800 мм (оцинков.) """,
-    """Регистрация автомобиля VOLVO""",
-    """Рекламна продукція""",
-    """Рекламна продукція""",
-    """Рекламна продукція""",
-    """Рекламная продукция""",
-    """Рекламний пластиковий стенд """,
-    """Рекламний пластиковий стенд BOOMBASTIC""",
-    """Рекламний пластиковий стенд Ozmo """,
-    """Рекламний стенд""",
-    """Рекламний стенд з картону """,
-    """Рекламний стенд з картону """,
-    """Рекламний стенд з картону """,
-    """Рекламний стенд з картону """,
-    """Рекламний стенд з картону """,
-    """Рекламний стенд з картону """,
-    """Рекламний стенд з картону BISCOLATA """,
-    """Рекламний стенд з картону BISCOLATA """,
-    """Рекламний стенд з картону з пластиковими полицями""",
-    """Рекламні матеріали""",
-    """Рекламні послуги""",
-    """Рекламні стенди Biscolata""",
-    """Рекламні стенди Ozmo""",
-    """Рекламні товари""",
-    """рекламные футболки""",
-    """Ремонт автомобіля  AUDI, бензин""",
-    """Ремонт автомобіля  VOLVO, бензин""",
-    """Ремонт принтера""",
-    """Ремонт складського обладнання""",
-    """Рідке мило Ваніль 400 млХ12 Saloon """,
-    """Рідке мило Ваніль 400+750 млХ6шт Saloon """,
-    """Рідке мило Гранат 400 млХ12 Saloon """,
-    """Рідке мило Гранат 400+750 млХ6шт Saloon""",
-    """Рідке мило Манго 400 млХ12  Saloon""",
-    """Рідке мило Манго 400+750 млХ6шт Saloon """,
-    """Рідке мило Оливкова 400 млХ12 Saloon """,
-    """Рідке мило Пшениця 400 млХ12 Saloon """,
-    """Рідке мило Сади Султана 400 млХ12  Saloon""",
-    """Рідке мило Сади Султана 400+750 млХ6шт Saloon """,
-    """Рідке мило Троянда 400 мл.Х12 Saloon """,
-    """Рідке мило Троянда 400+750 млХ6шт Saloon """,
-    """Роботи по організації локальної мережі""",
-    """Роздільник аркушів""",
-    """Розетка зовнішня подвійна RJ45 cat.5Е""",
-    """Розміщення реклами на сайті """,
-    """Розпушувач тіста 10 грамХ120штХ12бл Kenton NEW""",
-    """Розпушувач тіста 10 грамХ36штХ12бл Kenton""",
-    """Россия""",
-    """Рукавички господарські""",
-    """Рулет "ALPELLA" молочный коктейль 290г*12шт №572""",
-    """Рулет "ALPELLA" молочный коктейль с абрикосом 290г*12шт №573""",
-    """Рулет "ALPELLA" молочный коктейль с клубникой 290г*12шт №571""",
-    """Рулет "ALPELLA" шоколадный коктейль с вишней 290г*12шт №570""",
-    """Рулет "Peki" с какао кремом 150г*15шт/Хамле №7105""",
-    """Рулет "Peki" с кремом с ароматом абрикоса 150г*15шт/Хамле №7106""",
-    """Рулет "Peki" с кремом с ароматом сгущенного молока 150г*15шт/Хамле №7101""",
-    """Рулет "Рулетте" абрикосовый 150г*16шт №073-2""",
-    """Рулет "Рулетте" клубничный 150г*16шт №072-2""",
-    """Рулет "Рулетте" молочный 150г*16шт №071-2""",
-    """Рулет "Рулетте" с какао 150г*16шт №070-2""",
-    """Рулет "Сонатик" молочный коктейль с абрикосом 150г*16шт №563""",
-    """Рулет "Сонатик" молочный коктейль с клубникой 150г*16шт №562""",
-    """Рулет "Сонатик" шоколадный коктейль с вишней 150г*16шт №564""",
-    """Рулет"Нежность"абрикос.с ван.кремом 150г*15шт/Хамле 766""",
-    """Рулет"Нежность"вишн.с ван.кремом 150г*15шт/Хамле 764""",
-    """Рулет"Нежность"клуб.с ван.кремом 150г*15шт/Хамле 763""",
-    """Рулет"Нежность"с какао и мол.кремом 150г*15шт/Хамле 765""",
-    """Рулет"Рулетто"абрикос.с ван.кремом 180г*15шт/Хамле №756-1""",
-    """Рулет"Рулетто"вишн.с ван.кремом 180г*15шт/Хамле 754-1""",
-    """Рулет"Рулетто"клуб.с ван.кремом 180г*15шт/Хамле №753-1""",
-    """Рулет"Рулетто"клуб.с ван.кремом 180г*16шт/Хамле №753""",
-    """Рулет"Рулетто"с какао и мол.кремом 180г*15шт/Хамле №755-1""",
-    """Рулет"Рулетто"со сгущенкой 180г*15шт/Хамле №751-1""",
-    """Рулет"Соната" абрик.с ванильн.кр.200г*15шт/Хамле 716-1""",
-    """Рулет"Соната" абрик.с ванильн.кр.200г*15шт/Хамле*""",
-    """Рулет"Соната" абрик.с ванильн.кр.200г*16шт/Хамле №716""",
-    """Рулет"Соната" вишн.с ванильн.кр.200г*15шт/Хамле 714-1""",
-    """Рулет"Соната" вишн.с ванильн.кр.200г*16шт/Хамле""",
-    """Рулет"Соната" вишн.с ванильн.кр.200г*16шт/Хамле №714""",
-    """Рулет"Соната" клуб.с ванильн.кр.200г*15шт/Хамле 713-1""",
-    """Рулет"Соната" клуб.с ванильн.кр.200г*16шт/Хамле""",
-    """Рулет"Соната" клуб.с ванильн.кр.200г*16шт/Хамле №713""",
-    """Рулет"Соната" с какао и мол.кр.200гр*15шт/Хамле 715-1""",
-    """Рулет"Соната" с какао и мол.кр.200гр*16шт/Хамле""",
-    """Рулет"Соната" с какао и мол.кр.200гр*16шт/Хамле №715""",
-    """Рулет"Соната" с молочным кремом.200г*15шт/Хамле 710-1""",
-    """Рулет"Соната" с молочным кремом.200г*16шт/Хамле""",
-    """Рулет"Соната" с молочным кремом.200г*16шт/Хамле №710""",
-    """Рулет"Соната" сгущ.молоко 200г*15шт/Хамле 711-1""",
-    """Рулет"Соната" ч/смород. с ваниль.кр.200г*15шт/Хамле 719-1""",
-    """Рулет"Соната" ч/смород. с ваниль.кр.200г*15шт/Хамле*""",
-    """Рулет"Соната"абрикос. в шок.глаз.200г*15шт/Хамле 726-1""",
-    """Рулет"Соната"вишн.в шок.глаз.200г*15шт/Хамле 724-1""",
-    """Рулет"Соната"клуб.в шок.глаз.200г*15шт/Хамле 723-1""",
-    """Рулет"Соната"сгущ.молоко в шок.глаз.200г*15шт/Хамле 721-1""",
-    """Рулет"Соната"ч/смород.в шок.глаз.200г*15шт/Хамле 729-1""",
-    """Ручка 12шт. кулькова автоматична Delta by Axent DB2026 """,
-    """Ручка гелева (колір в асортименті)""",
-    """Ручка кулькова """,
-    """Ручка кулькова""",
-    """Ручка кулькова ECONOMIX ICE PEN 0.5 мм. синя""",
-    """Ручка кулькова Economix Range 0.5 мм""",
-    """Ручка кулькова Pelikan Stick Чорна 1 мм Прозорий""",
-    """Ручка кулькова SCHNEIDER 0.7 мм""",
-    """Ручка кулькова автомат""",
-    """Ручка кулькова металева STEEL, синя""",
-    """Ручка масляна""",
-    """Рушник паперовий""",
-    """Світшот бавовняний з логотипом SOLEN""",
-    """Сервер - Бізнес D3""",
-    """Серветки вологі 15 шт/уп.""",
-    """Серветки вологі 72 шт/уп.""",
-    """Серветки для чищення моніторів""",
-    """Серветки паперові 1-шар білі 100 шт 24*24""",
-    """Сервисне обслуговування""",
-    """Сертифікат в системі GS1""",
-    """Сітка скловолоконна FIBERGLASS 160 (50м2)""",
-    """Складывающаяся брендированная сумка The Mill из полиэстера (для выставок)""",
-    """Скло збільшуюче 90мм 2 - кратне""",
-    """Склоочисник 1л Х12шт.  CAMSIL """,
-    """Склоочисник Блиск 1лХ12шт  CAMSIL """,
-    """Склоочисник Квітковий 1лХ12шт  CAMSIL """,
-    """Скоба для зшивання (архівації)""",
-    """Скоби №10 Economix 1000шт.""",
-    """Скоби №10 мідні Economix 1000шт.""",
-    """Скоби №10 оптима 1000шт.""",
-    """Скоби №24/6 (1000шт.)""",
-    """Скоби №26/6 Economix (1000шт.)""",
-    """Скотч 12х66м  прозор.рул.""",
-    """Скотч 18х30м  прозор.рул.""",
-    """Скотч 48*100  прозорий IG_02""",
-    """Скотч 48х66/40мкм ярд прозор.рул.""",
-    """Скріпка 25 мм кругла EKONOMIXі, 100 шт""",
-    """Скріпка 25 мм трикутна EKONOMIX, 100 шт""",
-    """Скріпка 28 мм кругла EKONOMIX кольорова, 100 шт""",
-    """Скріпка 28 мм кругла Optima кольорова "Зебра", в пласт. коробці, 100 шт""",
-    """Скріпка 50 мм кругла EKONOMIX, 100 шт""",
-    """Сладости с кокосом марка "LUMAR" 150гр*24шт""",
-    """Сладости с кокосом марка "LUMAR" 300гр*12шт""",
-    """Слоеное Пирожное "KAT KAT TAT" с абрикосовым кремом 32г*24шт*6бл № 00692-09""",
-    """Слоеное Пирожное "KAT KAT TAT" с ванильным кремом 30г*24шт*6бл № 00693-09""",
-    """Слоеное Пирожное "KAT KAT TAT" с клубничным кремом 32г*24шт*6бл № 00694-09""",
-    """Слоеное Пирожное "KAT KAT TAT" с кремом какао 28г*24шт*6бл № 00690-09""",
-    """Слоеное Пирожное "KAT KAT TAT" с кремом какао и фундук 28г*24шт*6бл № 00690-09""",
-    """Слоеное пирожное"Kat Kat tat" крем.начинка из какао и лес. ореха 28г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" крем.начинка из какао и лес. ореха 28г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" крем.начинка из какао и лес. ореха 28г*24шт*6бл № 00690-00""",
-    """Слоеное пирожное"Kat Kat tat" с абрикосовым кремом 30г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" с абрикосовым кремом 32г*24шт*6бл № 00692-00""",
-    """Слоеное пирожное"Kat Kat tat" с абрикосовым кремом 36г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" с абрикосовым кремом 36г*24шт*6бл № 0692-9""",
-    """Слоеное пирожное"Kat Kat tat" с ванильным кремом 30г*24шт*6бл № 00693-00""",
-    """Слоеное пирожное"Kat Kat tat" с ванильным кремом 32г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" с ванильным кремом 34г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" с ванильным кремом 34г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" с клубничным кремом 32г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" с клубничным кремом 32г*24шт*6бл № 00694-00""",
-    """Слоеное пирожное"Kat Kat tat" с клубничным кремом 36г*24шт*6бл""",
-    """Слоеное пирожное"Kat Kat tat" с клубничным кремом 36г*24шт*6бл""",
-    """Слойка "Махариши" с глазурью 150г*14шт""",
-    """Смарт-карта""",
-    """Смартфон Sumsung J105H/DS Mini DUALSIM BLACK (SM-J105HZKDSEK)""",
-    """Снеки кукурудзяні "ÇEREZOS" зі смаком сиру та цибулі, 115гХ21""",
-    """Снеки кукурудзяні "ÇEREZOS" зі смаком тако, 100 г*21 шт""",
-    """Снеки кукурудзяні (Кульки) "ÇEREZOS" зі смаком солодкої молочної кукурудзи, 115 г*21 шт""",
-    """Совок д/сміття з гумовою насадкою YAGA AGD""",
-    """Содержание здания""",
-    """Солодкій напій "ROLLY" 20мл х24х20 бл""",
-    """Соломка "BISKREM" 25г*24шт*6бл № 00162-07""",
-    """Соломка "BISKREM" 25г*24шт*6бл № 00162-08""",
-    """Соломка "BISKREM" 48г*20шт № 00145-02""",
-    """Соломка "BISKREM" 50г*20шт № 00144-07""",
-    """Соломка "BISKREM" апельсин 25г*24шт*6бл № 00162-06""",
-    """Соломка "BISKREM" апельсин 48г*20шт № 00148-07""",
-    """Соломка "BISKREM" с какао 205г*12шт № 00151-02""",
-    """Соломка "BISKREM" с какао 50г*20шт № 00144-07""",
-    """Соломка "BISKREM" фундук 25г*24шт*6бл № 00162-08""",
-    """Соломка "BISKREM" фундук 48г*20шт № 00145-02""",
-    """Соломка "JIMMY CREAM CHOCOLATE" з вершковим кремом 55 гр. 24 штХ4 бл""",
-    """Соломка "JIMMY CREAM CHOCOLATE" з полуничним  кремом 55 гр. 24 штХ4 бл""",
-    """Соломка "JIMMY CREAM CHOCOLATE" з фісташковим кремом   кремом 55 гр. 24 штХ4 бл""",
-    """Соломка "JIMMY CREAM CHOCOLATE" з шоколадно-горіховим   кремом 55 гр. 24 штХ4 бл""",
-    """Соломка "Ozmo Hoxi-Poxi" з молочним шоколадом 36г 12 шт Х 4 бл""",
-    """Соломка «Biscolata Stix Milky» в молочному шоколаді 40г Х12шт Х4 бл """,
-    """Соломка «Biscolata Stix Milky» в молочному шоколаді з кокосом 32г Х12шт Х4 бл """,
-    """Соломка «Biscolata Stix Milky» в молочному шоколаді з рисовими кульками 34г Х12шт Х4 бл """,
-    """Соломка «Biscolata Stix Milky» в молочному шоколаді з фундуком 32г Х12шт Х4 бл """,
-    """Спецодяг""",
-    """Стiл S1-12-13""",
-    """Стiл S1-22-13""",
-    """Стiл журнальний DT2045-1 1000*550*460мм""",
-    """Стiл кухонний круглий 800*750*800 дуб сонома """,
-    """Стiл письмовий Леон дуб сосна""",
-    """Стакан паперовий (100 шт х 200 мл)""",
-    """Стакан паперовий (50 шт х 110 г)""",
-    """Стакан паперовий (50 шт х 175 г)""",
-    """Стакан паперовий (50 шт х 250 г)""",
-    """стаканы паперовий с логотипом""",
-    """Стеллаж 120*2,5 высота 73000мм""",
-    """Стеллаж СТО 2,5-1,5*0,6-5""",
-    """Стеллаж СТУ-Ф-1-2,0""",
-    """Стеллаж СТУ-Ф-2-2,0""",
-    """Стеллаж СТУ-Ф-3-3,0""",
-    """Стенд виставковий дегустаційний з пластику""",
-    """Стенд металевий EXIT""",
-    """Стенди рекламні для продукції""",
-    """Степлер""",
-    """стержні до механічного олівця 0,5 мм (12шт.)""",
-    """Стійка "ORIGINAL.GOURMET" (напол.стійка) 1200""",
-    """Стійка для продукції""",
-    """Стіки цукрова пудра CC Stick Candy (Tattoo) 7гр Х40 Х24 бл""",
-    """Стіки цукрова пудра CC Stick Candy (сніжна фея) 4гр х50 х40бл""",
-    """Стіки цукрова пудра CC Stick Candy (хлопчик ніндзя) 4гр х50 х40бл""",
-    """Стіки цукрова пудра JUMBO YOGURT  CC Stick Candy (Long) 4гр Х50 Х40 бл""",
-    """Стіки цукрова пудра Magic CC Stick Candy 30гр Х20 Х12 бл""",
-    """Стіл офісний """,
-    """Стіл офісний з топом""",
-    """Стілець Visitor black C-38""",
-    """стілець висотою 43 см""",
-    """стілець висотою 46 см""",
-    """стілець з металевим каркасом""",
-    """Стілець офісний""",
-    """Стол 1400х1400х600х750х18""",
-    """стол висотою 70 см""",
-    """стол висотою 75 см""",
-    """Стол для склада""",
-    """Страхування цивільної відповідальності""",
-    """Стрейч-плівка пакувальна """,
-    """Стрейч-плівка пакувальна 20 мкм""",
-    """Стрейч-плівка пакувальна чорна""",
-    """Стретч-плівка п/ет 500/17, рул.""",
-    """стретч-плівка256/09 435MSF EVO RE""",
-    """Стрічка клейка двостороння 48мм х 10м""",
-    """Стрічка клейка з логотипом""",
-    """Стрічка клейка канцелярська прозора""",
-    """Стрічка клейка пакувальна """,
-    """Стрічка клейка пакувальна 48мм х70м прозора""",
-    """Стрічка клейка пакувальна 48мм х80м прозора""",
-    """стрічка пакувальна клейка 45*100 (прозора)""",
-    """Стул для склада""",
-    """Субаренда нежилого помещения  по договору б/н от 01.05.2016""",
-    """Сумах, 50 г""",
-    """Сумка для ноутбука""",
-    """Сюрприз-яйце з льодяником "SURPRISE EGG TOY" 6гр х24х12""",
-    """такси""",
-    """ТАНАЙ""",
-    """Тележка гидравлическая стандартная Модель CBY-JC20""",
-    """Тележка механическая для склада""",
-    """Телекомунікаційні послуги""",
-    """Телефон мобільний Samsung Galaxy""",
-    """Телефон проводной Panasonic KX-TS2356UAB Black""",
-    """Тепловентилятор (офис Нина)""",
-    """Термоголовка (картридж) для термопринтера """,
-    """Термопрінтер XP-470B для друку єтикеток""",
-    """Технічне обслуговування кондиціонерів""",
-    """Тістечко "INVITE" вафля з карамельним соусом та глазур'ю 50гр х24х6""",
-    """Тістечко "INVITE" вафля з полуничним соусом та глазур'ю 50гр х24х6""",
-    """Тістечко "INVITE" вафля з шоколадним соусом та глазур'ю 50гр х24х6""",
-    """Тістечко "INVITE" Донат з шматочками фруктів 45гр х24х6""",
-    """Тістечко "INVITE" з вершковим кремом покрите  глазур'ю 45гр х24х6""",
-    """Тістечко "INVITE" з медово-ванільним кремом покрите глазур'ю 45гр х24х6""",
-    """Тістечко "INVITE" з шоколадним кремом покрите глазур'ю 45гр х24х6""",
-    """Тістечко "INVITE" покрите шоколадним соусом  50гр х24х6""",
-    """Тістечко «INVITE» Донат з банановою начинкою покрите глазур’ю 40гр х24х6""",
-    """Тістечко «INVITE» Донат з банановою начинкою покрите глазур’ю 45гр х24х6""",
-    """Тістечко «INVITE» Донат з карамельною начинкою покрите глазур’ю 40гр х24х6""",
-    """Тістечко «INVITE» Донат з карамельною начинкою покрите глазур’ю 45гр х24х6""",
-    """Тістечко «INVITE» Донат з карамельною начинкою покрите глазур’ю 50гр х24х6""",
-    """Тістечко «INVITE» Донат з полуничною начинкою покрите глазур’ю 40гр х24х6""",
-    """Тістечко «INVITE» Донат з полуничною начинкою покрите глазур’ю 45гр х24х6""",
-    """Тістечко «INVITE» Донат з шоколадною начинкою покрите глазур’ю 40гр х24х6""",
-    """Тістечко «INVITE» Донат з шоколадною начинкою покрите глазур’ю 45гр х24х6""",
-    """Тістечко «INVITE» Донат з шоколадною начинкою покрите глазур’ю 50гр х24х6""",
-    """Тістечко Jolly з полуничною начинкою 40 гр х 24 шт х6 бл""",
-    """Тістечко Ozmo "Ogopogo" (Мішка )  з полуничним кремом 30 гр. 24 шт Х 4бл""",
-    """Тістечко Оzmo "Ogopogo" (Мішка )  з шоколадним кремом 30 гр. 24 шт Х 4бл""",
-    """ТО складського обладнання""",
-    """товар""",
-    """товар SAKIZ BEDЕLI жевательная резинка""",
-    """Товары прочие""",
-    """товары Улькер Украина""",
-    """Томатная паста ROSANNA (25-28%). ГОСТ, ж/б ключ, 800гр*12шт""",
-    """Топ S7-00-06""",
-    """Торт (суміш для торту)  Ванільний 500 грамХ12шт Kenton""",
-    """Торт (суміш для торту) Синій бархат 580 грамХ12шт Kenton""",
-    """Торт (суміш для торту) Червоний бархат 580 грамХ12шт Kenton""",
-    """Торт (суміш для торту) Шоколадний 500 грамХ12шт Kenton""",
-    """Транспорт та логістика міжнародна""",
-    """Транспорт та логістика по Україні""",
-    """Транспорт, аренда транспорта""",
-    """Транспортно-експедиційні послуги""",
-    """Трубочки  "BİSKREM STICKS" з какао начинкою 32грХ24шт""",
-    """Трубочки "Biscolata Nirvana" з кокосовою начинкою 22,5 г Х12шт Х12 бл """,
-    """Трубочки "Biscolata Nirvana" з кокосовою начинкою 26г Х12шт Х12 бл """,
-    """Трубочки "Biscolata Nirvana" з кокосовою начинкою 26г Х12шт Х4 бл """,
-    """Трубочки "Biscolata Nirvana" з шоколадним кремом та крихтами печива  27,5 г Х12шт Х12 бл """,
-    """Трубочки "Biscolata Nirvana" з шоколадно горіховою начинкою 28г Х12шт Х12 бл """,
-    """Трубочки "Biscolata Nirvana" з шоколадно горіховою начинкою 28г Х12шт Х4 бл """,
-    """Трубочки "BISKREM" с начинкой 32г*24шт*6бл № 01080-07""",
-    """Трубочки "RULOKAT" хрустящие с ореховым кремом 30г*24шт*8бл № 00197-05""",
-    """Трубочки вафельні "Dr Gerald Chocolate" з какао та з шоколадною начинкою, 160 г х 20 шт""",
-    """Трубочки вафельні "Dr Gerald Milk Chocolate" з какао та молочно-шоколадною начинкою, 160 г х 20 шт""",
-    """Трубочки вафельні "Dr Gerald Zebra" з вершковою начинкою, 160 г х 20 шт""",
-    """Трюфель 325гр*10шт № 91005083""",
-    """Тумба 400х600х750""",
-    """Тумба стаціонарна S2-01-04-Z""",
-    """Тумба стаціонарна S2-01-04-Z""",
-    """Тумба стаціонарна S2-04-04-Z""",
-    """Тумба стаціонарна S2-04-04-Z""",
-    """Украинские поставщики товаров""",
-    """УЛЬКЕР""",
-    """Упаковка вологих серветок Janitex з вмістом спирту 75 % 3 пачки по 80 шт (860004431466_1)""",
-    """Упаковка гранатового чаю Mesh Stick 35 г х 2 пачки по 16 шт (8680211790611_1)""",
-    """Упаковка заспокійливого чаю Mesh Stick вечірній 32 г х 2 пачки по 12 шт (8683295370212_1)""",
-    """Упаковка зеленого чаю Mango Mesh Stick 32 г х 2 пачки по 16 шт (8683295370267_1)""",
-    """Упаковка зеленого чаю Mesh Stick 32 г х 2 пачки по 16 шт (8680211790505_1)""",
-    """Упаковка імбирного чаю Mesh Stick з лимоном 32 г х 2 пачки по 16 шт (8680211790970_1)""",
-    """Упаковка м'ятного чаю Mesh Stick 28.8 г х 2 пачки по 16 шт (8680211790550_1)""",
-    """Упаковка чаю антистрес Mesh Stick 32 г х 2 пачки по 16 шт (8683295370229_1)""",
-    """Упаковка чаю вітамін С Mesh Stick 32 г х 2 пачки по 16 шт (8683295370243_1)""",
-    """Упаковка чаю детокс Mesh Stick 32 г х 2 пачки по 16 шт (8680211790871_1)""",
-    """Упаковка чаю для мам-годувальниць Mesh Stick 32 г х 2 пачки по 16 шт (8680211790741_1)""",
-    """Упаковка чаю з лісових ягід Mesh Stick 32 г х 2 пачки по 16 шт (8680211790536_1)""",
-    """Упаковка чаю з фенхелю Mesh Stick 32 г х 2 пачки по 16 шт (8680211790734_1)""",
-    """Упаковка чаю з чебрецем Mesh Stick 14 г х 2 пачки по 16 шт (8680211790451_1)""",
-    """Упаковка чаю з шипшини Mesh Stick 40 г х 2 пачки по 16 шт (8680211790543_1)""",
-    """Упаковка чаю ройбос Mesh Stick ванільний 32 г х 2 пачки по 16 шт (8680211790567_1)""",
-    """Упаковка чаю шавлії Mesh Stick  32 г х 2 пачки по 16 шт (8680211790796_1)""",
-    """Упаковка чорного чаю Mesh Stick 32 г х 2 пачки по 16 шт (8680211790444_1)""",
-    """Упаковка чорного чаю Mesh Stick з бергамотом 32 г х 2 пачки по 16 шт (8680211790468_1)""",
-    """Упаковка яблучного чаю Mesh Stick 32 г х 2 пачки по 16 шт (8680211790604_1)""",
-    """услуги по организации конференции""",
-    """Услуги программиста""",
-    """Услуги складские""",
-    """услуги таможенного терминала""",
-    """Услуги телефонной связи""",
-    """Утеплювач Технофас 1200х600х100 мм""",
-    """Утеплювач Технофас 1200х600х50мм (2,88)""",
-    """Участие в выставке""",
-    """Файл A4 (100 шт/уп)""",
-    """Файл A5 (20 шт/уп)""",
-    """Файли-кишені A4+ 30 мкм глян""",
-    """Фарба штемпельна""",
-    """Фасад""",
-    """Фасад ДСП S4-00-01""",
-    """Фасад скло""",
-    """финансовая помошь""",
-    """Фісташки смажені з сіллю (150 гр *12 шт/уп)""",
-    """Фісташки смажені з сіллю (70 гр *12 шт/уп)""",
-    """Флешпам'ять 16Gb """,
-    """Флэш-пам'ять (флешка)""",
-    """Фонтан для шоколаду SLBK 7""",
-    """Фонтан для шоколаду SLBK7""",
-    """Форма""",
-    """Фотопапір А4, 180г/м 20 арк""",
-    """Фруктовий сироп "DROPS" 20мл х24х24 бл""",
-    """Фруктово-горіхове асорті "Лайт Мікс"60 гХ12""",
-    """Фундук смажений (160гр.*12 шт/уп.)""",
-    """Фундук смажений (70гр.*12 шт/уп.)""",
-    """ХАМЛЕ""",
-    """Хрусткий батончик "PEANUT" з нугою, карамеллю, арахісом та молочним шоколадом 22гр х24х6""",
-    """Хрусткий батончик "PEANUT" з нугою, карамеллю, арахісом та молочним шоколадом 22гр х24х6""",
-    """Целофанатор НА-450""",
-    """Цінова довідка""",
-    """Цукерка  JELIDO BURGULU MARSHMALLOW  (маршмеллоу косичка) 14грХ 48Х6 бл""",
-    """Цукерка  SMOKE CANDY  у вигляді цигарок, 12 грх20 штх24 бл.""",
-    """Цукерка "Ball king whistle"  3gr Х30 шт Х24 бл""",
-    """Цукерка "CUP COFFEE" 15гр х12шт х12""",
-    """Цукерка "EMOJY FACE" 3,5 грX24X8бл""",
-    """Цукерка "Finger Lollipop" 10 гр X30X24бл""",
-    """Цукерка "Finger Lollipop" 7,2 гр X30X24бл""",
-    """Цукерка "LIPSTICK" 10гр х30шт х24""",
-    """Цукерка "Motor whistle"  3gr Х30 шт Х24 бл""",
-    """Цукерка "NIPPLE CANDY" 3,5 грX24X8бл""",
-    """Цукерка "ORIGINAL.GOURMET" (магн. стійка) Льодяник асорті 31 гр 120 шт 60 х2 уп""",
-    """Цукерка "ORIGINAL.GOURMET" (магн.стійка) Льодяник асорті 31 гр 240 шт 60 х4 уп""",
-    """Цукерка "ORIGINAL.GOURMET" (напол. стійка) Льодяник асорті 31 гр 480 шт 60 х8 уп""",
-    """Цукерка "ORIGINAL.GOURMET" (настільна стійка) Льодяник асорті 31 гр 120 шт 60 х2 уп""",
-    """Цукерка "ORIGINAL.GOURMET" Льодяник асорті 31 гр 120 шт 60шт х2уп """,
-    """Цукерка "Paint Roller Candy" 7гр Х24Х15бл""",
-    """Цукерка "PENCIAL CANDY" 6гр х30шт х24""",
-    """Цукерка "Stick Nipple Bottle candy"  4,5гр Х30Х24бл""",
-    """Цукерка ELLO POLONYA 25гр х150""",
-    """Цукерка Finger powder 6грХ30штХ20бл""",
-    """Цукерка желе "ЗУБНА ПАСТА" 35гр х15шт х24""",
-    """Цукерка желе велика "BIG TONGUE GUMMY (JOKER)" 13.5гр х20 х12""",
-    """Цукерка желе міні "MINI TONGUE GUMMY" 6.5гр х30 х20""",
-    """Цукерка жувальна "Eyeball+Tongue Gummy Candy" 13.6грХ20штХ12""",
-    """Цукерка жувальна "Lip Gummy+lipstick Jam +Popping Candy" 11грХ20штХ12""",
-    """Цукерка жувальна JELIDO MARSHMALLOW MIX (маршмеллоу) 18грХ 24Х8бл""",
-    """Цукерка жувальна JELIDO MIX JELLY (желе) 15грХ 36Х8бл""",
-    """Цукерка жувальна Toffees Slim мікс смаків   1*8""",
-    """Цукерка жувальна Toffees Stick ассорті   800гр*8бл """,
-    """Цукерка жувальна Toffees Stick мікс смаків  1*8""",
-    """Цукерка жувальна Toffees ассорті   1*8""",
-    """Цукерка льодяник  Lollipop Neon  МОРОЗИВО   10 gx30 pcs x24 boxes""",
-    """Цукерка льодяник  Lollipop Neon  Пляшечка (Кола,лимон ,апельсин )  10 gx30 pcs x24 boxes""",
-    """Цукерка льодяник "Candy Cane" 10 г х100 шт Х 2""",
-    """Цукерка льодяник "Candy Cane" 12 г х100 шт Х 2""",
-    """Цукерка льодяник "Diamond Light Candy" 6грХ24штХ12""",
-    """Цукерка льодяник "HAMBURGER  Neon Lollipop"LEMON 10гр Х30Х24бл""",
-    """Цукерка льодяник "HAMBURGER  Neon Lollipop"PASSION  10гр Х30Х24бл""",
-    """Цукерка льодяник "HAMBURGER  Neon Lollipop"STRAWBERRY 10гр Х30Х24бл""",
-    """Цукерка льодяник "Melody pops" 10гр х30шт х12""",
-    """Цукерка льодяник "MONSTER EYESHAPE LOLLIPOP" 15гр х30 х20""",
-    """Цукерка льодяник "PONY  Neon Lollipop" 10гр Х30Х24бл""",
-    """Цукерка льодяник "ROOSTER" 15гр х30шт х20""",
-    """Цукерка льодяник "Spin Gun Lollipop" 3.5грХ30штХ24""",
-    """Цукерка льодяник "WAFER Neon Lollipop" 10гр Х30Х24бл""",
-    """Цукерка льодяник Donuts Lollipop 16gx30pcsx20 boxes""",
-    """Цукерка льодяник Double egg Lollipop 15gx30pcsx20 boxes""",
-    """Цукерка льодяник Ducks Lollipop  13gx30pcsx20 boxes""",
-    """Цукерка льодяник Eyeshape Lollipop 15gx30pcsx20 boxes""",
-    """Цукерка льодяник Hen Lollipop 16gx30pcsx20 boxes""",
-    """Цукерка льодяник Pepper Lollipop 16gx30pcsx20 boxes""",
-    """Цукерка льодяник Rabbit Lollipop 13gx30pcsx20 boxes""",
-    """Цукерка льодяник Rainbow Cane (Тростинка ) 10 г  100 штХ 2""",
-    """Цукерка льодяник SOUR POPPING  Neon Lollipop 10 gx30pcs x24 boxes""",
-    """Цукерка льодяник з кислинкою "SUPER SOUR HARD CANDY" 12гр х24 х20""",
-    """Цукерка льодяник з цукровою пудрою "DRINK POP NIPPLE BOTTLE POWDER CANDY" (3g+1.5g) х30 х20boxes""",
-    """Цукерка людяник з кислинкою "BIG FOOT" 7.5гр х30шт х24""",
-    """Цукерка спрей "Dinosaur" 20 мл x24шт x 24 бл""",
-    """Цукерка спрей "PEN SPRAY CANDY" 16мл х12шт х24бл""",
-    """Цукерка спрей "Spray Candy" 25мл*30шт*20бл / Spray Candy (Gas) 25mlx30pcsx20boxes """,
-    """Цукерка спрей "TOOTHBRUSH SPRAY CANDY" 20мл х30 х20""",
-    """Цукерка спрей піна "Foam Spray" 40мл Х15Х12бл""",
-    """Цукерка-драже "CANDY MUSICA" 9гр х100 х6""",
-    """Цукерка-драже "CANDY MUSICA" 9гр х100х""",
-    """Цукерка-желе "Magic Jam Candy" 20грХ20штХ10""",
-    """Цукерка-спрей "COLA/FANTA/SPRITE" 30мл х24шт х12""",
-    """Цукерка-спрей "МІНІ ВОГНЕГАСНИК" 25мл х30шт х12""",
-    """Цукерки  "VERONA " з білого шоколаду в кокосовій стружці 250 г Х12 шт """,
-    """Цукерки  «Maxbar Collection»  430г Х12шт""",
-    """Цукерки  «Maxbar Peanut»  430г Х12шт""",
-    """Цукерки  «Maxbar» в молочному шоколаді з кокосом  і нугою 430г Х12шт""",
-    """Цукерки  мармелад   "Стик" "LIKO RIKO" 1500 гр*8шт.""",
-    """Цукерки  мармелад   "Язычки" "Jellopy" 1500гр*8шт.""",
-    """Цукерки  мармелад   "Язычки" "LIKO RIKO" 1500 гр*8шт.""",
-    """Цукерки  мармелад  "LIKO RIKO" акула 1000 гр*12шт.""",
-    """Цукерки  мармелад  "LIKO RIKO" зуби  500 гр*12шт.""",
-    """Цукерки  мармелад  "LIKO RIKO" кобра  1000 гр*12шт.""",
-    """Цукерки  мармелад  "LIKO RIKO" кости 500 гр*12шт.""",
-    """Цукерки  мармелад  "LIKO RIKO" крокодил  1000 гр*12шт.""",
-    """Цукерки - мармелад JELIDO  Кола (лінійка) 15 гр Х 24Х12бл""",
-    """Цукерки - мармелад JELIDO  Кола (лінійка) 18 гр Х 24Х12бл""",
-    """Цукерки - мармелад JELIDO BLAST Кола язички  8 гр Х150Х8бл""",
-    """Цукерки - мармелад JELIDO BLAST Малина  язички  8 гр Х150Х8бл""",
-    """Цукерки - мармелад JELIDO BLAST Полуниця  язички  8 гр Х150Х8бл""",
-    """Цукерки - мармелад JELIDO BLAST Тутті фрутті язички  8 гр Х150Х8бл""",
-    """Цукерки - мармелад JELIDO BLAST Яблуко  язички  8 гр Х150Х8бл""",
-    """Цукерки - мармелад JELIDO JELLY MIX ( happy cola, fresh bone, teeth),  18грХ 36штХ8бл""",
-    """Цукерки - мармелад JELIDO RAINBOW BELT (різнокольорові) язички  10 гр Х150Х8бл""",
-    """Цукерки - мармелад JELIDO SOUR BOMB Кавун 30 гр Х 24Х8бл""",
-    """Цукерки - мармелад JELIDO SOUR BOMB Кола  30 гр Х 24Х8бл""",
-    """Цукерки - мармелад JELIDO SOUR BOMB Полуниця 30 гр Х 24Х8бл""",
-    """Цукерки - мармелад JELIDO SOUR BOMB Тутті Фрутті  30 гр Х 24Х8бл""",
-    """Цукерки - мармелад JELIDO STICKS Банан стік 10 гр Х132Х8бл""",
-    """Цукерки - мармелад JELIDO STICKS Кавун стік 10 гр Х132Х8бл""",
-    """Цукерки - мармелад JELIDO STICKS Кола стік 10 гр Х132Х8бл""",
-    """Цукерки - мармелад JELIDO STICKS Ожина стік 10 гр Х132Х8бл""",
-    """Цукерки - мармелад JELIDO STICKS Полуниця стік 10 гр Х132Х8бл""",
-    """Цукерки - мармелад JELIDO STICKS Фруктовий мікс  стік 10 гр Х132Х8бл""",
-    """Цукерки - мармелад JELIDO STICKS Яблуко стік 10 гр Х132Х8бл""",
-    """Цукерки - мармелад JELIDO Фруктовый мікс (лінійка) 15 гр Х 24Х12бл""",
-    """Цукерки - мармелад JELIDO Фруктовый мікс (лінійка) 18 гр Х 24Х12бл""",
-    """Цукерки  мармелад асорті  "Jellopy" 1500гр*8шт.""",
-    """Цукерки "ANTAT" з карамельним смаком   1000гр.*8шт.""",
-    """Цукерки "Cihan" 1000гр. X 6шт""",
-    """Цукерки "RUGANO" молочний шоколад з лісовим горіхом в кокос. стружці 500 г Х 12 шт """,
-    """Цукерки "SWEET SMILE" з фруктовою  начинкою 400грХ 12""",
-    """Цукерки "Ведмежатко" з рисовими кульками 700гр*8шт""",
-    """Цукерки "Солодке кохання" 250гр*16""",
-    """Цукерки «Maxbar Assortment» ассорті в молочному шоколаді   і нугою 200г Х 12шт""",
-    """Цукерки «Maxbar» в молочному шоколаді з карамеллю і нугою 430г Х12шт""",
-    """Цукерки «OZMO FUN » з молочного,  білого та чорного  шоколаду на паличці 23 г Х24шт Х 4бл""",
-    """Цукерки «OZMO FUN » з молочного,  білого та чорного  шоколаду на паличці Новий рік 23 г Х24шт Х4бл""",
-    """Цукерки «OZMO FUN » з молочного,  білого та чорного  шоколаду на паличці Новорічний 23 г Х24шт Х12бл""",
-    """Цукерки COCOTAT з кокосовим смаком 1000гр*8шт""",
-    """Цукерки MIRAN  з молочним  кремом вкриті білим шоколадом 1000 гр Х 8""",
-    """Цукерки SHADOW з молочного, гіркого та білого шоколаду з горіховим кремом, 1000 гр *8 шт """,
-    """Цукерки SWEET SMILE з фруктовою начинкою 1000 гр*8шт """,
-    """Цукерки SWEET SMILE троянда 180гр*12шт""",
-    """Цукерки TWILA 300гр*12шт""",
-    """Цукерки драже - асорті  "Drops" 12гр*24*12""",
-    """Цукерки драже - асорті  "Drops"12гр*90*4 """,
-    """Цукерки драже "Biberon Choco"  6gx24pcsx24boxes / Цукерки драже "Biberon Choco" 6гр*24шт*24бл""",
-    """Цукерки драже "Bottle Candy(Hop-on-Off)" 10грХ50штХ12""",
-    """Цукерки драже "CHOCO PUNTO PASTEL XL PEN" 12грX30X6""",
-    """Цукерки драже "Cola Bottle Candy(Metalized foil)"  8грХ30штХ20""",
-    """Цукерки Драже "LOL" ассорті зі смаками:м’яти,полуниці,лимону,яблука Z-  СТЕНД 8 г Х30 шт Х20 бл""",
-    """Цукерки Драже "LOL" зі смаками:м’яти,апельсину,вишні,лимону,ассорті 10 г Х50 шт Х6 бл""",
-    """Цукерки Драже "MINTY  CANDY " фруктове ассорті 10 г Х50 шт Х20 бл""",
-    """Цукерки Драже "PUNTO CANDY " фруктове ассорті 10 г Х50 шт Х6 бл""",
-    """Цукерки Драже "Веселка " зі смаками:м’яти,апельсину,вишні,лимону,ассорті 10 г Х50 шт Х6 бл""",
-    """Цукерки драже "Маша и Медведь" 12гр х 90х4""",
-    """Цукерки драже TOP POP 12GR*24*12""",
-    """Цукерки драже TOP POP12GR*90*4 """,
-    """Цукерки Драже різнокольорові PASTILLE CONVERSATION HEARTS 142 г Х 24 бл""",
-    """Цукерки желе  " Hamburger gummy" фруктовое 20грх60штx4""",
-    """Цукерки желе  " Hamburger gummy" фруктовое 8грх50штx12""",
-    """Цукерки желе  "AIR FORCE PLANE " фруктове 11гр х100х6                                               """,
-    """Цукерки желе  "Beetle" фруктовое 14,5гр х100х6""",
-    """Цукерки желе  "BEETLE" фруктовое 16.5гр х100х6""",
-    """Цукерки желе  "CAR " фруктовое 14.5гр х100х6""",
-    """Цукерки желе  "CAR " фруктовое 16.5гр х100х6""",
-    """Цукерки желе  "CAR RED" фруктові 15гр х100х6""",
-    """Цукерки желе  "CAR" фруктовое 16.5гр х100х6""",
-    """Цукерки желе  "Croco" фруктовое 35 гр Х30 Х8""",
-    """Цукерки желе  "Croco" фруктовое 70 гр Х24 Х6""",
-    """Цукерки желе  "FRUIT JELLE" 15гр х100х6""",
-    """Цукерки желе  "FRUIT JELLE" 16.5гр х100х6""",
-    """Цукерки желе  "Jelly Cup" 15гр х100 х 6""",
-    """Цукерки желе  "Mini Croco" фруктовое 35 гр Х48 Х6""",
-    """Цукерки желе  "Mini Snake" фруктовое 35 гр Х48 Х6""",
-    """Цукерки желе  "Panda" фруктовое 13 гр х100 х6 """,
-    """Цукерки желе  "Snake" фруктовое 35 гр Х30 Х8""",
-    """Цукерки желе  "Snake" фруктовое 70 гр Х24 Х6""",
-    """Цукерки желе  "SUPER CAR " фруктове 11гр х100х6""",
-    """Цукерки желе  "SUPER CAR " фруктове 15гр х80 х 6                                                    """,
-    """Цукерки желе  "TIGER" фруктовое 13 гр х100 х6 """,
-    """Цукерки желе  "TRAIN BLUE" фруктові 15гр х100х6""",
-    """Цукерки желе  "TRAIN" фруктовое 14.5гр х100х6""",
-    """Цукерки желе  "TRAIN" фруктовое 16.5гр х100х6""",
-    """Цукерки желе "2IN1CRAZY HAIR CANDY " 20гр х20шт х12""",
-    """Цукерки желе "Ass gummy" 8 грХ30Х20бл""",
-    """Цукерки желе "BEAR PUDDING" 42гр х24 х12""",
-    """Цукерки желе "BIRD" фруктовое 13 гр х100 х6""",
-    """Цукерки желе "CAT" 13 гр х100 х6""",
-    """Цукерки желе "CHINES ДРАКОН" 13гр х100 х6""",
-    """Цукерки желе "COBRA GUMMY" 16гр х24 х12""",
-    """Цукерки желе "Crazy Glasses Gummy " 15гр х24шт х12""",
-    """Цукерки желе "DRAGON" 13гр х100 х6""",
-    """Цукерки желе "Fruit Stick Jelly" ICE POP  70гр Х24Х8бл""",
-    """Цукерки желе "HOTDOG GUMMY" 16гр х24 х12""",
-    """Цукерки желе "Ice Lolly Jelly" 14грХ30штХ20""",
-    """Цукерки желе "JELLY IN EGG JAR" 32гр х60 х6""",
-    """Цукерки желе "Kitty" 13 гр х100 х6""",
-    """Цукерки желе "MICKEY" 13гр х100 х6""",
-    """Цукерки желе "SQAURE CUP" 80гр х12шт х12""",
-    """Цукерки желе "TIGER " 13 гр х100 х6""",
-    """Цукерки желе "TIGER" 13гр х100 х6""",
-    """Цукерки желе "Бегемотик"  13 гр  х100 х 6""",
-    """Цукерки желе "ВUNNY" 13гр х100 х6""",
-    """Цукерки желе "Ведмедик"  (у формі сердечка) 15 гр х100 х 6""",
-    """Цукерки желе "Ведмедик"  13 гр х100 х6""",
-    """Цукерки желе "Динозаврик"  13 гр  х100 х 6""",
-    """Цукерки желе "Дракон"  13 гр  х100 х 6""",
-    """Цукерки желе "Жабеня"  13 гр  х100 х 6""",
-    """Цукерки желе "Каченя"  13 гр  х100 х 6""",
-    """Цукерки желе "Корівка"  13 гр  х100 х 6""",
-    """Цукерки желе "Морський коник" 35гр X30Х8бл""",
-    """Цукерки желе "МОРСЬКИЙ КОНИК" 35гр х48 х6бл""",
-    """Цукерки желе "Морський коник" 75гр X24Х6бл""",
-    """Цукерки желе "Русалонька" 35гр Х30Х8бл""",
-    """Цукерки желе "РУСАЛОНЬКА" 35гр х48 х6бл""",
-    """Цукерки желе "Русалонька" 80гр Х24Х6бл""",
-    """Цукерки желе "Слоник"  13 гр  х100 х 6""",
-    """Цукерки желе "Сова"  13 гр  х100 х 6""",
-    """Цукерки желе BERRIES полун-ожина 20 гр 36*12бл""",
-    """Цукерки желе Fruits Jelly 20 г Х60шт Х6 бл""",
-    """Цукерки желе з іграшкою "TOY AND JELLY" 30гр х50 х6""",
-    """Цукерки желе Зайчик "BUNNY " 13 гр х100 х6""",
-    """Цукерки желе Мавпочка   13 гр  х100 х 6""",
-    """Цукерки желе Мавпочка   16.5гр х100 х 6""",
-    """Цукерки желе міні "COW" 13гр х100 х6""",
-    """Цукерки желе міні "MASHROOM" 13гр х100 х6""",
-    """Цукерки желе Пінгвін    16.5гр х100 х 6""",
-    """Цукерки желе Пінгвін  15 гр х100 х 6""",
-    """Цукерки желе Пінгвін  16.5гр х100 х 6""",
-    """Цукерки желе Собачка  16.5гр х100 х 6""",
-    """Цукерки желе фруктове   READY JELLY "Heart Shaped " М’ЯЧ   у формі серця   15гр х100х6""",
-    """Цукерки желе фруктове   READY JELLY "Heart Shaped " у БАНЦІ    у формі серця   15гр х100 х 6""",
-    """Цукерки желейні "JOLITA " мікс фруктових смаків  1000гр*6 шт""",
-    """Цукерки жув "CANDY METER SOUR BELT APPLE "(стрічки) з  яблучним смаком в коробці 15 гр 48 шт Х 12 бл""",
-    """Цукерки жув "CANDY METER SOUR BELT RAINBOW "(стрічки) з фруктовим смаком в коробці 15гр 48 шт Х 12 б""",
-    """Цукерки жув "CANDY METER SOUR BELT STRAWBERRY "(стрічки) з  полуничним смаком в коробці 15 гр 48Х 12""",
-    """Цукерки жув. "Docile SOUR COLORED STRAWBERRY PENCILS UNI "(олівці) з получним смаком, 15 гр 12 Х12""",
-    """Цукерки жув. "Docile SOUR STRAWBERRY COLOR. PENCILS YATAY" (олівці) з пол. смаком в конт 1,35 Х9""",
-    """Цукерки жув. "Docile SOUR STRAWBERRY COLORED PENCILS" (олівці) з пол. смаком в конт 1,35 Х9 """,
-    """Цукерки жув. "Docile SOUR STRAWBERRY PENCILS TWIST DINO EDITION 15г 85 шт  1,2 кг  Х9 бл""",
-    """Цукерки жув. "Docile SOUR STRAWBERRY PENCILS"UNI (олівці) з  полун. смаком у контейнері  1,35 кгХ 9""",
-    """Цукерки жув. "Docile SOUR STRAWBERRY PENCILS"UNI YATAY (олівці)  у контейнері  1,35 кгХ 9""",
-    """Цукерки жув. "FRUTMAN  "ASSORTED (олівці)  індив. упаковка  200 шт Х 6 блок""",
-    """Цукерки жувалі "CANDY METER SOUR BELT COLA "(стрічки) зі смаком коли в коробці 15гр 48 шт Х 12б """,
-    """Цукерки жувальні  "ADEL STICK CANDY " 1000гр.*6шт.""",
-    """Цукерки жувальні  "ADEL TOFFEE FRUIT MIX" 1000гр.*6шт.""",
-    """Цукерки жувальні  "ADEL TOFFEE OF CARAMEL " 1000гр.*6шт.""",
-    """Цукерки жувальні  "ADEL TOFIJOY MIX" 1000гр.*6шт.""",
-    """Цукерки жувальні  "ADEL TOFIJOYSTICK  " 1000гр.*6шт.""",
-    """Цукерки жувальні  "ADEL TOFIJOYSTICK  " 660 гр.*6шт.""",
-    """Цукерки жувальні  "ADEL TOFIJOYSTICK (банка)   " 660 грХ 8шт.""",
-    """Цукерки жувальні  "AKKA MOTIFLI  MIX" 1000гр.*5шт.""",
-    """Цукерки жувальні  HALLOWEEN фруктове асорті  900гр.*8шт.""",
-    """Цукерки жувальні  ассорті " Damla Sour Tubes "  з  фрукт смаком 35 г *24 шт * 8 бл""",
-    """Цукерки жувальні " BONART  SOUR BELT" (стрічки) з фруктовим смаком 8 г *72 шт* 12 бл """,
-    """Цукерки жувальні " Damla Sour Belts " (стрічки) з фруктовим смаком 15 г *72 шт* 6 бл  NEW""",
-    """Цукерки жувальні " Damla Sour Belts " (стрічки) зі смаком  коли  15 г *72 шт* 6 бл""",
-    """Цукерки жувальні " Damla Sour Belts " (стрічки) зі смаком  полуниці 15 г *72 шт* 6 бл""",
-    """Цукерки жувальні " Damla Sour Belts " (стрічки) зі смаком  полуниці 15 г *72 шт* 6 бл NEW""",
-    """Цукерки жувальні " Damla Sour Belts " Rainbow (стрічки) з фруктовим смаком 15 г *72 шт* 6 бл""",
-    """Цукерки жувальні " Damla Sour Tubes "  з  фруктовим смаком 35 г *24 шт * 8 бл NEW""",
-    """Цукерки жувальні " JIMMY  SOUR BELT" (стрічки) з фруктовим смаком 8 г *72 шт* 12 бл """,
-    """Цукерки жувальні " Love is " (F. DUO) зі смаком диня-ананас 25 г *12 шт* 18 бл""",
-    """Цукерки жувальні " Love is " (F. DUO) зі смаком кавун-тропік 25 г *12 шт* 18 бл""",
-    """Цукерки жувальні " Love is " (F. DUO) зі смаком манго-апельсин 25 г *12 шт* 18 бл""",
-    """Цукерки жувальні " Love is " (F. MİDİ) зі смаком полуниці 25 г *12 шт* 18 бл""",
-    """Цукерки жувальні "ALMOND CARAMEL TOFFEE " з мигдалем 650 г Х 8шт""",
-    """Цукерки жувальні "Bubby Candy" 10гр х48х12""",
-    """Цукерки жувальні "Damla Pencil" (олівці) з  фрукт. смаком у контейнері (150 шт) 1500 г * 8 бл NEW""",
-    """Цукерки жувальні "Damla Pencil" (олівці) з  фруктовим смаком у контейнері (150 шт) 1500 г * 8 бл""",
-    """Цукерки жувальні "Damla Sour Belt Rainbow "(стрічки) з  фрукт. смаком у конт. (150 шт) 1500 *8 NEW""",
-    """Цукерки жувальні "Damla Sour Belt Rainbow "(стрічки) з  фрукт. смаком у контейнері (150 шт) 1500 *8 """,
-    """Цукерки жувальні "Damla Sour Penci " (олівці) з  фруктовим смаком у контейнері (150 шт) 1500 г * 8 б""",
-    """Цукерки жувальні "Damla Sour Penci "(олівці) з  фрукт. смаком у контейнері (150 шт) 1500 г * 8 б NEW""",
-    """Цукерки жувальні "Damla Sour Pencil Raınbow" (олівці) з фрукт. смаком у конт. (150 шт) 1500*8бл NEW""",
-    """Цукерки жувальні "Damla Sour Pencil Raınbow" (олівці) з фрукт. смаком у контейнері (150 шт) 1500*8бл""",
-    """Цукерки жувальні "Docile ASSORTED PENCILS" (олівці) з  фруктовим смаком у контейнері  1,35 кг * 9 бл""",
-    """Цукерки жувальні "ELETAT SOFT" з молочним смаком 1000гр.*8шт.""",
-    """Цукерки жувальні "FLATAFFY" мікс (великі стіки 8 гр)  1кг  8 Х1000 gr""",
-    """Цукерки жувальні "KREMİNİ"  молочні 44гр Х20шт Х12 бл""",
-    """Цукерки жувальні "KREMİNİ" з апельсиновим смаком 44гр Х20шт Х12 бл""",
-    """Цукерки жувальні "KREMİNİ" з вишневим смаком 44гр Х20шт Х12 бл""",
-    """Цукерки жувальні "KREMİNİ" з малиновим смаком 44гр Х20шт Х12 бл""",
-    """Цукерки жувальні "KREMİNİ" з полуничним смаком 44гр Х20шт Х12 бл""",
-    """Цукерки жувальні "MY TOFEE" з фруктовим смаком 200шт   1кг Х8 """,
-    """Цукерки жувальні "MY TOFEE" фруктовий мікс 40шт 1кг Х8 """,
-    """Цукерки жувальні "TOFIGO SLIM" мікс (маленькі стіки 5 гр ) 1кг  8 Х1000 gr""",
-    """Цукерки жувальні "TROFLEX" з кавовим смаком  1000гр.*8шт.""",
-    """Цукерки жувальні "X 6 " зі смаком мяти 1000гр*8 шт""",
-    """Цукерки жувальні "X 6 " зі смаком мяти 250гр*20 шт""",
-    """Цукерки жувальні "X 6 " молочно-карамельні 1000гр*8 шт""",
-    """Цукерки жувальні "X 6 " молочно-карамельні 250гр*20 шт""",
-    """Цукерки жувальні COLORED STRAWBERRY PENCILS DINO BIG 26gX48X6 """,
-    """Цукерки жувальні COLORED STRAWBERRY PENCILS UNICORN BIG 26gX48X6""",
-    """Цукерки жувальні DAMLA SOUR BELTS COLA (стрічки) зі маком коли 15грх72штх6бл """,
-    """Цукерки жувальні SOUR COLORED STRAWBERRY  BELTS 70 г 24 шт X 6 бл""",
-    """Цукерки жувальні з банановим смаком "MILK PLUS" 250 гр х 12 шт""",
-    """Цукерки жувальні з банановим смаком "MILK PLUS" 80 гр х 2 бл х 12 шт""",
-    """Цукерки жувальні з кислинкою ROLL UP Sour Candy 20гр х40шт х10бл""",
-    """Цукерки жувальні з комбінованим фруктовим смаком "FRUITY DUOS" 1000 г х 8 шт""",
-    """Цукерки жувальні з молочним  смаком "MILK PLUS" 80 гр х 2 бл х 12 шт""",
-    """Цукерки жувальні з молочним смаком "MILK PLUS" 250 гр х 12 шт""",
-    """Цукерки жувальні з полуничним смаком "MILK PLUS" 250 гр х 12 шт""",
-    """Цукерки жувальні з полуничним смаком "MILK PLUS" 80 гр х 2 бл х 12 шт""",
-    """Цукерки жувальні карамель  з арахісом  "PEANUT  CARAMEL" 400 Х 12 шт""",
-    """Цукерки жувальні карамель з кокосовою стружкою   "COCONUT  CARAMEL" 400 Х 12 шт""",
-    """Цукерки жувальні карамель з медовою начинкою "HONEY CARAMEL" 400 Х 12 шт""",
-    """Цукерки жувальні карамель з молочною  начинкою "MILK ’N  CARAMEL" 400 Х 12 шт""",
-    """Цукерки жувальні мікс  "Frutomila" 500г*12шт""",
-    """Цукерки жувальні мікс  "TOFFIX" 1000гр.*8шт.""",
-    """Цукерки жувальні мікс  "TROFLEX" 1000гр.*8шт.""",
-    """Цукерки жувальні мікс " TUTI MAGIC SOFT" стики 1000 гр*8шт""",
-    """Цукерки жувальні мікс "TROFFYUM" STICK  1000 гр.*8шт.""",
-    """Цукерки жувальні мікс "TROFFYUM" STICK 800 гр.*8шт.""",
-    """Цукерки жувальні мікс з фруктовим смаком "FRUTTY MIDI (М і М)" 25 г х 8 бл х 40 шт""",
-    """Цукерки жувальні мікс з фруктовим смаком "FRUTTY MIDI" 20 г х 12 бл х 24 шт""",
-    """Цукерки жувальні мікс з фруктовою начинкою  "DAMLA" 1000 г x 8 шт""",
-    """Цукерки жувальні мікс з фруктовою начинкою  "DAMLA" 350 г x 12 шт""",
-    """Цукерки з гіркого шоколаду "Venetto Deluxe" з кремовою начинкою 450 гр Х12 """,
-    """Цукерки з гіркого шоколаду "Venetto" з кремовою начинкою 1000 гр Х8""",
-    """Цукерки з мол. шоколаду "MILANGO DIAMOND " з фундуком, хрусткою ваф. та горіховим кремом 38гр 12Х6бл""",
-    """Цукерки з молочного шок. "MILANGO DIAMOUD" з фундуком, хрусткою ваф. горіховим кремом 300гр х 12 шт""",
-    """Цукерки з молочного шоколаду "MILANGO DIAMOND " з фундуком, хруст. вафл та горіх кремом 200грх24шт""",
-    """Цукерки з молочного шоколаду "MILANGO GOLD" з фундуком та горіховим кремом 400гр х 12 шт""",
-    """Цукерки з молочного шоколаду "MILANGO PEARL" з фундуком та горіховим кремом 300гр х 12 шт""",
-    """Цукерки з молочного шоколаду з молочною начинкою "JIMMY" 20 г х 6 бл х 24 шт""",
-    """Цукерки з молочного шоколаду з молочною начинкою "JIMMY" 40 г х 6 бл х 24 шт""",
-    """Цукерки з молочного шоколаду з молочною начинкою (пласт. банка) "JIMMY" 1000 г х 8 шт""",
-    """Цукерки з фундуком та молочним шоколадом "HOBBY" 600грх6""",
-    """Цукерки з фундуком та молочним шоколадом "HOBBY" 6грх100х6 бл""",
-    """Цукерки карамель "HI-COCOS" з кокосовим смаком та наповнювачем 350 гр Х 12 шт""",
-    """Цукерки карамель "SCOTLER" з молочним смаком  1000 гр Х8""",
-    """Цукерки карамель з кавовим смаком "COFFEE INTENSE " 1000 г x 8 шт""",
-    """Цукерки карамель мікс "MULTI FRUIT " 1000 г x 8 шт""",
-    """Цукерки карамель мікс з молочно-фруктовим смаком  "CRASH" 1000 г x 8 шт""",
-    """Цукерки льодяник  Шалений Язик 10гр х24 х 12""",
-    """Цукерки льодяник на паличці  "CHERRY  POP COTTON " 14гр х100х6""",
-    """Цукерки льодяник на паличці  "CHERRY  POP ENERGY  " 14гр х100х6""",
-    """Цукерки льодяник на паличці  "CHERRY  POP MIX " 14гр х100х6""",
-    """Цукерки льодяник на паличці  "CHERRY  POP STRW Полуниця  " 14гр х100х6""",
-    """Цукерки льодяник на паличці  "DROP POP" 5,5гр х200х6""",
-    """Цукерки льодяник на паличці  SIMAS "MEGA POP ENERGY " 30гр х80х6""",
-    """Цукерки льодяник на паличці "AYSULTAN CARS" 16гр.х120х6""",
-    """Цукерки льодяник на паличці "AYTOP  Fruit Flavoured BAG" 16 гр 50штХ12""",
-    """Цукерки льодяник на паличці "AYTOP "Полуниця" 14гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP 3D XXL GUM  MIX " 30 гр. на пластиковому стенді 60 штХ6 стенд""",
-    """Цукерки льодяник на паличці "AYTOP 3D XXL GUM  MIX " shokoshops 30 гр. на пласт.стенді 60 штХ6 стенд""",
-    """Цукерки льодяник на паличці "AYTOP BÖĞÜRTLEN GUM" 14гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP CARAMEL" 16 гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP ÇİLEK" 14гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP CLASSIC" 11гр.х150х6""",
-    """Цукерки льодяник на паличці "AYTOP CLASSIC" 16гр.х100х6""",
-    """Цукерки льодяник на паличці "AYTOP COLA GUM"  зі смаком коли та жувальною гумкою 16гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP COLA" 16гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP ENERGY" 16гр.х100х6""",
-    """Цукерки льодяник на паличці "AYTOP EYES GUMMY YOGHURT" 16гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP EYES YOGURT" 16гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP FANS " 11гр х150х6""",
-    """Цукерки льодяник на паличці "AYTOP FANS " 12гр х150х6""",
-    """Цукерки льодяник на паличці "AYTOP FANS LOLİPOP " 16гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP FRUTY  MIX " 30 гр. 60штХ6 бан""",
-    """Цукерки льодяник на паличці "AYTOP FRUTY  MIX " 30 гр. 80штХ6 бан""",
-    """Цукерки льодяник на паличці "AYTOP GUMMY" 16гр.х100х6""",
-    """Цукерки льодяник на паличці "AYTOP MILKY" молочний з бананом,полуницею, шоколадом 16гр.х100х6""",
-    """Цукерки льодяник на паличці "AYTOP MIX " 30 гр. на пластиковому стенді 60 штХ6 стенд""",
-    """Цукерки льодяник на паличці "AYTOP Йогурт  16гр х120 х 6 NEW""",
-    """Цукерки льодяник на паличці "AYTOP Классік  16 гр х120 х 6 NEW""",
-    """Цукерки льодяник на паличці "AYTOP молочний з бананом,полуницею, шоколадом 16гр х120 х 6 NEW""",
-    """Цукерки льодяник на паличці "AYTOP Полуниця 14гр х150 х 6 NEW""",
-    """Цукерки льодяник на паличці "AYTOP Полуниця GUM" 14гр х100х6""",
-    """Цукерки льодяник на паличці "AYTOP" Гуммі  (класик)  22 гр х100 х 6 NEW""",
-    """Цукерки льодяник на паличці "AYTOP" Полуниця  GUM  24 гр х100 х 6 NEW 2""",
-    """Цукерки льодяник на паличці "BARSELONA" 16гр х100х6""",
-    """Цукерки льодяник на паличці "Blong Sour "28 г Х24х12   672 г рх12""",
-    """Цукерки льодяник на паличці "BlongEnergy Mix"  28 г Х24х12   672 г х12""",
-    """Цукерки льодяник на паличці "DROP POP COLA" 5,5гр х200х6""",
-    """Цукерки льодяник на паличці "DROP POP FRUTAS" 5,5гр х200х6""",
-    """Цукерки льодяник на паличці "DROP POP LAMPIAO " 5,5гр х200х6""",
-    """Цукерки льодяник на паличці "Dukling & Egg" NEON  10 г 30 шт Х24 бл""",
-    """Цукерки льодяник на паличці "Dynamite" NEON  9 г 30 шт Х12 бл""",
-    """Цукерки льодяник на паличці "EYES POP" 16гр х100х6""",
-    """Цукерки льодяник на паличці "LOVE IS " NEON lollipop mix  10 г 30 шт Х24 бл""",
-    """Цукерки льодяник на паличці "Pink Cookles" NEON  10 г 30 штХ 24бл""",
-    """Цукерки льодяник на паличці "TOPPY COLA" 12гр х120х6""",
-    """Цукерки льодяник на паличці "TOPPY FACE" 16гр х100х6""",
-    """Цукерки льодяник на паличці "TOPPY FRUITY" 10гр х120 х 6""",
-    """Цукерки льодяник на паличці "TOPPY GUM" 16гр х100х6""",
-    """Цукерки льодяник на паличці "Маша и Медведь" 16гр х100х6""",
-    """Цукерки льодяник на паличці Handmade Fruits  КАВУН Lollipop 12 г 30 шт Х 20бл""",
-    """Цукерки льодяник на паличці Handmade Fruits ФРУКТИ Lollipop 12 г 30 шт Х 20бл""",
-    """Цукерки льодяник на паличці SIMAS  "MEGA POP " 30гр х80х6""",
-    """Цукерки льодяник на паличці SIMAS  "MEGA POP SAMPOP" 30гр х80х6""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Black Cherry   17 г 48 шт Х16""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Mix Assorted 15 г 100 шт Х6""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Mix Assorted 15 г 48 шт Х16""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Mix Assorted 17 г 48 шт Х16""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Sour  Assorted 17 г 48 шт Х16""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Sour Cherry  17 г 48 шт Х16""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Sour PEACH  17 г 48 шт Х16""",
-    """Цукерки льодяник на паличці з жув. гумкою Pin Pop Tongue PAINTER  17 г 48 шт Х16""",
-    """Цукерки льодяник на паличці з жув.гумкою "AYTOP 3D XXXL MIX " 30 гр. 80штХ6 бан""",
-    """Цукерки льодяник на паличці з жув.гумкою "AYTOP ENERGY GUM " 30 гр. 80штХ6 бан""",
-    """Цукерки льодяник на паличці з жувальною гумкою "DROP POP FILLED  пакет  " 5,5гр х50шт  х36 """,
-    """Цукерки льодяник на паличці з жувальною гумкою "DROP POP" 5,5гр х200х6""",
-    """Цукерки льодяник на паличці з жувальною гумкою "Маша и Медведь" 16гр х100х6""",
-    """Цукерки льодяник на паличці з жувальною гумкою ALDOR  "Kbzoon " ASSORTED 24гр х80х6""",
-    """Цукерки льодяники  "ADEL JOYBON " 900гр.*6шт.""",
-    """Цукерки льодяники "BONTAT" з полуничним смаком  1000гр*5 шт""",
-    """Цукерки льодяники "BONTAT" з полуничним смаком  1000гр*5 шт""",
-    """Цукерки льодяники "BONTAT" фруктовий мікс   1000гр*5 шт""",
-    """Цукерки льодяники "CHOTAT " з кавовим смаком  1000 гр*5 шт""",
-    """Цукерки льодяники "CHOTAT " з молочним смаком  1000 гр*5 шт""",
-    """Цукерки льодяники "CHOTAT " з фруктовим смаком (мікс)   1000 гр*5 шт""",
-    """Цукерки льодяники "TOPPY CHUPS" 16гр х100х6""",
-    """Цукерки льодяники "TOPPY FOOTBALL" 10гр х120х6""",
-    """Цукерки льодяники "TOPPY FRUITY"  10гр х120х6""",
-    """Цукерки льодяники OLIPS зі смаком  лимона та апельсина 76 гр х 16 шт.""",
-    """Цукерки льодяники OLIPS зі смаком  м`яти 76 гр   х 16 шт.""",
-    """Цукерки льодяники OLIPS зі смаком  ментол-евкаліпт  , 28 гр х 24 шт х 12 бл.""",
-    """Цукерки льодяники OLIPS зі смаком  ментолу та евкаліпту 76 гр х 16 шт.""",
-    """Цукерки льодяники OLIPS зі смаком лимон-апельсин, 28 гр х 24 шт х 12 бл.""",
-    """Цукерки льодяники з молочним смаком "ONIX " 38 г x 8 бл х 24 шт""",
-    """Цукерки льодяники зі смаком ментолу та евкаліпта "ONIX SALSA " 28 г x 12 бл х 24 шт""",
-    """Цукерки льодяники зі смаком ментолу та евкаліпта "ONIX SALSA " 28 г x 12 бл х 24 шт""",
-    """Цукерки маршмелоу "Docile кольоровий твіст " з ванільним смаком, 250 гр х12""",
-    """Цукерки маршмелоу "Docile кольоровий твіст " з полуничним смаком, 250гр х12""",
-    """Цукерки маршмелоу "Docile кольорові трубочки " з ванільним смаком  смаком 250гр х12""",
-    """Цукерки маршмелоу "Docile" кольоровий твіст колор    150гр х24""",
-    """Цукерки маршмелоу "Docile" кольоровий твіст колор 2 полуниця     150гр х24""",
-    """Цукерки маршмелоу "Docile" кольоровий твіст туба ваніль    150гр х24""",
-    """Цукерки маршмелоу "Docile" у формі ведмедиків  150гр х24""",
-    """Цукерки маршмелоу "Docile" у формі ведмедиків 250гр х12""",
-    """Цукерки маршмелоу "Docile" у формі іграшкового автомобіля   150гр х24""",
-    """Цукерки маршмелоу "Docile" у формі іграшкового автомобіля 250гр х12""",
-    """Цукерки маршмелоу "Docile" у формі квітки 250 гр х12""",
-    """Цукерки маршмелоу "Docile" у формі полуниці 150гр х24""",
-    """Цукерки маршмелоу "Docile" у формі полуниці 250гр х12""",
-    """Цукерки маршмелоу "Docile" у формі сердечок полуниця   150гр х24""",
-    """Цукерки маршмелоу "Docile" у формі серця з полуничним смаком 250гр х12""",
-    """Цукерки маршмелоу "ICE CREAM" 12гр х30шт х12""",
-    """Цукерки маршмелоу "ICE CREAM" у пластиковому контейнері 3,3 г 60шт Х8 блок""",
-    """Цукерки маршмелоу "Twist Marshmallow"  16 гр х30x8бл""",
-    """Цукерки маршмелоу "TWIST MARSHMALLOW" 10гр х24 х12бл""",
-    """Цукерки маршмелоу "TWISTED" 13,5гр х24шт х24""",
-    """Цукерки маршмелоу LOL long кольоровий ТВІСТ " 17гр х24x12""",
-    """Цукерки маршмелоу LOVE IS  кольоровий ТВІСТ " 16 гр х24x12""",
-    """Цукерки маршмелоу LOVE IS  кольоровий ТВІСТ " 17 гр х24x12""",
-    """Цукерки маршмелоу MARSH MALLOW  кольоровий  " 16 г х24x12""",
-    """Цукерки маршмелоу PRESTIGE   кольоровий ТВІСТ " 10 гр х24x12""",
-    """Цукерки маршмелоу PRESTIGE   кольоровий ТВІСТ " 16 гр х24x12""",
-    """Цукерки маршмелоу PRESTIGE   кольоровий ТВІСТ " 17 гр х24x12""",
-    """Цукерки міні желе  "Крем-брюле" 16.5гр х100х6""",
-    """Цукерки міні-льодяники   "CHOTAT " фруктовий мікс (new)   1000 гр*5 шт""",
-    """Цукерки міні-льодяники "CHOTAT / TAT BON "  мікс смаків 1000гр*5 шт""",
-    """Цукерки м'які з комб. смаком полун,лимона, шоколаду з молочним кремом "CHEESECAKE" бан 1000 г х 8 шт""",
-    """Цукерки м'які з комб. смаком полун,лимона, шоколаду з молочним кремом "CHEESECAKE" кор 1000 г х 8 шт""",
-    """Цукерки на паличці "Chupa Chups The Best of" (120 шт х 12 г), 1440 г х 6 шт """,
-    """Цукерки пудинг-желе "BEAR PUDDING" 40гр х20шт х18""",
-    """Цукерки шоколадні  "TWILA PALACE" з кремовою начинкою і хрустким рисом 250 гр Х 12 """,
-    """Цукерки шоколадні  "VERONA SHOW" з горіховим кремом 300 гр Х12""",
-    """Цукерки шоколадні  «Chocodans » 125 г Х12шт Х 4бл""",
-    """Цукерки шоколадні  «Chocodans » 125 г Х12шт Х 4бл""",
-    """Цукерки шоколадні "SWEET LOVE" з кремовою   начинкою 1000 грХ 8""",
-    """Цукерки шоколадні асорті "ORIENT" з кремовою начинкою та хрустким рисом1000гр x8шт""",
-    """Цукерки шоколадні Банан (блістер) 11гр х30шт х20""",
-    """Цукерки шоколадні в коробці  "ARMONI" з фруктовою начинкою 210  гр Х12""",
-    """Цукерки-драже "  Bracelet Candy " фруктовий мікс 12гр х48 х12""",
-    """Цукерки-драже "BRACELET CANDY HEART & WATCH" фруктовий мікс 10гр х48 х12""",
-    """Цукерки-драже "Bracelet Candy" фруктовий мікс 10гр х48 х12""",
-    """Цукерки-драже "KOOLER" фруктовий мікс 4 шт 6гр 100 шт  Х 24бл""",
-    """Цукерки-драже "KOOLER" фруктовий мікс у Z-стенді 10гр 72штХ 6""",
-    """Цукерки-драже "KOOLER" фруктовий мікс у коробці-стенді 10гр 24штХ 12""",
-    """Цукерки-драже "KOOLER" фруктовий мікс у піраміда-стенді 10гр 90штХ 4""",
-    """Цукерки-драже "Roll Candy ( лимон, апельсин, кола)  ", 24гр х24 х24""",
-    """Цукерки-драже "Roll Candy Mint " фруктовий мікс( полуниця, мята, чорн, кавун ), 24гр х24 х24""",
-    """Цукерки-драже "Roll Candy" фруктовий мікс у пластиковій банці 5гр х100х12""",
-    """Цукерки-драже-какао "FROZEN"  трубочка 15гр х24х12""",
-    """Цукерки-драже-какао "MINIONS"  трубочка 15гр х24х12""",
-    """Цукерки-драже-какао "Маша и Медведь"  трубочка 15гр х24х12""",
-    """Цукерки-льодяники на паличці "Попито" 15 гр 6*40""",
-    """Цукерки-льодяники на паличці vil pop   "радуга" круглый вес 16 гр 6*100""",
-    """Цукерки-льодяники на паличці Vil pop " 30 гр сердечко"- "тюльпан"6*40 """,
-    """Цукерки-льодяники на паличці Vil pop "панда елка" 30 гр6*40""",
-    """Цукерки-льодяники на паличці Vil pop "петушок"- "ромашка" 30 гр 6*40""",
-    """Цукерки-льодяники на паличці vil pop "Радужный вкус"16 г 6*70 """,
-    """Цукерки-льодяники на паличці Vil pop" 30 гр радуга" 6*40""",
-    """Цукерки-льодяники на паличці VILPOP 30D 30гр*50*6""",
-    """Цукерки-льодяники на паличці VILPOP 3D XXL 30гр 80*6 NEW""",
-    """Цукерки-льодяники на паличці антістрес 24гр 6*80 """,
-    """Цукерки-льодяники на паличці арбузофф 16 гр 6*100""",
-    """Цукерки-льодяники на паличці бом бом соур 16 гр 6*100 NEW""",
-    """Цукерки-льодяники на паличці бом бом соур 16 гр 6*120""",
-    """Цукор ванільний 5 грамХ150штХ12бл Kenton NEW""",
-    """Цукор ванільний 5 грамХ36штХ12бл Kenton""",
-    """Цукрова пудра 2в1 Sour Powder 4грХ 50Х 40 бл""",
-    """Цукрова пудра 3в1 "3IN1TUBE SOUR POWDER CANDY " 15гр х30 х12""",
-    """Цукрова пудра 5в1 Sour Powder 10гр Х50 Х20 бл""",
-    """Цукрова пудра з кислинкою "SODA FRUIT BOTTLE SOUR POWDER CANDY" 4гр х120 х12""",
-    """Цукрова пудра з кислинкою "SODA FRUIT BOTTLE SOUR POWDER CANDY" 7гр х36 х18""",
-    """Цукрова пудра з кислинкою CC Mystery Mini Sour Powder Candy 2грx 50 х100""",
-    """Цукрова пудра з цукеркою "FRIZZLERS POWDER CANDY" 10гр х30 х20полуниця""",
-    """Цукрове драже Love is 10гр*50шт*20бл""",
-    """Чай черный Танай  пакетированный 175 грамм /100 пакетов X12шт""",
-    """Чай черный Танай  пакетированный 43,75 грамм /25 пакетов X 24шт """,
-    """Чай черный Танай Голд А Калите 500 грамм X18шт """,
-    """Чай черный Танай Пекое 250 грамм X20шт """,
-    """Чай черный Танай с бергамотом пакетированный 43,75 грамм /25 пакетов X24шт """,
-    """Чай черный Танай Сохбет (банка)  250 грамм X16 шт""",
-    """Чай черный Танай Сохбет (банка)  500 грамм X12шт""",
-    """Чай черный Танай Цейлон 100 грамм X24шт""",
-    """Чай черный Танай Цейлон 1000 грамм X9шт""",
-    """Чай черный Танай Цейлон 250 грамм X18шт""",
-    """Чай черный Танай Цейлон 500 грамм X18шт""",
-    """Чай черный Чайкур Ризе 1000 грамм X12шт """,
-    """Чай черный Чайкур Ризе 500 грамм X20шт """,
-    """Чай чорний байховий "ТАНАЙ ЕКО" крупнолистовий BLACK TEA OPA 1 кг  Х 5""",
-    """Чай чорний байховий "ТАНАЙ ЕКО" крупнолистовий BLACK TEA OPA 500 г  Х 10""",
-    """Чай чорний байховий "ТАНАЙ ЕКО" середньолистовий  BLACK TEA ВОР 1 кг  Х 8""",
-    """Чай чорний байховий "ТАНАЙ ЕКО" середньолистовий  BLACK TEA ВОР 500  г  Х 16""",
-    """Чай чорний байховий дрібний з бергамотом у пакетиках BETA TEA EARL GREY, 25 х 2 г Х 72""",
-    """Чай чорний байховий дрібний у пакетиках BETA TEA SELECTED QUALITY, 25 х 2 г Х 72""",
-    """Чай чорний байховий крупнолистовий  BETA TEA BRIGHT AND SMOOTH, 200 г  Х 45""",
-    """Чай чорний байховий середньолистовий  BETA TEA DREAM CEYLON, SUPER  PEKOE 100 г Х 90""",
-    """Чай чорний байховий середньолистовий BETA TEA SELECTED QUALITY, 100 г  Х 90""",
-    """Чай чорний байховий середньолистовий з бергамотом  BETA TEA EARL GREY, 100 г Х 90""",
-    """Чайник """,
-    """Чайник """,
-    """Чайник заварний Arti-M 470 з ковпаком """,
-    """Черный чай 100 пакетов/ТАНАЙ*12""",
-    """Черный чай 25 пакетов с дизайном чашки/ТАНАЙ*24""",
-    """Черный чай 25 пакетов/ТАНАЙ*24""",
-    """Черный чай с бергамотом 100 пакетов/ТАНАЙ*12""",
-    """Черный чай с бергамотом 25 пакетов/ТАНАЙ*24""",
-    """Чинка пластикова з контейнером Economix""",
-    """Чипси картопляні в тубусі з сілю (оригинальні) 100грх24 кор""",
-    """Чипси картопляні в тубусі зі смаком барбекю 100грх24 кор""",
-    """Чипси картопляні в тубусі зі смаком перцю чілі 100грх24 кор""",
-    """Чипси картопляні в тубусі зі смаком сиру 100грх24 кор""",
-    """Чипси картопляні в тубусі зі смаком сметани та цибулі 100грх24 кор""",
-    """Чіпси «Biscolata Chocochips Milky» з молочного шоколаду з фундуком та хрусткими рисом  115г""",
-    """Чіпси «Biscolata Chocochips Milky» з молочного шоколаду з хрусткими рисом  115г Х24 """,
-    """Чіпси «Biscolata Chocochips Milky» з чорного шоколаду з хрусткими рисом  115г Х24""",
-    """Чіпси з молочного шоколаду "Milango Moments" з карамеллю та морською сіллю 76 г Х12 шт""",
-    """Чіпси з чорного  шоколаду "Milango Moments" з апельсиновими цукатами 76 г Х12 шт""",
-    """Чіпси картопляні  "CHIPS MASTER"зі смаком йогурту та зелені, 104г*21 шт""",
-    """Чіпси картопляні "CHIPS MASTER" з прянощами, 104 г*21 шт""",
-    """Чіпси картопляні "CHIPS MASTER" зі смаком солі, 104 г*21 шт""",
-    """Чіпси картопляні "CİPSO"  з сіллю, 48 г*30 шт""",
-    """Чіпси картопляні "CİPSO"  рифлені з сіллю, 104 г*24 шт""",
-    """Чіпси картопляні "CİPSO" зі смаком томатів, 150 г*15 шт""",
-    """Чіпси картопляні "CİPSO" рифлені   з сіллю, 18 г*100 шт""",
-    """Чіпси картопляні "CİPSO" рифлені  зі см. йогурту  та зелені , 48 г*30 шт""",
-    """Чіпси картопляні "CİPSO" рифлені  зі смаком йогурту та зелені , 104 г*24 шт""",
-    """Чіпси картопляні "CİPSO" рифлені  зі смаком йогурту та зелені , 56 г*20 шт""",
-    """Чіпси картопляні "CİPSO" рифлені  зі смаком солі та оцету , 35 г*60 шт""",
-    """Чіпси картопляні "CİPSO" рифлені зі смаком солі та оцету , 100 г*21 шт""",
-    """Чіпси картопляні "CİPSO" рифлені зі смаком солі та оцету , 115 г*21 шт""",
-    """Чіпси картопляні "CİPSO" рифлені зі смаком солі та оцету , 16 г*135 шт""",
-    """Чіпси картопляні "CİPSO" рифлені зі смаком томатів, 104 г*24 шт""",
-    """Чіпси картопляні "CİPSO" рифлені зі смаком томатів, 18 г*100 шт""",
-    """Чіпси картопляні "CİPSO" рифлені зі смаком томатів, 48 г*30 шт""",
-    """Чіпси картопляні "CİPSO" рифлені зі смаком томатів, 56 г*20 шт""",
-    """Членські внески в Асоціації Товарної нумерації України""",
-    """Членські внески в Торгово-Промисловій Палаті""",
-    """Чорні оливки в росолі с маслом The Mill (291-350 S-XS) 450 гр х12 - Скляна банка """,
-    """Шампиньоны резаные "Прошу к столу!", ж/б, 425мл(400)гр*24шт""",
-    """Шампиньоны резаные "Прошу к столу!", ж/б, 850мл(800)гр*12шт""",
-    """Шампиньоны резаные PIKOLIN, ж/б, 425мл(400)гр*24шт""",
-    """Шампиньоны резаные PIKOLIN, ж/б, 850мл(800)гр*12шт""",
-    """Шафа - гардероб""",
-    """Шафа відкрита """,
-    """Шафа відкрита S4-00-19""",
-    """Шафа напіввідкрита """,
-    """Шафа настінна Wallmount Lite 9U-450 (акрил)""",
-    """Шафа-пенал напіввідкрита """,
-    """Шина 225/60R16 102V""",
-    """Шок.кон."Карнавал" 115гр*24шт мал.сер. карт. клубника ПРАЗД.УП.""",
-    """Шок.кон."Карнавал" 125гр*24шт картон 8-уг. апельсин№834-11""",
-    """Шок.кон."Карнавал" 125гр*24шт картон 8-уг. клубника №833-11""",
-    """Шок.кон."Карнавал" 125гр*24шт картон 8-уг. фундук №837-11""",
-    """Шок.кон."Карнавал" 125гр*24шт картон 8-уг.кокос №832-11""",
-    """Шок.кон."Карнавал" 125гр*24шт мал.сердце карт.апельсин №834-12""",
-    """Шок.кон."Карнавал" 125гр*24шт мал.сердце карт.клубника №833-12""",
-    """Шок.кон."Карнавал" 125гр*24шт мал.сердце карт.кокос №832-12""",
-    """Шок.кон."Карнавал" 125гр*24шт мал.сердце карт.фундук №837-12""",
-    """Шок.кон."Карнавал" 165гр*12шт дв.сердце пл.апельсин №834-9""",
-    """Шок.кон."Карнавал" 165гр*12шт дв.сердце пл.клубника №833-9""",
-    """Шок.кон."Карнавал" 165гр*12шт дв.сердце пл.кокос №832-9""",
-    """Шок.кон."Карнавал" 165гр*12шт дв.сердце пл.фундук №837-9""",
-    """Шок.кон."Карнавал" 180гр*24шт мал.сундук карт.апельсин №834-8""",
-    """Шок.кон."Карнавал" 180гр*24шт мал.сундук карт.клубника №833-8""",
-    """Шок.кон."Карнавал" 180гр*24шт мал.сундук карт.кокос №832-8""",
-    """Шок.кон."Карнавал" 180гр*24шт мал.сундук карт.фундук №837-8""",
-    """Шок.кон."Карнавал" 180гр*24шт трапеция картон апельсин №834-8""",
-    """Шок.кон."Карнавал" 180гр*24шт трапеция картон кокос №832-8""",
-    """Шок.кон."Карнавал" 2 кг апельсин и рис.хлопья №834""",
-    """Шок.кон."Карнавал" 2 кг клубника и рис.хлопья №833""",
-    """Шок.кон."Карнавал" 2 кг кокос и рис.хлопья №832""",
-    """Шок.кон."Карнавал" 2 кг орех и рис.хлопья №837""",
-    """Шок.кон."Карнавал" 2 кг шоколад и рис.хлопья** №836""",
-    """Шок.кон."Карнавал" 260гр*18шт трапеция картон апельсин №834-6""",
-    """Шок.кон."Карнавал" 260гр*18шт трапеция картон клубника №833-6""",
-    """Шок.кон."Карнавал" 260гр*18шт трапеция картон кокос №832-6""",
-    """Шок.кон."Карнавал" 260гр*18шт трапеция картон фундук №837-6""",
-    """Шок.кон."Карнавал" 300гр*6шт бол.сундук карт. апельсин №834-5""",
-    """Шок.кон."Карнавал" 300гр*6шт бол.сундук карт. клубника №833-5""",
-    """Шок.кон."Карнавал" 300гр*6шт бол.сундук карт. кокос №832-5""",
-    """Шок.кон."Карнавал" 300гр*6шт бол.сундук карт. фундук №837-5""",
-    """Шок.кон."Карнавал" 300гр*6шт бол.сундук карт. шоколад №836-5""",
-    """Шок.кон."Карнавал" 300гр*6шт конфета карт. апельсин №834-10""",
-    """Шок.кон."Карнавал" 300гр*6шт конфета карт. клубника №833-10""",
-    """Шок.кон."Карнавал" 300гр*6шт конфета карт. кокос №832-10""",
-    """Шок.кон."Карнавал" 300гр*6шт конфета карт. фундук №837-10""",
-    """Шок.кон."Карнавал" 300гр*6шт конфета карт. шоколад №836-10""",
-    """Шок.кон."Карнавал" 330гр*6шт бол.сердце пл. апельсин №834-3""",
-    """Шок.кон."Карнавал" 330гр*6шт бол.сердце пл. клубника №833-3""",
-    """Шок.кон."Карнавал" 330гр*6шт бол.сердце пл. кокос №832-3""",
-    """Шок.кон."Карнавал" 330гр*6шт бол.сердце пл. фундук №837-3""",
-    """Шок.кон."Карнавал" 330гр*6шт бол.сердце пл. шоколад №836-3""",
-    """Шок.кон."Карнавал" 330гр*8шт мал.овал пл. апельсин №834-13""",
-    """Шок.кон."Карнавал" 330гр*8шт мал.овал пл. клубника №833-13""",
-    """Шок.кон."Карнавал" 330гр*8шт мал.овал пл. кокос №832-13""",
-    """Шок.кон."Карнавал" 330гр*8шт мал.овал пл. фундук №837-13""",
-    """Шок.кон."Карнавал" 330гр*8шт мал.овал пл. шоколад №836-13""",
-    """Шок.кон."Карнавал" 360гр*6шт 8-уг.пл. апельсин №834-2""",
-    """Шок.кон."Карнавал" 360гр*6шт 8-уг.пл. клубника №833-2""",
-    """Шок.кон."Карнавал" 360гр*6шт 8-уг.пл. кокос №832-2""",
-    """Шок.кон."Карнавал" 360гр*6шт 8-уг.пл. фундук №837-2""",
-    """Шок.кон."Карнавал" 360гр*6шт 8-уг.пл. шоколад №836-2""",
-    """Шок.кон."Карнавал" 550гр*6шт бол.овал пл. апельсин №834-1""",
-    """Шок.кон."Карнавал" 550гр*6шт бол.овал пл. клубника №833-1""",
-    """Шок.кон."Карнавал" 550гр*6шт бол.овал пл. кокос №832-1""",
-    """Шок.кон."Карнавал" 550гр*6шт бол.овал пл. фундук №837-1""",
-    """Шок.кон."Карнавал" 550гр*6шт бол.овал пл. шоколад №836-1""",
-    """Шок.кон."Карнавал"180гр*24шт мал.сундук карт.апельсин №834-8""",
-    """Шок.кон."Розалина" 280гр*10шт молочный коколин № 8004""",
-    """Шок.кон."Розалина" 322гр*10шт молочный коколин и какао крем № 8006""",
-    """Шоколад  «Ozmo Club» молочний  з молочною начинкою 44г 6блХ 20шт""",
-    """Шоколад "Мадлен" 430гр*14шт № 91005451""",
-    """Шоколад "Мадлен" 500гр*14шт № 91005408""",
-    """Шоколадна фігурка "Ozmo Fun" 23г 24шт Х 4бл """,
-    """Шоколадна фігурка "Ozmo Go" 30g з молочного, білого та чорного шоколаду 20шт Х 4бл """,
-    """Шоколадне печиво "BISKIATO" з ванільним кремом 100гр х24х6""",
-    """Шоколадне печиво "BISKIATO" з ванільним кремом 68гр х24х6""",
-    """Шоколадне печиво "BISKIATO" сендвіч з ванільним кремомю 160гр х24""",
-    """Шоколадний батончик "ALBENI STICK" з карамеллю і печивом вкритий молочним шоколадом 47грХ18штХ 6 бл""",
-    """Шоколадний батончик "ALBENI" 25гр Х 24шт Х 6 бл""",
-    """Шоколадний батончик "ALBENI" з карамеллю і печивом вкритий молочним шоколадом 30гр Х 24шт Х 6 бл""",
-    """Шоколадний батончик "ALBENI" з карамеллю і печивом вкритий молочним шоколадом 40гр Х 24шт Х 6 бл""",
-    """Шоколадний батончик "ALSANA" з карамеллю і печивом вкритий молочним шоколадом   40гр х24х6""",
-    """Шоколадний батончик ''METRO'' 30грХ24шт Х6 бл""",
-    """Шоколадні цукерки "Cow" (монетки) USD Chocolate Coin 2,5 г х100 шт Х24""",
-    """Шоколадні цукерки "Rabbit" (монетки) USD Chocolate Coin 2,5 г х100 шт х24""",
-    """Шоколадні цукерки "КРОКОДИЛ" (монетки) USD Chocolate Coin 2,5г х100шт х24""",
-    """Шоколадні цукерки "Сова" (монетки) USD Chocolate Coin 2,5 г х100 шт Х24""",
-    """Шоколадні цукерки "ТИГР" (монетки) USD Chocolate Coin 2,5г х100шт х24""",
-    """Шоколадні цукерки (монетки) USD Chocolate Coin 2,5 г 200 шт Х 12""",
-    """Шоколадні цукерки BONART CHOCO COINS (монети)в пластиковій банці 100шт  500гр Х12 """,
-    """Шоколадное яйцо 125гр*12шт № 91005040""",
-    """Шоколадное яйцо 225гр*12шт № 91005035""",
-    """Шоколадно-фундукова паста «DIZZY STICK» з хлібними палочками  50 г Х 24 шт X 4 бл""",
-    """ШОКОЛАДНЫЕ КОНФЕТЫ""",
-    """Шоколадные ложечки "Элит" 54гр*15шт*4бл № 91005421""",
-    """Шоколадные трюфели 225гр*12шт № 91005016""",
-    """Штамп стандартний "КОПІЯ ВІРНА" 38х14мм""",
-    """Штампики ("сплачено", "виїзд джозволено", "копія вірна", згідно з оригіналом")""",
-    """Штраф в сумме НДС по блокировкам """,
-    """штраф ДПИ""",
-    """Штраф за недопоставку товара""",
-    """Штраф за недопоставку товарів, зг. договору """,
-    """Штукатурка декоративна ECO solutions КОРОЕД( 25 кг)""",
-    """Щітка для підлоги""",
-    """Щоденник А5""",
-    """ЭЛИТ""",
-    """Юридично-консультативні послуги""",
-    """Яйце "JIMMY THE PANDA TOYS (BLUE)" з молочним, білим кремом з пластівцями та іграшкою 25гр (24х6)""",
-    """Яйце "JIMMY THE PANDA TOYS (PINK)" з молочним, білим кремом з пластівцями та іграшкою 25гр (24х6)""",
-    """Яйце "MILKY KID" з шоколадної глазурі та сюрпризом 23гр х24х6""",
-    """Яйце "Ozmo Egg Faces" з молочним шоколадом і та сюрпризом 20гр 16 блХ 24шт""",
-    """Яйце "Ozmo Egg Faces" з молочним шоколадом і та сюрпризом 20гр 6блХ 24шт""",
-    """Яйце "Ozmo Egg Faces" з молочним шоколадом і та сюрпризом УКР  20гр 6блХ 24шт""",
-    """Яйце "ROYS TOYS" з шоколадної глазурі та сюрпризом 23гр х24х6""",
-    """Яйце "TOM&JERRY" з молочного шоколаду 150 г х 18""",
-    """Яйце пластикове  сюрприз "CAR" з кульками печива в  глазурі 8 г  60 шт Х 6""",
-    """Яйце пластикове  сюрприз "DINOSAUR " з кульками печива в  глазурі 12 г  24 штХ12бл""",
-    """Яйце пластикове  сюрприз "DINOSAUR " з кульками печива в  глазурі 8 г  60 шт Х 6""",
-    """Яйце пластикове  сюрприз "L.O.L. " з кульками печива в  глазурі 8 г  60 шт Х 6""",
-    """Яйце пластикове  сюрприз "LOVE" з кульками печива в  глазурі 12г 24 штХ12бл""",
-    """Яйце пластикове  сюрприз "PONY " з кульками печива в  глазурі 8 г  60 шт Х 6""",
-    """Яйце пластикове  сюрприз "PRETTY GIRL"   з кульками печива в  глазурі 8 г  60 шт Х 6""",
-    """Яйце пластикове  сюрприз "SURPRISE  "дівчатка  з кульками печива в  глазурі 8 г  60 шт Х 6""",
-    """Яйце пластикове  сюрприз "ZOMBIE " з кульками печива в  глазурі 8 г  60 шт Х 6""",
-    """Яйце пластикове "TOYS HAPPY EGG" в жув. гумкою та іграшкою 4гр 24штХ 6""",
-    """Яйце пластикове «Doll» з шоколадною цукеркою та іграшкою всередині, 8 г х 60 шт х 6 банок""",
-    """Яйце прозоре пластикове  з іграшкою та льодяником  "Cartoon car" 6гр х12х6 бл""",
-    """Яйце прозоре пластикове  з іграшкою та льодяником FIRE FIGHTER   6гр х12х6 бл""",
-    """Яйце прозоре пластикове  з іграшкою та льодяником PUPPY  6гр х12х6 бл""",
-    """Яйце прозоре пластикове  з іграшкою та льодяником RACER   6гр х12х6 бл""",
-    """Яйце прозоре пластикове  з іграшкою та льодяником TITANIC  new  6гр х12х6 бл""",
-    """Яйце прозоре пластикове "AIR FORCE" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "ARMY TANK" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "BULDOZER " з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "BULLDOZER" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "Cartoon car" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "CRYSTAL EGG" з іграшкою та льодяником 10гр х12 х6""",
-    """Яйце прозоре пластикове "DINORIUM" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "EGGY JOY BIGG EGG STAND" 10грХ72шт """,
-    """Яйце прозоре пластикове "Express" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "Express" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "FASHION  GIRL " з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "Fasnion Girl" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "FUNNY PLANE " з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "GREYDER " з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "Greyder" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "HELLO MOTO" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "MONSTER GIRL " з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "MONSTER GIRL" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "MONSTER TRUCK " з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "MONSTER TRUCK" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "MY PONY" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "POLICE" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "Puppu" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "RACER" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "Rainbow Spring" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "SO CHIC GIRL " з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "TITANIC" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "TRANSPARENT" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове "Маша і Ведмідь" з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце прозоре пластикове з іграшкою "CHICK CHIK" 10гр х9 х6 бл""",
-    """Яйце прозоре пластикове з іграшкою та льодяником "TOP MODEL" 10гр х9 х6 бл""",
-    """Яйце прозоре пластикове з іграшкою та льодяником 6гр х12 х6""",
-    """Яйце прозоре пластикове з іграшкою та льодяником 6гр х12х6 бл""",
-    """Яйце сюрприз "Choco Egg " з кульками печива в  глазурі 15гр х24х12""",
-    """Яйце сюрприз "HELLO KITTY" з кульками печива в  глазурі 15гр х24х12""",
-    """Яйце сюрприз "King EGG" з кульками печива в  глазурі 12гр х24х12бл""",
-    """Яйце сюрприз "King EGG" з кульками печива в  глазурі 15гр х24х12""",
-    """Яйце сюрприз "MAGIC GIRL" з кульками печива в  глазурі 12гр х24х12""",
-    """Яйце сюрприз "RABBIT" з кульками печива в  глазурі 12гр х24х12бл""",
-    """Яйце сюрприз "RACING" з кульками печива в  глазурі 12гр х24х12бл""",
-    """Яйце сюрприз "TOY EGG" з кульками печива в  глазурі 15гр х24х12""",
-    """Яйце сюрприз (Велике) пластикове з іграшкою з кульками печива в глазурі 65g x 9pcs x 4 boxes""",
-    """Яйце сюрприз пластикове з іграшкою з кульками печива в глазурі 20 g x6 pcsx 48 trays""",
-    """Яйце шоколадне "ANIMAL WORLD " з іграшкою в середині 25 гр 24Х6бл""",
-    """Яйце шоколадне "BARBELLA WORLD " з іграшкою в середині 25 гр 24Х6бл""",
-    """Яйце шоколадне "BONBON" з кольоровим драже в середині 30 гр 24Х6бл""",
-    """Яйце шоколадне "Junior" з іграшкою в середині 15 гр 24 Х6бл""",
-    """Яйце шоколадне "Princes " з іграшкою в середині 15 гр 24Х6бл""",
-    """Яйце шоколадне "Safari " з іграшкою в середині 15 гр 24Х6бл""",
-    """Яйцо Заврик 907431 86г/13В12""",
-    """ЯКАР""",
-    """Ящик гофро пакувальний""",
-    """Ящик картонний ДхШхВ 400х400х600мм, на чотири клапани""",
-    """Ящик картонний ДхШхВ 445х345х450мм, на чотири клапани""",
-]
+# Корпус SKU хранится в products.skuc (формат sku_corpus.py).
+# test_products - список строк, читается из файла при первом обращении;
+# corpus() - доступ к корпусу по индексу и срезам без загрузки всех строк.
+
+import os
+
+from sku_corpus import SkuCorpus
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "products.skuc")
+
+
+def corpus() -> SkuCorpus:
+    return SkuCorpus(CORPUS_PATH)
+
+
+def __getattr__(name):
+    if name == "test_products":
+        with corpus() as c:
+            value = list(c)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,165 @@
+# Общий дисковый кеш результатов разбора SKU (SQLite).
+# Ключ - нормализованный текст SKU + имя парсера + версия парсера.
+# Версия парсера - хеш таблицы шаблонов, файла модели или текста промпта,
+# поэтому при их изменении старые записи перестают находиться (и удаляются через invalidate).
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import unicodedata
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+DEFAULT_CACHE_PATH = "sku_cache.sqlite"
+
+
+def normalize_sku(text: str) -> str:
+    """Нормализация текста SKU: Unicode NFC и схлопывание пробелов"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _hash(*parts: str) -> str:
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+def text_version(*texts: str) -> str:
+    """Версия по тексту (например, промпта LLM)"""
+    return _hash(*texts)[:16]
+
+
+def pattern_table_version(patterns: Sequence[Tuple[Any, Callable]]) -> str:
+    """Версия таблицы шаблонов: шаблоны + байткод и константы обработчиков"""
+    parts = []
+    for pattern, extractor in patterns:
+        parts.append(getattr(pattern, "pattern", pattern))
+        code = getattr(extractor, "__code__", None)
+        if code is not None:
+            parts.append(code.co_code.hex())
+            parts.append(repr(code.co_consts))
+        else:
+            parts.append(repr(extractor))
+    return _hash(*map(str, parts))[:16]
+
+
+def file_version(path: str) -> str:
+    """Версия файла модели: размер и время изменения (без чтения файла)"""
+    if not os.path.exists(path):
+        return "missing"
+    stat = os.stat(path)
+    return _hash(os.path.abspath(path), str(stat.st_size), str(stat.st_mtime_ns))[:16]
+
+
+def _json_default(value):
+    # numpy-скаляры из DataFrame
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class SkuCache:
+    """Кеш результатов разбора SKU для regex, ML и LLM парсеров"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sku_cache (
+                key TEXT PRIMARY KEY,  -- sha256(парсер, версия, нормализованный SKU)
+                parser TEXT NOT NULL,
+                version TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                result TEXT NOT NULL,  -- результат в json
+                created REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS sku_cache_parser ON sku_cache (parser, version)")
+        self.conn.commit()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    @staticmethod
+    def make_key(text: str, parser: str, version: str) -> str:
+        return _hash(parser, version, normalize_sku(text))
+
+    def get(self, text: str, parser: str, version: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT result FROM sku_cache WHERE key = ?", (self.make_key(text, parser, version),)
+        ).fetchone()
+        if row is None:
+            self.misses[parser] += 1
+            return None
+        self.hits[parser] += 1
+        return json.loads(row[0])
+
+    def get_many(self, texts: Iterable[str], parser: str, version: str) -> Dict[str, Dict]:
+        """Результаты из кеша для набора текстов: {текст: результат}"""
+        keys: Dict[str, list] = {}
+        for text in texts:
+            keys.setdefault(self.make_key(text, parser, version), []).append(text)
+        found: Dict[str, Dict] = {}
+        key_list = list(keys)
+        for i in range(0, len(key_list), 500):
+            part = key_list[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, result FROM sku_cache WHERE key IN ({','.join('?' * len(part))})", part
+            )
+            for key, result in rows:
+                for text in keys[key]:
+                    found[text] = json.loads(result)
+        self.hits[parser] += len(found)
+        self.misses[parser] += sum(map(len, keys.values())) - len(found)
+        return found
+
+    def put(self, text: str, parser: str, version: str, result: Dict):
+        self.put_many([(text, result)], parser, version)
+
+    def put_many(self, items: Iterable[Tuple[str, Dict]], parser: str, version: str):
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO sku_cache (key, parser, version, sku, result, created) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    self.make_key(text, parser, version),
+                    parser,
+                    version,
+                    normalize_sku(text),
+                    json.dumps(result, ensure_ascii=False, default=_json_default),
+                    now,
+                )
+                for text, result in items
+            ],
+        )
+        self.conn.commit()
+
+    def invalidate(self, parser: str, current_version: Optional[str] = None) -> int:
+        """Удаляет записи парсера с версией, отличной от current_version (или все записи парсера)"""
+        if current_version is None:
+            cursor = self.conn.execute("DELETE FROM sku_cache WHERE parser = ?", (parser,))
+        else:
+            cursor = self.conn.execute(
+                "DELETE FROM sku_cache WHERE parser = ? AND version <> ?", (parser, current_version)
+            )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Счетчики попаданий/промахов по парсерам за время жизни объекта"""
+        return {
+            parser: {"hits": self.hits[parser], "misses": self.misses[parser]}
+            for parser in sorted(set(self.hits) | set(self.misses))
+        }
+
+    def print_stats(self):
+        for parser, counts in self.stats().items():
+            total = counts["hits"] + counts["misses"]
+            rate = counts["hits"] / total * 100 if total else 0.0
+            print(f"Кеш SKU [{parser}]: попаданий {counts['hits']}, промахов {counts['misses']} ({rate:.1f}% попаданий)")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,273 @@
+# Каскадное извлечение данных из SKU: regex -> ML -> локальная LLM (Ollama) -> удаленная LLM (DeepSeek).
+# Сначала работает самый дешевый экстрактор. Дальше передаются только SKU, которые он не разобрал
+# (или ML разобрал с уверенностью ниже порога). В колонке tier записывается, какой уровень дал результат.
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from lexicon import LEXICON
+from sku_cache import SkuCache
+
+TIERS = ("regex", "ml", "ollama", "deepseek")
+
+RESULT_COLUMNS = [
+    "sku", "weight", "weight_unit", "pieces", "containers", "container_type", "confidence", "tier",
+]
+
+
+def _to_number(value) -> Optional[float]:
+    try:
+        number = float(str(value).replace(",", "."))
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+class SkuCascade:
+    """
+    Каскад экстракторов SKU.
+
+    tiers - используемые уровни в порядке эскалации (подмножество TIERS)
+    ml_threshold - порог отказа ML: результат принимается, если уверенность по каждому полю
+    (тип контейнера, вес, штуки, контейнеры) не ниже порога
+    ollama_concurrency - число одновременных запросов к локальной модели
+    deepseek_concurrency - максимум одновременных запросов к DeepSeek (лимит подбирается по ответам API)
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[str] = TIERS,
+        ml_threshold: float = 0.8,
+        ollama_model: str = "gemma3:latest",
+        deepseek_model: str = "deepseek-chat",
+        cache: Optional[SkuCache] = None,
+        ollama_concurrency: int = 4,
+        deepseek_concurrency: int = 16,
+    ):
+        unknown = set(tiers) - set(TIERS)
+        if unknown:
+            raise ValueError(f"Неизвестные уровни каскада: {', '.join(sorted(unknown))}")
+        self.tiers = [tier for tier in TIERS if tier in tiers]
+        self.ml_threshold = ml_threshold
+        self.ollama_model = ollama_model
+        self.deepseek_model = deepseek_model
+        self.ollama_concurrency = ollama_concurrency
+        self.deepseek_concurrency = deepseek_concurrency
+        self.cache = cache
+        self._regex_parser = None
+        self._ml_parser = None
+        # статистика последнего прогона: {уровень: {"input": ..., "resolved": ...}}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        # ответы LLM, отклоненные проверкой по словарю
+        self.rejected = 0
+
+    # Парсеры создаются при первом обращении: ML обучается/загружается,
+    # а модули LLM читают .env при импорте
+    @property
+    def regex_parser(self):
+        if self._regex_parser is None:
+            from product_parser_re import ProductParser
+
+            self._regex_parser = ProductParser(self.cache)
+        return self._regex_parser
+
+    @property
+    def ml_parser(self):
+        if self._ml_parser is None:
+            from test import ProductParser
+
+            self._ml_parser = ProductParser(self.cache, abstain_threshold=self.ml_threshold)
+        return self._ml_parser
+
+    def _llm_result(self, text: str, weight, pieces, containers) -> Optional[Dict]:
+        """
+        Результат LLM после проверки: все числа положительные, вес стоит в тексте перед единицей измерения.
+        Тип тары и единица веса берутся из словаря, а не из ответа модели.
+        """
+        weight, pieces, containers = _to_number(weight), _to_number(pieces), _to_number(containers)
+        if weight is None or pieces is None or containers is None:
+            return None
+        if not LEXICON.validate_weight(text, weight):
+            self.rejected += 1
+            return None
+        container_type, weight_unit = LEXICON.classify(text)
+        return {
+            "weight": weight,
+            "weight_unit": weight_unit,
+            "pieces": int(pieces),
+            "containers": int(containers),
+            "container_type": container_type,
+            "confidence": None,
+        }
+
+    def _regex_tier(self, skus: List[str]) -> List[Optional[Dict]]:
+        df = self.regex_parser.parse_batch(skus)
+        results = []
+        for row in df.to_dict("records"):
+            if not row["parsed"]:
+                results.append(None)
+                continue
+            results.append({
+                "weight": row["weight"],
+                "weight_unit": row["weight_unit"],
+                "pieces": row["pieces"],
+                "containers": row["containers"],
+                "container_type": row["container_type"],
+                "confidence": 1.0,
+            })
+        return results
+
+    def _ml_tier(self, skus: List[str]) -> List[Optional[Dict]]:
+        results = []
+        for row in self.ml_parser.parse_batch(skus):
+            # parsed=False - ML отказался (уверенность хотя бы одного поля ниже ml_threshold)
+            if not row["parsed"]:
+                results.append(None)
+                continue
+            results.append({
+                "weight": float(row["weight"]),
+                "weight_unit": row["weight_unit"],
+                "pieces": row["pieces"],
+                "containers": row["containers"],
+                "container_type": row["container_type"],
+                "confidence": row["min_confidence"],
+            })
+        return results
+
+    def _ollama_tier(self, skus: List[str]) -> List[Optional[Dict]]:
+        from OllamaAsync import process_single_sku
+        from work_queue import AdaptiveLimiter, run_queue
+
+        responses: Dict[int, Dict] = {}
+
+        def on_error(i: int, e: BaseException):
+            print(f"Ошибка Ollama для {skus[i]}: {e}")
+
+        async def run():
+            # очередь с фиксированным лимитом: локальная модель не принимает сотни запросов сразу
+            limit = self.ollama_concurrency
+            await run_queue(
+                range(len(skus)),
+                lambda i: process_single_sku(self.ollama_model, skus[i], self.cache),
+                responses.__setitem__,
+                on_error,
+                AdaptiveLimiter(initial=limit, minimum=limit, maximum=limit),
+            )
+
+        asyncio.run(run())
+        results = []
+        for i, text in enumerate(skus):
+            response = responses.get(i)
+            if response is None or not isinstance(response.get("parsed_data"), dict):
+                results.append(None)
+                continue
+            data = response["parsed_data"]
+            results.append(
+                self._llm_result(text, data.get("grams_in_pcs"), data.get("pcs_in_block"), data.get("box_in_cartoon"))
+            )
+        return results
+
+    def _deepseek_tier(self, skus: List[str]) -> List[Optional[Dict]]:
+        from ExtractDataFromSKU import cached_info, request_info, store_info
+        from work_queue import AdaptiveLimiter, run_queue
+
+        responses: Dict[int, str] = {}
+        missing = []
+        for i, text in enumerate(skus):
+            cached = cached_info(text, self.deepseek_model, self.cache) if self.cache is not None else None
+            if cached is None:
+                missing.append(i)
+            else:
+                responses[i] = cached
+
+        def on_result(i: int, content: str):
+            # кеш (sqlite) пишется из цикла событий, а не из потоков с запросами
+            responses[i] = content
+            if self.cache is not None:
+                store_info(skus[i], self.deepseek_model, self.cache, content)
+
+        def on_error(i: int, e: BaseException):
+            print(f"Ошибка DeepSeek для {skus[i]}: {e}")
+
+        async def run():
+            # параллельность растет, пока API отвечает, и падает вдвое при 429 (RateLimitError)
+            limit = self.deepseek_concurrency
+            await run_queue(
+                missing,
+                lambda i: asyncio.to_thread(request_info, skus[i], self.deepseek_model),
+                on_result,
+                on_error,
+                AdaptiveLimiter(initial=min(4, limit), minimum=1, maximum=limit),
+            )
+
+        if missing:
+            asyncio.run(run())
+        results = []
+        for i, text in enumerate(skus):
+            content = responses.get(i)
+            if content is None:
+                results.append(None)
+                continue
+            try:
+                data = json.loads(content)
+            except ValueError as e:
+                print(f"Ошибка DeepSeek для {text}: {e}")
+                results.append(None)
+                continue
+            results.append(self._llm_result(text, data.get("грамм"), data.get("шт"), data.get("блок")))
+        return results
+
+    def run(self, products: Sequence[str]) -> pd.DataFrame:
+        """Прогон каскада. Строки результата идут в порядке входа; tier = None - не разобрано"""
+        skus = list(products)
+        resolved: Dict[int, Dict] = {}
+        pending = list(range(len(skus)))
+        self.stats = {}
+        self.rejected = 0
+
+        for tier in self.tiers:
+            if not pending:
+                break
+            extractor = getattr(self, f"_{tier}_tier")
+            results = extractor([skus[i] for i in pending])
+            still_pending = []
+            for i, result in zip(pending, results):
+                if result is None:
+                    still_pending.append(i)
+                else:
+                    resolved[i] = {**result, "tier": tier}
+            self.stats[tier] = {"input": len(pending), "resolved": len(pending) - len(still_pending)}
+            pending = still_pending
+
+        rows = []
+        for i, text in enumerate(skus):
+            row = resolved.get(i, {"tier": None})
+            rows.append({"sku": text, **row})
+        return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+    def print_stats(self):
+        for tier, counts in self.stats.items():
+            print(f"{tier}: на входе {counts['input']}, разобрано {counts['resolved']}")
+        if self.rejected:
+            print(f"Ответов LLM отклонено проверкой веса: {self.rejected}")
+
+
+def main():
+    from products_source import test_products
+
+    cache = SkuCache()
+    cascade = SkuCascade(cache=cache)
+    df = cascade.run(test_products)
+    cascade.print_stats()
+    cache.print_stats()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    df.to_excel(f"cascade_results_{timestamp}.xlsx", index=False)
+
+
+if __name__ == "__main__":
+    main()
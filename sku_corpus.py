@@ -0,0 +1,125 @@
+# Компактное хранилище корпусов SKU (вместо огромных списков-литералов в .py).
+# Формат .skuc: сигнатура, строки UTF-8 подряд, индекс смещений (uint64 little-endian, count + 1 шт.)
+# и в конце файла - смещение индекса и число строк. Файл пишется потоком (индекс - в конце),
+# читается через mmap: открытие не зависит от размера корпуса, строка декодируется только при обращении.
+
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, List, Optional, Union
+
+from catalog_reader import iter_skus
+
+MAGIC = b"SKUC\x00\x01\x00\x00"
+_FOOTER = struct.Struct("<QQ")  # смещение индекса, число строк
+
+
+def write_corpus(path: str, texts: Iterable[str]) -> int:
+    """Записывает строки в файл корпуса; возвращает число строк"""
+    offsets = array("Q", [0])
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        position = 0
+        for text in texts:
+            data = text.encode("utf-8")
+            f.write(data)
+            position += len(data)
+            offsets.append(position)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        index_offset = len(MAGIC) + position
+        f.write(offsets.tobytes())
+        f.write(_FOOTER.pack(index_offset, len(offsets) - 1))
+    os.replace(tmp_path, path)
+    return len(offsets) - 1
+
+
+def build_corpus(source: Union[str, Iterable[str]], path: str, column: str = "Description",
+                 name: str = "test_products") -> int:
+    """Корпус из любого источника catalog_reader (.json, .jsonl, .csv, .xlsx, список в .py)"""
+    return write_corpus(path, iter_skus(source, column, name))
+
+
+class SkuCorpus:
+    """
+    Корпус SKU только для чтения: len, индексация, срезы, итерация, случайная выборка.
+
+        corpus = SkuCorpus("products.skuc")
+        corpus[10], corpus[100:200], corpus.sample(50)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._index = self._offsets = None
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(MAGIC) + _FOOTER.size:
+            self._file.close()
+            raise ValueError(f"{path}: файл корпуса поврежден")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: не файл корпуса SKU")
+        index_offset, self._count = _FOOTER.unpack_from(self._mmap, size - _FOOTER.size)
+        self._index = memoryview(self._mmap)[index_offset:index_offset + 8 * (self._count + 1)]
+        if sys.byteorder == "little":
+            self._offsets = self._index.cast("Q")
+        else:
+            self._offsets = array("Q", self._index.tobytes())
+            self._offsets.byteswap()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _text(self, i: int) -> str:
+        start = len(MAGIC) + self._offsets[i]
+        end = len(MAGIC) + self._offsets[i + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(item, slice):
+            return [self._text(i) for i in range(*item.indices(self._count))]
+        if item < 0:
+            item += self._count
+        if not 0 <= item < self._count:
+            raise IndexError("индекс вне корпуса")
+        return self._text(item)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._text(i)
+
+    def sample(self, n: int, seed: Optional[int] = None) -> List[str]:
+        """Случайная выборка n строк без повторов (в порядке корпуса)"""
+        indices = sorted(random.Random(seed).sample(range(self._count), min(n, self._count)))
+        return [self._text(i) for i in indices]
+
+    def close(self):
+        # memoryview на mmap нужно освободить до закрытия mmap
+        for view in (self._offsets, self._index):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    # Пересборка корпуса из каталога 1С
+    count = build_corpus("Catalog_nomenclature.json", "Catalog_nomenclature.skuc")
+    print(f"Записано строк: {count}")
+    with SkuCorpus("Catalog_nomenclature.skuc") as corpus:
+        print(f"Первые строки: {corpus[:3]}")
+
+
+if __name__ == "__main__":
+    main()
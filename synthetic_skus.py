@@ -0,0 +1,245 @@
+# Генератор синтетических размеченных SKU для бенчмарков парсеров и обучения моделей.
+# Названия товаров берутся из реальных корпусов (часть строки до первого числа; услуги, техника и
+# названия со словами тары/единиц пропускаются), строки собираются
+# по шаблонам реальных форм записи: "6gx24pcsx12boxes", "10X48X28G", турецкие "6KT12AD40G",
+# кириллические "40г*24шт*6бл", "3,5 гр 100Х20бл" и т.п.
+# Выборка и сборка строк векторизованы (numpy): шаблон, название и числа выбираются массивами,
+# строки склеиваются np.char.add по частям шаблона. Результат пишется потоком по частям (CSV или .skuc).
+
+import os
+import re
+import string
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from catalog_reader import iter_skus
+from lexicon import LEXICON
+
+# Шаблоны: текст с полями {name} {w} (вес) {p} (штук) {c} (контейнеров), тип тары, единица, доля в выборке.
+# {w} в кириллических шаблонах - с десятичной запятой
+TEMPLATES = [
+    ("{name} {w}gx{p}pcsx{c}boxes", "box", "g", 3),
+    ("{name} {w}g x {p}pcs x {c}boxes", "box", "g", 2),
+    ("{name} {c}X{p}X{w}G", "box", "g", 3),
+    ("{name} {c}KT{p}AD{w}G", "box", "g", 3),
+    ("{name} {c}KT {p}AD {w}G", "box", "g", 3),
+    ("{name} {c}KT {p}ADT {w}GR", "box", "g", 1),
+    ("{name} {w}G {p} ADT {c}KT", "box", "g", 2),
+    ("{name} {w}g*{p}*{c}", "box", "g", 2),
+    ("{name} {w}гр*{p}шт*{c}бл", "box", "g", 4),
+    ("{name} {w}г*{p}шт*{c}бл", "box", "g", 3),
+    ("{name} {w} г х {p} шт х {c} бл", "box", "g", 3),
+    ("{name} {w} гр {p}шт Х{c}бл", "box", "g", 3),
+    ("{name} {w}гр х{p}х{c}", "box", "g", 3),
+    ("{name} {w} гр {p}Х{c}бл", "box", "g", 2),
+    ("{name} {w}г x {p}шт x {c}банки", "jar", "g", 1),
+    ("{name} {w}g x {p}pcs x {c}jars", "jar", "g", 1),
+    ("{name} {w}g x {p}pcs x {c}trays", "tray", "g", 1),
+    ("{name} {w}гр х {p}шт х {c}лотки", "tray", "g", 1),
+    ("{name} {w}мл х {p}шт х {c}бл", "box", "ml", 1),
+    ("{name} {w}ml x {p}pcs x {c}boxes", "box", "ml", 1),
+]
+
+# Реалистичные значения (из корпусов)
+WEIGHTS = np.array([3.5, 5, 6, 10, 12, 13, 15, 16, 18, 20, 25, 28, 30, 32, 35, 40, 42, 44, 50, 55, 60, 65, 70,
+                    76, 88, 100, 120, 125, 150, 200, 240, 250, 300, 400, 500, 900, 1000, 1500])
+PIECES = np.array([1, 6, 8, 10, 12, 15, 16, 20, 24, 30, 36, 48, 50, 100])
+CONTAINERS = np.array([1, 2, 4, 6, 8, 10, 12, 15, 20, 24])
+
+# Названия на случай, если корпусов нет
+DEFAULT_NAMES = [
+    "Diamond Light Candy",
+    "POP MANIA MAXXI STRAWBERRY",
+    "LUPPO DREAM BAR KAKAOLU",
+    "BOOMBASTIC MARSH.BARKEK",
+    "BISCOLATA DUOMAX SUTLU",
+    'Печиво сендвіч шоколадне "RONDO" з шоколадним кремом',
+    'Батончик "METRO" с нугой и карамелью',
+    'Цукерки жувальні "FRUTTY MIDI"',
+]
+
+COLUMNS = ["sku", "weight", "weight_unit", "pieces", "containers", "container_type"]
+
+_FIRST_DIGIT = re.compile(r"\d")
+
+# Строки корпусов, которые не являются фасованным товаром: услуги, компенсации, аренда, техника,
+# мебель и оборудование, канцтовары, упаковочные материалы, образцы для выставок
+_NOT_GOODS = re.compile(
+    r"(?<!\w)(?:п?послуг|услуг|компенсац|с?у?б?аренд|оренд|перепредъявлен|постачання|зберіган|друкован"
+    r"|погрузчик|навантажувач|автомобил|паливо|ноутбук|комп(?:ь|'|\"|)ютер|при?нтер|прінтер|картридж|телефон"
+    r"|стел+аж|тумба|шафа|стол\b|стіл\b|стілець|крісл|вітрин|витрин|металевий стенд|підставк|приставн|піддон|поддон"
+    r"|балка|рама\b|ребро|папка|маркер|ручка|коректор|блокнот|набір настільний|етикет|скотч"
+    r"|стр[еe][йт]ч|плівк|пленк|ящик|пакети для сміття|зразки продукц|сума\b)",
+    re.IGNORECASE,
+)
+
+
+# Слова тары и упаковки из корпусов, которых нет в словаре LEXICON ("у пластиковому контейнері",
+# "в коробці-стенді", "туба", "мультиупаковка"): тип тары в названии противоречил бы шаблону
+_CONTAINER_WORDS = re.compile(
+    r"(?<!\w)(?:контейнер|container|коробк|коробц|коробоч|короб\b|тубус|туб[аіиуе]?\b|tubes?\b|пакет"
+    r"|упаков|упакуван|мультиупаков|стенд)",
+    re.IGNORECASE,
+)
+
+
+def _number_text(values: np.ndarray, comma: bool) -> np.ndarray:
+    """Числа без лишних нулей ("40", "3.5" / "3,5") как массив строк"""
+    text = np.array([f"{value:g}" for value in values])
+    return np.char.replace(text, ".", ",") if comma else text
+
+
+def _has_lexicon_word(name: str) -> bool:
+    """В названии есть отдельное слово словаря тары, единиц или упаковки ("в пласт банці", "Jar", "L")"""
+    for token in LEXICON.tokens(name):
+        before = name[token.start - 1] if token.start > 0 else " "
+        after = name[token.end] if token.end < len(name) else " "
+        if not before.isalpha() and not after.isalpha():
+            return True
+    return False
+
+
+def extract_names(texts: Iterable[str], limit: Optional[int] = None) -> List[str]:
+    """
+    Названия товаров: часть строки до первого числа (без хвостовых разделителей).
+    Берутся только строки с числами (фасовкой) и названием хотя бы из трех букв.
+    Пропускаются не товары (_NOT_GOODS) и названия со словами тары или единиц (LEXICON, _CONTAINER_WORDS):
+    разметка берется из шаблона, и "банці" в названии противоречила бы типу тары шаблона.
+    """
+    names = {}
+    for text in texts:
+        match = _FIRST_DIGIT.search(text)
+        if match is None or _NOT_GOODS.search(text):
+            continue
+        name = " ".join(text[:match.start()].split()).rstrip(" ,.(-*/xXхХ×№")
+        if sum(char.isalpha() for char in name) >= 3 and not _has_lexicon_word(name) \
+                and not _CONTAINER_WORDS.search(name):
+            names[name] = None
+            if limit is not None and len(names) >= limit:
+                break
+    return list(names)
+
+
+def load_names(sources: Sequence[str] = ("products.skuc", "products_source.skuc"), limit: Optional[int] = None) -> List[str]:
+    """
+    Названия из корпусов (любой формат catalog_reader); относительные пути - от каталога модуля,
+    отсутствующие файлы пропускаются
+    """
+    paths = [os.path.join(os.path.dirname(os.path.abspath(__file__)), source) for source in sources]
+    texts = (text for path in paths if os.path.exists(path) for text in iter_skus(path))
+    names = extract_names(texts, limit)
+    if not names:
+        print(f"Корпусы {', '.join(paths)} не найдены или пусты - используются DEFAULT_NAMES")
+        return list(DEFAULT_NAMES)
+    return names
+
+
+class SyntheticSkuGenerator:
+    """
+    Генератор размеченных SKU.
+
+        generator = SyntheticSkuGenerator(seed=42)
+        df = generator.frame(100_000)                     # DataFrame с колонками COLUMNS
+        generator.write_csv("synthetic_skus.csv", 10_000_000)  # потоком, по chunk строк
+    """
+
+    def __init__(self, names: Optional[Sequence[str]] = None, templates: Sequence = TEMPLATES,
+                 seed: Optional[int] = None):
+        self.names = np.array(list(names) if names is not None else load_names())
+        self.templates = list(templates)
+        self.rng = np.random.default_rng(seed)
+        weights = np.array([template[3] for template in self.templates], dtype=float)
+        self.template_p = weights / weights.sum()
+        # части шаблонов: (литерал, поле) по string.Formatter
+        self._parts = [list(string.Formatter().parse(template[0])) for template in self.templates]
+        self._weight_text = {False: _number_text(WEIGHTS, False), True: _number_text(WEIGHTS, True)}
+        self._pieces_text = _number_text(PIECES, False)
+        self._containers_text = _number_text(CONTAINERS, False)
+
+    def _render(self, t: int, names: np.ndarray, w: np.ndarray, p: np.ndarray, c: np.ndarray) -> np.ndarray:
+        text, _, _, _ = self.templates[t]
+        comma = bool(re.search(r"[а-яА-ЯіїєІЇЄ]", text))
+        fields = {
+            "name": self.names[names],
+            "w": self._weight_text[comma][w],
+            "p": self._pieces_text[p],
+            "c": self._containers_text[c],
+        }
+        result = np.full(len(names), "")
+        for literal, field, _, _ in self._parts[t]:
+            if literal:
+                result = np.char.add(result, literal)
+            if field is not None:
+                result = np.char.add(result, fields[field])
+        return result
+
+    def frame(self, n: int) -> pd.DataFrame:
+        """n размеченных строк"""
+        rng = self.rng
+        template = rng.choice(len(self.templates), size=n, p=self.template_p)
+        names = rng.integers(len(self.names), size=n)
+        w = rng.integers(len(WEIGHTS), size=n)
+        p = rng.integers(len(PIECES), size=n)
+        c = rng.integers(len(CONTAINERS), size=n)
+
+        sku = np.empty(n, dtype=object)
+        container_type = np.empty(n, dtype=object)
+        weight_unit = np.empty(n, dtype=object)
+        for t in np.unique(template):
+            rows = np.flatnonzero(template == t)
+            sku[rows] = self._render(t, names[rows], w[rows], p[rows], c[rows]).tolist()
+            container_type[rows] = self.templates[t][1]
+            weight_unit[rows] = self.templates[t][2]
+        return pd.DataFrame({
+            "sku": sku,
+            "weight": WEIGHTS[w],
+            "weight_unit": weight_unit,
+            "pieces": PIECES[p],
+            "containers": CONTAINERS[c],
+            "container_type": container_type,
+        }, columns=COLUMNS)
+
+    def chunks(self, n: int, chunk: int = 100_000) -> Iterator[pd.DataFrame]:
+        """n строк частями по chunk"""
+        for start in range(0, n, chunk):
+            yield self.frame(min(chunk, n - start))
+
+    def labelled(self, n: int) -> List[dict]:
+        """n размеченных примеров в формате data_initial_dict (для pattern_benchmark.accuracy)"""
+        df = self.frame(n).rename(columns={"sku": "text"})
+        return df.to_dict("records")
+
+    def write_csv(self, path: str, n: int, chunk: int = 100_000) -> int:
+        """Потоковая запись в CSV (читается catalog_reader.iter_csv(path, "sku")); возвращает число строк"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            for i, df in enumerate(self.chunks(n, chunk)):
+                df.to_csv(f, header=i == 0, index=False)
+        os.replace(tmp_path, path)
+        return n
+
+    def write_corpus(self, path: str, n: int, chunk: int = 100_000) -> int:
+        """Только тексты SKU в корпус .skuc (sku_corpus) - для бенчмарков парсеров"""
+        from sku_corpus import write_corpus
+
+        return write_corpus(path, (text for df in self.chunks(n, chunk) for text in df["sku"]))
+
+
+def main():
+    import time
+
+    generator = SyntheticSkuGenerator(seed=42)
+    print(f"Названий: {len(generator.names)}, шаблонов: {len(generator.templates)}")
+    print(generator.frame(10).to_string())
+
+    n = 1_000_000
+    start = time.perf_counter()
+    generator.write_csv("synthetic_skus.csv", n)
+    elapsed = time.perf_counter() - start
+    print(f"Записано {n} строк в synthetic_skus.csv за {elapsed:.1f} c ({n / elapsed:,.0f} строк/с)")
+
+
+if __name__ == "__main__":
+    main()
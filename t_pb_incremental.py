@@ -0,0 +1,290 @@
+# Инкрементальная обработка t_pb: вместо повторного разбора всего диапазона дат за каждый запуск
+# обрабатываются только новые строки.
+# Состояние (водяной знак) - последняя обработанная пара (date_time_dat_od_tim_p, id) - хранится
+# в таблице STATE_TABLE по имени задания (job). Новые строки выбираются по ключу
+# (date_time_dat_od_tim_p, id) > (водяной знак) в порядке этого ключа (порциями по limit),
+# результаты разбора пишутся upsert'ом в RESULTS_TABLE (одна строка на job + id_banka).
+# Результаты и новый водяной знак сохраняются в одной транзакции: упавший запуск ничего не сдвигает.
+# Строки, которые модель не разобрала, записываются со status = 'error' и повторяются в следующих
+# запусках (не более MAX_ATTEMPTS раз), не задерживая водяной знак. Строки без назначения (osnd NULL
+# или пустой) разбирать нечего: они записываются сразу со status = 'skipped' и не повторяются.
+#
+# Синхронный вариант - psycopg2 (run_incremental: DeepSeekParseBank, deep_parser),
+# асинхронный - asyncpg (openrouter).
+
+import datetime
+import re
+from decimal import Decimal
+import json
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from packed_requests import PACKED_SYSTEM_PROMPT, normalize_result, run_packed
+
+STATE_TABLE = "t_pb_llm_state"
+RESULTS_TABLE = "t_pb_llm_results"
+MAX_ATTEMPTS = 3
+
+# status в RESULTS_TABLE
+STATUS_PARSED = "parsed"
+STATUS_ERROR = "error"  # повторяется в следующих запусках
+STATUS_SKIPPED = "skipped"  # нет назначения - окончательно
+
+# Поле результата LLM -> колонка RESULTS_TABLE
+RESULT_COLUMNS = {
+    "за_что": "purpose",
+    "номер_договора": "contract_number",
+    "номер_счета": "invoice_number",
+    "номер_накладной": "waybill_number",
+    "номер_заказа": "order_number",
+    "дата": "doc_date",
+    "НДС": "vat",
+    "период": "period",
+}
+
+CREATE_TABLES_SQL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+        job TEXT PRIMARY KEY,  -- имя задания (парсер)
+        last_date_time TIMESTAMP NOT NULL,  -- date_time_dat_od_tim_p последней обработанной строки
+        last_id BIGINT NOT NULL,  -- id последней обработанной строки
+        updated_at TIMESTAMP NOT NULL DEFAULT now()
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {RESULTS_TABLE} (
+        job TEXT NOT NULL,
+        id_banka BIGINT NOT NULL,  -- t_pb.id
+        osnd TEXT,
+        purpose TEXT,
+        contract_number TEXT,
+        invoice_number TEXT,
+        waybill_number TEXT,
+        order_number TEXT,
+        doc_date TEXT,
+        vat NUMERIC,
+        period TEXT,
+        status TEXT NOT NULL,  -- parsed / error / skipped
+        error TEXT,  -- текст ошибки (status = 'error')
+        attempts INT NOT NULL DEFAULT 0,  -- неудачных попыток
+        updated_at TIMESTAMP NOT NULL DEFAULT now(),
+        PRIMARY KEY (job, id_banka)
+    )
+    """,
+]
+
+STATE_SQL = f"SELECT last_date_time, last_id FROM {STATE_TABLE} WHERE job = $1"
+
+RETRY_SQL = f"""
+    SELECT t.id AS id_banka, t.osnd, t.date_time_dat_od_tim_p
+    FROM t_pb t
+    JOIN {RESULTS_TABLE} r ON r.id_banka = t.id AND r.job = $1
+    WHERE r.status = 'error' AND r.attempts < $2
+"""
+
+_COLUMNS = list(RESULT_COLUMNS.values())
+
+UPSERT_RESULT_SQL = f"""
+    INSERT INTO {RESULTS_TABLE} (job, id_banka, osnd, {', '.join(_COLUMNS)}, status, error, attempts, updated_at)
+    VALUES ({', '.join(f'${i}' for i in range(1, len(_COLUMNS) + 7))}, now())
+    ON CONFLICT (job, id_banka) DO UPDATE SET
+        osnd = EXCLUDED.osnd,
+        {', '.join(f'{column} = EXCLUDED.{column}' for column in _COLUMNS)},
+        status = EXCLUDED.status,
+        error = EXCLUDED.error,
+        attempts = {RESULTS_TABLE}.attempts + EXCLUDED.attempts,
+        updated_at = now()
+"""
+
+UPSERT_STATE_SQL = f"""
+    INSERT INTO {STATE_TABLE} (job, last_date_time, last_id, updated_at)
+    VALUES ($1, $2, $3, now())
+    ON CONFLICT (job) DO UPDATE SET
+        last_date_time = EXCLUDED.last_date_time,
+        last_id = EXCLUDED.last_id,
+        updated_at = now()
+"""
+
+
+def new_rows_sql(watermark: Optional[Tuple], start_date: Optional[datetime.date],
+                 limit: Optional[int]) -> Tuple[str, List]:
+    """Запрос новых строк t_pb после водяного знака (или с start_date при первом запуске)"""
+    conditions, params = [], []
+    if watermark is not None:
+        conditions.append(f"(date_time_dat_od_tim_p, id) > (${len(params) + 1}, ${len(params) + 2})")
+        params.extend(watermark)
+    elif start_date is not None:
+        conditions.append(f"date_time_dat_od_tim_p::date >= ${len(params) + 1}")
+        params.append(start_date)
+    sql = "SELECT id AS id_banka, osnd, date_time_dat_od_tim_p FROM t_pb"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY date_time_dat_od_tim_p, id"
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return sql, params
+
+
+def _psycopg2_sql(sql: str) -> str:
+    """$1, $2 ... (asyncpg) -> %s (psycopg2); параметры в запросах идут по порядку номеров"""
+    return re.sub(r"\$\d+", "%s", sql)
+
+
+def _has_osnd(osnd) -> bool:
+    return isinstance(osnd, str) and osnd.strip() != ""
+
+
+def contents_to_parse(df: pd.DataFrame) -> List[str]:
+    """Уникальные непустые назначения строк df"""
+    return [osnd for osnd in df["osnd"].unique() if _has_osnd(osnd)]
+
+
+def result_rows(job: str, df: pd.DataFrame, results: Dict[str, Dict]) -> List[Tuple]:
+    """
+    Строки для UPSERT_RESULT_SQL: результат по тексту osnd (results) для каждой строки df.
+    Пустое назначение - status skipped; нет результата или результат вида {"error": ...} -
+    status error и attempts = 1.
+    """
+    rows = []
+    empty = [None] * len(RESULT_COLUMNS)
+    for id_banka, osnd in zip(df["id_banka"], df["osnd"]):
+        if not _has_osnd(osnd):
+            rows.append((job, int(id_banka), None, *empty, STATUS_SKIPPED, None, 0))
+            continue
+        data = results.get(osnd)
+        if data is None or "error" in data:
+            error = str(data["error"]) if data is not None else "нет результата"
+            rows.append((job, int(id_banka), osnd, *empty, STATUS_ERROR, error, 1))
+        else:
+            data = normalize_result(data)
+            data["НДС"] = Decimal(str(data["НДС"]))  # NUMERIC: asyncpg не принимает float
+            rows.append((job, int(id_banka), osnd, *(data[field] for field in RESULT_COLUMNS), STATUS_PARSED, None, 0))
+    return rows
+
+
+def _watermark(new_rows: pd.DataFrame, watermark: Optional[Tuple]) -> Optional[Tuple]:
+    if new_rows.empty:
+        return watermark
+    last = new_rows.iloc[-1]
+    date_time = last["date_time_dat_od_tim_p"]
+    if isinstance(date_time, pd.Timestamp):
+        date_time = date_time.to_pydatetime()
+    return date_time, int(last["id_banka"])
+
+
+def _report(job: str, new_rows: pd.DataFrame, retry: pd.DataFrame, rows: List[Tuple], watermark):
+    failed = sum(1 for row in rows if row[-3] == STATUS_ERROR)
+    skipped = sum(1 for row in rows if row[-3] == STATUS_SKIPPED)
+    print(f"[{job}] новых строк: {len(new_rows)}, повторов: {len(retry)}, "
+          f"уникальных osnd: {len(set(row[2] for row in rows))}, не разобрано: {failed}, "
+          f"без назначения: {skipped}, водяной знак: {watermark}")
+
+
+def process_new_rows(conn, job: str, parse: Callable[[List[str]], Dict[str, Dict]],
+                     start_date: Optional[datetime.date] = None, limit: Optional[int] = None) -> int:
+    """
+    Один инкрементальный проход (psycopg2).
+    parse(тексты) -> {текст: результат} - разбор уникальных osnd новых строк и строк для повтора.
+    start_date - начало при первом запуске (нет водяного знака); None - вся история.
+    Возвращает число обработанных строк.
+    """
+    with conn.cursor() as cursor:
+        for sql in CREATE_TABLES_SQL:
+            cursor.execute(sql)
+        conn.commit()
+
+        cursor.execute(_psycopg2_sql(STATE_SQL), (job,))
+        watermark = cursor.fetchone()
+        sql, params = new_rows_sql(watermark, start_date, limit)
+        new_rows = pd.read_sql_query(_psycopg2_sql(sql), conn, params=params or None)
+        retry = pd.read_sql_query(_psycopg2_sql(RETRY_SQL), conn, params=(job, MAX_ATTEMPTS))
+        df = pd.concat([new_rows, retry], ignore_index=True)
+        # не держим транзакцию открытой, пока идут запросы к модели
+        conn.commit()
+        if df.empty:
+            print(f"[{job}] новых строк нет, водяной знак: {watermark}")
+            return 0
+
+        results = parse(contents_to_parse(df))
+        rows = result_rows(job, df, results)
+        watermark = _watermark(new_rows, watermark)
+        try:
+            cursor.executemany(_psycopg2_sql(UPSERT_RESULT_SQL), rows)
+            if watermark is not None:
+                cursor.execute(_psycopg2_sql(UPSERT_STATE_SQL), (job, *watermark))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    _report(job, new_rows, retry, rows, watermark)
+    return len(df)
+
+
+async def process_new_rows_async(conn, job: str, parse: Callable[[List[str]], Awaitable[Dict[str, Dict]]],
+                                 start_date: Optional[datetime.date] = None, limit: Optional[int] = None) -> int:
+    """Как process_new_rows, но для соединения asyncpg и асинхронного parse"""
+    for sql in CREATE_TABLES_SQL:
+        await conn.execute(sql)
+
+    state = await conn.fetchrow(STATE_SQL, job)
+    watermark = tuple(state) if state is not None else None
+    sql, params = new_rows_sql(watermark, start_date, limit)
+    columns = ["id_banka", "osnd", "date_time_dat_od_tim_p"]
+    new_rows = pd.DataFrame([tuple(record) for record in await conn.fetch(sql, *params)], columns=columns)
+    retry = pd.DataFrame([tuple(record) for record in await conn.fetch(RETRY_SQL, job, MAX_ATTEMPTS)], columns=columns)
+    df = pd.concat([new_rows, retry], ignore_index=True)
+    if df.empty:
+        print(f"[{job}] новых строк нет, водяной знак: {watermark}")
+        return 0
+
+    results = await parse(contents_to_parse(df))
+    rows = result_rows(job, df, results)
+    watermark = _watermark(new_rows, watermark)
+    async with conn.transaction():
+        await conn.executemany(UPSERT_RESULT_SQL, rows)
+        if watermark is not None:
+            await conn.execute(UPSERT_STATE_SQL, job, *watermark)
+    _report(job, new_rows, retry, rows, watermark)
+    return len(df)
+
+
+def parse_contents(contents: List[str], extract: Callable[[str, Optional[str]], str],
+                   pack_size: int = 20) -> Dict[str, Dict]:
+    """
+    Разбор назначений: {текст: результат}. extract(текст, системный промпт или None) - ответ модели.
+    Пакетами по pack_size (packed_requests), назначения без результата пакета - по одному.
+    Ошибка запроса - результат {"error": текст ошибки}.
+    """
+    results = {}
+    if pack_size > 1:
+        results, stats = run_packed(
+            [(content, content) for content in contents],
+            lambda content: extract(content, PACKED_SYSTEM_PROMPT),
+            pack_size,
+        )
+        print(f"Пакетные запросы: {stats}")
+    for content in contents:
+        if content not in results:
+            try:
+                results[content] = json.loads(extract(content, None))
+            except Exception as e:
+                results[content] = {"error": str(e)}
+    return results
+
+
+def run_incremental(connect: Callable, job: str, extract: Callable[[str, Optional[str]], str],
+                    start_date: Optional[datetime.date] = None, pack_size: int = 20,
+                    limit: Optional[int] = None) -> int:
+    """
+    Инкрементальный прогон (для ночного запуска) с синхронной моделью: connect() - соединение psycopg2,
+    extract - как в parse_contents. Только строки t_pb после сохраненного водяного знака
+    (при первом запуске - с start_date), результаты - upsert в RESULTS_TABLE.
+    limit - строк за проход (None - все новые).
+    """
+    conn = connect()
+    try:
+        return process_new_rows(conn, job, lambda contents: parse_contents(contents, extract, pack_size),
+                                start_date, limit)
+    finally:
+        conn.close()
@@ -1,33 +1,67 @@
 import pandas as pd
 import numpy as np
 import pickle
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.isotonic import IsotonicRegression
+from sklearn.utils import check_array
+from joblib import Parallel, delayed
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 from products_source import test_products
+from sku_cache import SkuCache, file_version, text_version
+from lexicon import LEXICON
+from training_log import TrainingLog
+from feature_store import CachedTfidfVectorizer, open_store
 import os
+import random
+import warnings
+
+TOKEN_PATTERN = r"(?u)\b[^\W\d_]+\b|\d+(?:[.,]\d+)?(?:\s*(?:г|кг|шт|бл|ml|мл|g|kg|pc|pcs|box|boxes|jar|jars|tray|trays|vase|vases|уп|упак|упаковка|упаковки|банка|банки|лоток|лотки|ваза|вазы|мілілітр|мілілітри|упаковка|упаковки|банка|банки|лоток|лотки|ваза|вази))?"
+
+# Число деревьев в каждом лесе при полном обучении
+N_ESTIMATORS = 100
+
+# Глубина деревьев регрессоров не ограничена: при max_depth=10 на разреженных TF-IDF признаках
+# дерево успевает выделить лишь несколько строк, и вес верен (в пределах WEIGHT_RTOL) у ~5% SKU
+REGRESSOR_MAX_DEPTH = None
+
+# Уверенность по полям: интервал предсказания - перцентили предсказаний деревьев леса.
+# Уверенность в числовом поле - калиброванная вероятность верного ответа (вес - в пределах WEIGHT_RTOL,
+# штуки и контейнеры - точно) по относительной ширине интервала: изотоническая регрессия,
+# обученная на out-of-bag предсказаниях обучающих примеров (см. _calibrate_field)
+PREDICTION_INTERVAL = (10, 90)
+WEIGHT_RTOL = 0.02
+# Минимум примеров с out-of-bag оценкой для калибровки уверенности
+MIN_CALIBRATION_ROWS = 20
+# Минимум out-of-bag деревьев для оценки интервала примера при калибровке
+MIN_OOB_TREES = 5
+
 
 class MLModel:
-    def __init__(self, model_path="ml_model.pkl"):
+    """
+    ML модель SKU: тип контейнера, вес, количество штук и контейнеров.
+
+    incremental=True - инкрементальный режим: HashingVectorizer (не требует обучения словаря)
+    и леса с warm_start. Новые примеры пишутся в журнал (training_log), к каждому лесу
+    добавляется trees_per_update деревьев, обученных на новых примерах и выборке старых (replay_size).
+    Когда деревьев становится больше max_estimators или появляется новый тип контейнера,
+    выполняется уплотнение (compact): полное переобучение по журналу.
+
+    feature_store - каталог хранилища признаков (feature_store.py) для полного режима:
+    обучающие тексты токенизируются один раз, при переобучении строки матрицы берутся из хранилища.
+    """
+
+    def __init__(self, model_path="ml_model.pkl", incremental: bool = False, trees_per_update: int = 10,
+                 max_estimators: int = 300, replay_size: int = 500, feature_store: Optional[str] = None):
         self.model_path = model_path
-        self.vectorizer = TfidfVectorizer(
-            ngram_range=(1, 3),
-            max_features=2000,
-            token_pattern=r"(?u)\b\p{L}+\b|\d+(?:[.,]\d+)?(?:\s*(?:г|кг|шт|бл|ml|мл|g|kg|pc|pcs|box|boxes|jar|jars|tray|trays|vase|vases|уп|упак|упаковка|упаковки|банка|банки|лоток|лотки|ваза|вазы|мілілітр|мілілітри|упаковка|упаковки|банка|банки|лоток|лотки|ваза|вази))?"
-        )
-        self.classifier = RandomForestClassifier(
-            n_estimators=100, max_depth=10, random_state=42
-        )
-        self.regressor_weight = RandomForestRegressor(
-            n_estimators=100, max_depth=10, random_state=42
-        )
-        self.regressor_pieces = RandomForestRegressor(
-            n_estimators=100, max_depth=10, random_state=42
-        )
-        self.regressor_containers = RandomForestRegressor(
-            n_estimators=100, max_depth=10, random_state=42
-        )
+        self.feature_store = feature_store
+        self.incremental = incremental
+        self.trees_per_update = trees_per_update
+        self.max_estimators = max_estimators
+        self.replay_size = replay_size
+        self.log_path = os.path.splitext(model_path)[0] + ".trainlog"
+        self._make_estimators()
 
         # Начальные обучающие данные
         self.initial_data = [
@@ -159,15 +193,60 @@ class MLModel:
             ('''CHOCODANS KARAMEL 4KT12AD125G RUSYA OTO''', 'box', 125, 12, 4),
         ]
         self.train_data = []
+        # инкрементальный режим: журнал примеров, ключи известных примеров, выборка для повторного обучения
+        self.log: Optional[TrainingLog] = None
+        self._seen = set()
+        self._replay: List[Tuple] = []
+        self._rows_seen = 0
         self.load_model()
 
         # Если модель новая, обучаем на начальных данных
-        if not self.train_data:
+        if not self.is_trained:
             texts, types, weights, pieces, containers = zip(*self.initial_data)
             self.train(texts, types, weights, pieces, containers)
 
+    def _make_estimators(self):
+        if self.incremental:
+            self.vectorizer = HashingVectorizer(
+                ngram_range=(1, 3), token_pattern=TOKEN_PATTERN, n_features=2 ** 12, alternate_sign=False
+            )
+        else:
+            self.vectorizer = self._make_vectorizer()
+        warm_start = self.incremental
+        # oob_score - out-of-bag вероятности для калибровки уверенности (см. _calibrate)
+        self.classifier = RandomForestClassifier(
+            n_estimators=N_ESTIMATORS, max_depth=10, random_state=42, warm_start=warm_start, oob_score=True
+        )
+        self.calibrator: Optional[IsotonicRegression] = None
+        # калибровка уверенности числовых полей: {поле: изотоническая регрессия ширины интервала}
+        self.field_calibrators: Dict[str, IsotonicRegression] = {}
+        self.regressor_weight = RandomForestRegressor(
+            n_estimators=N_ESTIMATORS, max_depth=REGRESSOR_MAX_DEPTH, random_state=42, warm_start=warm_start
+        )
+        self.regressor_pieces = RandomForestRegressor(
+            n_estimators=N_ESTIMATORS, max_depth=REGRESSOR_MAX_DEPTH, random_state=42, warm_start=warm_start
+        )
+        self.regressor_containers = RandomForestRegressor(
+            n_estimators=N_ESTIMATORS, max_depth=REGRESSOR_MAX_DEPTH, random_state=42, warm_start=warm_start
+        )
+
+    def _make_vectorizer(self):
+        if self.feature_store:
+            store = open_store(self.feature_store, ngram_range=(1, 3), token_pattern=TOKEN_PATTERN)
+            return CachedTfidfVectorizer(store, max_features=2000)
+        return TfidfVectorizer(ngram_range=(1, 3), max_features=2000, token_pattern=TOKEN_PATTERN)
+
+    @property
+    def is_trained(self) -> bool:
+        if self.incremental:
+            return hasattr(self.classifier, "estimators_")
+        return bool(self.train_data)
+
     def load_model(self):
         """Загрузка модели из файла"""
+        if self.incremental:
+            self._load_incremental()
+            return
         if os.path.exists(self.model_path):
             try:
                 with open(self.model_path, "rb") as f:
@@ -177,6 +256,8 @@ class MLModel:
                     self.regressor_weight = data["regressor_weight"]
                     self.regressor_pieces = data["regressor_pieces"]
                     self.regressor_containers = data["regressor_containers"]
+                    self.calibrator = data.get("calibrator")
+                    self.field_calibrators = data.get("field_calibrators", {})
                     self.train_data = data.get("train_data", [])
                 print(f"Загружена модель с {len(self.train_data)} обучающими примерами")
             except Exception as e:
@@ -185,8 +266,226 @@ class MLModel:
         else:
             self.train_data = []
 
+    def _load_incremental(self):
+        """Загрузка инкрементальной модели; данные старой модели (train_data в pickle) переносятся в журнал"""
+        self.log = TrainingLog(self.log_path)
+        data = None
+        if os.path.exists(self.model_path):
+            try:
+                with open(self.model_path, "rb") as f:
+                    data = pickle.load(f)
+            except Exception as e:
+                print(f"Ошибка загрузки модели: {e}")
+
+        for row in self.log:
+            self._remember(tuple(row))
+        if data is not None and data.get("incremental"):
+            self.vectorizer = data["vectorizer"]
+            self.classifier = data["classifier"]
+            self.regressor_weight = data["regressor_weight"]
+            self.regressor_pieces = data["regressor_pieces"]
+            self.regressor_containers = data["regressor_containers"]
+            self.calibrator = data.get("calibrator")
+            self.field_calibrators = data.get("field_calibrators", {})
+            self._replay = data.get("replay", self._replay)
+            print(f"Загружена инкрементальная модель, примеров в журнале: {len(self.log)}")
+            return
+
+        legacy = data.get("train_data", []) if data is not None else []
+        new_rows = [tuple(row) for row in legacy if tuple(row) not in self._seen]
+        if new_rows:
+            print(f"Перенос {len(new_rows)} обучающих примеров из {self.model_path} в журнал {self.log_path}")
+            for row in new_rows:
+                self.log.append(list(row))
+                self._remember(row)
+        if len(self.log):
+            self.compact()
+
+    def _remember(self, row: Tuple):
+        """Учет примера: ключ для проверки дубликатов и резервуарная выборка для повторного обучения"""
+        self._seen.add(row)
+        self._rows_seen += 1
+        if len(self._replay) < self.replay_size:
+            self._replay.append(row)
+        else:
+            i = random.randrange(self._rows_seen)
+            if i < self.replay_size:
+                self._replay[i] = row
+
+    def _fit_classifier(self, X, types, calibrate: bool = True):
+        """Обучение классификатора; calibrate=False - дообучение деревьев без пересчета калибровки"""
+        self.classifier.oob_score = calibrate
+        with warnings.catch_warnings():
+            # при малом числе деревьев часть примеров не попадает в out-of-bag - они пропускаются
+            warnings.filterwarnings("ignore", message="Some inputs do not have OOB scores")
+            self.classifier.fit(X, types)
+        if calibrate:
+            self._calibrate(types)
+
+    def _calibrate(self, types):
+        """
+        Калибровка уверенности: изотоническая регрессия максимальной out-of-bag вероятности
+        на факт правильного ответа. Вероятности леса на обучающих примерах завышены, out-of-bag - нет.
+        """
+        self.calibrator = None
+        oob = getattr(self.classifier, "oob_decision_function_", None)
+        if oob is None:
+            return
+        valid = ~np.isnan(oob).any(axis=1)
+        if valid.sum() < MIN_CALIBRATION_ROWS:
+            return
+        predicted = self.classifier.classes_[oob[valid].argmax(axis=1)]
+        correct = (predicted == np.asarray(types)[valid]).astype(float)
+        self.calibrator = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip")
+        self.calibrator.fit(oob[valid].max(axis=1), correct)
+
+    def _confidence(self, proba: np.ndarray) -> np.ndarray:
+        """Калиброванная уверенность по вероятностям классов (без калибровки - максимальная вероятность)"""
+        confidence = proba.max(axis=1)
+        if self.calibrator is not None:
+            confidence = self.calibrator.predict(confidence)
+        return confidence
+
+    def _fit_regressors(self, X, weights, pieces, containers, calibrate: bool = True):
+        """Обучение регрессоров; calibrate=False - дообучение деревьев без пересчета калибровки полей"""
+        fields = (
+            ("weight", self.regressor_weight, weights, False),
+            ("pieces", self.regressor_pieces, pieces, True),
+            ("containers", self.regressor_containers, containers, True),
+        )
+        for name, forest, y, integer in fields:
+            forest.fit(X, y)
+            if calibrate:
+                self._calibrate_field(name, forest, X, y, integer)
+
+    @staticmethod
+    def _relative_width(low: np.ndarray, high: np.ndarray, value: np.ndarray) -> np.ndarray:
+        return (high - low) / np.maximum(np.abs(value), 1.0)
+
+    @staticmethod
+    def _correct(predicted: np.ndarray, y: np.ndarray, integer: bool) -> np.ndarray:
+        if integer:
+            return np.rint(predicted) == np.rint(y)
+        return np.abs(predicted - y) <= WEIGHT_RTOL * np.maximum(np.abs(y), 1e-9)
+
+    def _calibrate_field(self, name: str, forest, X, y, integer: bool):
+        """
+        Калибровка уверенности поля: для каждого обучающего примера - медиана и интервал по деревьям,
+        не видевшим его (out-of-bag), и признак верного ответа; изотоническая регрессия
+        (убывающая) по относительной ширине интервала дает вероятность верного ответа.
+        """
+        self.field_calibrators.pop(name, None)
+        y = np.asarray(y, dtype=float)
+        trees = self._tree_predictions(forest, X, None)
+        out_of_bag = np.ones(trees.shape, dtype=bool)
+        for tree, samples in enumerate(forest.estimators_samples_):
+            out_of_bag[tree, samples] = False
+        valid = out_of_bag.sum(axis=0) >= MIN_OOB_TREES
+        if valid.sum() < MIN_CALIBRATION_ROWS:
+            return
+        trees = np.where(out_of_bag[:, valid], trees[:, valid], np.nan)
+        value = np.nanmedian(trees, axis=0)
+        low, high = np.nanpercentile(trees, PREDICTION_INTERVAL, axis=0)
+        calibrator = IsotonicRegression(y_min=0.0, y_max=1.0, increasing=False, out_of_bounds="clip")
+        calibrator.fit(self._relative_width(low, high, value), self._correct(value, y[valid], integer).astype(float))
+        self.field_calibrators[name] = calibrator
+
+    def _fit_all(self, rows: List[Tuple], calibrate: bool = True):
+        texts, types, weights, pieces, containers = zip(*rows)
+        X = self.vectorizer.transform(texts) if self.incremental else self.vectorizer.fit_transform(texts)
+        self._fit_classifier(X, types, calibrate)
+        self._fit_regressors(X, weights, pieces, containers, calibrate)
+        return X, types, weights, pieces, containers
+
+    def compact(self):
+        """Уплотнение: журнал без дубликатов и полное переобучение лесов (N_ESTIMATORS деревьев)"""
+        self.log.compact(lambda records: list(dict.fromkeys(tuple(r) for r in records)))
+        rows = [tuple(row) for row in self.log]
+        self._make_estimators()
+        self._seen = set()
+        self._replay = []
+        self._rows_seen = 0
+        for row in rows:
+            self._remember(row)
+        if rows:
+            self._fit_all(rows)
+        self.save_model()
+        print(f"Уплотнение модели: {len(rows)} примеров, {N_ESTIMATORS} деревьев")
+
+    def _train_incremental(self, rows: List[Tuple], retrain: bool = False):
+        """Дообучение на новых примерах: время пропорционально их числу (плюс выборка replay_size)"""
+        if retrain:
+            self.log.compact(lambda records: [list(row) for row in self.initial_data])
+            self._seen = set()
+        new_rows = list(dict.fromkeys(row for row in rows if row not in self._seen))
+        for row in new_rows:
+            self.log.append(list(row))
+        self.log.flush()
+        if retrain:
+            self.compact()
+            return
+        if not new_rows:
+            return
+
+        known_types = set(self.classifier.classes_) if self.is_trained else set()
+        new_types = {row[1] for row in new_rows}
+        if (
+            not self.is_trained
+            or not new_types <= known_types
+            or self.classifier.n_estimators + self.trees_per_update > self.max_estimators
+        ):
+            for row in new_rows:
+                self._remember(row)
+            self.compact()
+            return
+
+        # новые деревья видят новые примеры, выборку старых и хотя бы по одному примеру каждого типа
+        # (у всех деревьев леса должен быть одинаковый набор классов)
+        batch = new_rows + self._replay
+        present = {row[1] for row in batch}
+        for row in self._replay_by_type(known_types - present):
+            batch.append(row)
+        for row in new_rows:
+            self._remember(row)
+
+        for estimator in (self.classifier, self.regressor_weight, self.regressor_pieces, self.regressor_containers):
+            estimator.n_estimators += self.trees_per_update
+        # out-of-bag по пакету дообучения не имеет смысла для старых деревьев - калибровка остается прежней
+        self._fit_all(batch, calibrate=False)
+        self.save_model()
+        print(f"Дообучение: {len(new_rows)} новых примеров, деревьев в лесу: {self.classifier.n_estimators}")
+
+    def _replay_by_type(self, types: set) -> List[Tuple]:
+        """По одному примеру каждого из типов контейнера (поиск по журналу)"""
+        found = {}
+        if types:
+            for row in self.log:
+                if row[1] in types and row[1] not in found:
+                    found[row[1]] = tuple(row)
+                    if len(found) == len(types):
+                        break
+        return list(found.values())
+
     def save_model(self):
         """Сохранение модели в файл"""
+        if self.incremental:
+            # обучающие данные хранятся в журнале, в pickle - только модели и выборка для дообучения
+            with open(self.model_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "incremental": True,
+                        "vectorizer": self.vectorizer,
+                        "classifier": self.classifier,
+                        "regressor_weight": self.regressor_weight,
+                        "regressor_pieces": self.regressor_pieces,
+                        "regressor_containers": self.regressor_containers,
+                        "calibrator": self.calibrator,
+                        "field_calibrators": self.field_calibrators,
+                        "replay": self._replay,
+                    },
+                    f,
+                )
+            return
         with open(self.model_path, "wb") as f:
             pickle.dump(
                 {
@@ -195,50 +494,136 @@ class MLModel:
                     "regressor_weight": self.regressor_weight,
                     "regressor_pieces": self.regressor_pieces,
                     "regressor_containers": self.regressor_containers,
+                    "calibrator": self.calibrator,
+                    "field_calibrators": self.field_calibrators,
                     "train_data": self.train_data,
                 },
                 f,
             )
 
     def predict(self, text: str) -> Tuple[str, float]:
-        """Предсказание типа контейнера"""
-        if not self.train_data:
+        """Предсказание типа контейнера и калиброванной уверенности"""
+        if not self.is_trained:
             return "box", 0.0
 
         X = self.vectorizer.transform([text])
-        container_type = self.classifier.predict(X)[0]
-        confidence = max(self.classifier.predict_proba(X)[0])
+        proba = self.classifier.predict_proba(X)
+        container_type = self.classifier.classes_[proba[0].argmax()]
+        confidence = self._confidence(proba)[0]
         return container_type, confidence
 
     def predict_weight(self, text: str) -> float:
-        """Предсказание веса"""
-        if not self.train_data:
+        """Предсказание веса (медиана предсказаний деревьев, как в predict_batch)"""
+        if not self.is_trained:
             return 0.0
 
         X = self.vectorizer.transform([text])
-        weight = self.regressor_weight.predict(X)[0]
+        weight = np.median(self._tree_predictions(self.regressor_weight, X, None))
         return weight
 
     def predict_pieces(self, text: str) -> int:
-        """Предсказание количества штук"""
-        if not self.train_data:
+        """Предсказание количества штук (округление до ближайшего целого)"""
+        if not self.is_trained:
             return 0
 
         X = self.vectorizer.transform([text])
-        pieces = self.regressor_pieces.predict(X)[0]
-        return int(pieces)
+        pieces = np.median(self._tree_predictions(self.regressor_pieces, X, None))
+        return int(round(pieces))
 
     def predict_containers(self, text: str) -> int:
-        """Предсказание количества контейнеров"""
-        if not self.train_data:
+        """Предсказание количества контейнеров (округление до ближайшего целого)"""
+        if not self.is_trained:
             return 0
 
         X = self.vectorizer.transform([text])
-        containers = self.regressor_containers.predict(X)[0]
-        return int(containers)
+        containers = np.median(self._tree_predictions(self.regressor_containers, X, None))
+        return int(round(containers))
+
+    @staticmethod
+    def _tree_predictions(forest, X, n_jobs: Optional[int]) -> np.ndarray:
+        """Предсказания каждого дерева леса: массив (деревья, строки); среднее по деревьям = predict леса"""
+        X = check_array(X, accept_sparse="csr", dtype=np.float32)
+        jobs = forest.n_jobs if n_jobs is None else n_jobs
+        predictions = Parallel(n_jobs=jobs, prefer="threads")(
+            delayed(tree.predict)(X, check_input=False) for tree in forest.estimators_
+        )
+        return np.vstack(predictions)
+
+    def _field(self, name: str, forest, X, n_jobs: Optional[int], integer: bool) -> Dict[str, np.ndarray]:
+        """
+        Значение поля (медиана предсказаний деревьев), интервал предсказания и уверенность.
+        Уверенность - калиброванная вероятность верного ответа по ширине интервала (_calibrate_field);
+        без калибровки (мало примеров) - доля деревьев, согласных с ответом: для целых - то же число
+        после округления, для веса - в пределах WEIGHT_RTOL.
+        """
+        trees = self._tree_predictions(forest, X, n_jobs)
+        value = np.median(trees, axis=0)
+        low, high = np.percentile(trees, PREDICTION_INTERVAL, axis=0)
+        calibrator = self.field_calibrators.get(name)
+        if calibrator is not None:
+            confidence = calibrator.predict(self._relative_width(low, high, value))
+        else:
+            confidence = self._correct(trees, value, integer).mean(axis=0)
+        if integer:
+            value = np.rint(value)
+        return {
+            name: value.astype(int) if integer else value,
+            f"{name}_low": low,
+            f"{name}_high": high,
+            f"{name}_confidence": confidence,
+        }
+
+    def predict_batch(self, texts: List[str], n_jobs: Optional[int] = None) -> pd.DataFrame:
+        """
+        Пакетное предсказание: тексты векторизуются один раз, все четыре модели работают с общей матрицей.
+        Колонки: container_type, confidence (калиброванная уверенность в типе контейнера),
+        weight/pieces/containers, для каждого из них _low/_high (интервал PREDICTION_INTERVAL
+        по деревьям леса) и _confidence (калиброванная вероятность верного ответа). Строки в порядке texts.
+        Штуки и контейнеры округляются до ближайшего целого.
+        n_jobs - число потоков для предсказания лесов (None - как при обучении)
+        """
+        texts = list(texts)
+        if not self.is_trained or not texts:
+            zeros = np.zeros(len(texts))
+            columns = {"container_type": ["box"] * len(texts), "confidence": zeros}
+            for name in ("weight", "pieces", "containers"):
+                columns[name] = zeros if name == "weight" else zeros.astype(int)
+                columns[f"{name}_low"] = zeros
+                columns[f"{name}_high"] = zeros
+                columns[f"{name}_confidence"] = zeros
+            return pd.DataFrame(columns)
+
+        X = self.vectorizer.transform(texts)
+        saved_jobs = self.classifier.n_jobs
+        if n_jobs is not None:
+            self.classifier.n_jobs = n_jobs
+        try:
+            # predict классификатора - argmax predict_proba, поэтому считаем вероятности один раз
+            proba = self.classifier.predict_proba(X)
+        finally:
+            self.classifier.n_jobs = saved_jobs
+
+        columns = {
+            "container_type": self.classifier.classes_[proba.argmax(axis=1)],
+            "confidence": self._confidence(proba),
+        }
+        # ответ - медиана предсказаний деревьев (у дискретных весов среднее смещается между соседними
+        # значениями и выходит за WEIGHT_RTOL), разброс дает интервал и уверенность
+        columns.update(self._field("weight", self.regressor_weight, X, n_jobs, integer=False))
+        columns.update(self._field("pieces", self.regressor_pieces, X, n_jobs, integer=True))
+        columns.update(self._field("containers", self.regressor_containers, X, n_jobs, integer=True))
+        return pd.DataFrame(columns)
 
     def train(self, texts: List[str], container_types: List[str], weights: List[float], pieces: List[int], containers: List[int], retrain=False):
         """Обучение модели"""
+        if self.incremental:
+            rows = [
+                (text, container_type, weight, piece, container)
+                for text, container_type, weight, piece, container in zip(texts, container_types, weights, pieces, containers)
+            ]
+            self._train_incremental(rows, retrain)
+            return
+
         if retrain:
             self.train_data = list(self.initial_data)  # Начинаем с начальных данных
 
@@ -253,12 +638,12 @@ class MLModel:
         # Разделяем данные на тексты и метки
         texts, types, weights, pieces, containers = zip(*self.train_data)
 
-        # Обучаем модель
+        # Обучаем модель (векторизатор из pickle мог быть создан без хранилища признаков)
+        if self.feature_store and not isinstance(self.vectorizer, CachedTfidfVectorizer):
+            self.vectorizer = self._make_vectorizer()
         X = self.vectorizer.fit_transform(texts)
-        self.classifier.fit(X, types)
-        self.regressor_weight.fit(X, weights)
-        self.regressor_pieces.fit(X, pieces)
-        self.regressor_containers.fit(X, containers)
+        self._fit_classifier(X, types)
+        self._fit_regressors(X, weights, pieces, containers)
 
         # Сохраняем модель
         self.save_model()
@@ -274,9 +659,23 @@ class MLModel:
         print(f"Точность ML модели (количество контейнеров): {score_containers:.1%}")
 
 class ProductParser:
-    def __init__(self):
+    """
+    ML-парсер SKU. У каждого поля своя уверенность (см. MLModel.predict_batch), min_confidence - наименьшая.
+    abstain_threshold - порог отказа: при min_confidence ниже порога результат помечается parsed=False,
+    чтобы такие SKU можно было передать более дорогому экстрактору (каскад sku_cascade).
+    """
+
+    CACHE_NAME = "ml"
+    # меняется вместе с набором полей результата или способом их расчета (старые записи кеша не подходят)
+    RESULT_VERSION = "fields-3"
+
+    def __init__(self, cache: Optional[SkuCache] = None, incremental: bool = False,
+                 feature_store: Optional[str] = None, abstain_threshold: float = 0.0):
         # ML модель
-        self.ml_model = MLModel()
+        self.ml_model = MLModel(incremental=incremental, feature_store=feature_store)
+        # кеш результатов; версия - состояние файла модели
+        self.cache = cache
+        self.abstain_threshold = abstain_threshold
 
     def _detect_container_type(self, text: str) -> Tuple[str, float]:
         """Определение типа контейнера по тексту"""
@@ -284,24 +683,61 @@ class ProductParser:
         container_type, confidence = self.ml_model.predict(text)
         return container_type, confidence
 
+    @property
+    def cache_version(self) -> str:
+        # версия - состояние файла модели (меняется после дообучения)
+        return text_version(file_version(self.ml_model.model_path), repr(LEXICON.entries), self.RESULT_VERSION)
+
     def parse_product(self, text: str) -> Dict:
-        """Парсинг описания продукта"""
+        """Парсинг описания продукта (с учетом кеша)"""
+        return self.parse_batch([text])[0]
+
+    def parse_batch(self, products: List[str], n_jobs: Optional[int] = None) -> List[Dict]:
+        """Пакетный парсинг (с учетом кеша): одна векторизация и по одному вызову каждой модели на пакет"""
+        products = list(products)
+        if self.cache is None:
+            return [self._abstain(result) for result in self._parse_batch(products, n_jobs)]
+
+        version = self.cache_version
+        cached = self.cache.get_many(products, self.CACHE_NAME, version)
+        missing = list(dict.fromkeys(text for text in products if text not in cached))
+        parsed = dict(zip(missing, self._parse_batch(missing, n_jobs)))
+        if parsed:
+            self.cache.put_many(parsed.items(), self.CACHE_NAME, version)
+        # порог применяется после кеша: в кеше результат не зависит от abstain_threshold
+        return [self._abstain({**(parsed[text] if text in parsed else cached[text]), "sku": text}) for text in products]
+
+    def _abstain(self, result: Dict) -> Dict:
+        result["parsed"] = result["min_confidence"] >= self.abstain_threshold
+        return result
+
+    def _parse_batch(self, products: List[str], n_jobs: Optional[int] = None) -> List[Dict]:
+        """Парсинг описаний продуктов"""
         # Используем только ML для определения типа контейнера и предсказания веса, количества штук и количества контейнеров
-        container_type, confidence = self._detect_container_type(text)
-        weight = self.ml_model.predict_weight(text)
-        pieces = self.ml_model.predict_pieces(text)
-        containers = self.ml_model.predict_containers(text)
-
-        return {
-            "sku": text,
-            "weight": f"{weight:g}",
-            "weight_unit": "мл" if "ml" in text.lower() else "г",
-            "pieces": pieces,
-            "containers": containers,
-            "container_type": container_type,
-            "confidence": f"{confidence:.1%}",
-            "parsed": True,
-        }
+        predictions = self.ml_model.predict_batch(products, n_jobs)
+        results = []
+        for text, row in zip(products, predictions.itertuples(index=False)):
+            field_confidence = {
+                "container_type_confidence": round(float(row.confidence), 4),
+                "weight_confidence": round(float(row.weight_confidence), 4),
+                "pieces_confidence": round(float(row.pieces_confidence), 4),
+                "containers_confidence": round(float(row.containers_confidence), 4),
+            }
+            results.append({
+                "sku": text,
+                "weight": f"{row.weight:g}",
+                "weight_unit": "мл" if LEXICON.weight_unit(text) == "ml" else "г",
+                "pieces": int(row.pieces),
+                "containers": int(row.containers),
+                "container_type": row.container_type,
+                "confidence": f"{row.confidence:.1%}",
+                "weight_interval": f"{row.weight_low:g}-{row.weight_high:g}",
+                "pieces_interval": f"{row.pieces_low:g}-{row.pieces_high:g}",
+                "containers_interval": f"{row.containers_low:g}-{row.containers_high:g}",
+                **field_confidence,
+                "min_confidence": min(field_confidence.values()),
+            })
+        return results
 
     def parse_products(self, products: List[str]) -> None:
         """Парсинг списка продуктов"""
@@ -309,13 +745,13 @@ class ProductParser:
         success = 0
         failed = 0
 
-        for text in products:
-            result = self.parse_product(text)
+        for result in self.parse_batch(products):
+            text = result["sku"]
             data.append(result)
             if result["parsed"]:
                 success += 1
             else:
-                print(f"Не удалось разобрать: {text}")
+                print(f"Низкая уверенность ({result['min_confidence']:.0%}): {text}")
                 failed += 1
 
         if data:
@@ -342,7 +778,7 @@ class ProductParser:
         print(f"Всего продуктов: {total}")
         print(f"Успешно разобрано: {success} ({success/total*100:.1f}%)")
         if failed > 0:
-            print(f"Не удалось разобрать: {failed} ({failed/total*100:.1f}%)")
+            print(f"Отказ (уверенность ниже порога): {failed} ({failed/total*100:.1f}%)")
 
         # Статистика по типам контейнеров
         if success > 0:
@@ -354,8 +790,10 @@ class ProductParser:
 
 def main():
     # Создаем парсер и запускаем
-    parser = ProductParser()
+    cache = SkuCache()
+    parser = ProductParser(cache)
     parser.parse_products(test_products)
+    cache.print_stats()
 
 if __name__ == "__main__":
     main()
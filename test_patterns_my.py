@@ -1,6 +1,7 @@
 import re
 from typing import List, Tuple, Optional
 from nomenclature_patterns_my import nomenclature_pattern
+from pattern_matcher import CompiledPatternMatcher
 import pandas as pd
 from datetime import datetime
 from products_source import test_products
@@ -31,8 +32,13 @@ def format_result(sku:str, weight: str, pieces: int, boxes: int, pattern:str, pa
     }
 
 
-def extract_data_from_text(text:str)->dict:
-    result = find_match(text, nomenclature_pattern)
+def extract_data_from_text(text:str, matcher: Optional[CompiledPatternMatcher] = None)->dict:
+    if matcher is None:
+        result = find_match(text, nomenclature_pattern)
+    else:
+        # предкомпилированная таблица: CompiledPatternMatcher(nomenclature_pattern, flags=0)
+        found = matcher.match(text.lower())
+        result = (*found.values, found.pattern) if found else None
     if result:
         weight, pieces, boxes, pattern = result
         formatted = format_result(text, weight, pieces, boxes, pattern, True)
@@ -0,0 +1,13 @@
+import os
+import sys
+
+# модули проекта лежат в корне репозитория
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import nomenclature_extract_pattern  # noqa: F401
+except ImportError:
+    # таблица шаблонов не входит в репозиторий - подставляем тестовую
+    from tests import pattern_table
+
+    sys.modules["nomenclature_extract_pattern"] = pattern_table
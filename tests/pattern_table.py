@@ -0,0 +1,42 @@
+# Небольшая таблица шаблонов в формате nomenclature_extract_pattern (pattern, handler),
+# handler(match) -> (weight, pieces, containers). Подключается в conftest, только если
+# настоящей таблицы нет: тесты проверяют свойства движков, а не конкретные шаблоны.
+import re
+
+
+def extract_float(text: str) -> float:
+    return float(text.replace(",", "."))
+
+
+_X = r"\s*[xXхХ×*]\s*"
+_W = r"(\d+(?:[.,]\d+)?)"
+
+nomenclature_pattern = [
+    # 6gx24pcsx12boxes, 40 гр 24шт Х6бл, 22г*24шт*6бл
+    (_W + r"\s*(?:g|gr|г|гр|ml|мл)(?:\s*[xXхХ×*]\s*|\s+)(\d+)\s*(?:pcs|шт)?" + _X + r"(\d+)",
+     lambda m: (extract_float(m.group(1)), int(m.group(2)), int(m.group(3)))),
+    # 12X24X6G
+    (r"(\d+)X(\d+)X" + _W + r"G",
+     lambda m: (extract_float(m.group(3)), int(m.group(2)), int(m.group(1)))),
+    # 6KT24AD30G, 6KT 24ADT 30GR
+    (r"(\d+)\s*KT\s*(\d+)\s*ADT?\s*" + _W + r"\s*GR?",
+     lambda m: (extract_float(m.group(3)), int(m.group(2)), int(m.group(1)))),
+    # 30G 24 ADT 6KT
+    (_W + r"\s*G\s+(\d+)\s*ADT\s*(\d+)\s*KT",
+     lambda m: (extract_float(m.group(1)), int(m.group(2)), int(m.group(3)))),
+    # 3,5 гр 100Х20бл (вес без штук отбрасывается обработчиком - проверка "пропуска" шаблона)
+    (_W + r"\s*(?:g|gr|г|гр)\s*(\d+)" + _X + r"(\d+)",
+     lambda m: (extract_float(m.group(1)), int(m.group(2)), int(m.group(3)))),
+    # 290г*12шт - один блок
+    (_W + r"\s*(?:g|gr|г|гр)" + _X + r"(\d+)\s*(?:pcs|шт)",
+     lambda m: (extract_float(m.group(1)), int(m.group(2)), 1)),
+    # 0г - обработчик отказывается (ValueError), поиск продолжается
+    (r"(\d+)\s*(?:g|г)\b",
+     lambda m: (_positive(int(m.group(1))), 1, 1)),
+]
+
+
+def _positive(value: int) -> int:
+    if value <= 0:
+        raise ValueError(value)
+    return value
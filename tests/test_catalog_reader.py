@@ -0,0 +1,33 @@
+import json
+
+from catalog_reader import batched, iter_json_array, iter_skus
+
+ITEMS = [
+    {"Description": 'Цукерки "SOUR PENCILS" 15 гр * 12*12 бл', "Price": 12.345678901234},
+    {"Description": "Jelly \\u0041 [not, an] {array}", "Nested": {"Description": "inner", "list": [1, 2, 3]}},
+    {"Description": "", "Price": 1e-07},
+    {"Description": "Печиво\\tз\\nпереносом 350 г х 12 шт", "Price": 123456789012345},
+]
+
+
+def test_iter_json_array_equals_json_load(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(ITEMS * 50, ensure_ascii=False, indent=1), encoding="utf-8-sig")
+    with open(path, encoding="utf-8-sig") as f:
+        expected = [item["Description"] for item in json.load(f)]
+    # маленькие части - элементы и числа режутся на границах чтения
+    for chunk in (1, 7, 64, 1 << 16):
+        assert list(iter_json_array(str(path), chunk=chunk)) == expected
+
+
+def test_other_formats_and_batches(tmp_path):
+    texts = [item["Description"] for item in ITEMS]
+    (tmp_path / "catalog.jsonl").write_text("\n".join(json.dumps(item, ensure_ascii=False) for item in ITEMS) + "\n\n",
+                                            encoding="utf-8")
+    (tmp_path / "catalog.py").write_text(
+        "# список\ntest_products = [\n" + ",\n".join(repr(text) for text in texts) + ",\n]\n", encoding="utf-8"
+    )
+    (tmp_path / "strings.json").write_text(json.dumps(texts), encoding="utf-8")
+    for name in ("catalog.jsonl", "catalog.py", "strings.json"):
+        assert list(iter_skus(str(tmp_path / name))) == texts, name
+    assert list(batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
@@ -0,0 +1,19 @@
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from feature_store import CachedTfidfVectorizer, FeatureStore
+
+TRAIN = ["Jelly 35gx48pcsx6jars", "Candy 6gx24pcsx12boxes", "Печиво 40г*24шт*6бл", "Jelly cup 13gx100pcsx6jars"]
+UNSEEN = ["Gummy 8gx30pcsx20jars", "Печиво 40г*24шт*6бл", "New candy 12gx20pcsx12boxes"]
+
+
+def test_transform_matches_tfidf_and_does_not_grow_store(tmp_path):
+    store = FeatureStore(str(tmp_path), ngram_range=(1, 2))
+    vectorizer = CachedTfidfVectorizer(store, max_features=20)
+    reference = TfidfVectorizer(ngram_range=(1, 2), max_features=20)
+    np.testing.assert_allclose(vectorizer.fit_transform(TRAIN).toarray(), reference.fit_transform(TRAIN).toarray())
+
+    rows, terms = len(store), store.n_terms
+    np.testing.assert_allclose(vectorizer.transform(UNSEEN).toarray(), reference.transform(UNSEEN).toarray())
+    assert (len(store), store.n_terms) == (rows, terms)
+    assert not store._pending
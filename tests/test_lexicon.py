@@ -0,0 +1,38 @@
+import random
+
+from lexicon import LEXICON, AhoCorasick
+
+
+def test_aho_corasick_finds_every_occurrence():
+    words = ["g", "gr", "kg", "бл", "блок", "box", "boxes", "ox"]
+    automaton = AhoCorasick(words)
+    rng = random.Random(0)
+    for _ in range(200):
+        text = "".join(rng.choice("gkrxobesлбок ") for _ in range(30))
+        expected = sorted(
+            (start + len(word), word) for word in words for start in range(len(text)) if text.startswith(word, start)
+        )
+        assert sorted(automaton.find(text)) == expected
+
+
+def test_classify_container_and_unit():
+    assert LEXICON.classify("Jelly 25g x 20pcs x 12jars") == ("jar", "g")
+    assert LEXICON.classify("Сок 200мл х 24шт х 6бл") == ("box", "ml")
+    # "мл" внутри слова - не объем
+    assert LEXICON.classify("Хамле 40г*24шт*6бл") == ("box", "g")
+    assert LEXICON.container_type("Bonbon 10 pcs", default="bag") == "bag"
+
+
+def test_unit_letters_inside_words_are_ignored():
+    assert [token.start for token in LEXICON.unit_tokens("Gummy Bag 25g x 12")] == [12]
+    # единиц нет - проверять нечего
+    assert LEXICON.validate_weight("Big Gum", 12)
+    assert LEXICON.validate_weight("Gummy Bag 25g x 12", 25)
+    assert not LEXICON.validate_weight("Gummy Bag 25g x 12", 12)
+
+
+def test_validate_weight_number_before_unit():
+    assert LEXICON.validate_weight("Candy 6gx24pcsx12boxes", 6)
+    assert not LEXICON.validate_weight("Candy 6gx24pcsx12boxes", 24)
+    assert LEXICON.validate_weight("Печиво 40 гр 24шт", 40)
+    assert LEXICON.validate_weight("Печиво 0,5 кг", 500)
@@ -0,0 +1,24 @@
+import json
+
+from llm_cache import LlmCache
+
+
+def test_unparsable_response_is_not_stored(tmp_path):
+    cache = LlmCache(str(tmp_path / "llm.sqlite"))
+    answers = iter(["not json", '{"НДС": 20.0}'])
+
+    first = cache.cached("m", "s", "text", lambda: next(answers), validate=json.loads)
+    second = cache.cached("m", "s", "text", lambda: next(answers), validate=json.loads)
+    third = cache.cached("m", "s", "text", lambda: "unused", validate=json.loads)
+
+    assert first == "not json"
+    assert second == third == '{"НДС": 20.0}'
+    assert cache.stats() == {"m": {"hits": 1, "misses": 2}}
+
+
+def test_stored_unparsable_response_is_dropped(tmp_path):
+    cache = LlmCache(str(tmp_path / "llm.sqlite"))
+    cache.put("m", "s", "text", "not json")
+
+    assert cache.cached("m", "s", "text", lambda: "{}", validate=json.loads) == "{}"
+    assert cache.get("m", "s", "text") == "{}"
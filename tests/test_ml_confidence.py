@@ -0,0 +1,30 @@
+import numpy as np
+
+from sku_cascade import SkuCascade
+from synthetic_skus import DEFAULT_NAMES, SyntheticSkuGenerator
+from test import MLModel
+
+
+def test_default_threshold_resolves_held_out_skus(tmp_path):
+    generator = SyntheticSkuGenerator(names=DEFAULT_NAMES, seed=1)
+    train, held_out = generator.frame(1500), generator.frame(500)
+    model = MLModel(model_path=str(tmp_path / "model.pkl"))
+    model.train(
+        train["sku"].tolist(), train["container_type"].tolist(), train["weight"].tolist(),
+        train["pieces"].tolist(), train["containers"].tolist(), retrain=True,
+    )
+    assert set(model.field_calibrators) == {"weight", "pieces", "containers"}
+
+    prediction = model.predict_batch(held_out["sku"].tolist())
+    confidence = prediction[["confidence", "weight_confidence", "pieces_confidence", "containers_confidence"]]
+    resolved = confidence.min(axis=1).to_numpy() >= SkuCascade().ml_threshold
+    correct = (
+        (prediction["container_type"].to_numpy() == held_out["container_type"].to_numpy())
+        & (np.abs(prediction["weight"] - held_out["weight"]).to_numpy() <= 0.02 * held_out["weight"].to_numpy())
+        & (prediction["pieces"].to_numpy() == held_out["pieces"].to_numpy())
+        & (prediction["containers"].to_numpy() == held_out["containers"].to_numpy())
+    )
+
+    # уровень ML каскада принимает заметную часть SKU, и принятые ответы в основном верны
+    assert resolved.mean() >= 0.3
+    assert correct[resolved].mean() >= 0.9
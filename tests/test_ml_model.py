@@ -0,0 +1,24 @@
+import re
+
+from test import TOKEN_PATTERN, MLModel, N_ESTIMATORS
+
+
+def test_token_pattern_compiles_with_stdlib_re():
+    tokens = re.findall(TOKEN_PATTERN, "Żelki şeker 6gx24pcsx12boxes Печиво 40г")
+    assert "Żelki" in tokens and "şeker" in tokens and "Печиво" in tokens
+
+
+def test_incremental_step_adds_trees(tmp_path):
+    model = MLModel(model_path=str(tmp_path / "model.pkl"), incremental=True, trees_per_update=5)
+    assert model.classifier.n_estimators == N_ESTIMATORS
+
+    model.train(["New Jelly 25gx20pcsx12boxes"], ["box"], [25.0], [20], [12])
+
+    assert model.classifier.n_estimators == N_ESTIMATORS + 5
+    assert len(model.regressor_weight.estimators_) == N_ESTIMATORS + 5
+    prediction = model.predict_batch(["New Jelly 25gx20pcsx12boxes"])
+    assert prediction.loc[0, "container_type"] == "box"
+
+    # дообученная модель читается из файла и журнала
+    reloaded = MLModel(model_path=str(tmp_path / "model.pkl"), incremental=True)
+    assert reloaded.classifier.n_estimators == N_ESTIMATORS + 5
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from osnd_dedup import dedup_osnd, fan_out, transfer_result
+
+
+def test_period_is_transferred_from_date():
+    data = {"дата": "12.03.2025", "период": "03.2025"}
+    assert transfer_result(data, ["12.03.2025"], ["19.04.2025"]) == {"дата": "19.04.2025", "период": "04.2025"}
+
+
+def test_computed_vat_is_not_transferred():
+    df = pd.DataFrame({"osnd": [
+        "Оплата по счету №1543 от 12.03.2025, сумма 1200.00 в т.ч. НДС",
+        "Оплата по счету №1601 от 19.03.2025, сумма 1800.00 в т.ч. НДС",
+    ]})
+    representatives, _ = dedup_osnd(df, template=True)
+    results = {0: {"номер_счета": "1543", "дата": "12.03.2025", "НДС": 200.0}}
+
+    out, unresolved = fan_out(df, representatives, results, template=True)
+
+    # НДС 200 вычислен моделью: подстрока "200" суммы 1800.00 дала бы 800.0 вместо 300
+    assert 1 not in out
+    assert unresolved == [1]
@@ -0,0 +1,45 @@
+import asyncio
+import json
+
+from packed_requests import parse_pack_response, run_packed, run_packed_async
+
+
+def _answer(content, drop=()):
+    rows = [line.split(": ", 1) for line in content.split("\n")]
+    return json.dumps({"results": [
+        {"id": int(number), "за_что": text, "НДС": "1,5"} for number, text in rows if text not in drop
+    ]}, ensure_ascii=False)
+
+
+def _send(content):
+    if content.count("\n") >= 4:
+        return "Не могу обработать столько строк"  # неразбираемый ответ - пакет делится пополам
+    if "boom" in content:
+        raise RuntimeError("сервер упал")
+    return _answer(content, drop=("пропуск",))
+
+
+def test_invalid_responses_split_pack_down_to_single_rows():
+    texts = [f"платіж {i}" for i in range(10)] + ["пропуск", "boom"]
+    results, stats = run_packed(list(enumerate(texts)), _send, pack_size=12)
+
+    assert set(results) == set(range(10))
+    assert all(results[i]["за_что"] == texts[i] and results[i]["НДС"] == 1.5 for i in results)
+    assert stats["failed"] == 2 and stats["splits"] > 0 and stats["rows"] == 12
+
+
+def test_async_version_gives_same_results():
+    async def send(content):
+        return _send(content)
+
+    texts = [f"платіж {i}" for i in range(10)] + ["пропуск", "boom"]
+    expected = run_packed(list(enumerate(texts)), _send, pack_size=12)
+    assert asyncio.run(run_packed_async(list(enumerate(texts)), send, pack_size=12)) == expected
+
+
+def test_parse_pack_response_formats():
+    fenced = "```json\n[{\"id\": 2, \"дата\": \"01.02.2024\"}, {\"id\": 2}, {\"id\": 9}, 5]\n```"
+    assert list(parse_pack_response(fenced, 3)) == [2]
+    assert parse_pack_response(fenced, 3)[2]["дата"] == "01.02.2024"
+    by_key = parse_pack_response('{"1": {"НДС": null}, "2": {"НДС": "abc"}}', 2)
+    assert by_key[1]["НДС"] == 0.0 and by_key[2]["НДС"] == 0.0
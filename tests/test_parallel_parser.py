@@ -0,0 +1,13 @@
+import pandas as pd
+
+from parallel_parser import parse_catalogue
+from product_parser_re import ProductParser
+from products import test_products
+
+
+def test_sharded_output_equals_serial():
+    texts = list(test_products)
+    serial = ProductParser().parse_batch(texts)
+    sharded = parse_catalogue(texts, parser="re", workers=2, chunk_size=500)
+    pd.testing.assert_frame_equal(sharded, serial)
+    assert parse_catalogue(texts, parser="re", workers=1, chunk_size=700).equals(serial)
@@ -0,0 +1,28 @@
+import os
+import re
+import time
+
+import pattern_benchmark
+from pattern_benchmark import check_backtracking
+
+
+def _crashing_worker(pattern, flags, mode, inputs, start, conn):
+    for i in range(start, len(inputs)):
+        if inputs[i] == "crash":
+            os._exit(1)
+        t0 = time.perf_counter()
+        getattr(re.compile(pattern, flags), mode)(inputs[i])
+        conn.send((i, time.perf_counter() - t0))
+    conn.close()
+
+
+def test_crash_is_counted_and_remaining_inputs_are_checked(monkeypatch):
+    monkeypatch.setattr(pattern_benchmark, "_stress_worker", _crashing_worker)
+    report = check_backtracking(r"(a+)+$", inputs=["a", "crash", "a" * 40 + "!", "crash", "b"], timeout=0.3)
+    assert report["crashes"] == 2
+    assert report["timeouts"] == 1
+
+
+def test_no_timeouts_on_linear_pattern():
+    report = check_backtracking(r"\d+g", inputs=["1" * 1000 + "!", "12g"], timeout=1.0)
+    assert report == {"timeouts": 0, "crashes": 0, "worst_s": report["worst_s"]}
@@ -0,0 +1,70 @@
+import re
+
+from nomenclature_extract_pattern import nomenclature_pattern
+from pattern_matcher import CompiledPatternMatcher, PatternStats, reorder_patterns
+from products import test_products
+
+PATTERNS = [
+    (r"(\d+)\s*KT\s*(\d+)\s*AD", lambda m: (0.0, int(m.group(2)), int(m.group(1)))),
+    (r"(\d+)\s*g\s*x\s*(\d+)", lambda m: (float(m.group(1)), int(m.group(2)), 1)),
+    (r"(\d+)\s*g", lambda m: (float(m.group(1)), 1, 1)),
+]
+
+
+def _sequential(patterns, text):
+    """Эталон: последовательный re.search, первое совпадение с отработавшим обработчиком выигрывает"""
+    for index, (pattern, handler) in enumerate(patterns):
+        compiled = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.IGNORECASE)
+        match = compiled.search(text)
+        if match:
+            try:
+                return index, handler(match)
+            except (ValueError, IndexError):
+                continue
+    return None
+
+
+def test_match_equals_sequential_search():
+    patterns = PATTERNS + [
+        (r"(\d+)\s*(?:шт|pcs)", lambda m: (0.0, int(m.group(1)), 1)),
+        (re.compile(r"(\d+)BL"), lambda m: (0.0, 1, int(m.group(1)))),  # с учетом регистра
+        (r"[0-9]+", lambda m: int("x")),  # обработчик всегда отказывает
+    ]
+    texts = list(test_products) + ["6kt 24ad", "12 ШТ", "5bl", "5BL", "ſ 1", "no digits", ""]
+    for table in (patterns, nomenclature_pattern):
+        matcher = CompiledPatternMatcher(table)
+        for text in texts:
+            found = matcher.match(text)
+            expected = _sequential(table, text)
+            assert (found and (found.index, found.values)) == (expected or None), text
+
+
+def _stats(tmp_path, texts):
+    stats = PatternStats(str(tmp_path / "stats.json"))
+    matcher = CompiledPatternMatcher(PATTERNS)
+    stats.observe(matcher, texts)
+    stats.hits = {pattern: 100 * (i + 1) for i, (pattern, _) in enumerate(PATTERNS)}
+    return stats
+
+
+def test_unobserved_patterns_keep_their_place(tmp_path):
+    # KT/AD ни разу не попал в выборку - его непересечение с остальными не доказано
+    stats = _stats(tmp_path, ["Candy 6g x24"] * 20)
+    assert reorder_patterns(PATTERNS, stats) == [0, 1, 2]
+
+
+def test_only_proven_disjoint_pairs_are_swapped(tmp_path):
+    texts = ["Bar 6KT12AD"] * 10 + ["Candy 6g x24"] * 10
+    stats = _stats(tmp_path, texts)
+    # "g x" и "g" совпадали вместе - первый из них остается раньше; KT/AD переносится в конец
+    assert reorder_patterns(PATTERNS, stats) == [1, 2, 0]
+
+
+def test_precedence_allows_declared_order(tmp_path):
+    stats = _stats(tmp_path, ["Candy 6g x24"] * 20)
+    assert reorder_patterns(PATTERNS, stats, precedence=[(2, 1)]) == [0, 2, 1]
+
+
+def test_legacy_observed_list_is_ignored(tmp_path):
+    (tmp_path / "stats.json").write_text('{"observed": ["a", "b"]}', encoding="utf-8")
+    assert PatternStats(str(tmp_path / "stats.json")).observed == {}
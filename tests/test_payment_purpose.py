@@ -0,0 +1,97 @@
+import re
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+import payment_purpose as pp
+from payments_source import test_texts
+
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    # модель, векторизатор и журнал примеров создаются в текущем каталоге
+    monkeypatch.chdir(tmp_path)
+    extractor = pp.PaymentPurposeExtractor()
+    yield extractor
+    extractor.close()
+
+
+def _reference(text):
+    """Эталон: последовательный re.search по таблицам шаблонов и strptime, как до компиляции шаблонов"""
+    result = {'date': None, 'document_type': None, 'document_number': None, 'vat_amount': None}
+    match = pp.WORD_DATE_RE.search(text.lower())
+    if match and match.group(2) in pp.MONTHS:
+        day, month, year = match.groups()
+        result['date'] = f"{year}-{pp.MONTHS[month]}-{day.zfill(2)}"
+    else:
+        for pattern in pp.DATE_PATTERNS:
+            match = re.search(pattern, text, re.IGNORECASE)
+            for fmt in (pp.DATE_FORMATS if match else []):
+                try:
+                    result['date'] = datetime.strptime(match.group('date'), fmt).strftime('%Y-%m-%d')
+                    break
+                except ValueError:
+                    continue
+            if result['date']:
+                break
+
+    documents = ((doc_type, pattern) for doc_type, patterns in pp.DOC_PATTERNS.items() for pattern in patterns)
+    for doc_type, pattern in documents:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            result['document_type'], result['document_number'] = doc_type, match.group('number').strip()
+            break
+
+    if pp.VAT_FREE_RE.search(text.lower()) or pp.VAT_ZERO_RE.search(text):
+        result['vat_amount'] = 0.0
+    else:
+        normalized = pp.DIGIT_SPACE_RE.sub(r'\1\2', text).replace('_', ' ').replace('=', ' = ').replace(':', ' : ')
+        for pattern in pp.VAT_PATTERNS:
+            match = re.search(pattern, normalized, re.IGNORECASE)
+            if match:
+                result['vat_amount'] = pp.normalize_amount(match.group('amount'))
+                break
+    return result
+
+
+EXTRA = ["", "від 31.02.2023 від 01.03.2023", "12/05/23р. без ПДВ", "НДФЛ 15 травня 2023", "ПДВ - 0 % сч. 12 34"]
+
+
+def test_extract_fields_equals_sequential_search(extractor):
+    for text in list(test_texts) + EXTRA:
+        assert extractor.extract_fields(text) == _reference(text), text
+
+
+def test_extract_frame_equals_extract_fields(extractor):
+    texts = list(test_texts) + EXTRA + list(test_texts[:20])
+    df = pd.DataFrame({'osnd': texts + [None], 'id': range(len(texts) + 1)})
+    frame = extractor.extract_frame(df)
+    assert list(frame['id']) == list(df['id'])
+    for text, row in zip(texts + [''], frame.to_dict('records')):
+        expected = extractor.extract_fields(text)
+        assert {key: row[key] for key in expected} == expected, text
+
+
+def test_training_examples_are_appended_to_log(tmp_path, monkeypatch):
+    import pickle
+
+    monkeypatch.chdir(tmp_path)
+    with open('training_data.pkl', 'wb') as f:
+        pickle.dump({'texts': ['старий приклад'], 'labels': [{'type': 'акт', 'number': '1'}]}, f)
+
+    extractor = pp.PaymentPurposeExtractor()
+    extractor.extract_info(test_texts[0])
+    extractor.extract_info(test_texts[0])
+    extractor.close()
+    # недописанная запись в конце журнала (падение процесса) отрезается при открытии
+    with open('training_data.log', 'ab') as f:
+        f.write(b'\x10\x00\x00\x00garbage')
+
+    reopened = pp.PaymentPurposeExtractor()
+    data = reopened.training_data
+    assert data['texts'] == ['старий приклад', test_texts[0], test_texts[0]]
+    assert data['labels'][1] == data['labels'][2] and data['labels'][1]['document_number']
+    reopened.compact_training_data()
+    assert len(reopened.training_log) == 2
+    reopened.close()
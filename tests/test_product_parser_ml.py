@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from product_parser_ml import training
+from product_parser_re import ProductParser
+
+
+def _labelled(n, seed=1):
+    rng = np.random.default_rng(seed)
+    weight = rng.choice([3.5, 10, 16, 25, 40, 80, 125, 250, 500], n)
+    pieces = rng.choice([6, 12, 18, 24, 48], n)
+    containers = rng.choice([2, 4, 6, 12], n)
+    kind = rng.choice(["boxes", "jars", "trays"], n)
+    sku = [f"Candy #{i} {w:g}g x {p}pcs x {c}{k}" for i, (w, p, c, k) in enumerate(zip(weight, pieces, containers, kind))]
+    return pd.DataFrame({
+        "sku": sku,
+        "weight": weight,
+        "weight_unit": "g",
+        "pieces": pieces,
+        "containers": containers,
+        "container_type": pd.Series(kind).map({"boxes": "box", "jars": "jar", "trays": "tray"}),
+    })
+
+
+def test_weight_model_uses_regex_predictions():
+    df = _labelled(600)
+    parsed = ProductParser().parse_batch(df["sku"])
+    for column in ("weight", "pieces", "containers"):
+        df[f"{column}_pred"] = parsed[column].to_numpy()
+
+    report = training(df, n_jobs=1, cv=2, n_iter=2)["report"]["weight"]
+    assert "baseline_accuracy" in report
+    assert report["accuracy"] >= report["baseline_accuracy"] - 0.05
+    assert report["accuracy"] > 0.9
@@ -0,0 +1,45 @@
+import re
+
+from nomenclature_extract_pattern import nomenclature_pattern
+from product_parser_re import ProductParser
+from products import test_products
+
+EDGE_CASES = [
+    "Печиво 0g",  # обработчик отказывает - разбор продолжается следующими шаблонами
+    "Цукерки 3,5 гр 100Х20бл",
+    "Рулет 290г*12шт №573",
+    "6KT24AD30G CIS2",
+    "без чисел",
+    "",
+]
+
+
+def sequential(text):
+    """Эталон: последовательный re.search по таблице, первое совпадение выигрывает"""
+    for pattern, handler in nomenclature_pattern:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            try:
+                return pattern, handler(match)
+            except (ValueError, IndexError):
+                continue
+    return "", None
+
+
+def test_parse_batch_matches_sequential_search():
+    skus = list(test_products) + EDGE_CASES
+    frame = ProductParser().parse_batch(skus)
+    for text, row in zip(skus, frame.itertuples(index=False)):
+        pattern, values = sequential(text)
+        assert row.pattern == pattern, text
+        assert row.parsed == (values is not None)
+        if values is not None:
+            assert (row.weight, row.pieces, row.containers) == values
+
+
+def test_vector_pass_matches_per_row_matcher():
+    skus = list(test_products) + EDGE_CASES
+    vector, per_row = ProductParser(), ProductParser()
+    per_row.VECTOR_PATTERNS = 0
+    assert vector.parse_batch(skus).equals(per_row.parse_batch(skus))
+    assert vector.matcher.hits == per_row.matcher.hits
@@ -0,0 +1,35 @@
+import pandas as pd
+
+import product_parser_re
+from product_parser_re import ProductParser
+from products import test_products
+from sku_cache import SkuCache
+
+
+def test_cached_results_equal_fresh_parse(tmp_path):
+    texts = list(test_products[:500])
+    fresh = ProductParser().parse_batch(texts)
+    with_cache = ProductParser(SkuCache(str(tmp_path / "cache.sqlite")))
+    pd.testing.assert_frame_equal(with_cache.parse_batch(texts), fresh)
+    # второй проход - из кеша (колонка sku собирается заново, ее тип зависит от версии pandas)
+    pd.testing.assert_frame_equal(with_cache.parse_batch(texts), fresh, check_dtype=False)
+    assert with_cache.cache.stats()["re"]["hits"] == len(set(texts))
+    assert with_cache.parse_product(texts[0]) == fresh.iloc[0].to_dict()
+
+
+def test_pattern_table_change_invalidates_cache(tmp_path, monkeypatch):
+    cache = SkuCache(str(tmp_path / "cache.sqlite"))
+    text = "Candy 25g x 12pcs x 6boxes"
+    old = ProductParser(cache)
+    old.parse_product(text)
+
+    # та же таблица, но обработчик первого шаблона возвращает другие значения
+    pattern, handler = product_parser_re.nomenclature_pattern[0]
+    table = [(pattern, lambda m: (1.0, 2, 3))] + list(product_parser_re.nomenclature_pattern[1:])
+    monkeypatch.setattr(product_parser_re, "nomenclature_pattern", table)
+    new = ProductParser(cache)
+    assert new.cache_version != old.cache_version
+    result = new.parse_product(text)
+    assert (result["weight"], result["pieces"], result["containers"]) == (1.0, 2, 3)
+    assert cache.invalidate("re", new.cache_version) == 1
+    assert cache.get(text, "re", old.cache_version) is None
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import sys
+import types
+
+from sku_cascade import SkuCascade
+
+
+def test_ollama_tier_bounds_concurrency(monkeypatch):
+    active, peak = 0, 0
+
+    async def process_single_sku(model, text, cache):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if text == "bad":
+            raise ValueError("нет ответа")
+        return {"original_sku": text, "parsed_data": {"grams_in_pcs": 25, "pcs_in_block": 20, "box_in_cartoon": 12}}
+
+    monkeypatch.setitem(sys.modules, "OllamaAsync", types.SimpleNamespace(process_single_sku=process_single_sku))
+    skus = [f"Jelly 25g x20 x12 #{i}" for i in range(30)] + ["bad"]
+
+    results = SkuCascade(ollama_concurrency=3)._ollama_tier(skus)
+
+    assert peak == 3
+    assert len(results) == len(skus) and results[-1] is None
+    assert all(result["weight"] == 25 for result in results[:-1])
+
+
+def test_deepseek_tier_retries_rate_limited_requests(monkeypatch):
+    import threading
+    import time
+
+    from work_queue import RateLimitError
+
+    lock = threading.Lock()
+    calls, limited, active, peak = [], set(), 0, 0
+    cache = {"cached 10g x 6 x 2": json.dumps({"грамм": 10, "шт": 6, "блок": 2})}
+
+    def request_info(content, model):
+        nonlocal active, peak
+        with lock:
+            calls.append(content)
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+            # первый запрос каждой пятой строки получает 429
+            if content.endswith("0") and content not in limited:
+                limited.add(content)
+                raise RateLimitError("API Error: 429", retry_after=0)
+        return json.dumps({"грамм": 25, "шт": 20, "блок": 12})
+
+    module = types.SimpleNamespace(
+        request_info=request_info,
+        cached_info=lambda content, model, cache_: cache.get(content),
+        store_info=lambda content, model, cache_, result: cache.__setitem__(content, result),
+    )
+    monkeypatch.setitem(sys.modules, "ExtractDataFromSKU", module)
+    skus = [f"Jelly 25g x20 x12 #{i}" for i in range(20)] + ["cached 10g x 6 x 2"]
+
+    cascade = SkuCascade(cache=object(), deepseek_concurrency=4)
+    results = cascade._deepseek_tier(skus)
+
+    assert [result["weight"] for result in results] == [25] * 20 + [10]
+    assert len(calls) == 20 + len(limited) and len(limited) == 2
+    assert "cached 10g x 6 x 2" not in calls
+    assert peak <= 4
+    assert all(sku in cache for sku in skus)
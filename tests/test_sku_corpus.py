@@ -0,0 +1,30 @@
+from catalog_reader import iter_skus
+from sku_corpus import SkuCorpus, build_corpus, write_corpus
+
+TEXTS = ['"Alpella" 80г*18шт*6бл/Хамле №8012', "", "Jelly 25g x 20pcs x 12boxes", "emoji 🍬 ✓", "a" * 10_000]
+
+
+def test_skuc_round_trip(tmp_path):
+    path = str(tmp_path / "corpus.skuc")
+    assert write_corpus(path, iter(TEXTS)) == len(TEXTS)
+    with SkuCorpus(path) as corpus:
+        assert len(corpus) == len(TEXTS)
+        assert list(corpus) == TEXTS
+        assert corpus[-1] == TEXTS[-1] and corpus[1:4] == TEXTS[1:4] and corpus[::-2] == TEXTS[::-2]
+        assert corpus.sample(3, seed=1) == corpus.sample(3, seed=1)
+    assert list(iter_skus(path)) == TEXTS
+
+
+def test_build_corpus_from_python_list(tmp_path):
+    source = tmp_path / "source.py"
+    source.write_text("test_products = [\n" + ",\n".join(map(repr, TEXTS)) + "\n]\n", encoding="utf-8")
+    path = str(tmp_path / "corpus.skuc")
+    assert build_corpus(str(source), path) == len(TEXTS)
+    assert list(iter_skus(path)) == TEXTS
+
+
+def test_empty_corpus(tmp_path):
+    path = str(tmp_path / "empty.skuc")
+    assert write_corpus(path, []) == 0
+    with SkuCorpus(path) as corpus:
+        assert len(corpus) == 0 and list(corpus) == [] and corpus.sample(5) == []
@@ -0,0 +1,26 @@
+import os
+
+from synthetic_skus import DEFAULT_NAMES, extract_names, load_names
+
+
+def test_extract_names_skips_non_goods_and_packaging_words():
+    texts = [
+        "Послуга зі стимулювання та розширення ринку збуту, згідно п.3.1.9",
+        "Погрузчик Марка CPD/15G",
+        "SERT SEKER (ролл) цукерки на паличці в пласт банці 4лотки х 12шт",
+        "Mini cup Jelly (Owl Jar) 13g x 100pcs x 6boxes",
+        "Какао-драже \"MIMIDOTS\" в коробці-стенді 20г х 24шт",
+        "Жувальна гумка \"CUBE GUM\" у пластиковому контейнері 5г х 24шт",
+        "Упаковка чорного чаю Mesh Stick 20шт",
+        "Цукерки желе \"Каченя\" 1кг",
+    ]
+    assert extract_names(texts) == ['Цукерки желе "Каченя"']
+
+
+def test_load_names_resolves_paths_from_module_directory(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if os.path.exists(os.path.join(root, "products.skuc")):
+        assert load_names(("products.skuc",), limit=5) != DEFAULT_NAMES
+    assert load_names(("missing.skuc",)) == DEFAULT_NAMES
+    assert "DEFAULT_NAMES" in capsys.readouterr().out
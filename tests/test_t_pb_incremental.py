@@ -0,0 +1,112 @@
+import asyncio
+import datetime
+
+import t_pb_incremental as inc
+
+
+class FakeConnection:
+    """asyncpg-соединение поверх списков: t_pb, состояние заданий и RESULTS_TABLE"""
+
+    def __init__(self, t_pb):
+        self.t_pb = t_pb  # [(id, osnd, date_time)]
+        self.state = {}
+        self.results = {}  # (job, id_banka) -> строка UPSERT_RESULT_SQL
+
+    async def execute(self, sql, *params):
+        if sql == inc.UPSERT_STATE_SQL:
+            job, date_time, last_id = params
+            self.state[job] = (date_time, last_id)
+
+    async def fetchrow(self, sql, job):
+        assert sql == inc.STATE_SQL
+        return self.state.get(job)
+
+    async def fetch(self, sql, *params):
+        if sql == inc.RETRY_SQL:
+            job, max_attempts = params
+            failed = {
+                id_banka for (row_job, id_banka), row in self.results.items()
+                if row_job == job and row[-3] == inc.STATUS_ERROR and row[-1] < max_attempts
+            }
+            return [row for row in self.t_pb if row[0] in failed]
+        rows = sorted(self.t_pb, key=lambda row: (row[2], row[0]))
+        if "> ($1, $2)" in sql:
+            rows = [row for row in rows if (row[2], row[0]) > tuple(params)]
+        elif params:
+            rows = [row for row in rows if row[2].date() >= params[0]]
+        if " LIMIT " in sql:
+            rows = rows[:int(sql.rsplit(" LIMIT ", 1)[1])]
+        return rows
+
+    async def executemany(self, sql, rows):
+        assert sql == inc.UPSERT_RESULT_SQL
+        for row in rows:
+            key = row[:2]
+            attempts = row[-1] + (self.results[key][-1] if key in self.results else 0)
+            self.results[key] = (*row[:-1], attempts)
+
+    def transaction(self):
+        connection = self
+
+        class Transaction:
+            async def __aenter__(self):
+                self.saved = (dict(connection.state), dict(connection.results))
+
+            async def __aexit__(self, exc_type, *exc):
+                if exc_type is not None:
+                    connection.state, connection.results = self.saved
+
+        return Transaction()
+
+
+def _row(id_banka, osnd, day):
+    return id_banka, osnd, datetime.datetime(2025, 3, day, 12)
+
+
+def test_watermark_retry_and_empty_osnd():
+    conn = FakeConnection([
+        _row(1, "оплата по счету 1", 1),
+        _row(2, "сбой модели", 2),
+        _row(3, None, 2),
+        _row(4, "", 3),
+    ])
+    calls = []
+
+    async def parse(contents):
+        calls.append(sorted(contents))
+        return {content: ({"error": "нет json"} if content == "сбой модели" else {"за_что": "за товар"})
+                for content in contents}
+
+    def run():
+        return asyncio.run(inc.process_new_rows_async(conn, "job", parse, datetime.date(2025, 3, 1)))
+
+    assert run() == 4
+    # пустые назначения в модель не отправляются и окончательно помечены skipped
+    assert calls == [["оплата по счету 1", "сбой модели"]]
+    assert conn.results[("job", 3)][-3] == conn.results[("job", 4)][-3] == inc.STATUS_SKIPPED
+    assert conn.results[("job", 1)][-3] == inc.STATUS_PARSED
+    assert conn.state["job"] == (datetime.datetime(2025, 3, 3, 12), 4)
+
+    # новых строк нет - повторяется только ошибочная, не более MAX_ATTEMPTS раз
+    for _ in range(inc.MAX_ATTEMPTS - 1):
+        assert run() == 1
+    assert conn.results[("job", 2)][-1] == inc.MAX_ATTEMPTS
+    assert run() == 0
+    assert calls[1:] == [["сбой модели"]] * (inc.MAX_ATTEMPTS - 1)
+
+    # новая строка после водяного знака
+    conn.t_pb.append(_row(5, "оплата по счету 2", 4))
+    assert run() == 1
+    assert calls[-1] == ["оплата по счету 2"]
+    assert conn.state["job"] == (datetime.datetime(2025, 3, 4, 12), 5)
+
+
+def test_parse_contents_falls_back_to_single_requests():
+    def extract(content, system_prompt):
+        if system_prompt is not None:
+            raise RuntimeError("пакет не принят")
+        return '{"за_что": "за товар"}' if content == "a" else "не json"
+
+    results = inc.parse_contents(["a", "b"], extract, pack_size=20)
+    assert results["a"] == {"за_что": "за товар"}
+    assert "error" in results["b"]
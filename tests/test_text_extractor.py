@@ -0,0 +1,21 @@
+from text_extractor import FIELDS, TRAINING_DATA, TextExtractor
+
+TEXT = "Счет №123-45 от 15.03.2024 по договору №ДП-2024/03, НДС 1250.50, период 03.2024"
+
+
+def test_only_requested_fields_are_loaded(tmp_path):
+    extractor = TextExtractor()
+    extractor.train(TRAINING_DATA)
+    extractor.save_model(str(tmp_path))
+    expected = extractor.extract_from_text(TEXT)
+
+    loaded = TextExtractor.load_model(str(tmp_path))
+    result = loaded.extract_from_text(TEXT, fields=['номер_счета'])
+    assert set(loaded.classifiers.loaded) == {'номер_счета'}
+    assert result['номер_счета'] == expected['номер_счета']
+    assert result['дата'] == expected['дата']
+
+    assert loaded.classifiers.get('нет_такого_поля') is None
+    assert list(loaded.classifiers) == FIELDS
+    assert loaded.extract_from_text(TEXT) == expected
+    assert set(loaded.classifiers.loaded) == set(FIELDS)
@@ -0,0 +1,55 @@
+import asyncio
+
+from work_queue import AdaptiveLimiter, RateLimitError, retry_after_seconds, run_queue
+
+
+def test_limiter_backs_off_on_rate_limit():
+    limiter = AdaptiveLimiter(initial=8, minimum=1, maximum=8)
+    seen = {}
+    active, peak_after_429 = 0, 0
+    limited = set()
+
+    async def worker(item):
+        nonlocal active, peak_after_429
+        active += 1
+        if limited:
+            peak_after_429 = max(peak_after_429, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        # сервер выдерживает не больше 3 одновременных запросов
+        if active >= 3 and item not in limited:
+            limited.add(item)
+            raise RateLimitError("429", retry_after=0.02)
+        return item * 2
+
+    stats = asyncio.run(run_queue(range(40), worker, seen.__setitem__, limiter=limiter))
+
+    assert seen == {i: i * 2 for i in range(40)}
+    assert stats["rate_limited"] == len(limited) > 0
+    assert stats["retries"] == len(limited) and stats["failed"] == 0
+    assert limiter.limit < 8 and peak_after_429 < 8
+
+
+def test_retries_are_bounded_and_latency_lowers_limit():
+    errors = {}
+
+    async def always_limited(item):
+        raise RateLimitError("429", retry_after=0)
+
+    stats = asyncio.run(run_queue([1], always_limited, on_error=errors.__setitem__,
+                                  limiter=AdaptiveLimiter(initial=1, maximum=1), max_retries=2))
+    assert stats["retries"] == 2 and stats["failed"] == 1 and isinstance(errors[1], RateLimitError)
+
+    limiter = AdaptiveLimiter(initial=4, minimum=1, maximum=4, target_latency=0.001)
+
+    async def slow(item):
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run_queue(range(8), slow, limiter=limiter))
+    assert limiter.limit < 4 and limiter.stats["slow"] > 0
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds("2.5") == 2.5
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") is None
@@ -1,25 +1,65 @@
 import re
 import json
+import os
+from collections.abc import Mapping
 from datetime import datetime
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import RandomForestClassifier
+from feature_store import CachedTfidfVectorizer, open_store
+import joblib
 import pickle
 
+# Поля, которые предсказывают классификаторы
+FIELDS = ['за_что', 'номер_договора', 'номер_счета', 'номер_накладной', 'номер_заказа']
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class LazyClassifiers(Mapping):
+    """
+    Классификаторы полей, загружаемые из каталога модели при первом обращении.
+    Файлы joblib открываются с mmap_mode: массивы numpy читаются из файла по мере надобности.
+    """
+
+    def __init__(self, model_dir, files, mmap_mode='r'):
+        self.model_dir = model_dir
+        self.files = files
+        self.mmap_mode = mmap_mode
+        # уже загруженные классификаторы
+        self.loaded = {}
+
+    def __getitem__(self, field):
+        if field not in self.loaded:
+            if field not in self.files:
+                raise KeyError(field)
+            path = os.path.join(self.model_dir, self.files[field])
+            self.loaded[field] = joblib.load(path, mmap_mode=self.mmap_mode)
+        return self.loaded[field]
+
+    def __iter__(self):
+        return iter(self.files)
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, field):
+        return field in self.files
+
+
 class TextExtractor:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(
-            ngram_range=(1, 3),
-            max_features=5000
-        )
-        self.classifiers = {
-            'за_что': RandomForestClassifier(n_estimators=100),
-            'номер_договора': RandomForestClassifier(n_estimators=100),
-            'номер_счета': RandomForestClassifier(n_estimators=100),
-            'номер_накладной': RandomForestClassifier(n_estimators=100),
-            'номер_заказа': RandomForestClassifier(n_estimators=100)
-        }
-        
+    def __init__(self, feature_store=None):
+        # feature_store - каталог хранилища признаков (feature_store.py): тексты токенизируются один раз
+        if feature_store:
+            self.vectorizer = CachedTfidfVectorizer(open_store(feature_store, ngram_range=(1, 3)), max_features=5000)
+        else:
+            self.vectorizer = TfidfVectorizer(
+                ngram_range=(1, 3),
+                max_features=5000
+            )
+        # классификаторы создаются при обучении или загружаются из каталога модели
+        self.classifiers = {}
+
     def train(self, training_data):
         """
         Обучение модели на размеченных данных
@@ -32,21 +72,25 @@ class TextExtractor:
         X = self.vectorizer.fit_transform(texts)
         
         # Обучаем классификаторы для каждого поля
-        for field in self.classifiers:
+        self.classifiers = {}
+        for field in FIELDS:
             y = [label.get(field, "") for label in labels]
+            self.classifiers[field] = RandomForestClassifier(n_estimators=100)
             self.classifiers[field].fit(X, y)
     
-    def extract_from_text(self, text):
-        """Извлекает информацию из текста"""
+    def extract_from_text(self, text, fields=None):
+        """
+        Извлекает информацию из текста.
+        fields - поля для классификаторов (по умолчанию все); загружаются только нужные
+        """
         # Преобразуем текст в вектор
         X = self.vectorizer.transform([text])
         
         result = {}
         
         # Предсказываем значения для каждого поля
-        for field in self.classifiers:
+        for field in (self.classifiers if fields is None else fields):
             result[field] = self.classifiers[field].predict(X)[0]
-        
         # Извлекаем даты с помощью регулярных выражений
         dates = re.findall(r'\d{2}\.\d{2}\.\d{4}', text)
         result['дата'] = dates[0] if dates else ""
@@ -67,24 +111,38 @@ class TextExtractor:
         
         return result
     
-    def save_model(self, filename):
-        """Сохраняет модель в файл"""
-        model_data = {
-            'vectorizer': self.vectorizer,
-            'classifiers': self.classifiers
-        }
-        with open(filename, 'wb') as f:
-            pickle.dump(model_data, f)
-    
+    def save_model(self, path):
+        """
+        Сохраняет модель в каталог path: векторизатор и каждый классификатор - в отдельном файле joblib
+        (без сжатия, чтобы массивы можно было отображать в память при загрузке)
+        """
+        os.makedirs(path, exist_ok=True)
+        files = {}
+        joblib.dump(self.vectorizer, os.path.join(path, 'vectorizer.joblib'))
+        for i, field in enumerate(self.classifiers):
+            files[field] = f'classifier_{i}.joblib'
+            joblib.dump(self.classifiers[field], os.path.join(path, files[field]))
+        with open(os.path.join(path, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump({'vectorizer': 'vectorizer.joblib', 'classifiers': files}, f, ensure_ascii=False, indent=2)
+
     @classmethod
-    def load_model(cls, filename):
-        """Загружает модель из файла"""
-        with open(filename, 'rb') as f:
-            model_data = pickle.load(f)
-        
+    def load_model(cls, path, mmap_mode='r'):
+        """
+        Загружает модель. path - каталог модели (save_model) или файл pickle старого формата.
+        Из каталога сразу загружается только векторизатор, классификаторы - при первом обращении к полю.
+        """
         extractor = cls()
-        extractor.vectorizer = model_data['vectorizer']
-        extractor.classifiers = model_data['classifiers']
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                model_data = pickle.load(f)
+            extractor.vectorizer = model_data['vectorizer']
+            extractor.classifiers = model_data['classifiers']
+            return extractor
+
+        with open(os.path.join(path, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+        extractor.vectorizer = joblib.load(os.path.join(path, manifest['vectorizer']), mmap_mode=mmap_mode)
+        extractor.classifiers = LazyClassifiers(path, manifest['classifiers'], mmap_mode)
         return extractor
 
 # Пример обучающих данных
@@ -128,7 +186,7 @@ def main():
     extractor.train(TRAINING_DATA)
     
     # Сохраняем модель
-    extractor.save_model('text_extractor_model.pkl')
+    extractor.save_model('text_extractor_model')
     
     # Пример использования
     test_text = """
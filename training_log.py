@@ -0,0 +1,134 @@
+# Журнал обучающих примеров: файл только на дозапись.
+# Запись: длина (uint32) + crc32 (uint32) + JSON в UTF-8. Записи копятся в буфере и сбрасываются
+# пачкой (flush), поэтому добавление примера не требует перезаписи всего набора данных.
+# При открытии недописанный или поврежденный хвост (падение процесса посреди записи) отрезается.
+# compact() атомарно переписывает журнал (например, без дубликатов).
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+_HEADER = struct.Struct("<II")  # длина, crc32
+
+
+def _encode(record: Any) -> bytes:
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _read_records(f) -> Iterator[tuple]:
+    """(запись, смещение конца записи) до конца файла или первой поврежденной записи"""
+    position = f.tell()
+    while True:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return
+        length, checksum = _HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return
+        position += _HEADER.size + length
+        yield json.loads(payload.decode("utf-8")), position
+
+
+class TrainingLog:
+    """
+    Журнал записей (любых JSON-совместимых значений).
+
+    flush_every - сколько записей держать в буфере до записи на диск
+    fsync - вызывать os.fsync после каждого сброса (надежнее, но медленнее)
+    """
+
+    def __init__(self, path: str, flush_every: int = 100, fsync: bool = False):
+        self.path = path
+        self.flush_every = flush_every
+        self.fsync = fsync
+        self._buffer: List[bytes] = []
+        self.count = self._recover()
+        self._file = open(path, "ab")
+
+    def _recover(self) -> int:
+        """Считает целые записи и отрезает поврежденный хвост"""
+        if not os.path.exists(self.path):
+            return 0
+        count = 0
+        end = 0
+        with open(self.path, "rb") as f:
+            for _, end in _read_records(f):
+                count += 1
+        if end < os.path.getsize(self.path):
+            print(f"Журнал {self.path}: отрезан поврежденный хвост ({os.path.getsize(self.path) - end} байт)")
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+        return count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, record: Any):
+        self._buffer.append(_encode(record))
+        self.count += 1
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def extend(self, records: Iterable[Any]):
+        for record in records:
+            self.append(record)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        self._file.write(b"".join(self._buffer))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._buffer = []
+
+    def __iter__(self) -> Iterator[Any]:
+        """Все записи, включая еще не сброшенные на диск"""
+        self.flush()
+        with open(self.path, "rb") as f:
+            for record, _ in _read_records(f):
+                yield record
+
+    def compact(self, transform: Optional[Callable[[List[Any]], Iterable[Any]]] = None) -> int:
+        """
+        Переписывает журнал. transform получает все записи и возвращает новые
+        (по умолчанию - удаление точных дубликатов с сохранением порядка). Возвращает число записей.
+        """
+        records = list(self)
+        if transform is None:
+            seen = set()
+            unique = []
+            for record in records:
+                key = json.dumps(record, ensure_ascii=False, sort_keys=True)
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(record)
+            records = unique
+        else:
+            records = list(transform(records))
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for record in records:
+                f.write(_encode(record))
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "ab")
+        self.count = len(records)
+        return self.count
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,168 @@
+# Асинхронная очередь запросов к API с адаптивным ограничением параллельности.
+# Воркеры непрерывно берут задания из очереди: как только запрос завершен, начинается следующий,
+# без ожидания остальных запросов "пачки" и без фиксированных пауз.
+# Число одновременных запросов регулируется по принципу AIMD (как окно TCP): после каждой серии
+# успешных быстрых ответов лимит растет на 1, при ответе 429 (RateLimitError) или росте задержки
+# выше target_latency - уменьшается вдвое. После 429 новые запросы ждут Retry-After (или backoff).
+# Результат каждого задания передается в on_result сразу по завершении.
+
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+
+class RateLimitError(Exception):
+    """Сервер ограничил частоту запросов (HTTP 429 / 503); retry_after - пауза из заголовка Retry-After"""
+
+    def __init__(self, message: str = "Rate limit", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Значение заголовка Retry-After в секундах (дата HTTP не поддерживается)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    """
+    Лимит одновременных запросов с AIMD-регулированием.
+
+    initial, minimum, maximum - начальный, минимальный и максимальный лимит
+    target_latency - задержка (с), выше которой лимит уменьшается (None - только по 429)
+    backoff - пауза после 429 без Retry-After (удваивается при повторах, не больше max_backoff)
+    """
+
+    def __init__(self, initial: int = 5, minimum: int = 1, maximum: int = 50,
+                 target_latency: Optional[float] = None, decrease: float = 0.5,
+                 backoff: float = 1.0, max_backoff: float = 60.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.decrease = decrease
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.active = 0
+        self._condition = asyncio.Condition()
+        self._resume_at = 0.0
+        self._penalty = backoff
+        # после уменьшения лимита следующее уменьшение - не раньше, чем завершатся запросы,
+        # начатые до него (иначе один всплеск задержек обрушит лимит до минимума)
+        self._started = 0
+        self._decreased_at = 0
+        self.stats = {"rate_limited": 0, "slow": 0, "max_limit": int(self.limit)}
+
+    async def acquire(self) -> int:
+        """Ожидание свободного места; возвращает порядковый номер запроса"""
+        async with self._condition:
+            while True:
+                pause = self._resume_at - time.monotonic()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), pause)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self.active < int(self.limit):
+                    break
+                await self._condition.wait()
+            self.active += 1
+            self._started += 1
+            return self._started
+
+    async def release(self, ticket: int, latency: Optional[float] = None, rate_limited: bool = False,
+                      retry_after: Optional[float] = None):
+        """Освобождение места с обратной связью: задержка ответа или признак 429"""
+        async with self._condition:
+            self.active -= 1
+            if rate_limited:
+                self.stats["rate_limited"] += 1
+                self._decrease(ticket)
+                pause = retry_after if retry_after is not None else self._penalty
+                self._penalty = min(self._penalty * 2, self.max_backoff)
+                self._resume_at = max(self._resume_at, time.monotonic() + pause)
+            elif self.target_latency is not None and latency is not None and latency > self.target_latency:
+                self.stats["slow"] += 1
+                self._decrease(ticket)
+            else:
+                self._penalty = self.backoff
+                # +1 за "окно": limit успешных ответов
+                self.limit = min(self.maximum, self.limit + 1 / max(self.limit, 1.0))
+                self.stats["max_limit"] = max(self.stats["max_limit"], int(self.limit))
+            self._condition.notify_all()
+
+    def _decrease(self, ticket: int):
+        if ticket <= self._decreased_at:
+            return
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        self._decreased_at = self._started
+
+
+async def _call(callback: Optional[Callable], *args):
+    if callback is None:
+        return
+    result = callback(*args)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def run_queue(
+    items: Iterable[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    on_result: Optional[Callable[[Any, Any], Any]] = None,
+    on_error: Optional[Callable[[Any, BaseException], Any]] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    max_retries: int = 5,
+) -> Dict[str, Any]:
+    """
+    Выполнение worker(item) для всех заданий с адаптивной параллельностью.
+
+    on_result(item, result) вызывается сразу после завершения задания (может быть корутиной),
+    on_error(item, exception) - после исчерпания повторов или при другой ошибке.
+    RateLimitError повторяется до max_retries раз (с паузой из лимитера), остальные ошибки не повторяются.
+    Задания берутся из items по мере освобождения воркеров - корутины для всех строк заранее не создаются.
+    Возвращает статистику: выполнено, ошибок, повторов, 429, итоговый и максимальный лимит, время.
+    """
+    limiter = limiter or AdaptiveLimiter()
+    iterator = iter(items)
+    stats = {"done": 0, "failed": 0, "retries": 0}
+    start = time.monotonic()
+
+    async def run_worker():
+        for item in iterator:
+            attempt = 0
+            while True:
+                ticket = await limiter.acquire()
+                started = time.monotonic()
+                try:
+                    result = await worker(item)
+                except RateLimitError as e:
+                    await limiter.release(ticket, rate_limited=True, retry_after=e.retry_after)
+                    if attempt < max_retries:
+                        attempt += 1
+                        stats["retries"] += 1
+                        continue
+                    stats["failed"] += 1
+                    await _call(on_error, item, e)
+                    break
+                except Exception as e:
+                    await limiter.release(ticket, time.monotonic() - started)
+                    stats["failed"] += 1
+                    await _call(on_error, item, e)
+                    break
+                await limiter.release(ticket, time.monotonic() - started)
+                stats["done"] += 1
+                await _call(on_result, item, result)
+                break
+
+    # воркеров - по максимальному лимиту; сколько из них работает одновременно, решает лимитер
+    await asyncio.gather(*(run_worker() for _ in range(limiter.maximum)))
+    stats.update(limiter.stats)
+    stats["limit"] = int(limiter.limit)
+    stats["seconds"] = round(time.monotonic() - start, 2)
+    return stats